@@ -0,0 +1,61 @@
+"""CPU cost of parsing the AFIP/SENASA auth pages: BeautifulSoup vs lxml extract_forms.
+
+Usage:
+    python benchmarks/bench_auth_html.py [captured.html ...]
+
+Without arguments it uses the synthetic pages from tests/unit/_auth_pages.py; pass
+HTML files captured from a real login (e.g. the ``_dump_snippet`` output) to
+measure those instead. The "per login" line adds up the pages of one login flow.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from senasa_pipeline.infrastructure.adapters.html.forms import extract_forms  # noqa: E402
+from tests.unit._auth_pages import (  # noqa: E402
+    afip_login_page,
+    afip_token_page,
+    senasa_login_page,
+)
+
+
+def _bs4(text: str) -> None:
+    soup = BeautifulSoup(text, "html.parser")
+    for form in soup.find_all("form"):
+        {i.get("name"): i.get("value", "") for i in form.find_all("input") if i.get("name")}
+
+
+def _pages() -> dict[str, str]:
+    if len(sys.argv) > 1:
+        return {p: Path(p).read_text(encoding="utf-8", errors="replace") for p in sys.argv[1:]}
+    return {
+        "afip_cuit": afip_login_page(padding=200),
+        "afip_password": afip_login_page("VS-PASSWORD", padding=200),
+        "afip_token_sign": afip_token_page(),
+        "senasa_login": senasa_login_page(viewstate_size=100_000, padding=300),
+    }
+
+
+def main(number: int = 50) -> None:
+    total = {"bs4": 0.0, "lxml": 0.0}
+    for name, text in _pages().items():
+        bs4_ms = timeit.timeit(lambda t=text: _bs4(t), number=number) / number * 1000
+        lxml_ms = timeit.timeit(lambda t=text: extract_forms(t), number=number) / number * 1000
+        total["bs4"] += bs4_ms
+        total["lxml"] += lxml_ms
+        print(
+            f"{name:<20} {len(text) / 1024:8.1f} KB  bs4 {bs4_ms:8.2f} ms  "
+            f"lxml {lxml_ms:7.2f} ms  x{bs4_ms / lxml_ms:5.1f}"
+        )
+    print(f"{'per login':<20} {'':11}  bs4 {total['bs4']:8.2f} ms  lxml {total['lxml']:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""create tambores and establecimientos
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "establecimientos",
+        sa.Column("codigo_senasa", sa.String(32), primary_key=True),
+        sa.Column("nombre", sa.String(255), nullable=False),
+        sa.Column("direccion", sa.String(255), nullable=False),
+        sa.Column("localidad", sa.String(128), nullable=False),
+        sa.Column("provincia", sa.String(128), nullable=False),
+        sa.Column("cuit", sa.String(11), nullable=False),
+        sa.Column("fecha_vencimiento", sa.Date, nullable=False),
+    )
+    op.create_table(
+        "tambores",
+        sa.Column("nro_senasa", sa.String(32), primary_key=True),
+        sa.Column("establecimiento_codigo", sa.String(32), nullable=False),
+        sa.Column("fecha_extraccion", sa.Date, nullable=False),
+        sa.Column("peso", sa.Float, nullable=False),
+        sa.Column("tipo_miel", sa.String(64), nullable=False),
+        sa.Column("origen", sa.String(64), nullable=False),
+        sa.Column("productor", sa.String(255), nullable=False),
+    )
+    op.create_index("ix_tambores_establecimiento_codigo", "tambores", ["establecimiento_codigo"])
+    op.create_index("ix_tambores_fecha_extraccion", "tambores", ["fecha_extraccion"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tambores_fecha_extraccion", table_name="tambores")
+    op.drop_index("ix_tambores_establecimiento_codigo", table_name="tambores")
+    op.drop_table("tambores")
+    op.drop_table("establecimientos")
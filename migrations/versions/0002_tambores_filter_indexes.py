@@ -0,0 +1,34 @@
+"""composite indexes for filtered keyset pagination on tambores
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # (establecimiento_codigo, nro_senasa) cubre también las búsquedas por establecimiento
+    op.drop_index("ix_tambores_establecimiento_codigo", table_name="tambores")
+    op.create_index(
+        "ix_tambores_establecimiento_nro", "tambores", ["establecimiento_codigo", "nro_senasa"]
+    )
+    op.create_index("ix_tambores_productor_nro", "tambores", ["productor", "nro_senasa"])
+    op.create_index("ix_tambores_tipo_miel_nro", "tambores", ["tipo_miel", "nro_senasa"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tambores_tipo_miel_nro", table_name="tambores")
+    op.drop_index("ix_tambores_productor_nro", table_name="tambores")
+    op.drop_index("ix_tambores_establecimiento_nro", table_name="tambores")
+    op.create_index("ix_tambores_establecimiento_codigo", "tambores", ["establecimiento_codigo"])
@@ -0,0 +1,32 @@
+"""sync_mark: incremental sync checkpoints shared by the API and workers
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sync_mark",
+        sa.Column("establecimiento_codigo", sa.String(32), primary_key=True),
+        sa.Column("fecha_extraccion", sa.Date),
+        sa.Column("cursor_fecha", sa.Date),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sync_mark")
@@ -0,0 +1,41 @@
+"""senasa_session and senasa_refresh_lock shared by the API and workers
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "senasa_session",
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=False),
+        sa.Column("cookies", sa.Text, nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True)),
+        sa.Column("is_active", sa.Boolean, nullable=False),
+        sa.CheckConstraint("id = 1", name="ck_senasa_session_single_row"),
+    )
+    op.create_table(
+        "senasa_refresh_lock",
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=False),
+        sa.Column("owner", sa.String(64)),
+        sa.Column("expires_at", sa.Float),
+        sa.CheckConstraint("id = 1", name="ck_senasa_refresh_lock_single_row"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("senasa_refresh_lock")
+    op.drop_table("senasa_session")
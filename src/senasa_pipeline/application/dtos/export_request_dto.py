@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
+from senasa_pipeline.domain.repositories.interfaces import RecordFilter
+
 
 @dataclass(frozen=True)
 class ExportRequestDTO:
     format: str = "parquet"
+    filters: RecordFilter | None = None
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import date
 
 from senasa_pipeline.domain.entities.senasa_record import SenasaRecord
 
@@ -7,6 +8,7 @@ from senasa_pipeline.domain.entities.senasa_record import SenasaRecord
 class SenasaRecordDTO:
     nro_senasa: str
     establecimiento_codigo: str
+    fecha_extraccion: date
     peso: float
     tipo_miel: str
     origen: str
@@ -18,6 +20,7 @@ class SenasaRecordDTO:
         return cls(
             nro_senasa=str(t.nro_senasa),
             establecimiento_codigo=str(t.establecimiento_codigo),
+            fecha_extraccion=t.fecha_extraccion,
             peso=t.peso,
             tipo_miel=t.tipo_miel,
             origen=t.origen,
@@ -4,3 +4,5 @@ from dataclasses import dataclass
 @dataclass(frozen=True)
 class SyncRequestDTO:
     incremental: bool = False
+    # Partición por establecimiento: vacío = sync completo en un solo recorrido
+    establecimientos: tuple[str, ...] = ()
@@ -0,0 +1,122 @@
+"""In-process cache of the establecimiento dimension.
+
+A sync run sees the same few establecimientos on thousands of tambores. The
+cache keeps one canonical Establecimiento per código (LRU-bounded), loads
+misses in bulk with ``get_many`` and writes an establecimiento only when it is
+new or its data changed, so each one is upserted at most once per run and the
+tambor rows just reference it by código.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from senasa_pipeline.domain.entities.establecimiento import Establecimiento
+from senasa_pipeline.domain.repositories.interfaces import IEstablecimientoRepository
+
+
+class EstablecimientoCache:
+    """LRU cache over an IEstablecimientoRepository, keyed by CodigoSenasa.
+
+    Thread-safe: the sync use case calls it from the consumer thread while API
+    handlers may read it concurrently.
+
+    Args:
+        repo (IEstablecimientoRepository): Backing repository.
+        maxsize (int, optional): Establecimientos kept in memory. Defaults to 10_000.
+    """
+
+    def __init__(self, repo: IEstablecimientoRepository, maxsize: int = 10_000) -> None:
+        self.repo = repo
+        self.maxsize = max(1, maxsize)
+        self._items: OrderedDict[str, Establecimiento] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, codigo: object) -> bool:
+        return str(codigo) in self._items
+
+    def get(self, codigo: str) -> Establecimiento | None:
+        """Cached establecimiento, loading it from the repository on a miss."""
+        return self.prefetch([codigo]).get(str(codigo))
+
+    def prefetch(self, codigos: Iterable[str]) -> dict[str, Establecimiento]:
+        """Loads every missing código with a single ``get_many`` call.
+
+        Returns:
+            dict[str, Establecimiento]: Known establecimientos among ``codigos``.
+        """
+        keys = {str(c) for c in codigos}
+        found: dict[str, Establecimiento] = {}
+        with self._lock:
+            for key in keys:
+                est = self._lookup(key)
+                if est is not None:
+                    found[key] = est
+        missing = keys - found.keys()
+        self.hits += len(found)
+        self.misses += len(missing)
+        if missing:
+            loaded = self.repo.get_many(missing)
+            with self._lock:
+                for key, est in loaded.items():
+                    found[key] = self._store(key, est)
+        return found
+
+    def intern(self, est: Establecimiento) -> Establecimiento:
+        """Canonical instance for ``est``: the cached one if equal, else ``est`` itself.
+
+        Does not write to the repository; see upsert_changed.
+        """
+        key = str(est.codigo_senasa)
+        with self._lock:
+            cached = self._lookup(key)
+            if cached is not None and cached == est:
+                return cached
+            return self._store(key, est)
+
+    def upsert_changed(self, ests: Iterable[Establecimiento]) -> int:
+        """Persists the establecimientos that are new or differ from the stored ones.
+
+        Args:
+            ests (Iterable[Establecimiento]): Establecimientos seen in a batch
+                (last one wins per código).
+
+        Returns:
+            int: Number of establecimientos written.
+        """
+        incoming = {str(e.codigo_senasa): e for e in ests}
+        if not incoming:
+            return 0
+        known = self.prefetch(incoming)
+        changed = [est for key, est in incoming.items() if known.get(key) != est]
+        if not changed:
+            return 0
+        written = self.repo.upsert_many(changed)
+        with self._lock:
+            for est in changed:
+                self._store(str(est.codigo_senasa), est)
+        return written
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def _lookup(self, key: str) -> Establecimiento | None:
+        est = self._items.get(key)
+        if est is not None:
+            self._items.move_to_end(key)
+        return est
+
+    def _store(self, key: str, est: Establecimiento) -> Establecimiento:
+        self._items[key] = est
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+        return est
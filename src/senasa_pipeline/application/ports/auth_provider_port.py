@@ -9,3 +9,11 @@ class AuthProviderPort(Protocol):
     def get_token_sign(self) -> tuple[str, str]:
         """Returns (token, sign). Raises exceptions on failure."""
         ...
+
+
+class AsyncAuthProviderPort(Protocol):
+    """Async variant of AuthProviderPort."""
+
+    async def get_token_sign(self) -> tuple[str, str]:
+        """Returns (token, sign). Raises exceptions on failure."""
+        ...
@@ -5,6 +5,22 @@ from typing import Any, Protocol
 import json
 
 
+class Headers(dict[str, str]):
+    """Case-insensitive header mapping (HTTP header names are case-insensitive)."""
+
+    def __init__(self, headers: Mapping[str, str]) -> None:
+        super().__init__((k.lower(), v) for k, v in headers.items())
+
+    def __getitem__(self, key: str) -> str:
+        return super().__getitem__(key.lower())
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and super().__contains__(key.lower())
+
+    def get(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        return super().get(key.lower(), default)
+
+
 class HttpResponse:
     def __init__(
         self,
@@ -18,9 +34,14 @@ class HttpResponse:
         self.status_code = status_code
         self.text = text
         self.url = url
-        self.headers = dict(headers)
+        self.headers = Headers(headers)
         self._raw = raw
 
+    @property
+    def raw(self) -> Any | None:
+        """Underlying client response (e.g. httpx.Response), if any."""
+        return self._raw
+
     @property
     def request(self) -> Any:
         if self._raw is None or not hasattr(self._raw, "request"):
@@ -39,6 +60,9 @@ class HttpClientPort(Protocol):
     def get(
         self, url: str, *, headers: Mapping[str, str] | None = None, allow_redirects: bool = True
     ) -> HttpResponse: ...
+    def head(
+        self, url: str, *, headers: Mapping[str, str] | None = None, allow_redirects: bool = False
+    ) -> HttpResponse: ...
     def post(
         self,
         url: str,
@@ -49,3 +73,24 @@ class HttpClientPort(Protocol):
     ) -> HttpResponse: ...
     def set_cookies(self, cookies: Mapping[str, str]) -> None: ...
     def dump_cookies(self) -> dict[str, str]: ...
+
+
+class AsyncHttpClientPort(Protocol):
+    """Async counterpart of HttpClientPort, so logins don't block the event loop."""
+
+    async def get(
+        self, url: str, *, headers: Mapping[str, str] | None = None, allow_redirects: bool = True
+    ) -> HttpResponse: ...
+    async def head(
+        self, url: str, *, headers: Mapping[str, str] | None = None, allow_redirects: bool = False
+    ) -> HttpResponse: ...
+    async def post(
+        self,
+        url: str,
+        *,
+        data: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        allow_redirects: bool = True,
+    ) -> HttpResponse: ...
+    def set_cookies(self, cookies: Mapping[str, str]) -> None: ...
+    def dump_cookies(self) -> dict[str, str]: ...
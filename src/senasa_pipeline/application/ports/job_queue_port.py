@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Protocol
+
+# Estados de un job
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+FINISHED_STATES = frozenset({JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED})
+
+
+class JobCancelledError(Exception):
+    """Raised at a job checkpoint once cancellation was requested."""
+
+
+@dataclass
+class JobInfo:
+    """Snapshot of a queued job: status, progress counters and outcome."""
+
+    id: str
+    kind: str
+    status: str = JOB_QUEUED
+    params: dict[str, Any] = field(default_factory=dict)
+    progress: dict[str, Any] = field(default_factory=dict)
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    cancel_requested: bool = False
+    created_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "params": self.params,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "cancel_requested": self.cancel_requested,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class JobContext:
+    """Handle a running job uses to publish progress and honour cancellation.
+
+    Args:
+        job_id (str): Id of the running job.
+        on_progress (Callable[[dict[str, Any]], None]): Receives the merged counters.
+        is_cancelled (Callable[[], bool]): True once cancellation was requested.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        on_progress: Callable[[dict[str, Any]], None],
+        is_cancelled: Callable[[], bool],
+    ) -> None:
+        self.job_id = job_id
+        self.progress: dict[str, Any] = {}
+        self._on_progress = on_progress
+        self._is_cancelled = is_cancelled
+
+    def report(self, **counters: Any) -> None:
+        """Publishes progress counters; also a cancellation checkpoint."""
+        self.progress.update(counters)
+        self._on_progress(dict(self.progress))
+        self.check_cancelled()
+
+    def check_cancelled(self) -> None:
+        """Raises JobCancelledError if the job should stop."""
+        if self._is_cancelled():
+            raise JobCancelledError(self.job_id)
+
+
+# Un handler recibe los parámetros del job y devuelve un resultado serializable a JSON
+JobHandler = Callable[[dict[str, Any], JobContext], dict[str, Any]]
+
+
+class JobQueuePort(Protocol):
+    """Runs registered job kinds outside the request that submitted them."""
+
+    def register(self, kind: str, handler: JobHandler) -> None: ...
+
+    def submit(self, kind: str, params: dict[str, Any] | None = None) -> JobInfo:
+        """Queues a job of a registered kind; raises ValueError for unknown kinds."""
+        ...
+
+    def get(self, job_id: str) -> JobInfo | None: ...
+
+    def cancel(self, job_id: str) -> bool:
+        """Requests cancellation; False if the job is unknown or already finished."""
+        ...
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Releases the queue's workers or connections; called when the app stops."""
+        ...
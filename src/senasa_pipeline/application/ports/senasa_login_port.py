@@ -4,7 +4,20 @@ from typing import Protocol
 
 
 class SenasaLoginPort(Protocol):
-    """Consumes AFIP token/sign and completes SENASA login (including user selection)."""
+    """Consumes AFIP token/sign and completes SENASA login (including user selection).
+
+    ``restore_session`` loads stored cookies so ``validate_session`` can probe them
+    without a new login.
+    """
 
     def login_with_token_sign(self, token: str, sign: str) -> None: ...
+    def restore_session(self, cookies: dict[str, str]) -> None: ...
     def validate_session(self) -> bool: ...
+
+
+class AsyncSenasaLoginPort(Protocol):
+    """Async variant of SenasaLoginPort."""
+
+    async def login_with_token_sign(self, token: str, sign: str) -> None: ...
+    def restore_session(self, cookies: dict[str, str]) -> None: ...
+    async def validate_session(self) -> bool: ...
@@ -30,3 +30,19 @@ class SessionStorePort(Protocol):
     def mark_inactive(self) -> None:
         """Mark the stored session as inactive (e.g., after failed probe)."""
         ...
+
+
+class RefreshLockPort(Protocol):
+    """Cross-process lease so only one caller runs the AFIP→SENASA login at a time."""
+
+    def acquire(self, owner: str, ttl_seconds: float) -> bool:
+        """Try to take the lease for ``owner``; an expired lease may be taken over.
+
+        Returns:
+            bool: True if the lease is now held by ``owner``.
+        """
+        ...
+
+    def release(self, owner: str) -> None:
+        """Release the lease if still held by ``owner``."""
+        ...
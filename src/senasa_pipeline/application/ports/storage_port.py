@@ -1,8 +1,15 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator
 from typing import Protocol
 
-from senasa_pipeline.application.dtos.senasa_record_dto import SenasaRecordDTO
+from senasa_pipeline.application.record_batch import SenasaRecordBatch
 
 
 class IStoragePort(Protocol):
-    def export(self, rows: Sequence[SenasaRecordDTO], fmt: str, path: str) -> str: ...
+    def export(self, batches: Iterable[SenasaRecordBatch], fmt: str, path: str) -> str: ...
+
+
+class IStreamingExportPort(Protocol):
+    """Serializes record batches incrementally, for responses streamed to the client."""
+
+    def media_type(self, fmt: str) -> str: ...
+    def stream(self, batches: Iterable[SenasaRecordBatch], fmt: str) -> Iterator[bytes]: ...
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
+from typing import Protocol
+
+
+@dataclass(frozen=True)
+class SyncCheckpoint:
+    """Sync position of one establecimiento.
+
+    ``fecha_extraccion`` is the committed mark: a sync that completed
+    persisted every row extracted up to that date. ``cursor`` is the newest
+    fecha_extraccion persisted by a run that has not completed (or crashed);
+    the listing is newest-first, so older rows may still be missing and the
+    cursor only becomes the mark once a run covering the establecimiento
+    completes (``commit``).
+    """
+
+    fecha_extraccion: date | None = None
+    cursor: date | None = None
+
+    def resume_from(self, overlap_days: int = 0) -> date | None:
+        """First date an incremental run must fetch; None if there is no mark.
+
+        The mark date itself is fetched again (plus ``overlap_days`` before
+        it): tambores added or edited later that day are picked up and the
+        repository upsert dedupes the rest.
+        """
+        if self.fecha_extraccion is None:
+            return None
+        return self.fecha_extraccion - timedelta(days=overlap_days)
+
+    def advance(self, newest: date) -> SyncCheckpoint:
+        """Returns the checkpoint with its cursor moved forward to ``newest``."""
+        if self.cursor is not None and self.cursor >= newest:
+            return self
+        return replace(self, cursor=newest)
+
+    def commit(self) -> SyncCheckpoint:
+        """Returns the checkpoint with the cursor promoted to the mark."""
+        if self.cursor is None:
+            return self
+        if self.fecha_extraccion is not None and self.fecha_extraccion >= self.cursor:
+            return SyncCheckpoint(self.fecha_extraccion)
+        return SyncCheckpoint(self.cursor)
+
+
+class SyncStatePort(Protocol):
+    """Persistence for incremental sync checkpoints, keyed by establecimiento code."""
+
+    def load(self) -> dict[str, SyncCheckpoint]:
+        """Returns all stored checkpoints."""
+        ...
+
+    def save(self, checkpoints: Mapping[str, SyncCheckpoint]) -> None:
+        """Upserts the given checkpoints; others are left untouched."""
+        ...
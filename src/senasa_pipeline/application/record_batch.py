@@ -0,0 +1,316 @@
+"""Arrow-backed container for batches of SENASA records.
+
+A ``SenasaRecord`` costs several Python objects per tambor (record, Tambor, two
+``CodigoSenasa`` strings, date, float and three text fields). ``SenasaRecordBatch``
+keeps the same data as Arrow columns instead: repeated text (tipo de miel,
+origen, productor, establecimiento) is dictionary-encoded, and establecimientos
+are stored once per código. Rows are materialized lazily through
+``SenasaRecordView``, which exposes the ``tambor``/``establecimiento`` attributes
+of a ``SenasaRecord``, so batches flow through code written for lists of
+records while Arrow/Polars/DuckDB consumers read the columns without copying.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import date
+from itertools import groupby
+from typing import Any, overload
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from senasa_pipeline.domain.entities.establecimiento import Establecimiento
+from senasa_pipeline.domain.entities.senasa_record import SenasaRecord
+from senasa_pipeline.domain.entities.tambor import Tambor
+from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
+
+_DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+
+TAMBOR_FIELDS = (
+    "nro_senasa",
+    "establecimiento_codigo",
+    "fecha_extraccion",
+    "peso",
+    "tipo_miel",
+    "origen",
+    "productor",
+)
+RECORD_SCHEMA = pa.schema(
+    [
+        ("nro_senasa", pa.string()),
+        ("establecimiento_codigo", _DICT_STRING),
+        ("fecha_extraccion", pa.date32()),
+        ("peso", pa.float64()),
+        ("tipo_miel", _DICT_STRING),
+        ("origen", _DICT_STRING),
+        ("productor", _DICT_STRING),
+        # Si la fila trae su establecimiento (ver SenasaRecordBatch.establecimientos)
+        ("has_establecimiento", pa.bool_()),
+    ]
+)
+
+
+def _array(values: Sequence[Any], type_: pa.DataType) -> pa.Array:
+    if pa.types.is_dictionary(type_):
+        return pa.array(values, type=pa.string()).dictionary_encode()
+    return pa.array(values, type=type_)
+
+
+class SenasaRecordView:
+    """Lazy row of a SenasaRecordBatch, duck-typed as a SenasaRecord.
+
+    Field values are read from the columns on access; ``tambor`` builds the
+    domain object on demand.
+    """
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: SenasaRecordBatch, index: int) -> None:
+        self._batch = batch
+        self._index = index
+
+    def _value(self, name: str) -> Any:
+        return self._batch.table.column(name)[self._index].as_py()
+
+    @property
+    def nro_senasa(self) -> str:
+        return self._value("nro_senasa")  # type: ignore[no-any-return]
+
+    @property
+    def establecimiento_codigo(self) -> str:
+        return self._value("establecimiento_codigo")  # type: ignore[no-any-return]
+
+    @property
+    def fecha_extraccion(self) -> date:
+        return self._value("fecha_extraccion")  # type: ignore[no-any-return]
+
+    @property
+    def peso(self) -> float:
+        return self._value("peso")  # type: ignore[no-any-return]
+
+    @property
+    def tambor(self) -> Tambor:
+        row = self.as_dict()
+        return Tambor(
+            nro_senasa=CodigoSenasa(row["nro_senasa"]),
+            establecimiento_codigo=CodigoSenasa(row["establecimiento_codigo"]),
+            fecha_extraccion=row["fecha_extraccion"],
+            peso=row["peso"],
+            tipo_miel=row["tipo_miel"],
+            origen=row["origen"],
+            productor=row["productor"],
+        )
+
+    @property
+    def establecimiento(self) -> Establecimiento | None:
+        if not self._value("has_establecimiento"):
+            return None
+        return self._batch.establecimientos.get(self.establecimiento_codigo)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Tambor fields of this row as plain Python values."""
+        return {name: self._value(name) for name in TAMBOR_FIELDS}
+
+    def to_record(self) -> SenasaRecord:
+        return SenasaRecord(tambor=self.tambor, establecimiento=self.establecimiento)
+
+    def __repr__(self) -> str:
+        return f"SenasaRecordView({self.nro_senasa!r})"
+
+
+class SenasaRecordBatch(Sequence[SenasaRecordView]):
+    """Immutable columnar batch of SENASA records (see module docstring).
+
+    Slicing, filtering and ``take`` return new batches sharing the underlying
+    Arrow buffers where Arrow allows it.
+
+    Args:
+        table (pa.Table): Columns following RECORD_SCHEMA.
+        establecimientos (Mapping[str, Establecimiento] | None, optional):
+            Establecimientos by código for rows with ``has_establecimiento``.
+    """
+
+    def __init__(
+        self,
+        table: pa.Table,
+        establecimientos: Mapping[str, Establecimiento] | None = None,
+    ) -> None:
+        self.table = table if table.schema.equals(RECORD_SCHEMA) else table.cast(RECORD_SCHEMA)
+        self.establecimientos: Mapping[str, Establecimiento] = establecimientos or {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[SenasaRecord]) -> SenasaRecordBatch:
+        """Columnarizes records; Establecimiento objects are kept once per código.
+
+        Views of existing batches (e.g. a download-mode scraper's pages) are
+        taken from their batch's columns instead of being rebuilt row by row.
+        """
+        records = list(records)
+        views = [rec for rec in records if isinstance(rec, SenasaRecordView)]
+        if views and len(views) == len(records):
+            return cls.concat(
+                batch.take(view._index for view in run)
+                for batch, run in groupby(views, key=lambda view: view._batch)
+            )
+        columns: dict[str, list[Any]] = {name: [] for name in RECORD_SCHEMA.names}
+        establecimientos: dict[str, Establecimiento] = {}
+        for rec in records:
+            t = rec.tambor
+            columns["nro_senasa"].append(str(t.nro_senasa))
+            columns["establecimiento_codigo"].append(str(t.establecimiento_codigo))
+            columns["fecha_extraccion"].append(t.fecha_extraccion)
+            columns["peso"].append(t.peso)
+            columns["tipo_miel"].append(t.tipo_miel)
+            columns["origen"].append(t.origen)
+            columns["productor"].append(t.productor)
+            columns["has_establecimiento"].append(rec.establecimiento is not None)
+            if rec.establecimiento is not None:
+                establecimientos[str(t.establecimiento_codigo)] = rec.establecimiento
+        arrays = [_array(columns[f.name], f.type) for f in RECORD_SCHEMA]
+        return cls(pa.Table.from_arrays(arrays, schema=RECORD_SCHEMA), establecimientos)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]]) -> SenasaRecordBatch:
+        """Columnarizes tambor tuples in TAMBOR_FIELDS order, e.g. a SQL result.
+
+        No record objects are built; rows carry no establecimiento data.
+        """
+        columns = list(zip(*rows, strict=True)) or [()] * len(TAMBOR_FIELDS)
+        arrays = [
+            _array(values, RECORD_SCHEMA.field(name).type)
+            for name, values in zip(TAMBOR_FIELDS, columns, strict=True)
+        ]
+        return cls.from_arrow(pa.Table.from_arrays(arrays, names=list(TAMBOR_FIELDS)))
+
+    @classmethod
+    def from_arrow(
+        cls,
+        data: pa.Table | pa.RecordBatch,
+        establecimientos: Mapping[str, Establecimiento] | None = None,
+    ) -> SenasaRecordBatch:
+        """Wraps Arrow data with (at least) the tambor columns, e.g. a read_export frame.
+
+        A missing ``has_establecimiento`` column means "no establecimiento data".
+        """
+        table = data if isinstance(data, pa.Table) else pa.Table.from_batches([data])
+        if "has_establecimiento" not in table.column_names:
+            table = table.append_column(
+                "has_establecimiento", pa.array([False] * table.num_rows, type=pa.bool_())
+            )
+        return cls(table.select(RECORD_SCHEMA.names), establecimientos)
+
+    @classmethod
+    def concat(cls, batches: Iterable[SenasaRecordBatch]) -> SenasaRecordBatch:
+        parts = list(batches)
+        establecimientos: dict[str, Establecimiento] = {}
+        for part in parts:
+            establecimientos.update(part.establecimientos)
+        if not parts:
+            return cls(RECORD_SCHEMA.empty_table())
+        table = pa.concat_tables([p.table for p in parts]).unify_dictionaries()
+        return cls(table.combine_chunks(), establecimientos)
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    @overload
+    def __getitem__(self, index: int) -> SenasaRecordView: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> SenasaRecordBatch: ...
+
+    def __getitem__(self, index: int | slice) -> SenasaRecordView | SenasaRecordBatch:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self.take(range(start, stop, step))
+            return self._derive(self.table.slice(start, max(0, stop - start)))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SenasaRecordBatch index out of range")
+        return SenasaRecordView(self, index)
+
+    def __iter__(self) -> Iterator[SenasaRecordView]:
+        return (SenasaRecordView(self, i) for i in range(len(self)))
+
+    def _derive(self, table: pa.Table) -> SenasaRecordBatch:
+        return SenasaRecordBatch(table, self.establecimientos)
+
+    def filter(self, mask: Sequence[bool] | pa.Array) -> SenasaRecordBatch:
+        """Rows where ``mask`` is true (e.g. a BatchValidation mask)."""
+        return self._derive(self.table.filter(pa.array(mask, type=pa.bool_())))
+
+    def take(self, indices: Iterable[int]) -> SenasaRecordBatch:
+        return self._derive(self.table.take(pa.array(list(indices), type=pa.int64())))
+
+    def since(self, starts: Mapping[str, date]) -> SenasaRecordBatch:
+        """Rows extracted on or after their establecimiento's date in ``starts``.
+
+        Establecimientos missing from ``starts`` keep all their rows. Computed
+        over the columns, without materializing rows.
+        """
+        if not starts or not len(self):
+            return self
+        codigos = pc.cast(self.table.column("establecimiento_codigo"), pa.string())
+        index = pc.index_in(codigos, value_set=pa.array(list(starts), type=pa.string()))
+        start = pc.take(pa.array(list(starts.values()), type=pa.date32()), index)
+        keep = pc.fill_null(pc.greater_equal(self.table.column("fecha_extraccion"), start), True)
+        return self._derive(self.table.filter(keep))
+
+    def newest_by_establecimiento(self) -> dict[str, date]:
+        """Latest ``fecha_extraccion`` per establecimiento código (one group-by)."""
+        if not len(self):
+            return {}
+        grouped = (
+            self.table.select(["establecimiento_codigo", "fecha_extraccion"])
+            .group_by("establecimiento_codigo")
+            .aggregate([("fecha_extraccion", "max")])
+        )
+        return dict(
+            zip(
+                grouped.column("establecimiento_codigo").to_pylist(),
+                grouped.column("fecha_extraccion_max").to_pylist(),
+                strict=True,
+            )
+        )
+
+    def without_establecimientos(self) -> SenasaRecordBatch:
+        """Same rows with no Establecimiento objects attached (tambores keep the código)."""
+        return SenasaRecordBatch(
+            self.table.set_column(
+                self.table.schema.get_field_index("has_establecimiento"),
+                "has_establecimiento",
+                pa.array([False] * self.table.num_rows, type=pa.bool_()),
+            )
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the Arrow buffers (establecimiento objects not included)."""
+        return self.table.nbytes
+
+    def to_arrow(self, *, dense: bool = False) -> pa.Table:
+        """Tambor columns as Arrow, without copying.
+
+        With ``dense=True`` dictionary columns are decoded to plain strings (the
+        storage EXPORT_SCHEMA), which does allocate.
+        """
+        table = self.table.select(TAMBOR_FIELDS)
+        if not dense:
+            return table
+        return pa.Table.from_arrays(
+            [
+                pc.cast(col, pa.string()) if pa.types.is_dictionary(col.type) else col
+                for col in table.columns
+            ],
+            names=list(TAMBOR_FIELDS),
+        )
+
+    def to_pylist(self) -> list[dict[str, Any]]:
+        """Tambor fields as JSON-ready dicts (one Arrow conversion for the whole batch)."""
+        return self.to_arrow().to_pylist()  # type: ignore[no-any-return]
+
+    def to_records(self) -> list[SenasaRecord]:
+        return [view.to_record() for view in self]
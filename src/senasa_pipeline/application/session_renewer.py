@@ -0,0 +1,137 @@
+"""Proactive SENASA session renewal, so callers never pay the AFIP login latency."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+
+from senasa_pipeline.application.ports.session_store_port import SessionStorePort
+from senasa_pipeline.application.use_cases.ensure_senasa_session import (
+    Clock,
+    EnsureSessionResult,
+    SystemClock,
+)
+from senasa_pipeline.log import correlated, get_logger
+
+RefreshSession = Callable[[], Awaitable[EnsureSessionResult]]
+
+
+class SessionRenewer:
+    """Background loop that renews the session at a fraction of its TTL.
+
+    The renewal instant is derived from the *stored* ``expires_at``: a session
+    issued with TTL ``T`` is renewed once ``renew_fraction * T`` has elapsed, minus
+    a random jitter of up to ``jitter_fraction * T``. Several workers running a
+    renewer against the same store therefore spread out, and once one of them
+    renews, the others see the later expiry and go back to sleep instead of
+    logging in again (the refresh itself is single-flight, see
+    EnsureSenasaSessionUseCase). The jitter is drawn once per stored expiry,
+    so repeated checks within a cycle agree on the renewal instant.
+
+    A failed renewal is retried after ``retry_seconds``, doubling on every
+    consecutive failure up to ``max_retry_seconds``. After ``max_failures``
+    consecutive failures the loop logs an error and stops: requests still
+    log in on demand, but AFIP is no longer hit in the background.
+
+    Args:
+        store (SessionStorePort): Where the current session expiry is read from.
+        refresh (RefreshSession): Coroutine performing a forced, single-flight refresh.
+        ttl_hours (int): Session TTL used when the session was issued.
+        renew_fraction (float, optional): Share of the TTL after which to renew. Defaults to 0.8.
+        jitter_fraction (float, optional): Max jitter as a share of the TTL. Defaults to 0.05.
+        retry_seconds (float, optional): Delay before the first retry. Defaults to 60.
+        max_retry_seconds (float, optional): Backoff cap. Defaults to 3600.
+        max_failures (int, optional): Consecutive failures before giving up. Defaults to 10.
+        clock (Clock | None, optional): Time source. Defaults to SystemClock.
+        rng (Callable[[], float] | None, optional): Uniform [0, 1) source for jitter.
+    """
+
+    def __init__(
+        self,
+        store: SessionStorePort,
+        refresh: RefreshSession,
+        *,
+        ttl_hours: int,
+        renew_fraction: float = 0.8,
+        jitter_fraction: float = 0.05,
+        retry_seconds: float = 60.0,
+        max_retry_seconds: float = 3600.0,
+        max_failures: int = 10,
+        clock: Clock | None = None,
+        rng: Callable[[], float] | None = None,
+    ) -> None:
+        if not 0 < renew_fraction < 1:
+            raise ValueError("renew_fraction debe estar entre 0 y 1")
+        self.store = store
+        self.refresh = refresh
+        self.ttl = timedelta(hours=ttl_hours)
+        self.renew_fraction = renew_fraction
+        self.jitter_fraction = jitter_fraction
+        self.retry_seconds = retry_seconds
+        self.max_retry_seconds = max(retry_seconds, max_retry_seconds)
+        self.max_failures = max(1, max_failures)
+        self.clock = clock or SystemClock()
+        self.rng = rng or random.random
+        self.failures = 0
+        self._log = get_logger(type(self).__name__)
+        self._jitter: tuple[datetime, float] | None = None
+
+    def seconds_until_renewal(self) -> float:
+        """Seconds until the stored session is due for renewal (0 if due now)."""
+        cookies, expires_at, is_active = self.store.load()
+        if not (cookies and expires_at and is_active):
+            return 0.0
+        renew_at = expires_at - self.ttl * (1 - self.renew_fraction)
+        return max(
+            0.0, (renew_at - self.clock.now()).total_seconds() - self._jitter_for(expires_at)
+        )
+
+    def retry_delay(self) -> float:
+        """Backoff after ``failures`` consecutive failed renewals."""
+        return float(
+            min(self.retry_seconds * 2 ** max(0, self.failures - 1), self.max_retry_seconds)
+        )
+
+    def _jitter_for(self, expires_at: datetime) -> float:
+        # Un sorteo por ciclo: cambia sólo cuando otra renovación movió el vencimiento
+        if self._jitter is None or self._jitter[0] != expires_at:
+            self._jitter = (
+                expires_at,
+                self.ttl.total_seconds() * self.jitter_fraction * self.rng(),
+            )
+        return self._jitter[1]
+
+    @correlated("session_renewal")
+    async def run_once(self) -> EnsureSessionResult | None:
+        """Renews the session if due; returns None when nothing had to be done."""
+        if self.seconds_until_renewal() > 0:
+            return None
+        result = await self.refresh()
+        self._log.info("session_renewed", status=result.status, detail=result.message)
+        return result
+
+    async def run(self) -> None:
+        """Runs until cancelled (e.g. on application shutdown) or ``max_failures`` in a row."""
+        while True:
+            delay = self.seconds_until_renewal()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            try:
+                result = await self.run_once()
+            except Exception:  # el loop no debe morir por un login fallido
+                self._log.exception("session_renewal_failed", failures=self.failures + 1)
+            else:
+                if result is None or (
+                    result.status != "ERROR" and self.seconds_until_renewal() > 0
+                ):
+                    self.failures = 0
+                    continue
+            # Falló o la sesión sigue vencida: backoff exponencial, no un loop cerrado
+            self.failures += 1
+            if self.failures >= self.max_failures:
+                self._log.error("session_renewal_stopped", failures=self.failures)
+                return
+            await asyncio.sleep(self.retry_delay())
@@ -0,0 +1,86 @@
+"""Iterator helpers for the streaming scrape → validate → persist pipeline."""
+
+from __future__ import annotations
+
+import contextvars
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Groups an iterable into lists of at most ``size`` items without materializing it."""
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def prefetch(items: Iterable[T], max_pending: int) -> Iterator[T]:
+    """Consumes ``items`` on a background thread through a bounded queue.
+
+    The producer runs ahead of the consumer by at most ``max_pending`` items and
+    blocks when the queue is full (back-pressure), so downloads overlap with
+    persistence while memory stays bounded. Producer exceptions are re-raised in
+    the consumer. With ``max_pending <= 0`` items are consumed inline.
+
+    Args:
+        items (Iterable[T]): Source iterable, typically batches of scraped records.
+        max_pending (int): Maximum items buffered between producer and consumer.
+
+    Yields:
+        T: Items in source order.
+    """
+    if max_pending <= 0:
+        yield from items
+        return
+
+    buffer: queue.Queue[object] = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as exc:  # forwarded to the consumer
+            put(_Failure(exc))
+            return
+        put(_DONE)
+
+    # El productor hereda el contexto (correlation_id de los logs) del consumidor
+    context = contextvars.copy_context()
+    producer = threading.Thread(
+        target=context.run, args=(produce,), name="senasa-prefetch", daemon=True
+    )
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exc
+            yield item  # type: ignore[misc]
+    finally:
+        # Unblocks a producer waiting on a full queue if the consumer stops early
+        stop.set()
@@ -1,13 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+import uuid
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Protocol
-import time
 
-from senasa_pipeline.application.ports.auth_provider_port import AuthProviderPort
-from senasa_pipeline.application.ports.senasa_login_port import SenasaLoginPort
-from senasa_pipeline.application.ports.session_store_port import SessionStorePort
+from senasa_pipeline.application.ports.auth_provider_port import (
+    AsyncAuthProviderPort,
+    AuthProviderPort,
+)
+from senasa_pipeline.application.ports.senasa_login_port import (
+    AsyncSenasaLoginPort,
+    SenasaLoginPort,
+)
+from senasa_pipeline.application.ports.session_store_port import (
+    RefreshLockPort,
+    SessionStorePort,
+)
+from senasa_pipeline.log import correlated, get_logger
+
+SessionSnapshot = tuple[dict[str, str], datetime | None, bool]
 
 
 class Clock(Protocol):
@@ -26,8 +41,112 @@ class EnsureSessionResult:
     message: str
 
 
+class SessionValidationCache:
+    """Remembers a successful validation probe for a short time (per process).
+
+    Keyed by the cookie set, so a refreshed session is never treated as validated
+    by a probe of the previous one. Server-side invalidation (a scraper redirected
+    to /Login.aspx) goes through ``SessionStorePort.mark_inactive``, which makes the
+    stored session non-current before the cache is even consulted.
+
+    Args:
+        ttl_seconds (float, optional): How long a probe result is trusted. Defaults to 60.
+        clock (Clock | None, optional): Time source. Defaults to SystemClock.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, clock: Clock | None = None) -> None:
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.clock = clock or SystemClock()
+        self._entry: tuple[frozenset[tuple[str, str]], datetime] | None = None
+
+    def is_fresh(self, cookies: dict[str, str]) -> bool:
+        entry = self._entry
+        return bool(
+            entry and entry[0] == frozenset(cookies.items()) and entry[1] > self.clock.now()
+        )
+
+    def mark_valid(self, cookies: dict[str, str]) -> None:
+        self._entry = (frozenset(cookies.items()), self.clock.now() + self.ttl)
+
+    def invalidate(self) -> None:
+        self._entry = None
+
+
+def _is_current(snapshot: SessionSnapshot, now: datetime) -> bool:
+    cookies, expires_at, is_active = snapshot
+    return bool(cookies and expires_at and expires_at > now and is_active)
+
+
+class _StoredSession:
+    """Decisions about the stored session, shared by the sync and async use cases.
+
+    The use cases only run the SENASA validation probe (plain or awaited)
+    between ``cached()`` and ``probed()``.
+    """
+
+    def __init__(
+        self,
+        snapshot: SessionSnapshot,
+        now: datetime,
+        *,
+        force: bool,
+        cache: SessionValidationCache | None,
+    ) -> None:
+        self.snapshot = snapshot
+        self.cookies = snapshot[0]
+        self.cache = cache
+        # Sin force, una sesión vigente se valida antes de pensar en renovarla
+        self.reusable = not force and _is_current(snapshot, now)
+
+    def cached(self) -> EnsureSessionResult | None:
+        if self.cache and self.cache.is_fresh(self.cookies):
+            return EnsureSessionResult(
+                "ALREADY_ACTIVE", self.snapshot[1], "Session validated recently (cached)"
+            )
+        return None
+
+    def probed(self, valid: bool) -> EnsureSessionResult | None:
+        """Result for a successful probe; None (and a dropped cache entry) means re-login."""
+        if valid:
+            if self.cache:
+                self.cache.mark_valid(self.cookies)
+            return EnsureSessionResult(
+                "ALREADY_ACTIVE", self.snapshot[1], "Valid session from store"
+            )
+        if self.cache:
+            self.cache.invalidate()
+        return None
+
+
+def _peer_refresh(
+    store: SessionStorePort, snapshot: SessionSnapshot, now: datetime
+) -> EnsureSessionResult | None:
+    """Result to reuse if another caller refreshed the session since ``snapshot``."""
+    current = store.load()
+    if current != snapshot and _is_current(current, now):
+        return EnsureSessionResult(
+            "ALREADY_ACTIVE", current[1], "Session refreshed by concurrent caller"
+        )
+    return None
+
+
+def _lock_timeout() -> EnsureSessionResult:
+    return EnsureSessionResult(
+        "ERROR", None, "Timed out waiting for a concurrent session refresh"
+    )
+
+
 class EnsureSenasaSessionUseCase:
-    """Orchestrates AFIP→SENASA login, preferring cached session when valid."""
+    """Orchestrates AFIP→SENASA login, preferring cached session when valid.
+
+    Refreshes are single-flight: callers sharing this instance serialize on an
+    in-process lock, and with a ``refresh_lock`` (e.g. the SQLite session store)
+    other workers/processes wait on a lease instead of logging in again. Waiters
+    reuse the cookies the winner saved to the store.
+
+    With a ``validation_cache`` the "already active" hot path skips the SENASA
+    probe entirely while a previous probe of the same cookies is still fresh.
+    """
 
     def __init__(
         self,
@@ -37,70 +156,236 @@ class EnsureSenasaSessionUseCase:
         *,
         ttl_hours: int = 12,
         clock: Clock | None = None,
+        refresh_lock: RefreshLockPort | None = None,
+        lock_ttl_seconds: float = 300.0,
+        lock_wait_seconds: float = 300.0,
+        lock_poll_seconds: float = 0.5,
+        validation_cache: SessionValidationCache | None = None,
     ) -> None:
         self.store = store
         self.provider = provider
         self.consumer = consumer
         self.ttl = timedelta(hours=ttl_hours)
         self.clock = clock or SystemClock()
+        self.refresh_lock = refresh_lock
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self.lock_wait_seconds = lock_wait_seconds
+        self.lock_poll_seconds = lock_poll_seconds
+        self.validation_cache = validation_cache
+        self._inflight = threading.Lock()
+        self._log = get_logger(type(self).__name__)
 
-    def execute(self) -> EnsureSessionResult:
-        cookies, expires_at, is_active = self.store.load()
-        # If we have cookies and not expired, attempt validation probe
-        now = self.clock.now()
-        session_exists = cookies and expires_at and expires_at > now and is_active
-        if session_exists:
+    @correlated("ensure_session")
+    def execute(self, *, force: bool = False) -> EnsureSessionResult:
+        """Ensures a usable SENASA session.
+
+        Args:
+            force (bool, optional): Renew even if the stored session is still valid
+                (proactive renewal). Still single-flight. Defaults to False.
+        """
+        stored = _StoredSession(
+            self.store.load(), self.clock.now(), force=force, cache=self.validation_cache
+        )
+        if stored.reusable:
+            if cached := stored.cached():
+                return cached
             try:
-                if self.consumer.validate_session():
-                    return EnsureSessionResult(
-                        "ALREADY_ACTIVE", expires_at, "Valid session from store"
-                    )
-            except Exception:
-                # ignore and re-login
-                pass
+                self.consumer.restore_session(stored.cookies)
+                valid = self.consumer.validate_session()
+            except Exception as e:
+                self._log.warning("session_probe_failed", error=str(e))
+                valid = False
+            if result := stored.probed(valid):
+                return result
+        return self._refresh(stored.snapshot)
+
+    def _refresh(self, snapshot: SessionSnapshot) -> EnsureSessionResult:
+        """Single-flight refresh: in-process lock first, then the cross-process lease."""
+        with self._inflight:
+            if peer := _peer_refresh(self.store, snapshot, self.clock.now()):
+                return peer
+            if self.refresh_lock is None:
+                return self._login()
+
+            owner = uuid.uuid4().hex
+            deadline = time.monotonic() + self.lock_wait_seconds
+            while not self.refresh_lock.acquire(owner, self.lock_ttl_seconds):
+                if peer := _peer_refresh(self.store, snapshot, self.clock.now()):
+                    return peer
+                if time.monotonic() >= deadline:
+                    return _lock_timeout()
+                time.sleep(self.lock_poll_seconds)
+            try:
+                # El lease pudo liberarse justo después de que otro guardó la sesión
+                if peer := _peer_refresh(self.store, snapshot, self.clock.now()):
+                    return peer
+                return self._login()
+            finally:
+                self.refresh_lock.release(owner)
+
+    def _login(self) -> EnsureSessionResult:
+        now = self.clock.now()
         # Fresh login via AFIP token/sign path
         try:
-            print("Fresh login via AFIP token/sign path")
+            self._log.info("session_login_started", path="afip_token_sign")
             token, sign = self.provider.get_token_sign()
-            print(f"Token: {token}, Sign: {sign}")
             self.consumer.login_with_token_sign(token, sign)
             new_exp = now + self.ttl
-            
+
             # CRITICAL: Post-login validation with retry for timing issues
             # The follow-up needs time to complete before validation works
             validation_success = self._validate_with_retry(max_retries=3, delay=1.0)
-            
+
             if not validation_success:
                 self.store.mark_inactive()
                 return EnsureSessionResult("ERROR", None, "Post-login validation failed after retries")
-            
+
             # Save successful session
             self.store.save(
                 self.consumer.cookies, new_exp
             )
+            if self.validation_cache:
+                self.validation_cache.mark_valid(self.consumer.cookies)
             return EnsureSessionResult(
                 "REFRESHED", new_exp, "Session refreshed via AFIP token/sign"
             )
         except Exception as e:
+            self._log.exception("session_login_failed")
             self.store.mark_inactive()
             return EnsureSessionResult("ERROR", None, f"Login failed: {e}")
-    
+
     def _validate_with_retry(self, max_retries: int = 3, delay: float = 1.0) -> bool:
         """Retry validation to handle timing issues after login follow-up."""
         for attempt in range(max_retries):
             try:
                 if self.consumer.validate_session():
                     return True
-                    
+
                 if attempt < max_retries - 1:  # Don't sleep after last attempt
-                    print(f"[EnsureSenasaSessionUseCase] Validation attempt {attempt + 1} failed, retrying in {delay}s...")
+                    self._log.info("session_validation_retry", attempt=attempt + 1, delay=delay)
                     time.sleep(delay)
                     delay *= 1.5  # Exponential backoff
-                    
+
             except Exception as e:
-                print(f"[EnsureSenasaSessionUseCase] Validation attempt {attempt + 1} exception: {e}")
+                self._log.warning("session_validation_error", attempt=attempt + 1, error=str(e))
                 if attempt < max_retries - 1:
                     time.sleep(delay)
                     delay *= 1.5
-        
+
+        return False
+
+
+class AsyncEnsureSenasaSessionUseCase:
+    """Async variant of EnsureSenasaSessionUseCase.
+
+    Same decision flow, but provider/consumer calls and the post-login retry
+    backoff are awaited, so the event loop keeps serving other requests while
+    the AFIP→SENASA login is in flight. The session store and refresh lease stay
+    synchronous (local SQLite, sub-millisecond calls); waiting on the lease is an
+    ``asyncio.sleep`` poll.
+    """
+
+    def __init__(
+        self,
+        store: SessionStorePort,
+        provider: AsyncAuthProviderPort,
+        consumer: AsyncSenasaLoginPort,
+        *,
+        ttl_hours: int = 12,
+        clock: Clock | None = None,
+        refresh_lock: RefreshLockPort | None = None,
+        lock_ttl_seconds: float = 300.0,
+        lock_wait_seconds: float = 300.0,
+        lock_poll_seconds: float = 0.5,
+        validation_cache: SessionValidationCache | None = None,
+    ) -> None:
+        self.store = store
+        self.provider = provider
+        self.consumer = consumer
+        self.ttl = timedelta(hours=ttl_hours)
+        self.clock = clock or SystemClock()
+        self.refresh_lock = refresh_lock
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self.lock_wait_seconds = lock_wait_seconds
+        self.lock_poll_seconds = lock_poll_seconds
+        self.validation_cache = validation_cache
+        self._inflight = asyncio.Lock()
+        self._log = get_logger(type(self).__name__)
+
+    @correlated("ensure_session")
+    async def execute(self, *, force: bool = False) -> EnsureSessionResult:
+        stored = _StoredSession(
+            self.store.load(), self.clock.now(), force=force, cache=self.validation_cache
+        )
+        if stored.reusable:
+            if cached := stored.cached():
+                return cached
+            try:
+                self.consumer.restore_session(stored.cookies)
+                valid = await self.consumer.validate_session()
+            except Exception as e:
+                self._log.warning("session_probe_failed", error=str(e))
+                valid = False
+            if result := stored.probed(valid):
+                return result
+        return await self._refresh(stored.snapshot)
+
+    async def _refresh(self, snapshot: SessionSnapshot) -> EnsureSessionResult:
+        async with self._inflight:
+            if peer := _peer_refresh(self.store, snapshot, self.clock.now()):
+                return peer
+            if self.refresh_lock is None:
+                return await self._login()
+
+            owner = uuid.uuid4().hex
+            deadline = time.monotonic() + self.lock_wait_seconds
+            while not self.refresh_lock.acquire(owner, self.lock_ttl_seconds):
+                if peer := _peer_refresh(self.store, snapshot, self.clock.now()):
+                    return peer
+                if time.monotonic() >= deadline:
+                    return _lock_timeout()
+                await asyncio.sleep(self.lock_poll_seconds)
+            try:
+                if peer := _peer_refresh(self.store, snapshot, self.clock.now()):
+                    return peer
+                return await self._login()
+            finally:
+                self.refresh_lock.release(owner)
+
+    async def _login(self) -> EnsureSessionResult:
+        now = self.clock.now()
+        try:
+            self._log.info("session_login_started", path="afip_token_sign")
+            token, sign = await self.provider.get_token_sign()
+            await self.consumer.login_with_token_sign(token, sign)
+            new_exp = now + self.ttl
+
+            if not await self._validate_with_retry(max_retries=3, delay=1.0):
+                self.store.mark_inactive()
+                return EnsureSessionResult(
+                    "ERROR", None, "Post-login validation failed after retries"
+                )
+
+            self.store.save(self.consumer.cookies, new_exp)
+            if self.validation_cache:
+                self.validation_cache.mark_valid(self.consumer.cookies)
+            return EnsureSessionResult(
+                "REFRESHED", new_exp, "Session refreshed via AFIP token/sign"
+            )
+        except Exception as e:
+            self._log.exception("session_login_failed")
+            self.store.mark_inactive()
+            return EnsureSessionResult("ERROR", None, f"Login failed: {e}")
+
+    async def _validate_with_retry(self, max_retries: int = 3, delay: float = 1.0) -> bool:
+        """Retry validation to handle timing issues after login follow-up."""
+        for attempt in range(max_retries):
+            try:
+                if await self.consumer.validate_session():
+                    return True
+            except Exception as e:
+                self._log.warning("session_validation_error", attempt=attempt + 1, error=str(e))
+            if attempt < max_retries - 1:
+                await asyncio.sleep(delay)
+                delay *= 1.5
         return False
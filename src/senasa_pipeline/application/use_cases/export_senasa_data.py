@@ -1,14 +1,60 @@
+from collections.abc import Callable, Iterator
+
 from senasa_pipeline.application.dtos.export_request_dto import ExportRequestDTO
-from senasa_pipeline.application.dtos.senasa_record_dto import SenasaRecordDTO
-from senasa_pipeline.application.ports.storage_port import IStoragePort
-from senasa_pipeline.domain.repositories.interfaces import ISenasaRepository
+from senasa_pipeline.application.ports.storage_port import IStoragePort, IStreamingExportPort
+from senasa_pipeline.application.record_batch import SenasaRecordBatch
+from senasa_pipeline.domain.repositories.interfaces import ISenasaRepository, RecordFilter
+from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
+from senasa_pipeline.log import correlated
 
 
 class ExportSenasaDataUseCase:
-    def __init__(self, repo: ISenasaRepository, storage: IStoragePort):
+    """Exports the dataset, streaming rows from the repository in keyset pages.
+
+    Pages are read as SenasaRecordBatch columns and handed to the writers as
+    is, with no record or DTO per row. ``execute`` writes a file through
+    ``storage``; ``stream`` yields the serialized export chunk by chunk
+    through ``streamer`` (e.g. for an HTTP response), so neither holds more
+    than a page of rows in memory. ``on_progress`` receives the number of
+    rows read after every page.
+    """
+
+    def __init__(
+        self,
+        repo: ISenasaRepository,
+        storage: IStoragePort | None = None,
+        *,
+        streamer: IStreamingExportPort | None = None,
+        page_size: int = 5000,
+        on_progress: Callable[[int], None] | None = None,
+    ):
         self.repo = repo
         self.storage = storage
+        self.streamer = streamer
+        self.page_size = max(1, page_size)
+        self.on_progress = on_progress
 
+    @correlated("export")
     def execute(self, req: ExportRequestDTO, path: str) -> str:
-        rows = [SenasaRecordDTO.from_domain(r) for r in self.repo.list(limit=10000, offset=0)]
-        return self.storage.export(rows, req.format, path)
+        if self.storage is None:
+            raise RuntimeError("ExportSenasaDataUseCase sin storage configurado")
+        return self.storage.export(self.iter_batches(req.filters), req.format, path)
+
+    def stream(self, req: ExportRequestDTO) -> Iterator[bytes]:
+        if self.streamer is None:
+            raise RuntimeError("ExportSenasaDataUseCase sin streamer configurado")
+        return self.streamer.stream(self.iter_batches(req.filters), req.format)
+
+    def iter_batches(self, filters: RecordFilter | None = None) -> Iterator[SenasaRecordBatch]:
+        after: CodigoSenasa | None = None
+        rows = 0
+        while True:
+            page = self.repo.list_batch(limit=self.page_size, after=after, filters=filters)
+            if len(page):
+                yield page
+            rows += len(page)
+            if self.on_progress is not None:
+                self.on_progress(rows)
+            if len(page) < self.page_size:
+                return
+            after = CodigoSenasa(page[-1].nro_senasa)
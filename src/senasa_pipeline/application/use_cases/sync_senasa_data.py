@@ -1,36 +1,311 @@
 # adjust imports: recreate services protocol here to avoid circulars
+import contextvars
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date
 from typing import Protocol
 
 from senasa_pipeline.application.dtos.sync_request_dto import SyncRequestDTO
+from senasa_pipeline.application.establecimiento_cache import EstablecimientoCache
+from senasa_pipeline.application.ports.sync_state_port import SyncCheckpoint, SyncStatePort
+from senasa_pipeline.application.record_batch import SenasaRecordBatch
+from senasa_pipeline.application.streaming import batched, prefetch
 from senasa_pipeline.domain.entities.senasa_record import SenasaRecord
 from senasa_pipeline.domain.repositories.interfaces import (
     ISenasaRepository,
 )
+from senasa_pipeline.log import correlated
 
 
 class ISenasaScrapingService(Protocol):
-    def fetch_latest(self, incremental: bool = False) -> list[SenasaRecord]: ...
+    def fetch_latest(
+        self,
+        incremental: bool = False,
+        since: date | None = None,
+        establecimiento: str | None = None,
+    ) -> Iterable[SenasaRecord]:
+        """Records in scrape order; implementations should yield page by page.
+
+        ``since`` is a hint: rows extracted before that date may be skipped.
+        ``establecimiento`` restricts the scrape to one establecimiento (only
+        used by partitioned syncs).
+        """
+        ...
 
 
 class IDataValidationService(Protocol):
     def validate(self, record: SenasaRecord) -> bool: ...
 
 
+@dataclass(frozen=True)
+class BatchValidation:
+    """Per-row outcome of a batch validation, aligned with the input records.
+
+    ``reasons`` holds comma-separated rule codes for rejected rows, None for valid ones.
+    """
+
+    mask: Sequence[bool]
+    reasons: Sequence[str | None]
+
+
+class IBatchValidationService(IDataValidationService, Protocol):
+    def validate_batch(self, records: Sequence[SenasaRecord]) -> BatchValidation: ...
+
+
+@dataclass
+class SyncProgress:
+    """Running counters of a sync, reported after every persisted batch."""
+
+    pages_fetched: int = 0
+    records_fetched: int = 0
+    records_validated: int = 0
+    records_rejected: int = 0
+    records_saved: int = 0
+    # Filas de origen que el scraper no pudo parsear (no llegan a validarse)
+    records_skipped: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
 class SyncSenasaDataUseCase:
+    """Streams scraped records through validation into the repository.
+
+    Scraping runs on a background thread (``prefetch``) at most
+    ``max_pending_batches`` batches ahead of persistence, so memory stays flat
+    and the first batches are saved while later pages are still downloading.
+    Buffered batches are held as Arrow-backed SenasaRecordBatch objects, which
+    validators and repositories can consume column-wise.
+
+    With a ``state`` store, every establecimiento gets a SyncCheckpoint. Each
+    persisted batch only moves its in-progress ``cursor``; the mark is
+    committed when the run (or, partitioned, the partition) completes, so a
+    crashed or cancelled run never marks rows it did not fetch and the next
+    incremental run fetches them again. Incremental runs ask the scraper for
+    rows from the oldest mark date on (``overlap_days`` earlier) and skip rows
+    older than their establecimiento's window; the mark date itself is
+    re-fetched and the repository upsert dedupes it. Establecimientos without
+    a mark are only backfilled by a full or partitioned sync.
+
+    Validators exposing ``validate_batch`` (IBatchValidationService) check each
+    batch in one call; rejection reasons are tallied in ``rejected``.
+
+    With an ``establecimientos`` cache, establecimientos are written through it
+    (only new or changed ones, once per run) and tambores are saved referencing
+    them by código; ``establecimientos_written`` counts those upserts.
+
+    ``on_progress`` receives the SyncProgress counters after every batch; it
+    may raise (e.g. JobCancelledError) to stop the sync between batches, with
+    everything persisted so far kept (but no mark committed).
+
+    A request with ``establecimientos`` runs a partitioned sync: each
+    establecimiento is scraped on its own (``fetch_latest(establecimiento=...)``)
+    and persisted through the same pipeline, up to ``partition_workers``
+    partitions at a time on a thread pool. Every partition resumes from its
+    own checkpoint, so incremental runs also backfill establecimientos that
+    have none yet. Counters, rejections and checkpoints are merged as
+    partitions progress.
+    """
+
     def __init__(
         self,
         scraper: ISenasaScrapingService,
-        validator: IDataValidationService,
+        validator: IDataValidationService | IBatchValidationService,
         repo: ISenasaRepository,
+        *,
+        batch_size: int = 1000,
+        max_pending_batches: int = 4,
+        state: SyncStatePort | None = None,
+        establecimientos: EstablecimientoCache | None = None,
+        on_progress: Callable[[SyncProgress], None] | None = None,
+        partition_workers: int = 1,
+        overlap_days: int = 0,
     ):
         self.scraper = scraper
         self.validator = validator
         self.repo = repo
+        self.batch_size = max(1, batch_size)
+        self.max_pending_batches = max_pending_batches
+        self.state = state
+        self.establecimientos = establecimientos
+        self.rejected: Counter[str] = Counter()
+        self.establecimientos_written = 0
+        self.on_progress = on_progress
+        self.partition_workers = max(1, partition_workers)
+        self.overlap_days = max(0, overlap_days)
+        self.progress = SyncProgress()
+        self._lock = threading.Lock()
+        self._counts_at_start: dict[str, int] = {}
 
+    @correlated("sync")
     def execute(self, req: SyncRequestDTO) -> int:
+        checkpoints = self.state.load() if self.state else {}
+        self._counts_at_start = {
+            name: _scraper_count(self.scraper, name) or 0 for name in _SCRAPER_COUNTS
+        }
+        if req.establecimientos:
+            return self._execute_partitioned(req, checkpoints)
+
+        since = None
+        if req.incremental:
+            marks = (cp.resume_from(self.overlap_days) for cp in checkpoints.values())
+            since = min((d for d in marks if d is not None), default=None)
+        records = self.scraper.fetch_latest(incremental=req.incremental, since=since)
+        count = self._consume(records, checkpoints, req.incremental)
+        # Completo: todo lo extraído desde ``since`` quedó persistido. Sin marca
+        # previa sólo se commitea si se recorrió todo (since=None)
+        self._commit(
+            checkpoints,
+            [k for k, cp in checkpoints.items() if since is None or cp.fecha_extraccion],
+        )
+        return count
+
+    def _execute_partitioned(
+        self, req: SyncRequestDTO, checkpoints: dict[str, SyncCheckpoint]
+    ) -> int:
+        def run(codigo: str) -> int:
+            cp = checkpoints.get(codigo) if req.incremental else None
+            records = self.scraper.fetch_latest(
+                incremental=req.incremental,
+                since=cp.resume_from(self.overlap_days) if cp else None,
+                establecimiento=codigo,
+            )
+            count = self._consume(records, checkpoints, req.incremental)
+            self._commit(checkpoints, [codigo])
+            return count
+
+        partitions = list(dict.fromkeys(req.establecimientos))
+        if self.partition_workers == 1 or len(partitions) == 1:
+            return sum(run(codigo) for codigo in partitions)
+        with ThreadPoolExecutor(
+            min(self.partition_workers, len(partitions)), thread_name_prefix="senasa-sync"
+        ) as pool:
+            # Un contexto por partición: los logs conservan el correlation_id
+            futures = [
+                pool.submit(contextvars.copy_context().run, run, codigo) for codigo in partitions
+            ]
+            try:
+                return sum(f.result() for f in futures)
+            except BaseException:
+                # Las particiones en cola no arrancan; las que corren paran en su próximo lote
+                for f in futures:
+                    f.cancel()
+                raise
+
+    def _consume(
+        self,
+        records: Iterable[SenasaRecord],
+        checkpoints: dict[str, SyncCheckpoint],
+        incremental: bool,
+    ) -> int:
         count = 0
-        for rec in self.scraper.fetch_latest(incremental=req.incremental):
-            if self.validator.validate(rec):
-                self.repo.save(rec)
-                count += 1
+        # Columnarizar en el hilo productor: lo que queda en cola es compacto
+        batches = (
+            SenasaRecordBatch.from_records(chunk) for chunk in batched(records, self.batch_size)
+        )
+        for batch in prefetch(batches, self.max_pending_batches):
+            fetched = len(batch)
+            if incremental and checkpoints:
+                batch = batch.since(self._starts(checkpoints))
+            valid = self._validate(batch)
+            saved = self._save(valid) if valid else 0
+            if valid:
+                self._advance(checkpoints, valid)
+            count += saved
+            with self._lock:
+                self.progress.records_fetched += fetched
+                self.progress.records_validated += len(batch)
+                self.progress.records_rejected += len(batch) - len(valid)
+                self.progress.records_saved += saved
+                self._report()
+        with self._lock:
+            # Filas descartadas después del último lote (p. ej. una página entera)
+            if self._scraper_progress() != self.progress.as_dict():
+                self._report()
         return count
+
+    def _scraper_progress(self) -> dict[str, int]:
+        """Progress with the counters the scraper exposes brought up to date."""
+        progress = self.progress.as_dict()
+        # Los scrapers que cuentan páginas y filas descartadas (SenasaWebScrapingAdapter)
+        for name, field_name in _SCRAPER_COUNTS.items():
+            value = _scraper_count(self.scraper, name)
+            if value is not None:
+                progress[field_name] = value - self._counts_at_start.get(name, 0)
+        return progress
+
+    def _report(self) -> None:
+        if self.on_progress is None:
+            return
+        for name, value in self._scraper_progress().items():
+            setattr(self.progress, name, value)
+        self.on_progress(self.progress)
+
+    def _save(self, batch: SenasaRecordBatch) -> int:
+        if self.establecimientos is None:
+            return self.repo.save_many(batch)
+        written = self.establecimientos.upsert_changed(batch.establecimientos.values())
+        with self._lock:
+            self.establecimientos_written += written
+        return self.repo.save_many(batch.without_establecimientos())
+
+    def _validate(self, batch: SenasaRecordBatch) -> SenasaRecordBatch:
+        validate_batch = getattr(self.validator, "validate_batch", None)
+        if validate_batch is None:
+            return batch.filter([self.validator.validate(rec.to_record()) for rec in batch])
+        result: BatchValidation = validate_batch(batch)
+        rejected = Counter(
+            code for reasons in result.reasons if reasons for code in reasons.split(",")
+        )
+        if rejected:
+            with self._lock:
+                self.rejected.update(rejected)
+        return batch.filter(result.mask)
+
+    def _advance(self, checkpoints: dict[str, SyncCheckpoint], saved: SenasaRecordBatch) -> None:
+        """Moves the in-progress cursors to the newest row saved per establecimiento."""
+        if self.state is None:
+            return
+        newest = saved.newest_by_establecimiento()
+        with self._lock:
+            changed = {}
+            for key, fecha in newest.items():
+                current = checkpoints.get(key) or SyncCheckpoint()
+                moved = current.advance(fecha)
+                if moved is not current:
+                    changed[key] = moved
+            if changed:
+                self.state.save(changed)
+                checkpoints.update(changed)
+
+    def _commit(self, checkpoints: dict[str, SyncCheckpoint], codigos: Iterable[str]) -> None:
+        """Promotes the cursors of ``codigos`` to marks once their run completed."""
+        if self.state is None:
+            return
+        with self._lock:
+            committed = {
+                k: checkpoints[k].commit()
+                for k in codigos
+                if k in checkpoints and checkpoints[k].cursor is not None
+            }
+            if committed:
+                self.state.save(committed)
+                checkpoints.update(committed)
+
+    def _starts(self, checkpoints: dict[str, SyncCheckpoint]) -> dict[str, date]:
+        """First fecha_extraccion each establecimiento still needs in an incremental run."""
+        with self._lock:
+            starts = {k: cp.resume_from(self.overlap_days) for k, cp in checkpoints.items()}
+        return {k: d for k, d in starts.items() if d is not None}
+
+
+# Contador del scraper -> campo de SyncProgress
+_SCRAPER_COUNTS = {"pages_fetched": "pages_fetched", "rows_skipped": "records_skipped"}
+
+
+def _scraper_count(scraper: ISenasaScrapingService, name: str) -> int | None:
+    value = getattr(scraper, name, None)
+    return value if isinstance(value, int) else None
@@ -9,12 +9,59 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 @dataclass(frozen=True)
 class Settings:
     afip_cuit: str = os.getenv("AFIP_CUIT", "")
     afip_password: str = os.getenv("AFIP_PASSWORD", "")
     http_timeout: float = float(os.getenv("HTTP_TIMEOUT", "45"))
+    http_max_connections: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+    http_max_keepalive_connections: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    http_keepalive_expiry: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    http2: bool = _env_bool("HTTP2", False)
     session_ttl_hours: int = int(os.getenv("SESSION_TTL_HOURS", "12"))
+    session_refresh_lock_seconds: float = float(os.getenv("SESSION_REFRESH_LOCK_SECONDS", "300"))
+    session_validation_ttl_seconds: float = float(os.getenv("SESSION_VALIDATION_TTL_SECONDS", "60"))
+    session_renewal_enabled: bool = _env_bool("SESSION_RENEWAL_ENABLED", True)
+    session_renew_fraction: float = float(os.getenv("SESSION_RENEW_FRACTION", "0.8"))
+    session_renew_jitter_fraction: float = float(os.getenv("SESSION_RENEW_JITTER_FRACTION", "0.05"))
+    session_renew_max_failures: int = int(os.getenv("SESSION_RENEW_MAX_FAILURES", "10"))
+    session_db_path: str = os.getenv("SESSION_DB_PATH", ".senasa_auth.sqlite")
+    sync_state_db_path: str = os.getenv("SYNC_STATE_DB_PATH", ".senasa_sync_state.sqlite")
+    scraper_concurrency: int = int(os.getenv("SCRAPER_CONCURRENCY", "4"))
+    scraper_requests_per_second: float = float(os.getenv("SCRAPER_REQUESTS_PER_SECOND", "5"))
+    scraper_mode: str = os.getenv("SCRAPER_MODE", "auto")
+    scraper_download_dir: str = os.getenv("SCRAPER_DOWNLOAD_DIR", "")
+    scraper_export_control: str = os.getenv("SCRAPER_EXPORT_CONTROL", "")
+    scraper_filter_field: str = os.getenv("SCRAPER_FILTER_FIELD", "")
+    duckdb_path: str = os.getenv("DUCKDB_PATH", "senasa.duckdb")
+    sync_batch_size: int = int(os.getenv("SYNC_BATCH_SIZE", "1000"))
+    sync_prefetch_batches: int = int(os.getenv("SYNC_PREFETCH_BATCHES", "4"))
+    sync_partition_workers: int = int(os.getenv("SYNC_PARTITION_WORKERS", "4"))
+    sync_overlap_days: int = int(os.getenv("SYNC_OVERLAP_DAYS", "0"))
+    validation_max_peso_kg: float = float(os.getenv("VALIDATION_MAX_PESO_KG", "400"))
+    establecimiento_cache_size: int = int(os.getenv("ESTABLECIMIENTO_CACHE_SIZE", "10000"))
+    export_page_size: int = int(os.getenv("EXPORT_PAGE_SIZE", "5000"))
+    export_row_group_size: int = int(os.getenv("EXPORT_ROW_GROUP_SIZE", "65536"))
+    export_parquet_compression: str = os.getenv("EXPORT_PARQUET_COMPRESSION", "zstd")
+    export_dir: str = os.getenv("EXPORT_DIR", "exports")
+    celery_broker_url: str = os.getenv("CELERY_BROKER_URL", "")
+    celery_result_backend: str = os.getenv("CELERY_RESULT_BACKEND", "")
+    job_workers: int = int(os.getenv("JOB_WORKERS", "1"))
+    # Vacío: DuckDB en DUCKDB_PATH (ver infrastructure.repositories.factory)
+    database_url: str = os.getenv("DATABASE_URL", "")
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_batch_size: int = int(os.getenv("DB_BATCH_SIZE", "1000"))
+    db_statement_cache_size: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
+    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    log_format: str = os.getenv("LOG_FORMAT", "console")
 
 
 settings = Settings()
@@ -1,17 +1,70 @@
-from collections.abc import Sequence
-from typing import Protocol
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Protocol
 
 from senasa_pipeline.domain.entities.establecimiento import Establecimiento
 from senasa_pipeline.domain.entities.senasa_record import SenasaRecord
 from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
 
+if TYPE_CHECKING:
+    from senasa_pipeline.application.record_batch import SenasaRecordBatch
+
+
+@dataclass(frozen=True)
+class RecordFilter:
+    """Tambor filters pushed down to the repository query (None = no filter).
+
+    ``fecha_desde``/``fecha_hasta`` bound ``fecha_extraccion`` inclusively.
+    """
+
+    establecimiento: str | None = None
+    productor: str | None = None
+    tipo_miel: str | None = None
+    fecha_desde: date | None = None
+    fecha_hasta: date | None = None
+
 
 class ISenasaRepository(Protocol):
     def save(self, record: SenasaRecord) -> None: ...
+    def save_many(self, records: Sequence[SenasaRecord] | SenasaRecordBatch) -> int:
+        """Upserts records by nro_senasa; a SenasaRecordBatch is read column-wise."""
+        ...
+
     def get_by_nro(self, nro_senasa: CodigoSenasa) -> SenasaRecord | None: ...
-    def list(self, limit: int = 100, offset: int = 0) -> Sequence[SenasaRecord]: ...
+    def list(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        after: CodigoSenasa | None = None,
+        filters: RecordFilter | None = None,
+    ) -> Sequence[SenasaRecord]:
+        """Records ordered by nro_senasa; ``after`` enables keyset pagination."""
+        ...
+
+    def list_batch(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        after: CodigoSenasa | None = None,
+        filters: RecordFilter | None = None,
+    ) -> SenasaRecordBatch:
+        """Tambores of ``list`` as Arrow columns, without building records or establecimientos."""
+        ...
+
+    def count(self, filters: RecordFilter | None = None) -> int:
+        """Number of tambores matching ``filters``."""
+        ...
 
 
 class IEstablecimientoRepository(Protocol):
     def upsert(self, est: Establecimiento) -> None: ...
+    def upsert_many(self, ests: Sequence[Establecimiento]) -> int: ...
     def get(self, codigo: CodigoSenasa) -> Establecimiento | None: ...
+    def get_many(self, codigos: Iterable[str]) -> dict[str, Establecimiento]:
+        """Establecimientos found among ``codigos``, keyed by código (missing ones omitted)."""
+        ...
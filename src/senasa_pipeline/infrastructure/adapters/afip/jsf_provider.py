@@ -2,10 +2,9 @@ from __future__ import annotations
 
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup  # type: ignore[import-untyped]
-
 from senasa_pipeline.application.ports.auth_provider_port import AuthProviderPort
 from senasa_pipeline.application.ports.http_client_port import HttpClientPort
+from senasa_pipeline.infrastructure.adapters.html.forms import extract_forms
 
 AFIP_BASE = "https://auth.afip.gob.ar"
 AFIP_LOGIN_URL = f"{AFIP_BASE}/contribuyente_/login.xhtml?action=SYSTEM&system=senasa_traapi"
@@ -43,13 +42,13 @@ class JSFProvider(AuthProviderPort):
                 "Sec-Fetch-User": "?1",
             },
         )
-        soup = BeautifulSoup(resp.text, "html.parser")
-        view_state_input = soup.find("input", {"name": "javax.faces.ViewState"})
-        form_f1 = soup.find("form", {"id": "F1"})
-        if not view_state_input or not form_f1 or not form_f1.get("action"):
+        page = extract_forms(resp.text)
+        view_state = page.inputs.get("javax.faces.ViewState")
+        form_f1 = page.form(id="F1")
+        if view_state is None or not form_f1 or not form_f1.action:
             raise RuntimeError("AFIP JSF: no se pudo extraer ViewState/action inicial")
-        action_url = urljoin(AFIP_LOGIN_URL, form_f1["action"])
-        return view_state_input.get("value", ""), action_url
+        action_url = urljoin(AFIP_LOGIN_URL, form_f1.action)
+        return view_state, action_url
 
     def _post_cuit(self, view_state_cuit: str, action_url: str) -> tuple[str, str]:
         payload = {
@@ -64,13 +63,13 @@ class JSFProvider(AuthProviderPort):
             "Content-Type": "application/x-www-form-urlencoded",
         }
         resp = self.http.post(action_url, data=payload, headers=headers)
-        soup = BeautifulSoup(resp.text, "html.parser")
-        view_state_pwd = soup.find("input", {"name": "javax.faces.ViewState"})
-        form_f1 = soup.find("form", {"id": "F1"})
-        if not view_state_pwd or not form_f1 or not form_f1.get("action"):
+        page = extract_forms(resp.text)
+        view_state_pwd = page.inputs.get("javax.faces.ViewState")
+        form_f1 = page.form(id="F1")
+        if view_state_pwd is None or not form_f1 or not form_f1.action:
             raise RuntimeError("AFIP JSF: no se pudo extraer ViewState/action de contraseña")
-        action_pwd = urljoin(action_url, form_f1["action"])
-        return view_state_pwd.get("value", ""), action_pwd
+        action_pwd = urljoin(action_url, form_f1.action)
+        return view_state_pwd, action_pwd
 
     def _post_password(
         self, view_state_pwd: str, action_url: str, *, referer: str
@@ -89,13 +88,10 @@ class JSFProvider(AuthProviderPort):
             "Content-Type": "application/x-www-form-urlencoded",
         }
         resp = self.http.post(action_url, data=payload, headers=headers)
-        soup = BeautifulSoup(resp.text, "html.parser")
-        form = soup.find("form", {"name": "myform"}) or soup.find("form")
+        page = extract_forms(resp.text)
+        form = page.form(name="myform") or page.form()
         if not form:
             return "", "", ""
-        magyp_action = form.get("action")
-        token_inp = form.find("input", {"name": "token"})
-        sign_inp = form.find("input", {"name": "sign"})
-        token = token_inp.get("value", "") if token_inp else ""
-        sign = sign_inp.get("value", "") if sign_inp else ""
-        return token, sign, magyp_action
+        token = form.fields.get("token", "")
+        sign = form.fields.get("sign", "")
+        return token, sign, form.action
@@ -1,100 +1,84 @@
 from __future__ import annotations
 
+import time
+from typing import Any
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup  # type: ignore[import-untyped]
-
 from senasa_pipeline.application.ports.afip_token_provider_port import AfipTokenProviderPort
-from senasa_pipeline.application.ports.http_client_port import HttpClientPort
+from senasa_pipeline.application.ports.http_client_port import (
+    AsyncHttpClientPort,
+    HttpClientPort,
+    HttpResponse,
+)
+from senasa_pipeline.infrastructure import metrics
+from senasa_pipeline.infrastructure.adapters.html.forms import extract_forms
+from senasa_pipeline.log import get_logger
 
 AFIP_BASE_URL = "https://auth.afip.gob.ar"
 AFIP_LOGIN_URL = f"{AFIP_BASE_URL}/contribuyente_/login.xhtml?action=SYSTEM&system=senasa_traapi"
 PORTAL_CF_BASE = "https://portalcf.cloud.afip.gob.ar"
 
-
-class UnifiedAfipProvider(AfipTokenProviderPort):
-    """Obtiene token/sign de AFIP usando JSF primero, fallback a Portal CF.
-
-    1. AFIP JSF: CUIT → password → extraer token/sign de myform
-    2. Si no hay token/sign, Portal CF: /portal/app → /api/servicios → /api/autorizacion
-
-    Comparte HttpClientPort con SenasaLoginConsumer para mantener sesión unificada.
+_INITIAL_PAGE_HEADERS = {
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "cross-site",
+    "Sec-Fetch-User": "?1",
+}
+_PORTAL_APP_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+}
+_PORTAL_JSON_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "Referer": f"{PORTAL_CF_BASE}/portal/app/",
+    "X-Requested-With": "XMLHttpRequest",
+}
+_PORTAL_JSON_RETRY_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "Referer": f"{PORTAL_CF_BASE}/portal/app/",
+}
+
+
+class _UnifiedAfipFlow:
+    """Parsing y payloads del login AFIP compartidos por las variantes sync y async.
+
+    Las subclases sólo implementan la E/S HTTP de cada paso.
     """
 
-    def __init__(self, http: HttpClientPort, *, cuit: str, password: str) -> None:
-        self.http = http
+    def __init__(self, *, cuit: str, password: str) -> None:
         self.cuit = cuit
         self.password = password
+        self._log = get_logger(type(self).__name__)
 
-    def _log(self, msg: str) -> None:
-        print(f"[UnifiedAfipProvider] {msg}")
+    # ---------- AFIP JSF ----------
+    @staticmethod
+    def _parse_f1_form(html: str, base_url: str, error: str) -> tuple[str, str]:
+        """Extrae ViewState y action absoluta del form F1."""
+        page = extract_forms(html)
+        view_state = page.inputs.get("javax.faces.ViewState")
+        form_f1 = page.form(id="F1")
 
-    # ---------- AFIP JSF Login ----------
-    def _get_initial_afip_cuit_page(self) -> tuple[str, str]:
-        """GET inicial a AFIP JSF para extraer ViewState y action.
-        
-        Returns:
-            tuple[str, str]: ViewState y action URL.
-        """
-        resp = self.http.get(
-            AFIP_LOGIN_URL,
-            headers={
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "cross-site",
-                "Sec-Fetch-User": "?1",
-            },
-        )
-
-        soup = BeautifulSoup(resp.text, "html.parser")
-        view_state_input = soup.find("input", {"name": "javax.faces.ViewState"})
-        form_f1 = soup.find("form", {"id": "F1"})
+        if view_state is None or not form_f1 or not form_f1.action:
+            raise RuntimeError(error)
 
-        if not view_state_input or not form_f1 or not form_f1.get("action"):
-            raise RuntimeError("AFIP JSF: No se pudo extraer ViewState o action inicial")
+        return view_state, urljoin(base_url, form_f1.action)
 
-        action_url = urljoin(AFIP_LOGIN_URL, form_f1["action"])
-        return view_state_input.get("value", ""), action_url
-
-    def _post_cuit(self, view_state_cuit: str, action_url: str) -> tuple[str, str]:
-        """POST CUIT a AFIP JSF para obtener nuevo ViewState y action.
-        
-        Args:
-            view_state_cuit (str): ViewState inicial.
-            action_url (str): URL de action inicial.
-        
-        Returns:
-            tuple[str, str]: Nuevo ViewState y action URL.
-        """
+    def _cuit_request(self, view_state_cuit: str) -> tuple[dict[str, str], dict[str, str]]:
         payload = {
             "F1": "F1",
             "F1:username": self.cuit,
             "F1:btnSiguiente": "Siguiente",
             "javax.faces.ViewState": view_state_cuit,
         }
-
         headers = {
             "Referer": AFIP_LOGIN_URL,
             "Origin": AFIP_BASE_URL,
             "Content-Type": "application/x-www-form-urlencoded",
         }
+        return payload, headers
 
-        resp = self.http.post(action_url, data=payload, headers=headers)
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        view_state_pwd = soup.find("input", {"name": "javax.faces.ViewState"})
-        form_f1 = soup.find("form", {"id": "F1"})
-
-        if not view_state_pwd or not form_f1 or not form_f1.get("action"):
-            raise RuntimeError("AFIP JSF: No se pudo extraer ViewState o action de password")
-
-        action_pwd = urljoin(action_url, form_f1["action"])
-        return view_state_pwd.get("value", ""), action_pwd
-
-    def _post_password(
-        self, view_state_pwd: str, action_url: str, *, referer: str
-    ) -> tuple[str, str, str]:
-        """POST password a AFIP JSF, intenta extraer token/sign de myform."""
+    def _password_request(
+        self, view_state_pwd: str, referer: str
+    ) -> tuple[dict[str, str], dict[str, str]]:
         payload = {
             "F1": "F1",
             "F1:captcha": "",
@@ -103,146 +87,162 @@ class UnifiedAfipProvider(AfipTokenProviderPort):
             "F1:btnIngresar": "Ingresar",
             "javax.faces.ViewState": view_state_pwd,
         }
-
         headers = {
             "Referer": referer,
             "Origin": AFIP_BASE_URL,
             "Content-Type": "application/x-www-form-urlencoded",
         }
+        return payload, headers
 
-        resp = self.http.post(action_url, data=payload, headers=headers)
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        # Buscar form myform con token/sign
-        form = soup.find("form", {"name": "myform"}) or soup.find("form")
+    @staticmethod
+    def _parse_token_sign_form(html: str) -> tuple[str, str, str]:
+        """Busca form myform con token/sign. Devuelve (action, token, sign) o vacíos."""
+        page = extract_forms(html)
+        form = page.form(name="myform") or page.form()
         if not form:
             return "", "", ""
 
-        magyp_action = form.get("action")
-        token_input = form.find("input", {"name": "token"})
-        sign_input = form.find("input", {"name": "sign"})
+        token = form.fields.get("token", "")
+        sign = form.fields.get("sign", "")
+        if not form.action or not token or not sign:
+            return "", "", ""
+
+        return form.action, token, sign
+
+    # ---------- Portal CF ----------
+    def _service_info_url(self) -> str:
+        return f"{PORTAL_CF_BASE}/portal/api/servicios/{self.cuit}/servicio/senasa_traapi"
+
+    def _authorization_url(self) -> str:
+        return f"{self._service_info_url()}/autorizacion"
 
+    @staticmethod
+    def _json_or_none(resp: HttpResponse) -> Any:
+        try:
+            return resp.json()
+        except Exception:
+            return None
+
+    @staticmethod
+    def _check_service_info(service_info: dict[str, Any]) -> None:
         if (
-            not magyp_action
-            or not token_input
-            or not token_input.get("value")
-            or not sign_input
-            or not sign_input.get("value")
+            not service_info
+            or service_info.get("servicio", {}).get("serviceName") != "senasa_traapi"
         ):
-            return "", "", ""
+            raise RuntimeError("Portal CF: servicio senasa_traapi no disponible para el CUIT")
 
-        return magyp_action, token_input.get("value", ""), sign_input.get("value", "")
+    @staticmethod
+    def _extract_authorization(data: Any) -> tuple[str, str]:
+        if not data or "token" not in data or "sign" not in data:
+            raise RuntimeError("Portal CF: no se obtuvo token/sign de autorización para SENASA")
+        return data["token"], data["sign"]
+
+
+class UnifiedAfipProvider(_UnifiedAfipFlow, AfipTokenProviderPort):
+    """Obtiene token/sign de AFIP usando JSF primero, fallback a Portal CF.
+
+    1. AFIP JSF: CUIT → password → extraer token/sign de myform
+    2. Si no hay token/sign, Portal CF: /portal/app → /api/servicios → /api/autorizacion
+
+    Comparte HttpClientPort con SenasaLoginConsumer para mantener sesión unificada.
+    """
+
+    def __init__(self, http: HttpClientPort, *, cuit: str, password: str) -> None:
+        super().__init__(cuit=cuit, password=password)
+        self.http = http
+
+    # ---------- AFIP JSF Login ----------
+    def _get_initial_afip_cuit_page(self) -> tuple[str, str]:
+        """GET inicial a AFIP JSF para extraer ViewState y action.
 
-    # ---------- Portal CF Fallback ----------
-    def _portal_open_app(self) -> None:
-        """Abre Portal CF /app para inicializar sesión.
-        
-        Args:
-            None
-        
         Returns:
-            None
+            tuple[str, str]: ViewState y action URL.
         """
-        self.http.get(
-            f"{PORTAL_CF_BASE}/portal/app/",
-            headers={
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            },
+        resp = self.http.get(AFIP_LOGIN_URL, headers=_INITIAL_PAGE_HEADERS)
+        metrics.observe_http(resp, "AFIP-JSF-login-page")
+        return self._parse_f1_form(
+            resp.text, AFIP_LOGIN_URL, "AFIP JSF: No se pudo extraer ViewState o action inicial"
         )
 
-    def _portal_get_service_info(self) -> dict[str, object]:
-        """GET servicio info con reintentos si no hay JSON directo.
-        
+    def _post_cuit(self, view_state_cuit: str, action_url: str) -> tuple[str, str]:
+        """POST CUIT a AFIP JSF para obtener nuevo ViewState y action.
+
         Args:
-            None
-        
+            view_state_cuit (str): ViewState inicial.
+            action_url (str): URL de action inicial.
+
         Returns:
-            dict[str, object]: Servicio info.
+            tuple[str, str]: Nuevo ViewState y action URL.
         """
-        url = f"{PORTAL_CF_BASE}/portal/api/servicios/{self.cuit}/servicio/senasa_traapi"
-
-        resp = self.http.get(
-            url,
-            headers={
-                "Accept": "application/json, text/plain, */*",
-                "Referer": f"{PORTAL_CF_BASE}/portal/app/",
-                "X-Requested-With": "XMLHttpRequest",
-            },
+        payload, headers = self._cuit_request(view_state_cuit)
+        resp = self.http.post(action_url, data=payload, headers=headers)
+        metrics.observe_http(resp, "AFIP-JSF-POST-cuit")
+        return self._parse_f1_form(
+            resp.text, action_url, "AFIP JSF: No se pudo extraer ViewState o action de password"
         )
 
-        try:
-            return resp.json()
-        except Exception:
+    def _post_password(
+        self, view_state_pwd: str, action_url: str, *, referer: str
+    ) -> tuple[str, str, str]:
+        """POST password a AFIP JSF, intenta extraer token/sign de myform."""
+        payload, headers = self._password_request(view_state_pwd, referer)
+        resp = self.http.post(action_url, data=payload, headers=headers)
+        metrics.observe_http(resp, "AFIP-JSF-POST-password")
+        return self._parse_token_sign_form(resp.text)
+
+    # ---------- Portal CF Fallback ----------
+    def _portal_open_app(self) -> None:
+        """Abre Portal CF /app para inicializar sesión."""
+        resp = self.http.get(f"{PORTAL_CF_BASE}/portal/app/", headers=_PORTAL_APP_HEADERS)
+        metrics.observe_http(resp, "PortalCF-app")
+
+    def _portal_get_service_info(self) -> dict[str, Any]:
+        """GET servicio info con reintentos si no hay JSON directo.
+
+        Returns:
+            dict[str, Any]: Servicio info.
+        """
+        url = self._service_info_url()
+        resp = self.http.get(url, headers=_PORTAL_JSON_HEADERS)
+        metrics.observe_http(resp, "PortalCF-service-info")
+        data = self._json_or_none(resp)
+        if data is None:
             # Reintento tras navegar a /portal/app y /portal/servicios
             self.http.get(f"{PORTAL_CF_BASE}/portal/app/")
             self.http.get(f"{PORTAL_CF_BASE}/portal/servicios")
-
-            resp2 = self.http.get(
-                url,
-                headers={
-                    "Accept": "application/json, text/plain, */*",
-                    "Referer": f"{PORTAL_CF_BASE}/portal/app/",
-                },
-            )
-
-            try:
-                return resp2.json()
-            except Exception:
-                return {}
+            resp = self.http.get(url, headers=_PORTAL_JSON_RETRY_HEADERS)
+            metrics.observe_http(resp, "PortalCF-service-info")
+            data = self._json_or_none(resp)
+        return data or {}
 
     def _portal_get_authorization(self) -> tuple[str, str]:
         """GET token/sign de autorización con reintentos.
-        
-        Args:
-            None
-        
+
         Returns:
             tuple[str, str]: Token y sign.
         """
-        url = (
-            f"{PORTAL_CF_BASE}/portal/api/servicios/{self.cuit}/servicio/senasa_traapi/autorizacion"
-        )
-
-        resp = self.http.get(
-            url,
-            headers={
-                "Accept": "application/json, text/plain, */*",
-                "Referer": f"{PORTAL_CF_BASE}/portal/app/",
-                "X-Requested-With": "XMLHttpRequest",
-            },
-        )
-
+        url = self._authorization_url()
+        resp = self.http.get(url, headers=_PORTAL_JSON_HEADERS)
+        metrics.observe_http(resp, "PortalCF-authorization")
         try:
             data = resp.json()
         except Exception:
             # Reintento tras /portal/servicios
             self.http.get(f"{PORTAL_CF_BASE}/portal/servicios")
-
-            resp2 = self.http.get(
-                url,
-                headers={
-                    "Accept": "application/json, text/plain, */*",
-                    "Referer": f"{PORTAL_CF_BASE}/portal/app/",
-                },
-            )
-            data = resp2.json()
-
-        if not data or "token" not in data or "sign" not in data:
-            raise RuntimeError("Portal CF: no se obtuvo token/sign de autorización para SENASA")
-
-        return data["token"], data["sign"]
+            resp = self.http.get(url, headers=_PORTAL_JSON_RETRY_HEADERS)
+            metrics.observe_http(resp, "PortalCF-authorization")
+            data = resp.json()
+        return self._extract_authorization(data)
 
     # ---------- API del puerto ----------
     def get_token_sign(self) -> tuple[str, str]:
         """Obtiene token/sign: AFIP JSF primero, fallback a Portal CF.
-        
-        Args:
-            None
-        
+
         Returns:
             tuple[str, str]: Token y sign.
         """
-        self._log("Starting AFIP JSF login")
+        self._log.info("afip_login_started", stage="afip_jsf")
+        started = time.perf_counter()
 
         try:
             # Flujo AFIP JSF
@@ -253,27 +253,125 @@ class UnifiedAfipProvider(AfipTokenProviderPort):
             )
 
             if token_afip and sign_afip:
-                self._log("AFIP JSF login successful, got token/sign")
+                self._log.info("afip_login_succeeded", stage="afip_jsf")
+                metrics.observe_login("afip_jsf", "success", started)
                 return token_afip, sign_afip
 
-            self._log("AFIP JSF: no token/sign in response, falling back to Portal CF")
+            self._log.warning("afip_login_fallback", stage="afip_jsf", reason="no_token")
+            metrics.observe_login("afip_jsf", "no_token", started)
 
         except Exception as e:
-            self._log(f"AFIP JSF failed: {e}, falling back to Portal CF")
+            self._log.warning("afip_login_fallback", stage="afip_jsf", reason="error", error=str(e))
+            metrics.observe_login("afip_jsf", "failure", started)
 
         # Fallback a Portal CF
-        self._log("Starting Portal CF fallback")
+        self._log.info("afip_login_started", stage="afip_portal_cf")
+        started = time.perf_counter()
+        try:
+            self._portal_open_app()
+            service_info = self._portal_get_service_info()
+            self._check_service_info(service_info)
+            self._log.debug("portal_cf_service_info", service_info=service_info)
+            token, sign = self._portal_get_authorization()
+        except Exception:
+            metrics.observe_login("afip_portal_cf", "failure", started)
+            raise
+        metrics.observe_login("afip_portal_cf", "success", started)
+        self._log.info("afip_login_succeeded", stage="afip_portal_cf")
 
-        self._portal_open_app()
-        service_info = self._portal_get_service_info()
+        return token, sign
 
-        if (
-            not service_info
-            or service_info.get("servicio", {}).get("serviceName") != "senasa_traapi"
-        ):
-            raise RuntimeError("Portal CF: servicio senasa_traapi no disponible para el CUIT")
-        self._log(f"Portal CF fallback successful {service_info}, got token/sign")
-        token, sign = self._portal_get_authorization()
-        self._log("Portal CF fallback successful, got token/sign")
 
+class AsyncUnifiedAfipProvider(_UnifiedAfipFlow):
+    """Variante async de UnifiedAfipProvider sobre AsyncHttpClientPort.
+
+    Mismo flujo (JSF primero, fallback a Portal CF) sin bloquear el event loop,
+    para que la API atienda otras requests mientras el login está en curso.
+    """
+
+    def __init__(self, http: AsyncHttpClientPort, *, cuit: str, password: str) -> None:
+        super().__init__(cuit=cuit, password=password)
+        self.http = http
+
+    async def _jsf_token_sign(self) -> tuple[str, str]:
+        resp = await self.http.get(AFIP_LOGIN_URL, headers=_INITIAL_PAGE_HEADERS)
+        metrics.observe_http(resp, "AFIP-JSF-login-page")
+        view_state_cuit, action_url_cuit = self._parse_f1_form(
+            resp.text, AFIP_LOGIN_URL, "AFIP JSF: No se pudo extraer ViewState o action inicial"
+        )
+
+        payload, headers = self._cuit_request(view_state_cuit)
+        resp = await self.http.post(action_url_cuit, data=payload, headers=headers)
+        metrics.observe_http(resp, "AFIP-JSF-POST-cuit")
+        view_state_pwd, action_url_pwd = self._parse_f1_form(
+            resp.text,
+            action_url_cuit,
+            "AFIP JSF: No se pudo extraer ViewState o action de password",
+        )
+
+        payload, headers = self._password_request(view_state_pwd, action_url_cuit)
+        resp = await self.http.post(action_url_pwd, data=payload, headers=headers)
+        metrics.observe_http(resp, "AFIP-JSF-POST-password")
+        _, token, sign = self._parse_token_sign_form(resp.text)
+        return token, sign
+
+    async def _portal_get_service_info(self) -> dict[str, Any]:
+        url = self._service_info_url()
+        resp = await self.http.get(url, headers=_PORTAL_JSON_HEADERS)
+        metrics.observe_http(resp, "PortalCF-service-info")
+        data = self._json_or_none(resp)
+        if data is None:
+            await self.http.get(f"{PORTAL_CF_BASE}/portal/app/")
+            await self.http.get(f"{PORTAL_CF_BASE}/portal/servicios")
+            resp = await self.http.get(url, headers=_PORTAL_JSON_RETRY_HEADERS)
+            metrics.observe_http(resp, "PortalCF-service-info")
+            data = self._json_or_none(resp)
+        return data or {}
+
+    async def _portal_get_authorization(self) -> tuple[str, str]:
+        url = self._authorization_url()
+        resp = await self.http.get(url, headers=_PORTAL_JSON_HEADERS)
+        metrics.observe_http(resp, "PortalCF-authorization")
+        try:
+            data = resp.json()
+        except Exception:
+            await self.http.get(f"{PORTAL_CF_BASE}/portal/servicios")
+            resp = await self.http.get(url, headers=_PORTAL_JSON_RETRY_HEADERS)
+            metrics.observe_http(resp, "PortalCF-authorization")
+            data = resp.json()
+        return self._extract_authorization(data)
+
+    async def get_token_sign(self) -> tuple[str, str]:
+        """Obtiene token/sign: AFIP JSF primero, fallback a Portal CF.
+
+        Returns:
+            tuple[str, str]: Token y sign.
+        """
+        self._log.info("afip_login_started", stage="afip_jsf")
+        started = time.perf_counter()
+        try:
+            token, sign = await self._jsf_token_sign()
+            if token and sign:
+                self._log.info("afip_login_succeeded", stage="afip_jsf")
+                metrics.observe_login("afip_jsf", "success", started)
+                return token, sign
+            self._log.warning("afip_login_fallback", stage="afip_jsf", reason="no_token")
+            metrics.observe_login("afip_jsf", "no_token", started)
+        except Exception as e:
+            self._log.warning("afip_login_fallback", stage="afip_jsf", reason="error", error=str(e))
+            metrics.observe_login("afip_jsf", "failure", started)
+
+        self._log.info("afip_login_started", stage="afip_portal_cf")
+        started = time.perf_counter()
+        try:
+            resp = await self.http.get(f"{PORTAL_CF_BASE}/portal/app/", headers=_PORTAL_APP_HEADERS)
+            metrics.observe_http(resp, "PortalCF-app")
+            service_info = await self._portal_get_service_info()
+            self._check_service_info(service_info)
+            token, sign = await self._portal_get_authorization()
+        except Exception:
+            metrics.observe_login("afip_portal_cf", "failure", started)
+            raise
+        metrics.observe_login("afip_portal_cf", "success", started)
+        self._log.info("afip_login_succeeded", stage="afip_portal_cf")
         return token, sign
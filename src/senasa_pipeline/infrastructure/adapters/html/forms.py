@@ -0,0 +1,99 @@
+"""Targeted form extraction for the AFIP/SENASA login flows, backed by lxml.
+
+The login steps only need a couple of values per page (``javax.faces.ViewState``,
+``token``/``sign``, ASP.NET hidden fields, a form action). Parsing with lxml's C
+parser once per response and reading those nodes directly replaces several
+``BeautifulSoup(..., "html.parser")`` trees per page.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from lxml import etree
+from lxml import html as lxml_html
+
+HtmlElement = lxml_html.HtmlElement
+
+
+@dataclass(frozen=True)
+class HtmlForm:
+    """A ``<form>``: identifiers, raw action and named ``<input>`` values."""
+
+    action: str = ""
+    id: str | None = None
+    name: str | None = None
+    fields: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class FormPage:
+    """Forms and inputs of one HTML response, parsed once.
+
+    ``inputs`` holds every named input in the document, also those outside any
+    form, for lookups (first occurrence wins). ``hidden`` and ``HtmlForm.fields``
+    are postback payloads, so a repeated name keeps its last value as in a
+    submitted form. The lxml tree is kept in ``doc`` for the rare lookups that
+    need more than forms.
+    """
+
+    forms: list[HtmlForm] = field(default_factory=list)
+    inputs: dict[str, str] = field(default_factory=dict)
+    hidden: dict[str, str] = field(default_factory=dict)
+    doc: HtmlElement | None = None
+
+    def form(self, *, id: str | None = None, name: str | None = None) -> HtmlForm | None:
+        """First form matching ``id``/``name`` (any form if neither is given)."""
+        for form in self.forms:
+            if (id is None or form.id == id) and (name is None or form.name == name):
+                return form
+        return None
+
+
+def parse_document(text: str) -> HtmlElement | None:
+    """Parses HTML with lxml; None for empty or unparseable input."""
+    if not text or not text.strip():
+        return None
+    try:
+        return lxml_html.document_fromstring(text)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def _named_inputs(root: HtmlElement, xpath: str, *, first_wins: bool = False) -> dict[str, str]:
+    values: dict[str, str] = {}
+    for inp in root.xpath(xpath):
+        name = inp.get("name")
+        if not name or (first_wins and name in values):
+            continue
+        values[name] = inp.get("value", "")
+    return values
+
+
+def extract_forms(text: str) -> FormPage:
+    """Extracts forms and named inputs from an HTML page in a single lxml parse.
+
+    Args:
+        text (str): Response body.
+
+    Returns:
+        FormPage: Parsed forms/inputs; empty if the body is not HTML.
+    """
+    doc = parse_document(text)
+    if doc is None:
+        return FormPage()
+    forms = [
+        HtmlForm(
+            action=form.get("action") or "",
+            id=form.get("id"),
+            name=form.get("name"),
+            fields=_named_inputs(form, ".//input[@name]"),
+        )
+        for form in doc.iter("form")
+    ]
+    return FormPage(
+        forms=forms,
+        inputs=_named_inputs(doc, "//input[@name]", first_wins=True),
+        hidden=_named_inputs(doc, '//input[@type="hidden"][@name]'),
+        doc=doc,
+    )
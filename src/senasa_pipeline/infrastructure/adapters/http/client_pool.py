@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import httpx
+
+from senasa_pipeline.infrastructure.adapters.http.httpx_client import (
+    DEFAULT_HEADERS,
+    AsyncHttpxClient,
+)
+
+TraceCallback = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class HostPoolStats:
+    """Request/connection counters for one host of the shared pool."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    http2_responses: int = 0
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of requests served over an already-open connection."""
+        if not self.requests:
+            return 0.0
+        return max(0.0, 1 - self.connections_opened / self.requests)
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Wraps the process-wide transport: counts connects and ignores per-client close.
+
+    httpx closes a client's transport on ``AsyncClient.aclose()``; wrapping it lets
+    short-lived clients (one cookie jar per login) share a single connection pool
+    owned by the registry.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self.transport = transport
+        self.stats: dict[str, HostPoolStats] = defaultdict(HostPoolStats)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        stats = self.stats[request.url.host]
+        stats.requests += 1
+        request.extensions["trace"] = self._trace(stats, request.extensions.get("trace"))
+        response = await self.transport.handle_async_request(request)
+        if response.extensions.get("http_version") == b"HTTP/2":
+            stats.http2_responses += 1
+        return response
+
+    @staticmethod
+    def _trace(stats: HostPoolStats, inner: TraceCallback | None) -> TraceCallback:
+        async def trace(event: str, info: dict[str, Any]) -> None:
+            # httpcore sólo abre TCP cuando no hay conexión reutilizable en el pool
+            if event == "connection.connect_tcp.complete":
+                stats.connections_opened += 1
+            if inner is not None:
+                await inner(event, info)
+
+        return trace
+
+    async def aclose(self) -> None:
+        # El pool vive lo que vive el registry; ver HttpClientRegistry.aclose
+        return None
+
+
+class HttpClientRegistry:
+    """Application-lifetime HTTP connection pool for AFIP/SENASA calls.
+
+    Owns one ``httpx.AsyncHTTPTransport`` (keep-alive pool, optional HTTP/2) and
+    hands out ``AsyncHttpxClient`` instances on top of it. Each client keeps its own
+    cookie jar, so concurrent logins don't mix sessions, while TCP/TLS connections
+    to auth.afip.gob.ar, portalcf and trazabilidadapicola are reused across requests.
+
+    Args:
+        timeout (float, optional): Request timeout in seconds. Defaults to 45.0.
+        max_connections (int, optional): Max open connections in the pool. Defaults to 20.
+        max_keepalive_connections (int, optional): Max idle connections kept. Defaults to 10.
+        keepalive_expiry (float, optional): Seconds an idle connection is kept. Defaults to 30.0.
+        http2 (bool, optional): Negotiate HTTP/2 where the server supports it. Defaults to False.
+        transport (httpx.AsyncBaseTransport | None, optional): Transport override (tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 45.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self._transport = _SharedTransport(
+            transport or httpx.AsyncHTTPTransport(limits=self.limits, http2=http2)
+        )
+
+    def client(self) -> AsyncHttpxClient:
+        """New client with a fresh cookie jar over the shared connection pool."""
+        return AsyncHttpxClient(
+            client=httpx.AsyncClient(
+                transport=self._transport,
+                timeout=self.timeout,
+                headers=DEFAULT_HEADERS,
+                follow_redirects=True,
+            )
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Pool configuration plus per-host counters and connection reuse rate."""
+        hosts = {
+            host: {**asdict(s), "reuse_rate": round(s.reuse_rate, 4)}
+            for host, s in self._transport.stats.items()
+        }
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry,
+            "hosts": hosts,
+        }
+
+    async def aclose(self) -> None:
+        """Closes every pooled connection. Call once, on application shutdown."""
+        await self._transport.transport.aclose()
@@ -2,7 +2,13 @@ from __future__ import annotations
 from typing import Mapping, Any
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
-from senasa_pipeline.application.ports.http_client_port import HttpClientPort, HttpResponse
+from senasa_pipeline.application.ports.http_client_port import AsyncHttpClientPort, HttpClientPort, HttpResponse
+
+DEFAULT_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "es-419,es;q=0.9,en;q=0.8",
+    "User-Agent": "senasa-data-pipeline/0.1 httpx",
+}
 
 class HttpTemporaryError(Exception):
     pass
@@ -18,11 +24,7 @@ class HttpxClient(HttpClientPort):
         Args:
             timeout (float, optional): Timeout for requests. Defaults to 45.0.
         """
-        self._client = httpx.Client(timeout=timeout, headers={
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "es-419,es;q=0.9,en;q=0.8",
-            "User-Agent": "senasa-data-pipeline/0.1 httpx",
-        }, follow_redirects=True)
+        self._client = httpx.Client(timeout=timeout, headers=DEFAULT_HEADERS, follow_redirects=True)
 
     @retry(reraise=True, stop=stop_after_attempt(3), wait=wait_exponential_jitter(initial=1, max=8), retry=retry_if_exception_type(HttpTemporaryError))
     def get(self, url: str, *, headers: Mapping[str, str] | None = None, allow_redirects: bool = True) -> HttpResponse:
@@ -49,6 +51,26 @@ class HttpxClient(HttpClientPort):
             raise HttpTemporaryError(f"GET {url} -> {resp.status_code}")
         return HttpResponse(resp.status_code, resp.text, str(resp.url), resp.headers, raw=resp)
 
+    @retry(reraise=True, stop=stop_after_attempt(3), wait=wait_exponential_jitter(initial=1, max=8), retry=retry_if_exception_type(HttpTemporaryError))
+    def head(self, url: str, *, headers: Mapping[str, str] | None = None, allow_redirects: bool = False) -> HttpResponse:
+        """Sends a HEAD request (status/headers only, no body).
+
+        Args:
+            url (str): URL to probe.
+            headers (Mapping[str, str] | None, optional): Headers to include. Defaults to None.
+            allow_redirects (bool, optional): Whether to allow redirects. Defaults to False.
+
+        Returns:
+            HttpResponse: Response from the server, with empty text.
+        """
+        try:
+            resp = self._client.head(url, headers=headers, follow_redirects=allow_redirects)
+        except httpx.HTTPError as e:
+            raise HttpTemporaryError(str(e)) from e
+        if resp.status_code >= 500:
+            raise HttpTemporaryError(f"HEAD {url} -> {resp.status_code}")
+        return HttpResponse(resp.status_code, resp.text, str(resp.url), resp.headers, raw=resp)
+
     @retry(reraise=True, stop=stop_after_attempt(3), wait=wait_exponential_jitter(initial=1, max=8), retry=retry_if_exception_type(HttpTemporaryError))
     def post(self, url: str, *, data: Mapping[str, Any] | None = None, headers: Mapping[str, str] | None = None, allow_redirects: bool = True) -> HttpResponse:
         """Posts data to the given URL.
@@ -91,3 +113,129 @@ class HttpxClient(HttpClientPort):
             dict[str, str]: Cookies from the client.
         """
         return dict(self._client.cookies)
+
+
+
+class AsyncHttpxClient(AsyncHttpClientPort):
+    def __init__(self, timeout: float = 45.0, *, client: httpx.AsyncClient | None = None) -> None:
+        """Async HTTP client adapter backed by a persistent httpx.AsyncClient.
+
+        Same contract as HttpxClient (cookie jar, retries on 5xx/transport errors)
+        but awaits I/O, so a multi-hop login doesn't block the event loop.
+
+        Args:
+            timeout (float, optional): Timeout for requests. Defaults to 45.0.
+            client (httpx.AsyncClient | None, optional): Pre-configured client to wrap. Defaults to None.
+        """
+        self._client = client or httpx.AsyncClient(
+            timeout=timeout, headers=DEFAULT_HEADERS, follow_redirects=True
+        )
+
+    @retry(
+        reraise=True,
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=1, max=8),
+        retry=retry_if_exception_type(HttpTemporaryError),
+    )
+    async def get(
+        self, url: str, *, headers: Mapping[str, str] | None = None, allow_redirects: bool = True
+    ) -> HttpResponse:
+        """Gets the given URL.
+
+        Args:
+            url (str): URL to get.
+            headers (Mapping[str, str] | None, optional): Headers to include. Defaults to None.
+            allow_redirects (bool, optional): Whether to allow redirects. Defaults to True.
+
+        Returns:
+            HttpResponse: Response from the server.
+        """
+        try:
+            resp = await self._client.get(url, headers=headers, follow_redirects=allow_redirects)
+        except httpx.HTTPError as e:
+            raise HttpTemporaryError(str(e)) from e
+        if resp.status_code >= 500:
+            raise HttpTemporaryError(f"GET {url} -> {resp.status_code}")
+        return HttpResponse(resp.status_code, resp.text, str(resp.url), resp.headers, raw=resp)
+
+    @retry(
+        reraise=True,
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=1, max=8),
+        retry=retry_if_exception_type(HttpTemporaryError),
+    )
+    async def head(
+        self, url: str, *, headers: Mapping[str, str] | None = None, allow_redirects: bool = False
+    ) -> HttpResponse:
+        """Sends a HEAD request (status/headers only, no body).
+
+        Args:
+            url (str): URL to probe.
+            headers (Mapping[str, str] | None, optional): Headers to include. Defaults to None.
+            allow_redirects (bool, optional): Whether to allow redirects. Defaults to False.
+
+        Returns:
+            HttpResponse: Response from the server, with empty text.
+        """
+        try:
+            resp = await self._client.head(url, headers=headers, follow_redirects=allow_redirects)
+        except httpx.HTTPError as e:
+            raise HttpTemporaryError(str(e)) from e
+        if resp.status_code >= 500:
+            raise HttpTemporaryError(f"HEAD {url} -> {resp.status_code}")
+        return HttpResponse(resp.status_code, resp.text, str(resp.url), resp.headers, raw=resp)
+
+    @retry(
+        reraise=True,
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=1, max=8),
+        retry=retry_if_exception_type(HttpTemporaryError),
+    )
+    async def post(
+        self,
+        url: str,
+        *,
+        data: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        allow_redirects: bool = True,
+    ) -> HttpResponse:
+        """Posts data to the given URL.
+
+        Args:
+            url (str): URL to post to.
+            data (Mapping[str, Any] | None, optional): Data to post. Defaults to None.
+            headers (Mapping[str, str] | None, optional): Headers to include. Defaults to None.
+            allow_redirects (bool, optional): Whether to allow redirects. Defaults to True.
+
+        Returns:
+            HttpResponse: Response from the server.
+        """
+        try:
+            resp = await self._client.post(
+                url, data=data, headers=headers, follow_redirects=allow_redirects
+            )
+        except httpx.HTTPError as e:
+            raise HttpTemporaryError(str(e)) from e
+        if resp.status_code >= 500:
+            raise HttpTemporaryError(f"POST {url} -> {resp.status_code}")
+        return HttpResponse(resp.status_code, resp.text, str(resp.url), resp.headers, raw=resp)
+
+    def set_cookies(self, cookies: Mapping[str, str]) -> None:
+        """Sets cookies in the client.
+
+        Args:
+            cookies (Mapping[str, str]): Cookies to set.
+        """
+        self._client.cookies.update(dict(cookies))
+
+    def dump_cookies(self) -> dict[str, str]:
+        """Dumps cookies from the client.
+
+        Returns:
+            dict[str, str]: Cookies from the client.
+        """
+        return dict(self._client.cookies)
+
+    async def aclose(self) -> None:
+        """Closes the underlying client and its connection pool."""
+        await self._client.aclose()
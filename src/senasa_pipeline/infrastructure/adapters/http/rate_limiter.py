@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class HostRateLimiter:
+    """Async token-bucket rate limiter keyed by host.
+
+    Each host gets its own bucket of ``burst`` tokens refilled at ``rate`` tokens
+    per second; ``acquire`` waits until a token is available. A non-positive
+    rate disables limiting. Instances are bound to the event loop that uses them.
+
+    Args:
+        rate (float): Sustained requests per second per host.
+        burst (int, optional): Requests allowed back-to-back. Defaults to 1.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, host: str) -> None:
+        if self.rate <= 0:
+            return
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(host, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - last) * self.rate)
+            if tokens < 1:
+                await asyncio.sleep((1 - tokens) / self.rate)
+                now = time.monotonic()
+                tokens = 1.0
+            self._buckets[host] = (tokens - 1, now)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import Any
+
+from celery import Celery, Task, states
+from celery.exceptions import Ignore
+from celery.result import AsyncResult
+from celery.worker import state as worker_state
+
+from senasa_pipeline.application.ports.job_queue_port import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    JobCancelledError,
+    JobContext,
+    JobHandler,
+    JobInfo,
+    JobQueuePort,
+)
+from senasa_pipeline.log import correlation_scope
+
+TASK_NAME = "senasa_pipeline.run_job"
+PROGRESS = "PROGRESS"
+
+_STATUS = {
+    states.PENDING: JOB_QUEUED,
+    states.RECEIVED: JOB_QUEUED,
+    states.STARTED: JOB_RUNNING,
+    PROGRESS: JOB_RUNNING,
+    states.RETRY: JOB_RUNNING,
+    states.SUCCESS: JOB_SUCCEEDED,
+    states.FAILURE: JOB_FAILED,
+    states.REVOKED: JOB_CANCELLED,
+}
+
+
+class CeleryJobQueue(JobQueuePort):
+    """Job queue backed by Celery (e.g. Redis broker and result backend).
+
+    Every job kind runs through a single task, ``senasa_pipeline.run_job``,
+    which dispatches to the handler registered in the worker process (see
+    ``senasa_pipeline.presentation.worker``). Progress is published as a
+    custom ``PROGRESS`` state; cancellation revokes the task, which drops it
+    if still queued and makes a running one stop at its next checkpoint.
+
+    Args:
+        broker_url (str): Celery broker URL.
+        backend_url (str | None, optional): Result backend. Defaults to the broker URL.
+        app (Celery | None, optional): Existing Celery app to register the task on.
+    """
+
+    def __init__(
+        self, broker_url: str, *, backend_url: str | None = None, app: Celery | None = None
+    ) -> None:
+        self.app = app or Celery(
+            "senasa_pipeline", broker=broker_url, backend=backend_url or broker_url
+        )
+        self.app.conf.update(
+            task_track_started=True,
+            result_extended=True,  # kind/params del job disponibles en el backend
+            worker_prefetch_multiplier=1,  # syncs largos: no acaparar jobs en un worker
+        )
+        self._handlers: dict[str, JobHandler] = {}
+
+        @self.app.task(name=TASK_NAME, bind=True)
+        def run_job(task: Task, kind: str, params: dict[str, Any]) -> dict[str, Any]:
+            return self._execute(task, kind, params)
+
+        self._task = run_job
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        self._handlers[kind] = handler
+
+    def submit(self, kind: str, params: dict[str, Any] | None = None) -> JobInfo:
+        if kind not in self._handlers:
+            raise ValueError(f"Tipo de job desconocido: {kind}")
+        params = dict(params or {})
+        result = self._task.apply_async(kwargs={"kind": kind, "params": params})
+        return self.get(result.id) or JobInfo(id=result.id, kind=kind, params=params)
+
+    def get(self, job_id: str) -> JobInfo | None:
+        res = AsyncResult(job_id, app=self.app)
+        kwargs = res.kwargs or {}
+        info = res.info if isinstance(res.info, dict) else {}
+        job = JobInfo(
+            id=job_id,
+            kind=kwargs.get("kind") or info.get("kind", ""),
+            status=_STATUS.get(res.state, JOB_RUNNING),
+            params=kwargs.get("params") or {},
+            progress=info.get("progress", {}),
+            finished_at=res.date_done,
+        )
+        if res.state == states.SUCCESS:
+            job.result = info.get("result")
+        elif res.state == states.FAILURE:
+            job.error = f"{type(res.result).__name__}: {res.result}"
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        if AsyncResult(job_id, app=self.app).ready():
+            return False
+        self.app.control.revoke(job_id)
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        # Los jobs siguen en los workers; solo se cierran las conexiones al broker
+        self.app.close()
+
+    def _execute(self, task: Task, kind: str, params: dict[str, Any]) -> dict[str, Any]:
+        handler = self._handlers.get(kind)
+        if handler is None:
+            raise ValueError(f"Tipo de job no registrado en el worker: {kind}")
+        job_id = task.request.id
+
+        def publish(progress: dict[str, Any]) -> None:
+            task.update_state(state=PROGRESS, meta={"kind": kind, "progress": progress})
+
+        ctx = JobContext(job_id, publish, lambda: job_id in worker_state.revoked)
+        try:
+            with correlation_scope(kind, correlation_id=job_id):
+                result = handler(params, ctx)
+        except JobCancelledError:
+            # El backend guarda REVOKED como excepción: el progreso parcial no se conserva
+            task.backend.mark_as_revoked(job_id, "cancelled", request=task.request)
+            raise Ignore() from None
+        return {"kind": kind, "progress": ctx.progress, "result": result}
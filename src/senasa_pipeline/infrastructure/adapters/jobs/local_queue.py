@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from datetime import UTC, datetime
+from typing import Any
+
+from senasa_pipeline.application.ports.job_queue_port import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    JobCancelledError,
+    JobContext,
+    JobHandler,
+    JobInfo,
+    JobQueuePort,
+)
+from senasa_pipeline.log import correlation_scope
+
+
+class LocalJobQueue(JobQueuePort):
+    """In-process job queue on a thread pool, used when no broker is configured.
+
+    Jobs live in memory only (lost on restart) and run in this process, so it
+    suits a single API instance. A queued job is cancelled right away; a
+    running one stops at its next JobContext checkpoint. Only the newest
+    ``max_finished`` finished jobs are kept.
+
+    Args:
+        max_workers (int, optional): Jobs running at the same time. Defaults to 1.
+        max_finished (int, optional): Finished jobs kept for status queries. Defaults to 500.
+    """
+
+    def __init__(self, *, max_workers: int = 1, max_finished: int = 500) -> None:
+        self.max_finished = max(1, max_finished)
+        self._handlers: dict[str, JobHandler] = {}
+        self._jobs: OrderedDict[str, JobInfo] = OrderedDict()
+        self._futures: dict[str, Future[None]] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max(1, max_workers), thread_name_prefix="senasa-job")
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        self._handlers[kind] = handler
+
+    def submit(self, kind: str, params: dict[str, Any] | None = None) -> JobInfo:
+        if kind not in self._handlers:
+            raise ValueError(f"Tipo de job desconocido: {kind}")
+        job = JobInfo(id=uuid.uuid4().hex, kind=kind, params=dict(params or {}), created_at=_now())
+        with self._lock:
+            self._jobs[job.id] = job
+            self._futures[job.id] = self._pool.submit(self._run, job.id)
+            snapshot = _snapshot(job)
+        return snapshot
+
+    def get(self, job_id: str) -> JobInfo | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return _snapshot(job) if job else None
+
+    def cancel(self, job_id: str) -> bool:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished:
+                return False
+            job.cancel_requested = True
+            future = self._futures.get(job_id)
+            if future is not None and future.cancel():
+                self._finish(job, JOB_CANCELLED)
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops accepting jobs; queued ones are cancelled, running ones asked to stop."""
+        with self._lock:
+            for job in self._jobs.values():
+                if not job.finished:
+                    job.cancel_requested = True
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, job_id: str) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            job.status = JOB_RUNNING
+            job.started_at = _now()
+            handler = self._handlers[job.kind]
+            params = dict(job.params)
+        ctx = JobContext(
+            job_id,
+            on_progress=lambda progress: self._set_progress(job_id, progress),
+            is_cancelled=lambda: self._jobs[job_id].cancel_requested,
+        )
+        try:
+            # El id del job es el correlation_id de todo lo que loguea el handler
+            with correlation_scope(job.kind, correlation_id=job_id):
+                result = handler(params, ctx)
+        except JobCancelledError:
+            with self._lock:
+                self._finish(job, JOB_CANCELLED)
+        except Exception as exc:  # el error queda en el job, no en el pool
+            with self._lock:
+                job.error = f"{type(exc).__name__}: {exc}"
+                self._finish(job, JOB_FAILED)
+        else:
+            with self._lock:
+                job.result = result
+                self._finish(job, JOB_SUCCEEDED)
+
+    def _set_progress(self, job_id: str, progress: dict[str, Any]) -> None:
+        with self._lock:
+            self._jobs[job_id].progress = progress
+
+    def _finish(self, job: JobInfo, status: str) -> None:
+        job.status = status
+        job.finished_at = _now()
+        self._futures.pop(job.id, None)
+        finished = [j.id for j in self._jobs.values() if j.finished]
+        for old in finished[: max(0, len(finished) - self.max_finished)]:
+            del self._jobs[old]
+
+
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+
+def _snapshot(job: JobInfo) -> JobInfo:
+    return replace(
+        job,
+        params=dict(job.params),
+        progress=dict(job.progress),
+        result=dict(job.result) if job.result is not None else None,
+    )
@@ -1,6 +1,11 @@
 from typing import Any
 
+from senasa_pipeline.log import get_logger
+
 
 class SimpleNotificationAdapter:
+    def __init__(self) -> None:
+        self._log = get_logger(type(self).__name__)
+
     def notify(self, event: str, payload: dict[str, Any]) -> None:
-        print(f"[{event}] {payload}")
+        self._log.info(event, **payload)
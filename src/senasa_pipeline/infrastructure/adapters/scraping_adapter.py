@@ -1,8 +1,169 @@
-from collections.abc import Sequence
+from __future__ import annotations
 
+import asyncio
+import tempfile
+from collections.abc import AsyncGenerator, Iterator
+from datetime import date
+
+import httpx
+
+from senasa_pipeline.application.ports.session_store_port import SessionStorePort
+from senasa_pipeline.application.record_batch import SenasaRecordBatch
 from senasa_pipeline.domain.entities.senasa_record import SenasaRecord
+from senasa_pipeline.infrastructure.adapters.http.httpx_client import DEFAULT_HEADERS
+from senasa_pipeline.infrastructure.adapters.senasa.export_download import (
+    SenasaExportUnavailableError,
+    SenasaGridExporter,
+    iter_record_batches,
+    read_export,
+)
+from senasa_pipeline.infrastructure.adapters.senasa.extracciones_scraper import (
+    SenasaExtraccionesScraper,
+)
+from senasa_pipeline.infrastructure.adapters.senasa.webforms import SenasaSessionExpiredError
+from senasa_pipeline.log import get_logger
 
 
 class SenasaWebScrapingAdapter:
-    def fetch_latest(self, incremental: bool = False) -> Sequence[SenasaRecord]:
-        return []
+    """Sync facade over the async Extracciones scraper.
+
+    Drives ``SenasaExtraccionesScraper.iter_pages`` on a private event loop and
+    yields records page by page, so it plugs into the streaming sync pipeline.
+    Cookies come from the session store populated by the AFIP→SENASA login; a
+    redirect to /Login.aspx marks the stored session inactive so the next
+    ensure_session skips any cached validation and logs in again.
+
+    ``mode`` selects how rows are extracted: ``"html"`` pages through the grid,
+    ``"download"`` uses the grid's native export (one request, parsed with
+    polars) and ``"auto"`` tries the export first and falls back to paging when
+    the grid offers none. ``fetch_latest(establecimiento=...)`` always pages
+    the grid filtered to that establecimiento (the export covers every
+    establecimiento), which is what partitioned syncs use; each call opens
+    its own client on the shared stored session, so calls can run on
+    separate threads. ``pages_fetched`` counts the pages (or export batches)
+    fetched by this adapter so far, and ``rows_skipped`` the source rows it
+    dropped because they could not be parsed (each one is logged).
+
+    Args:
+        session_store (SessionStorePort | None, optional): Source of SENASA cookies.
+        concurrency (int, optional): Max in-flight page requests. Defaults to 4.
+        requests_per_second (float, optional): Per-host rate limit. Defaults to 5.0.
+        timeout (float, optional): HTTP timeout in seconds. Defaults to 45.0.
+        mode (str, optional): "html", "download" or "auto". Defaults to "html".
+        download_dir (str | None, optional): Where exports are kept. Defaults to a
+            temporary directory removed after parsing.
+        export_control (str | None, optional): Export button override (see SenasaGridExporter).
+        batch_size (int, optional): Records per yielded batch in download mode. Defaults to 1000.
+        filter_field (str | None, optional): Establecimiento filter input override.
+        transport (httpx.AsyncBaseTransport | None, optional): Transport override (tests).
+    """
+
+    MODES = ("html", "download", "auto")
+
+    def __init__(
+        self,
+        session_store: SessionStorePort | None = None,
+        *,
+        concurrency: int = 4,
+        requests_per_second: float = 5.0,
+        timeout: float = 45.0,
+        mode: str = "html",
+        download_dir: str | None = None,
+        export_control: str | None = None,
+        batch_size: int = 1000,
+        filter_field: str | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f"mode debe ser uno de {self.MODES}: {mode!r}")
+        self.session_store = session_store
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        self.timeout = timeout
+        self.mode = mode
+        self.download_dir = download_dir
+        self.export_control = export_control
+        self.batch_size = max(1, batch_size)
+        self.filter_field = filter_field
+        self.transport = transport
+        self.pages_fetched = 0
+        self.rows_skipped = 0
+        self._log = get_logger(type(self).__name__)
+
+    def fetch_latest(
+        self,
+        incremental: bool = False,
+        since: date | None = None,
+        establecimiento: str | None = None,
+    ) -> Iterator[SenasaRecord]:
+        loop = asyncio.new_event_loop()
+        pages = self._iter_pages(since if incremental else None, establecimiento)
+        try:
+            while True:
+                try:
+                    page = loop.run_until_complete(anext(pages))
+                except StopAsyncIteration:
+                    return
+                self.pages_fetched += 1
+                # Las vistas de un SenasaRecordBatch se comportan como SenasaRecord
+                yield from page  # type: ignore[misc]
+        finally:
+            loop.run_until_complete(pages.aclose())
+            loop.close()
+
+    async def _iter_pages(
+        self, since: date | None, establecimiento: str | None = None
+    ) -> AsyncGenerator[list[SenasaRecord] | SenasaRecordBatch, None]:
+        cookies = self.session_store.load()[0] if self.session_store else {}
+        limits = httpx.Limits(max_connections=self.concurrency)
+        async with httpx.AsyncClient(
+            cookies=cookies,
+            headers=DEFAULT_HEADERS,
+            timeout=self.timeout,
+            limits=limits,
+            transport=self.transport,
+        ) as client:
+            try:
+                if self.mode != "html" and establecimiento is None:
+                    try:
+                        batches = await self._download_batches(client, since)
+                    except SenasaExportUnavailableError as e:
+                        if self.mode == "download":
+                            raise
+                        self._log.warning("export_unavailable", fallback="html", error=str(e))
+                    else:
+                        for batch in batches:
+                            yield batch
+                        return
+                scraper = SenasaExtraccionesScraper(
+                    client,
+                    concurrency=self.concurrency,
+                    requests_per_second=self.requests_per_second,
+                    filter_field=self.filter_field,
+                    on_skipped=self._count_skipped,
+                )
+                async for page in scraper.iter_pages(since=since, establecimiento=establecimiento):
+                    yield page
+            except SenasaSessionExpiredError:
+                if self.session_store:
+                    self.session_store.mark_inactive()
+                raise
+
+    def _count_skipped(self, rows: int) -> None:
+        self.rows_skipped += rows
+
+    async def _download_batches(
+        self, client: httpx.AsyncClient, since: date | None
+    ) -> Iterator[SenasaRecordBatch]:
+        """Downloads and parses the export into Arrow-backed batches of ``batch_size`` rows."""
+        with tempfile.TemporaryDirectory(prefix="senasa-export-") as tmp:
+            exporter = SenasaGridExporter(
+                client, self.download_dir or tmp, export_control=self.export_control
+            )
+            download = await exporter.download()
+            self._log.info("export_downloaded", filename=download.filename, size=download.size)
+            # Parseo fuera del event loop; el directorio temporal se borra al salir
+            df = await asyncio.to_thread(
+                read_export, download.path, since=since, on_skipped=self._count_skipped
+            )
+        return iter_record_batches(df, self.batch_size)
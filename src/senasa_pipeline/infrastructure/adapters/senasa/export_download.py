@@ -0,0 +1,377 @@
+"""Download-based extraction: SENASA's native grid export instead of paged HTML.
+
+The SENASA grids have an export button (Excel/CSV). Triggering it is a single
+postback that returns the whole listing, either as an attachment or, through
+the master page's pending-download mechanism, base64 in the
+``ctl00$hidden_PENDING_DOWNLOAD_*`` hidden fields. The file is streamed to disk
+and parsed column-wise with polars.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import codecs
+import os
+import re
+import tempfile
+import time
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from urllib.parse import unquote
+
+import httpx
+import polars as pl
+from lxml import html as lxml_html
+
+from senasa_pipeline.application.record_batch import SenasaRecordBatch
+from senasa_pipeline.infrastructure import metrics
+from senasa_pipeline.infrastructure.adapters.html.forms import FormPage, extract_forms
+from senasa_pipeline.infrastructure.adapters.senasa.extracciones_scraper import (
+    DEFAULT_COLUMNS,
+    EXTRACCIONES_LIST_URL,
+    _normalize,
+)
+from senasa_pipeline.infrastructure.adapters.senasa.webforms import (
+    SenasaSessionExpiredError,
+    is_delta,
+    parse_delta,
+)
+from senasa_pipeline.log import get_logger
+
+PENDING_DOWNLOAD_BYTES = "ctl00$hidden_PENDING_DOWNLOAD_BYTES"
+PENDING_DOWNLOAD_FILENAME = "ctl00$hidden_PENDING_DOWNLOAD_FILENAME"
+PENDING_DOWNLOAD_CONTENTTYPE = "ctl00$hidden_PENDING_DOWNLOAD_CONTENTTYPE"
+
+_EXPORT_RE = re.compile(r"export|excel|xls|csv", re.IGNORECASE)
+_DOPOSTBACK_RE = re.compile(r"__doPostBack\('([^']+)','([^']*)'\)")
+_FILENAME_RE = re.compile(r"filename\*?=(?:UTF-8'')?\"?([^\";]+)\"?", re.IGNORECASE)
+_DATE_FORMATS = ("%d/%m/%Y", "%d/%m/%Y %H:%M:%S", "%Y-%m-%d")
+_CODE_FIELDS = ("nro_senasa", "establecimiento_codigo")
+_TEXT_FIELDS = ("tipo_miel", "origen", "productor")
+
+_log = get_logger("read_export")
+
+
+class SenasaExportUnavailableError(RuntimeError):
+    """The grid offers no export, or the export did not produce a usable file."""
+
+
+@dataclass(frozen=True)
+class ExportDownload:
+    """A grid export saved to disk."""
+
+    path: Path
+    filename: str
+    content_type: str
+    size: int
+
+
+def find_export_postback(page: FormPage, control: str | None = None) -> dict[str, str] | None:
+    """Postback fields that press the grid's export button.
+
+    Args:
+        page (FormPage): Parsed list page.
+        control (str | None, optional): Exact ``name``/``__doPostBack`` target of
+            the button. Defaults to the first control mentioning Excel/CSV/export.
+
+    Returns:
+        dict[str, str] | None: Fields to add to the page's hidden fields, or None.
+    """
+    if page.doc is None:
+        return None
+    for el in page.doc.xpath('//input[@name][@type="submit" or @type="image"] | //button[@name]'):
+        name = el.get("name")
+        label = " ".join(filter(None, (el.get("id"), name, el.get("value"), el.get("title"))))
+        if name == control or (control is None and _EXPORT_RE.search(label)):
+            if el.get("type") == "image":
+                return {f"{name}.x": "0", f"{name}.y": "0"}
+            return {name: el.get("value", "")}
+    for el in page.doc.xpath('//a[contains(@href, "__doPostBack")]'):
+        match = _DOPOSTBACK_RE.search(el.get("href", ""))
+        if not match:
+            continue
+        target, argument = match.groups()
+        label = " ".join(filter(None, (el.get("id"), target, el.get("title"), el.text_content())))
+        if target == control or (control is None and _EXPORT_RE.search(label)):
+            return {"__EVENTTARGET": target, "__EVENTARGUMENT": argument}
+    return None
+
+
+def _attachment_filename(content_disposition: str) -> str | None:
+    if "attachment" not in content_disposition.lower():
+        return None
+    match = _FILENAME_RE.search(content_disposition)
+    return unquote(match.group(1)) if match else "export"
+
+
+class SenasaGridExporter:
+    """Triggers a SENASA grid export and streams the file into ``download_dir``.
+
+    Args:
+        client (httpx.AsyncClient): Client carrying the authenticated SENASA cookies.
+        download_dir (str | Path): Directory where exports are written.
+        list_url (str, optional): GridView page URL. Defaults to EXTRACCIONES_LIST_URL.
+        export_control (str | None, optional): Export button name/postback target
+            override. Defaults to auto-detection.
+        chunk_size (int, optional): Bytes per streamed chunk. Defaults to 64 KiB.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        download_dir: str | Path,
+        *,
+        list_url: str = EXTRACCIONES_LIST_URL,
+        export_control: str | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> None:
+        self.client = client
+        self.download_dir = Path(download_dir)
+        self.list_url = list_url
+        self.export_control = export_control
+        self.chunk_size = chunk_size
+
+    async def download(self) -> ExportDownload:
+        """Loads the list page, presses its export button and saves the file.
+
+        Raises:
+            SenasaExportUnavailableError: No export button, or no file returned.
+            SenasaSessionExpiredError: SENASA redirected to the login page.
+        """
+        resp = await self.client.get(
+            self.list_url, headers={"Referer": self.list_url}, follow_redirects=False
+        )
+        metrics.observe_http(resp, "Export-list")
+        self._check_response(resp, "GET")
+        page = extract_forms(resp.text)
+        fields = find_export_postback(page, self.export_control)
+        if fields is None:
+            raise SenasaExportUnavailableError(f"{self.list_url} has no export control")
+
+        data = {**page.hidden, "__EVENTTARGET": "", "__EVENTARGUMENT": "", **fields}
+        # Respuesta en streaming: se mide hasta terminar de bajar el archivo
+        started = time.perf_counter()
+        status = "error"
+        try:
+            async with self.client.stream(
+                "POST",
+                self.list_url,
+                data=data,
+                headers={"Referer": self.list_url},
+                follow_redirects=False,
+            ) as resp:
+                status = str(resp.status_code)
+                self._check_response(resp, "POST")
+                filename = _attachment_filename(resp.headers.get("Content-Disposition", ""))
+                if filename is not None:
+                    content_type = resp.headers.get("Content-Type", "")
+                    return await self._save_stream(resp, filename, content_type)
+                text = (await resp.aread()).decode(resp.encoding or "utf-8", errors="replace")
+        finally:
+            metrics.observe_hop(
+                self.list_url, "Export-download", status, time.perf_counter() - started
+            )
+        return self._save_pending_download(text)
+
+    def _check_response(self, resp: httpx.Response, method: str) -> None:
+        if resp.is_redirect and "/Login.aspx" in resp.headers.get("Location", ""):
+            raise SenasaSessionExpiredError(f"{method} {self.list_url} redirected to login")
+        resp.raise_for_status()
+
+    def _new_path(self, filename: str) -> Path:
+        self.download_dir.mkdir(parents=True, exist_ok=True)
+        name = Path(filename).name or "export"
+        fd, path = tempfile.mkstemp(
+            dir=self.download_dir, prefix=f"{Path(name).stem}-", suffix=Path(name).suffix
+        )
+        os.close(fd)
+        return Path(path)
+
+    async def _save_stream(
+        self, resp: httpx.Response, filename: str, content_type: str
+    ) -> ExportDownload:
+        path = self._new_path(filename)
+        size = 0
+        with path.open("wb") as handle:
+            async for chunk in resp.aiter_bytes(self.chunk_size):
+                handle.write(chunk)
+                size += len(chunk)
+        return ExportDownload(path=path, filename=filename, content_type=content_type, size=size)
+
+    def _save_pending_download(self, text: str) -> ExportDownload:
+        # El master page deja el archivo en hidden fields y un script lo descarga
+        hidden = parse_delta(text).hidden if is_delta(text) else extract_forms(text).hidden
+        encoded = hidden.get(PENDING_DOWNLOAD_BYTES, "")
+        if not encoded:
+            raise SenasaExportUnavailableError("Export postback returned no file")
+        try:
+            content = base64.b64decode(encoded, validate=False)
+        except (binascii.Error, ValueError) as e:
+            raise SenasaExportUnavailableError(f"Invalid pending download: {e}") from e
+        filename = hidden.get(PENDING_DOWNLOAD_FILENAME) or "export"
+        path = self._new_path(filename)
+        path.write_bytes(content)
+        return ExportDownload(
+            path=path,
+            filename=filename,
+            content_type=hidden.get(PENDING_DOWNLOAD_CONTENTTYPE, ""),
+            size=len(content),
+        )
+
+
+def _read_raw(path: Path) -> pl.DataFrame:
+    with path.open("rb") as f:
+        head = f.read(512)
+    if head.startswith(b"PK"):
+        return pl.read_excel(path, engine="openpyxl")
+    if head.removeprefix(b"\xef\xbb\xbf").lstrip().startswith(b"<"):
+        # Muchos "Excel" de WebForms son una <table> HTML con extensión .xls
+        return _read_html_table(_decode(path.read_bytes()))
+    first_line = head.split(b"\n", 1)[0]
+    separator = ";" if first_line.count(b";") > first_line.count(b",") else ","
+    # polars lee el archivo directo; lo que no es UTF-8 es el cp1252 de Windows
+    # (los encabezados inválidos no fallan: se detectan en los primeros bytes;
+    # el decoder incremental tolera un carácter cortado al final de ``head``)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head)
+        return pl.read_csv(path, separator=separator, infer_schema_length=0)
+    except (UnicodeDecodeError, pl.exceptions.ComputeError):
+        return pl.read_csv(
+            path, separator=separator, infer_schema_length=0, encoding="windows-1252"
+        )
+
+
+def _decode(data: bytes) -> str:
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return data.decode("cp1252")
+
+
+def _read_html_table(text: str) -> pl.DataFrame:
+    doc = lxml_html.fromstring(text)
+    rows = [
+        [cell.text_content().strip() for cell in tr.xpath("./th|./td")]
+        for tr in doc.xpath("//table[1]//tr")
+    ]
+    if not rows:
+        return pl.DataFrame()
+    header, body = rows[0], [r for r in rows[1:] if len(r) == len(rows[0])]
+    return pl.DataFrame(
+        {h: [r[i] for r in body] for i, h in enumerate(header)},
+        schema=dict.fromkeys(header, pl.String),
+    )
+
+
+def _date_expr(name: str, dtype: pl.DataType) -> pl.Expr:
+    col = pl.col(name)
+    if dtype == pl.Date:
+        return col
+    if isinstance(dtype, pl.Datetime):
+        return col.dt.date()
+    text = col.cast(pl.String).str.strip_chars()
+    return pl.coalesce([text.str.strptime(pl.Date, fmt, strict=False) for fmt in _DATE_FORMATS])
+
+
+def _peso_expr(name: str, dtype: pl.DataType) -> pl.Expr:
+    col = pl.col(name)
+    if dtype.is_numeric():
+        return col.cast(pl.Float64)
+    # Formato AR: 1.234,5
+    return (
+        col.cast(pl.String)
+        .str.strip_chars()
+        .str.replace_all(".", "", literal=True)
+        .str.replace(",", ".", literal=True)
+        .cast(pl.Float64, strict=False)
+    )
+
+
+def read_export(
+    path: str | Path,
+    columns: Mapping[str, str] = DEFAULT_COLUMNS,
+    since: date | None = None,
+    *,
+    on_skipped: Callable[[int], None] | None = None,
+) -> pl.DataFrame:
+    """Parses an Extracciones export (xlsx, CSV or HTML-table .xls) into typed columns.
+
+    Headers are matched like the HTML grid's (see DEFAULT_COLUMNS). Rows with a
+    missing or unparseable value, or codes shorter than CodigoSenasa allows,
+    are dropped as the HTML scraper drops them: each one is logged as
+    ``export_row_skipped`` with its row number and raw values.
+
+    Args:
+        path (str | Path): Downloaded file.
+        columns (Mapping[str, str], optional): Normalized header -> Tambor field.
+        since (date | None, optional): Keep only rows extracted on or after this date.
+        on_skipped (Callable[[int], None] | None, optional): Called with the
+            number of dropped rows, if any (rows before ``since`` do not count).
+
+    Returns:
+        pl.DataFrame: One column per Tambor field.
+
+    Raises:
+        SenasaExportUnavailableError: If required columns are missing.
+    """
+    raw = _read_raw(Path(path))
+    picked: dict[str, str] = {}
+    for name in raw.columns:
+        field_name = columns.get(_normalize(str(name)))
+        if field_name and field_name not in picked:
+            picked[field_name] = name
+    missing = set(columns.values()) - picked.keys()
+    if missing:
+        raise SenasaExportUnavailableError(f"Export without columns: {sorted(missing)}")
+
+    schema = raw.schema
+    text = [
+        pl.col(picked[f]).cast(pl.String).str.strip_chars().alias(f)
+        for f in (*_CODE_FIELDS, *_TEXT_FIELDS)
+    ]
+    df = raw.select(
+        *text,
+        _date_expr(picked["fecha_extraccion"], schema[picked["fecha_extraccion"]]).alias(
+            "fecha_extraccion"
+        ),
+        _peso_expr(picked["peso"], schema[picked["peso"]]).alias("peso"),
+    )
+    parsed = df.select(
+        (
+            pl.all_horizontal(pl.all().is_not_null())
+            & pl.all_horizontal([pl.col(f).str.len_chars() >= 3 for f in _CODE_FIELDS])
+        ).alias("parsed")
+    ).to_series()
+    if not parsed.all():
+        _log_skipped(raw, parsed, on_skipped)
+    df = df.filter(parsed)
+    if since is not None:
+        df = df.filter(pl.col("fecha_extraccion") >= since)
+    return df
+
+
+def _log_skipped(
+    raw: pl.DataFrame, parsed: pl.Series, on_skipped: Callable[[int], None] | None
+) -> None:
+    rows = parsed.not_().arg_true()
+    for row, values in zip(rows, raw.filter(~parsed).iter_rows(), strict=True):
+        # Número de fila de datos (1 = la primera después del encabezado)
+        _log.warning(
+            "export_row_skipped",
+            row=int(row) + 1,
+            cells=[None if v is None else str(v) for v in values],
+        )
+    if on_skipped:
+        on_skipped(len(rows))
+
+
+def iter_record_batches(df: pl.DataFrame, batch_size: int = 1000) -> Iterator[SenasaRecordBatch]:
+    """Yields a read_export frame as SenasaRecordBatch slices of ``batch_size`` rows.
+
+    The columns go to Arrow as they are; no SenasaRecord is built per row.
+    """
+    for chunk in df.iter_slices(n_rows=batch_size):
+        yield SenasaRecordBatch.from_arrow(chunk.to_arrow())
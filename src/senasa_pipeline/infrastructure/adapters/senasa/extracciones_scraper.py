@@ -0,0 +1,415 @@
+from __future__ import annotations
+
+import asyncio
+import re
+import unicodedata
+from collections.abc import AsyncGenerator, Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from urllib.parse import urlparse
+
+import httpx
+from lxml import html as lxml_html
+
+from senasa_pipeline.domain.entities.senasa_record import SenasaRecord
+from senasa_pipeline.domain.entities.tambor import Tambor
+from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
+from senasa_pipeline.infrastructure import metrics
+from senasa_pipeline.infrastructure.adapters.html.forms import FormPage, extract_forms
+from senasa_pipeline.infrastructure.adapters.http.rate_limiter import HostRateLimiter
+from senasa_pipeline.infrastructure.adapters.senasa.login_consumer import SENASA_BASE
+from senasa_pipeline.infrastructure.adapters.senasa.webforms import (
+    SenasaSessionExpiredError,
+    find_pager,
+    find_update_panel,
+    page_postback,
+    read_page_postback,
+)
+from senasa_pipeline.log import get_logger
+
+EXTRACCIONES_LIST_URL = f"{SENASA_BASE}/Sur/Extracciones/List"
+
+_SEARCH_BUTTON_RE = re.compile(r"buscar|filtrar|consultar|search", re.IGNORECASE)
+
+# Encabezado normalizado de la grilla -> campo de Tambor
+DEFAULT_COLUMNS: dict[str, str] = {
+    "nro senasa": "nro_senasa",
+    "nro. senasa": "nro_senasa",
+    "tambor": "nro_senasa",
+    "establecimiento": "establecimiento_codigo",
+    "cod. establecimiento": "establecimiento_codigo",
+    "fecha extraccion": "fecha_extraccion",
+    "fecha": "fecha_extraccion",
+    "peso": "peso",
+    "peso (kg)": "peso",
+    "tipo de miel": "tipo_miel",
+    "tipo miel": "tipo_miel",
+    "origen": "origen",
+    "productor": "productor",
+    "apicultor": "productor",
+}
+
+
+_log = get_logger("SenasaExtraccionesScraper")
+
+
+class SenasaFilterUnavailableError(RuntimeError):
+    """The list page has no establecimiento filter to scrape a single partition."""
+
+
+class SenasaGridLayoutError(RuntimeError):
+    """The grid's header row lacks columns the scraper needs (the page layout changed)."""
+
+
+@dataclass
+class GridPage:
+    """Parsed GridView page: records, postback state and pager info.
+
+    ``skipped`` keeps the raw cells of data rows that could not be parsed.
+    ``update_panel`` is the (ScriptManager, UpdatePanel) pair to page through
+    async posts, when the page has one (see find_update_panel).
+    """
+
+    records: list[SenasaRecord]
+    skipped: list[list[str]] = field(default_factory=list)
+    hidden: dict[str, str] = field(default_factory=dict)
+    pager_target: str | None = None
+    page_numbers: set[int] = field(default_factory=set)
+    update_panel: tuple[str, str] | None = None
+
+
+def _normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+def _parse_date(value: str) -> date:
+    value = value.strip()
+    for fmt in ("%d/%m/%Y", "%d/%m/%Y %H:%M:%S", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Fecha inválida: {value!r}")
+
+
+def _parse_peso(value: str) -> float:
+    # Formato AR: 1.234,5
+    return float(value.strip().replace(".", "").replace(",", "."))
+
+
+def parse_grid_page(text: str, columns: Mapping[str, str] = DEFAULT_COLUMNS) -> GridPage:
+    """Extracts tambores, hidden postback fields and pager links from a GridView page.
+
+    The grid is identified by its pager (``__doPostBack('<grid>','Page$N')``); when
+    no pager is present (single page) the first table whose header row has the
+    expected columns is used.
+
+    Args:
+        text (str): Full HTML of the list page.
+        columns (Mapping[str, str], optional): Normalized header -> Tambor field.
+
+    Returns:
+        GridPage: Parsed rows plus state needed to request other pages.
+
+    Raises:
+        SenasaGridLayoutError: The pager's grid lacks one of the mapped columns.
+    """
+    doc = lxml_html.fromstring(text)
+    hidden = {
+        inp.get("name"): inp.get("value", "") for inp in doc.xpath('//input[@type="hidden"][@name]')
+    }
+    target, pages = find_pager(text)
+
+    grid = doc.xpath(f'//table[@id="{target.replace("$", "_")}"]') if target else []
+    records: list[SenasaRecord] = []
+    skipped: list[list[str]] = []
+    if grid:
+        records, skipped = _parse_rows(grid[0], columns)
+    else:
+        # Sin pager no hay id de grilla: la primera tabla con los encabezados esperados
+        tables = doc.xpath("//table[.//th]")
+        for table in tables:
+            try:
+                records, skipped = _parse_rows(table, columns)
+                break
+            except SenasaGridLayoutError:
+                continue
+        else:
+            if tables:
+                _log.warning("grid_not_found", tables=len(tables))
+    return GridPage(
+        records=records,
+        skipped=skipped,
+        hidden=hidden,
+        pager_target=target,
+        page_numbers=pages,
+        update_panel=find_update_panel(text, doc, target),
+    )
+
+
+def _parse_rows(
+    table: lxml_html.HtmlElement, columns: Mapping[str, str]
+) -> tuple[list[SenasaRecord], list[list[str]]]:
+    """Records of the grid's data rows, plus the cells of the rows that did not parse."""
+    headers = [_normalize(th.text_content()) for th in table.xpath(".//tr[th][1]/th")]
+    index = {columns[h]: i for i, h in enumerate(headers) if h in columns}
+    missing = set(columns.values()) - index.keys()
+    if missing:
+        raise SenasaGridLayoutError(
+            f"La grilla no tiene las columnas {sorted(missing)}; encabezados: {headers}"
+        )
+    records = []
+    skipped = []
+    for tr in table.xpath(".//tr[td]"):
+        cells = [td.text_content().strip() for td in tr.xpath("./td")]
+        if len(cells) < len(headers):
+            continue  # fila del pager u otras filas auxiliares
+        try:
+            tambor = Tambor(
+                nro_senasa=CodigoSenasa(cells[index["nro_senasa"]]),
+                establecimiento_codigo=CodigoSenasa(cells[index["establecimiento_codigo"]]),
+                fecha_extraccion=_parse_date(cells[index["fecha_extraccion"]]),
+                peso=_parse_peso(cells[index["peso"]]),
+                tipo_miel=cells[index["tipo_miel"]],
+                origen=cells[index["origen"]],
+                productor=cells[index["productor"]],
+            )
+        except (AssertionError, ValueError):
+            skipped.append(cells)
+            continue
+        records.append(SenasaRecord(tambor=tambor))
+    return records, skipped
+
+
+def find_establecimiento_search(
+    page: FormPage, codigo: str, field: str | None = None
+) -> tuple[dict[str, str], dict[str, str]] | None:
+    """Form fields that filter the grid by one establecimiento.
+
+    Args:
+        page (FormPage): Parsed list page.
+        codigo (str): Establecimiento to search for.
+        field (str | None, optional): Exact ``name`` of the filter input. Defaults
+            to the first text input or select whose name/id mentions "establecimiento".
+
+    Returns:
+        tuple[dict[str, str], dict[str, str]] | None: The filter field (replayed
+        on every page postback) and the search button fields (sent once), or
+        None if the page has no such filter.
+    """
+    if page.doc is None:
+        return None
+    name = field
+    if name is None:
+        inputs = page.doc.xpath(
+            '//input[@name][not(@type) or @type="text" or @type="search"] | //select[@name]'
+        )
+        for el in inputs:
+            if "establecimiento" in _normalize(f"{el.get('id', '')} {el.get('name')}"):
+                name = el.get("name")
+                break
+    if name is None:
+        return None
+    button: dict[str, str] = {}
+    for el in page.doc.xpath('//input[@name][@type="submit" or @type="image"] | //button[@name]'):
+        label = " ".join(filter(None, (el.get("id"), el.get("name"), el.get("value"))))
+        if _SEARCH_BUTTON_RE.search(label):
+            if el.get("type") == "image":
+                button = {f"{el.get('name')}.x": "0", f"{el.get('name')}.y": "0"}
+            else:
+                button = {el.get("name"): el.get("value", "")}
+            break
+    return {name: codigo}, button
+
+
+def _all_older(page: GridPage, since: date | None) -> bool:
+    return (
+        since is not None
+        and bool(page.records)
+        and all(r.tambor.fecha_extraccion < since for r in page.records)
+    )
+
+
+class SenasaExtraccionesScraper:
+    """Concurrent scraper for the SENASA Extracciones (tambores) GridView.
+
+    Page 1 is fetched with a GET. Every other page is a postback with
+    ``__EVENTARGUMENT=Page$N`` carrying the ViewState of the page whose pager
+    linked to N: WebForms only accepts events the posted state rendered, and
+    the pager shows a window of pages, so Page$12 has to be posted from the
+    page that showed the next window's link. Pages linked from the same page
+    are independent and run in parallel. When the grid sits in an
+    UpdatePanel, pages are requested as async posts: the answer is a delta
+    with just the grid and the changed hidden fields, much smaller than the
+    full page, and the state is carried forward from the posted page.
+
+    Requests are bounded by a semaphore (``concurrency``) and a per-host
+    token bucket (``requests_per_second``). At most ``concurrency`` pages are
+    requested ahead of the consumer.
+
+    ``iter_pages(establecimiento=...)`` scrapes a single establecimiento: the
+    grid's search form is posted first and its filter field is replayed with
+    every page, so partitions of a sync can be scraped independently.
+
+    Data rows that do not parse (bad código, date or peso) are not yielded:
+    each one is logged as ``grid_row_skipped`` with its page and raw cells,
+    and ``on_skipped`` gets the count per page, so the loss shows up in the
+    sync's progress instead of passing silently.
+
+    Args:
+        client (httpx.AsyncClient): Client carrying the authenticated SENASA cookies.
+        concurrency (int, optional): Max in-flight page requests. Defaults to 4.
+        requests_per_second (float, optional): Per-host rate limit. Defaults to 5.0.
+        list_url (str, optional): GridView page URL. Defaults to EXTRACCIONES_LIST_URL.
+        columns (Mapping[str, str] | None, optional): Header mapping override.
+        filter_field (str | None, optional): Establecimiento filter input override
+            (see find_establecimiento_search).
+        async_post (bool, optional): Use UpdatePanel async posts when the page
+            supports them. Defaults to True.
+        on_skipped (Callable[[int], None] | None, optional): Called with the
+            number of unparseable rows of each page that had any.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        concurrency: int = 4,
+        requests_per_second: float = 5.0,
+        list_url: str = EXTRACCIONES_LIST_URL,
+        columns: Mapping[str, str] | None = None,
+        filter_field: str | None = None,
+        async_post: bool = True,
+        on_skipped: Callable[[int], None] | None = None,
+    ) -> None:
+        self.client = client
+        self.concurrency = max(1, concurrency)
+        self.list_url = list_url
+        self.columns = columns or DEFAULT_COLUMNS
+        self.filter_field = filter_field
+        self.async_post = async_post
+        self.on_skipped = on_skipped
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._limiter = HostRateLimiter(requests_per_second, burst=self.concurrency)
+        self._host = urlparse(list_url).netloc
+
+    async def iter_pages(
+        self, since: date | None = None, establecimiento: str | None = None
+    ) -> AsyncGenerator[list[SenasaRecord], None]:
+        """Yields each page's records in page order.
+
+        The listing shows the most recent extracciones first, so with ``since``
+        paging stops at the first page whose rows are all older than that date.
+        With ``establecimiento`` only that establecimiento's rows are yielded.
+
+        Raises:
+            SenasaFilterUnavailableError: ``establecimiento`` was given but the
+                page has no establecimiento filter.
+        """
+        extra: dict[str, str] = {}
+        if establecimiento is None:
+            first = await self._request("GET", self.list_url, step="Extracciones-list")
+        else:
+            first, extra = await self._search(establecimiento)
+        yield self._page_records(first, 1, establecimiento)
+        if not first.pager_target or _all_older(first, since):
+            return
+
+        # Página -> página ya obtenida cuyo pager la enlaza (su estado es el que se postea)
+        linked_from = dict.fromkeys(first.page_numbers, first)
+        next_page = 2
+        pending: dict[int, asyncio.Task[GridPage]] = {}
+        try:
+            while True:
+                while len(pending) < self.concurrency and next_page in linked_from:
+                    pending[next_page] = asyncio.create_task(
+                        self._request_page(linked_from[next_page], next_page, extra)
+                    )
+                    next_page += 1
+                if not pending:
+                    return
+                page_no = min(pending)
+                page = await pending.pop(page_no)
+                # El pager sólo muestra una ventana de páginas: se descubren más al avanzar
+                for n in page.page_numbers:
+                    linked_from.setdefault(n, page)
+                yield self._page_records(page, page_no, establecimiento)
+                if _all_older(page, since):
+                    return
+        finally:
+            for task in pending.values():
+                task.cancel()
+
+    async def _search(self, establecimiento: str) -> tuple[GridPage, dict[str, str]]:
+        form = extract_forms(
+            (await self._send("GET", self.list_url, step="Extracciones-list")).text
+        )
+        search = find_establecimiento_search(form, establecimiento, self.filter_field)
+        if search is None:
+            raise SenasaFilterUnavailableError(
+                "La grilla de Extracciones no tiene filtro por establecimiento"
+            )
+        filter_fields, button = search
+        data = {**form.hidden, **filter_fields, **button}
+        page = await self._request("POST", self.list_url, data=data, step="Extracciones-search")
+        return page, filter_fields
+
+    def _page_records(
+        self, page: GridPage, page_no: int, establecimiento: str | None
+    ) -> list[SenasaRecord]:
+        for cells in page.skipped:
+            _log.warning("grid_row_skipped", page=page_no, cells=cells)
+        if page.skipped and self.on_skipped:
+            self.on_skipped(len(page.skipped))
+        # El filtro del sitio puede ser por prefijo: se descartan otros establecimientos
+        if establecimiento is None:
+            return page.records
+        return [r for r in page.records if str(r.tambor.establecimiento_codigo) == establecimiento]
+
+    async def _request_page(
+        self, source: GridPage, page_no: int, extra: Mapping[str, str] | None = None
+    ) -> GridPage:
+        data, headers = page_postback(
+            source.pager_target or "",
+            page_no,
+            {**source.hidden, **(extra or {})},
+            source.update_panel if self.async_post else None,
+        )
+        resp = await self._send(
+            "POST", self.list_url, data=data, headers=headers, step="Extracciones-page"
+        )
+        posted = read_page_postback(resp.text, page_no, source.hidden)
+        page = parse_grid_page(posted.html, self.columns)
+        page.hidden = posted.hidden
+        # El delta no trae el ScriptManager: la página siguiente usa el mismo panel
+        if posted.async_post:
+            page.update_panel = source.update_panel
+        return page
+
+    async def _request(
+        self, method: str, url: str, *, data: Mapping[str, str] | None = None, step: str
+    ) -> GridPage:
+        resp = await self._send(method, url, data=data, step=step)
+        return parse_grid_page(resp.text, self.columns)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        step: str,
+    ) -> httpx.Response:
+        headers = {"Referer": self.list_url, **(headers or {})}
+        async with self._semaphore:
+            await self._limiter.acquire(self._host)
+            resp = await self.client.request(
+                method, url, data=data, headers=headers, follow_redirects=False
+            )
+        metrics.observe_http(resp, step)
+        if resp.is_redirect and "/Login.aspx" in resp.headers.get("Location", ""):
+            raise SenasaSessionExpiredError(f"{method} {url} redirected to login")
+        resp.raise_for_status()
+        return resp
@@ -1,162 +1,369 @@
 from __future__ import annotations
 
-from mimetypes import init
 import re
 import time
-from urllib.parse import urljoin, urlparse, unquote
+from typing import Generic, TypeVar
+from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup  # type: ignore[import-untyped]
-
-from senasa_pipeline.application.ports.http_client_port import HttpClientPort
-from senasa_pipeline.application.ports.senasa_login_port import SenasaLoginPort
+from senasa_pipeline.application.ports.http_client_port import (
+    AsyncHttpClientPort,
+    HttpClientPort,
+    HttpResponse,
+)
+from senasa_pipeline.application.ports.senasa_login_port import (
+    AsyncSenasaLoginPort,
+    SenasaLoginPort,
+)
+from senasa_pipeline.infrastructure import metrics
+from senasa_pipeline.infrastructure.adapters.html.forms import (
+    FormPage,
+    extract_forms,
+    parse_document,
+)
+from senasa_pipeline.infrastructure.adapters.senasa.webforms import is_delta, parse_delta
+from senasa_pipeline.log import debug_enabled, get_logger
 
 SENASA_BASE = "https://trazabilidadapicola.senasa.gob.ar"
+LOGIN_URL = f"{SENASA_BASE}/Login.aspx?from=afip"
+VALIDATION_URL = f"{SENASA_BASE}/Sur/Extracciones/List"
 
+_HTML_ACCEPT = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_FORM_TAG_RE = re.compile(r"<form[\s>]", re.IGNORECASE)
+_USER_BUTTON_ID = "ctl00_MasterEditBox_ucLogin_rptUsuariosAfip_ctl05_btnLoginAfip"
+_USER_NAME = "COOP. APICOLA DEL PARANA"
+_USER_CUIT = "30-70933844-3"
 
-class SenasaLoginConsumer(SenasaLoginPort):
-    """
-    Consume token/sign AFIP para establecer sesión SENASA.
+_AFIP_POST_HEADERS = {
+    "Referer": "https://portalcf.cloud.afip.gob.ar/portal/app/",
+    "Origin": "https://portalcf.cloud.afip.gob.ar",
+    "Content-Type": "application/x-www-form-urlencoded",
+}
+
+# Exact headers from DevTools
+_AJAX_HEADERS = {
+    "Accept": "*/*",
+    "Accept-Language": "es-419,es;q=0.9,en;q=0.8",
+    "Cache-Control": "no-cache",
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+    "Origin": SENASA_BASE,
+    "Referer": LOGIN_URL,
+    "X-MicrosoftAjax": "Delta=true",
+    "X-Requested-With": "XMLHttpRequest",
+}
+
+_DEFAULT_ASPX_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "Accept-Encoding": "gzip, deflate, br, zstd",
+    "Accept-Language": "es-419,es;q=0.9,en;q=0.8",
+    "Cache-Control": "max-age=0",
+    "Priority": "u=0, i",
+    "Referer": LOGIN_URL,
+}
+
+_VALIDATION_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "Accept-Encoding": "gzip, deflate, br, zstd",
+    "Accept-Language": "es-419,es;q=0.9,en;q=0.8",
+    "Cache-Control": "max-age=0",
+    "Priority": "u=0, i",
+    "Referer": f"{SENASA_BASE}/Default.aspx",
+    "Sec-Ch-Ua": '"Google Chrome";v="141", "Not?A_Brand";v="8", "Chromium";v="141"',
+    "Sec-Ch-Ua-Mobile": "?0",
+    "Sec-Ch-Ua-Platform": '"Windows"',
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "same-origin",
+    "Sec-Fetch-User": "?1",
+    "Upgrade-Insecure-Requests": "1",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36",
+}
+
+
+# Cliente HTTP de cada variante: mypy ve métodos sync o corrutinas, nunca la unión
+_HttpT = TypeVar("_HttpT", HttpClientPort, AsyncHttpClientPort)
+
+
+class _SenasaLoginFlow(Generic[_HttpT]):
+    """Parsing y payloads del login SENASA compartidos por las variantes sync y async.
+
+    Las subclases sólo implementan la E/S HTTP de cada paso.
     """
 
-    def __init__(self, http: HttpClientPort) -> None:
-        self.http = http
+    http: _HttpT
+
+    def __init__(self) -> None:
         self.cookies: dict[str, str] = {}
         self._session_ready = False
-        self._dump_html = True
         self._max_dump_chars = 2000
-
-    def _log(self, msg: str) -> None:
-        print(f"[SenasaLoginConsumer] {msg}")
+        self._log = get_logger(type(self).__name__)
 
     def _dump_snippet(self, html: str, label: str) -> None:
-        if not self._dump_html or not html:
+        if not html or not debug_enabled():
             return
         snippet = re.sub(r"\s+", " ", html)[: self._max_dump_chars]
-        self._log(f"{label} snippet: {snippet}")
-
-    def _log_response_details(self, resp, step_name: str) -> None:
-        url = getattr(resp, "url", "unknown")
-        content_length = len(resp.text) if hasattr(resp, "text") else 0
-        self._log(f"{step_name} -> status={resp.status_code} len={content_length} url={url}")
-        if hasattr(resp, "text") and resp.text:
-            soup = BeautifulSoup(resp.text, "html.parser")
-            forms = soup.find_all("form")
-            viewstate = 'name="__VIEWSTATE"' in resp.text
-            self._log(f"{step_name} -> forms={len(forms)} viewstate={viewstate}")
-        if content_length < 500:  # Log short responses completely
-            self._dump_snippet(getattr(resp, "text", ""), step_name)
-        sent_cookies = resp.request.headers.get('Cookie', 'NO COOKIES SENT') if hasattr(resp, 'request') else 'NO REQUEST INFO'
-        self._log(f"{step_name} -> cookies_sent: {sent_cookies[:200]}...")
+        self._log.debug("response_snippet", step=label, snippet=snippet)
 
+    def _log_response_details(self, resp: HttpResponse, step_name: str) -> None:
+        metrics.observe_http(resp, step_name)
+        text = getattr(resp, "text", "") or ""
+        self._log.info(
+            "senasa_step",
+            step=step_name,
+            status=resp.status_code,
+            length=len(text),
+            url=getattr(resp, "url", "unknown"),
+        )
+        if not debug_enabled():
+            return
+        # Sólo diagnóstico (nivel DEBUG): se cuentan tags sin construir un árbol HTML
+        try:
+            sent_cookies = resp.request.headers.get("Cookie")
+        except AttributeError:
+            sent_cookies = None
+        self._log.debug(
+            "senasa_step_details",
+            step=step_name,
+            forms=len(_FORM_TAG_RE.findall(text)),
+            viewstate='name="__VIEWSTATE"' in text,
+            cookies_sent=sent_cookies,
+        )
+        if len(text) < 500:  # respuestas cortas: se vuelcan completas
+            self._dump_snippet(text, step_name)
 
     def _parse_updatepanel_response(self, response_text: str) -> str | None:
         """Parse Microsoft AJAX UpdatePanel response for pageRedirect."""
-        if not response_text or not response_text.startswith("1|#|"):
+        if not response_text or not is_delta(response_text):
             return None
-        parts = response_text.split("|")
         try:
-            for i, part in enumerate(parts):
-                if part == "pageRedirect" and i + 2 < len(parts):
-                    redirect_url = parts[i + 2]
-                    return unquote(redirect_url) if "%" in redirect_url else redirect_url
-        except Exception as e:
-            self._log(f"Error parsing UpdatePanel: {e}")
+            return parse_delta(response_text).redirect
+        except ValueError as e:
+            self._log.warning("updatepanel_parse_failed", error=str(e))
+        return None
+
+    @staticmethod
+    def _updatepanel_redirect_url(redirect_path: str, base_url: str) -> str:
+        if redirect_path.startswith("/"):
+            return f"{SENASA_BASE}{redirect_path}"
+        return urljoin(base_url, redirect_path)
+
+    @staticmethod
+    def _first_form_request(html: str, base_url: str) -> tuple[str, dict[str, str]] | None:
+        """URL y payload para auto-submit del primer form con action."""
+        form = extract_forms(html).form()
+        if not form or not form.action:
+            return None
+        return urljoin(base_url, form.action), dict(form.fields)
+
+    def _extract_meta_refresh(self, html: str, base_url: str) -> str | None:
+        """Extract meta refresh URL from HTML."""
+        doc = parse_document(html)
+        if doc is None:
+            return None
+        metas = doc.xpath("//meta[translate(@http-equiv, 'REFSH', 'refsh')='refresh']")
+        if not metas:
+            return None
+        content = metas[0].get("content", "")
+        parts = content.split("url=", 1)
+        if len(parts) == 2:
+            url = parts[1].strip().strip("'\"")
+            return urljoin(base_url, url)
+        return None
+
+    @staticmethod
+    def _intermediate_token_sign_form(page: FormPage) -> tuple[str, dict[str, str]] | None:
+        """Form intermedio con token/sign que el browser auto-envía, si está presente."""
+        form = page.form()
+        if not (form and "token" in form.fields and "sign" in form.fields):
+            return None
+        return urljoin(LOGIN_URL, form.action or LOGIN_URL), dict(form.fields)
+
+    def _user_selection_payload(self, page: FormPage) -> dict[str, str]:
+        """Arma el POST AJAX que selecciona el usuario COOP. APICOLA DEL PARANA."""
+        hidden = dict(page.hidden)
+        self._log.debug("hidden_fields_extracted", count=len(hidden))
+
+        # Find COOP. APICOLA DEL PARANA button - robust detection: exact ID,
+        # then by text (name or CUIT), then inside the rptUsuariosAfip repeater
+        user_btn = None
+        if page.doc is not None:
+            for xpath in (
+                f'//a[@id="{_USER_BUTTON_ID}"]',
+                f'//a[contains(., "{_USER_NAME}")]',
+                f'//a[contains(., "{_USER_CUIT}")]',
+                f'//*[contains(@id, "rptUsuariosAfip")]//a[contains(., "{_USER_NAME}")]',
+            ):
+                if found := page.doc.xpath(xpath):
+                    user_btn = found[0]
+                    break
+
+        if user_btn is None:
+            raise RuntimeError("Could not find COOP. APICOLA DEL PARANA user button")
+
+        btn_id = user_btn.get("id", _USER_BUTTON_ID)
+        if not btn_id:
+            raise RuntimeError("User button has no ID")
+
+        label = user_btn.text_content().strip()
+        self._log.debug("user_button_found", button_id=btn_id, label=label)
+
+        event_target = btn_id.replace("_", "$")
+        payload = hidden.copy()
+        payload.update(
+            {
+                "ctl00$ScriptManager1": f"ctl00$updatePanelEdit|{event_target}",
+                "__EVENTTARGET": event_target,
+                "__EVENTARGUMENT": "",
+                "__ASYNCPOST": "true",
+                "__LASTFOCUS": "",
+                "__SCROLLPOSITIONX": "0",
+                "__SCROLLPOSITIONY": "0",
+                "ctl00$hiddenPendingDownload": "",
+                "ctl00$hidden_PENDING_DOWNLOAD_FILENAME": "",
+                "ctl00$hidden_PENDING_DOWNLOAD_CONTENTTYPE": "",
+                "ctl00$hidden_PENDING_DOWNLOAD_BYTES": "",
+                "ctl00$hiddenPostBackAction": "",
+            }
+        )
+        return payload
+
+    def _check_default_response(self, default_resp: HttpResponse) -> None:
+        """Verify we got to the main app page."""
+        if default_resp.status_code != 200:
+            if default_resp.status_code in _REDIRECT_CODES:
+                loc = default_resp.headers.get("Location", "")
+                self._log.info("default_aspx_redirected", location=loc)
+                if "/Login.aspx" in loc:
+                    raise RuntimeError("Default.aspx redirected to login - session not established")
+            else:
+                raise RuntimeError(f"Default.aspx returned {default_resp.status_code}")
+        self._log.info("session_established")
+
+    def restore_session(self, cookies: dict[str, str]) -> None:
+        """Carga cookies guardadas para probar/usar una sesión previa sin re-login."""
+        self.http.set_cookies(cookies)
+        self.cookies = dict(cookies)
+        self._session_ready = True
+
+    def _probe_result(self, resp: HttpResponse) -> bool | None:
+        """Interpreta el HEAD sin redirects: True/False, o None si no es concluyente."""
+        metrics.observe_http(resp, "Session-probe")
+        self._log.debug("session_probe", status=resp.status_code)
+        if resp.status_code == 200:
+            return True
+        if resp.status_code in (401, 403):
+            return False
+        if resp.status_code in _REDIRECT_CODES and "/Login.aspx" in resp.headers.get(
+            "Location", ""
+        ):
+            self._log.info("session_invalid", reason="redirected_to_login")
+            return False
+        # p.ej. 405 si el servidor no acepta HEAD: se valida con el GET completo
         return None
 
-    def _follow_updatepanel_redirect(self, response, base_url: str):
-        """Follow UpdatePanel pageRedirect if present."""
+    def _validation_result(self, resp: HttpResponse) -> bool:
+        self._log_response_details(resp, "Session-validation")
+        if resp.status_code in _REDIRECT_CODES:
+            loc = resp.headers.get("Location", "")
+            if "/Login.aspx" in loc:
+                self._log.info("session_invalid", reason="redirected_to_login")
+                return False
+
+        success = resp.status_code == 200 and 'name="__VIEWSTATE"' in resp.text
+        self._log.info("session_validated", status=resp.status_code, success=success)
+        return success
+
+
+class SenasaLoginConsumer(_SenasaLoginFlow[HttpClientPort], SenasaLoginPort):
+    """
+    Consume token/sign AFIP para establecer sesión SENASA.
+    """
+
+    def __init__(self, http: HttpClientPort) -> None:
+        super().__init__()
+        self.http = http
+
+    def _follow_updatepanel_redirect(
+        self, response: HttpResponse, base_url: str
+    ) -> HttpResponse | None:
+        """Follow UpdatePanel pageRedirect."""
         if not hasattr(response, "text"):
             return None
         redirect_path = self._parse_updatepanel_response(response.text)
         if not redirect_path:
             return None
-        redirect_url = f"{SENASA_BASE}{redirect_path}" if redirect_path.startswith("/") else urljoin(base_url, redirect_path)
-        self._log(f"Following UpdatePanel redirect to: {redirect_url}")
+        redirect_url = self._updatepanel_redirect_url(redirect_path, base_url)
+        self._log.debug("updatepanel_redirect", url=redirect_url)
         try:
-            return self.http.get(redirect_url, headers={
-                "Referer": base_url,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            })
+            return self.http.get(
+                redirect_url, headers={"Referer": base_url, "Accept": _HTML_ACCEPT}
+            )
         except Exception as e:
-            self._log(f"Error following UpdatePanel redirect: {e}")
+            self._log.warning("updatepanel_redirect_failed", error=str(e))
             return None
 
-    def _auto_submit_first_form(self, html: str, base_url: str):
+    def _auto_submit_first_form(self, html: str, base_url: str) -> HttpResponse | None:
         """Auto-submit first form found in HTML."""
-        soup = BeautifulSoup(html, "html.parser")
-        form = soup.find("form")
-        if not form:
-            return None
-        action = form.get("action") or ""
-        if not action:
-            return None
-        post_url = urljoin(base_url, action)
-        payload = {inp.get("name"): inp.get("value", "") for inp in form.find_all("input") if inp.get("name")}
-        return self.http.post(post_url, data=payload, headers={
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Referer": base_url,
-        })
-
-    def _extract_meta_refresh(self, html: str, base_url: str):
-        """Extract meta refresh URL from HTML."""
-        soup = BeautifulSoup(html, "html.parser")
-        meta = soup.find("meta", attrs={"http-equiv": lambda v: v and v.lower() == "refresh"})
-        if not meta:
+        request = self._first_form_request(html, base_url)
+        if not request:
             return None
-        content = meta.get("content", "")
-        parts = content.split("url=", 1)
-        if len(parts) == 2:
-            url = parts[1].strip().strip("'\"")
-            return urljoin(base_url, url)
-        return None
+        post_url, payload = request
+        return self.http.post(
+            post_url,
+            data=payload,
+            headers={"Content-Type": "application/x-www-form-urlencoded", "Referer": base_url},
+        )
 
     def login_with_token_sign(self, token: str, sign: str) -> None:
-        self._log("Starting SENASA login with AFIP token/sign")
+        self._log.info("senasa_login_started")
         self._session_ready = False
-        
-        # 1. POST token/sign to SENASA
-        html=self._post_token_sign_to_senasa(token, sign)
-        
-        # 2. Get login page and select user
-        self._select_user_and_establish_session(html)
-        
+        started = time.perf_counter()
+        try:
+            # 1. POST token/sign to SENASA
+            html = self._post_token_sign_to_senasa(token, sign)
+
+            # 2. Get login page and select user
+            self._select_user_and_establish_session(html)
+        except Exception:
+            metrics.observe_login("senasa", "failure", started)
+            raise
+        metrics.observe_login("senasa", "success", started)
+
         # 3. Save cookies
         self.cookies = self.http.dump_cookies()
         self._session_ready = True
-        self._log(f"Login complete, {len(self.cookies)} cookies saved")
+        self._log.info("senasa_login_complete", cookie_count=len(self.cookies))
 
     def _post_token_sign_to_senasa(self, token: str, sign: str) -> str:
         """Step 1: POST token/sign to /afip endpoint."""
-        url = f"{SENASA_BASE}/afip"
-        headers = {
-            "Referer": "https://portalcf.cloud.afip.gob.ar/portal/app/",
-            "Origin": "https://portalcf.cloud.afip.gob.ar",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        resp = self.http.post(url, data={"token": token, "sign": sign}, headers=headers, allow_redirects=True)
+        resp = self.http.post(
+            f"{SENASA_BASE}/afip",
+            data={"token": token, "sign": sign},
+            headers=_AFIP_POST_HEADERS,
+            allow_redirects=True,
+        )
         self._log_response_details(resp, "POST-afip")
         return resp.text
 
-    def _select_user_and_establish_session(self,initial_html: str | None = None) -> None:
+    def _select_user_and_establish_session(self, initial_html: str | None = None) -> None:
         """Step 2: Navigate to login page, select user, and establish session."""
-        login_url = f"{SENASA_BASE}/Login.aspx?from=afip"
-        html=initial_html or ''
+        html = initial_html or ""
         # GET login page with user selection
         if not html:
-            resp = self.http.get(login_url, headers={
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Referer": f"{SENASA_BASE}/afip",
-            },allow_redirects=False)
+            resp = self.http.get(
+                LOGIN_URL,
+                headers={"Accept": _HTML_ACCEPT, "Referer": f"{SENASA_BASE}/afip"},
+                allow_redirects=False,
+            )
             self._log_response_details(resp, "GET-login-page")
-        
+            html = resp.text
+
         # Handle intermediate token/sign form if present
-        soup = BeautifulSoup(html, "html.parser")
-        form = soup.find("form")
-        if form and form.find("input", {"name": "token"}) and form.find("input", {"name": "sign"}):
-            self._log("Auto-submitting intermediate token/sign form")
-            action = form.get("action") or login_url
-            post_url = urljoin(login_url, action)
-            payload = {inp.get("name"): inp.get("value", "") for inp in form.find_all("input") if inp.get("name")}
+        page = extract_forms(html)
+        intermediate = self._intermediate_token_sign_form(page)
+        if intermediate:
+            self._log.debug("intermediate_form_submitted")
+            post_url, payload = intermediate
             headers = {
                 "Content-Type": "application/x-www-form-urlencoded",
                 "Origin": SENASA_BASE,
@@ -164,174 +371,118 @@ class SenasaLoginConsumer(SenasaLoginPort):
             }
             resp = self.http.post(post_url, data=payload, headers=headers)
             self._log_response_details(resp, "Token-sign-auto-submit")
-            soup = BeautifulSoup(resp.text, "html.parser")
-        
-        # Extract hidden fields
-        hidden = {}
-        for inp in soup.find_all("input", {"type": "hidden", "name": True}):
-            hidden[inp["name"]] = inp.get("value", "")
-        self._log(f"Extracted {len(hidden)} hidden fields")
-        
-        # Find COOP. APICOLA DEL PARANA button - robust detection
-        user_btn = None
-        # Try by exact ID first
-        user_btn = soup.find("a", id="ctl00_MasterEditBox_ucLogin_rptUsuariosAfip_ctl05_btnLoginAfip")
-        if not user_btn:
-            # Try by text content
-            user_btn = soup.find("a", string=lambda t: t and "COOP. APICOLA DEL PARANA" in t)
-        if not user_btn:
-            # Try finding any button with the CUIT
-            user_btn = soup.find("a", string=lambda t: t and "30-70933844-3" in t)
-        if not user_btn:
-            # Fallback: find in repeater container
-            container = soup.find(id=lambda x: x and "rptUsuariosAfip" in x)
-            if container:
-                buttons = container.find_all("a")
-                for btn in buttons:
-                    if btn.get_text() and "COOP. APICOLA DEL PARANA" in btn.get_text():
-                        user_btn = btn
-                        break
-        
-        if not user_btn:
-            raise RuntimeError("Could not find COOP. APICOLA DEL PARANA user button")
-        
-        btn_id = user_btn.get('id', 'ctl00_MasterEditBox_ucLogin_rptUsuariosAfip_ctl05_btnLoginAfip')
-        if not btn_id:
-            raise RuntimeError("User button has no ID")
-        
-        self._log(f"Found user button: {btn_id} -> {user_btn.get_text()}")
-        
+            page = extract_forms(resp.text)
+
         # Execute user selection AJAX POST with exact DevTools headers
-        event_target = btn_id.replace("_", "$")
-        payload = hidden.copy()
-        payload.update({
-            "ctl00$ScriptManager1": f"ctl00$updatePanelEdit|{event_target}",
-            "__EVENTTARGET": event_target,
-            "__EVENTARGUMENT": "",
-            "__ASYNCPOST": "true",
-            "__LASTFOCUS": "",
-            "__SCROLLPOSITIONX": "0",
-            "__SCROLLPOSITIONY": "0", 
-            "ctl00$hiddenPendingDownload": "",
-            "ctl00$hidden_PENDING_DOWNLOAD_FILENAME": "",
-            "ctl00$hidden_PENDING_DOWNLOAD_CONTENTTYPE": "",
-            "ctl00$hidden_PENDING_DOWNLOAD_BYTES": "",
-            "ctl00$hiddenPostBackAction": "",
-        })
-        
-        # Exact headers from DevTools
-        ajax_headers = {
-            "Accept": "*/*",
-            "Accept-Language": "es-419,es;q=0.9,en;q=0.8",
-            "Cache-Control": "no-cache",
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "Origin": SENASA_BASE,
-            "Referer": login_url,
-            "X-MicrosoftAjax": "Delta=true",
-            "X-Requested-With": "XMLHttpRequest",
-        }
-        
-        self._log(f"Executing user selection AJAX POST with {len(payload)} fields")
-        resp_ajax = self.http.post(login_url, data=payload, headers=ajax_headers)
+        payload = self._user_selection_payload(page)
+        self._log.debug("user_selection_post", fields=len(payload))
+        resp_ajax = self.http.post(LOGIN_URL, data=payload, headers=_AJAX_HEADERS)
         self._log_response_details(resp_ajax, "User-selection-AJAX")
-        
-        """# Handle response
-        if hasattr(resp_ajax, 'text') and resp_ajax.text.strip():
-            # Non-empty response - check for UpdatePanel redirect
-            if resp_ajax.text.startswith('1|#|'):
-                redirect_path = self._parse_updatepanel_response(resp_ajax.text)
-                if redirect_path:
-                    self._log(f"UpdatePanel redirect to: {redirect_path}")
-                    # Follow redirect and log error details
-                    error_resp = self._follow_updatepanel_redirect(resp_ajax, login_url)
-                    if error_resp:
-                        self._log_response_details(error_resp, "Error-page")
-                    raise RuntimeError(f"User selection failed - redirected to: {redirect_path}")
-            else:
-                self._log("Non-empty AJAX response (unexpected):")
-                self._dump_snippet(resp_ajax.text, "AJAX-unexpected")
-        else:
-            self._log("AJAX response empty/null (success indicator)")"""
-        
+
         # Navigate to Default.aspx like the browser does with EXACT DevTools headers
-        self._log("Navigating to /Default.aspx to establish session")
-        default_headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
-            "Accept-Language": "es-419,es;q=0.9,en;q=0.8",
-            "Cache-Control": "max-age=0",
-            "Priority": "u=0, i",
-            "Referer": login_url,
-        }
-        default_resp = self.http.get(f"{SENASA_BASE}/Default.aspx", allow_redirects=False, headers=default_headers)
+        self._log.debug("default_aspx_navigation")
+        default_resp = self.http.get(
+            f"{SENASA_BASE}/Default.aspx", allow_redirects=False, headers=_DEFAULT_ASPX_HEADERS
+        )
         self._log_response_details(default_resp, "Default-aspx")
-        
-        # Verify we got to the main app page
-        if default_resp.status_code != 200:
-            if default_resp.status_code in (301, 302, 303, 307, 308):
-                loc = default_resp.headers.get('Location', '')
-                self._log(f"Default.aspx redirected to: {loc}")
-                if '/Login.aspx' in loc:
-                    raise RuntimeError("Default.aspx redirected to login - session not established")
-            else:
-                raise RuntimeError(f"Default.aspx returned {default_resp.status_code}")
-        
-        
-        self._log("Session established successfully at /Default.aspx")
-
-    # ---------- Helpers ----------
-    def _follow_updatepanel_redirect(self, response, base_url: str):
-        """Follow UpdatePanel pageRedirect."""
-        if not hasattr(response, "text"):
-            return None
-        redirect_path = self._parse_updatepanel_response(response.text)
-        if not redirect_path:
-            return None
-        redirect_url = f"{SENASA_BASE}{redirect_path}" if redirect_path.startswith("/") else urljoin(base_url, redirect_path)
-        try:
-            return self.http.get(redirect_url, headers={
-                "Referer": base_url,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            })
-        except Exception as e:
-            self._log(f"Error following UpdatePanel redirect: {e}")
-            return None
+        self._check_default_response(default_resp)
 
     # ---------- Validation ----------
     def validate_session(self) -> bool:
+        """Validate SENASA session without following redirects.
+
+        A HEAD probe (no body) settles the common cases; only an inconclusive
+        status falls back to downloading the page and checking ``__VIEWSTATE``.
+        """
+        if not self._session_ready:
+            self._log.warning("validate_session_before_setup")
+            return False
+        probe = self._probe_result(
+            self.http.head(VALIDATION_URL, allow_redirects=False, headers=_VALIDATION_HEADERS)
+        )
+        if probe is not None:
+            return probe
+        resp = self.http.get(VALIDATION_URL, allow_redirects=False, headers=_VALIDATION_HEADERS)
+        return self._validation_result(resp)
+
+
+class AsyncSenasaLoginConsumer(_SenasaLoginFlow[AsyncHttpClientPort], AsyncSenasaLoginPort):
+    """Variante async de SenasaLoginConsumer sobre AsyncHttpClientPort."""
+
+    def __init__(self, http: AsyncHttpClientPort) -> None:
+        super().__init__()
+        self.http = http
+
+    async def login_with_token_sign(self, token: str, sign: str) -> None:
+        self._log.info("senasa_login_started")
+        self._session_ready = False
+        started = time.perf_counter()
+        try:
+            resp = await self.http.post(
+                f"{SENASA_BASE}/afip",
+                data={"token": token, "sign": sign},
+                headers=_AFIP_POST_HEADERS,
+                allow_redirects=True,
+            )
+            self._log_response_details(resp, "POST-afip")
+            await self._select_user_and_establish_session(resp.text)
+        except Exception:
+            metrics.observe_login("senasa", "failure", started)
+            raise
+        metrics.observe_login("senasa", "success", started)
+
+        self.cookies = self.http.dump_cookies()
+        self._session_ready = True
+        self._log.info("senasa_login_complete", cookie_count=len(self.cookies))
+
+    async def _select_user_and_establish_session(self, initial_html: str | None = None) -> None:
+        html = initial_html or ""
+        if not html:
+            resp = await self.http.get(
+                LOGIN_URL,
+                headers={"Accept": _HTML_ACCEPT, "Referer": f"{SENASA_BASE}/afip"},
+                allow_redirects=False,
+            )
+            self._log_response_details(resp, "GET-login-page")
+            html = resp.text
+
+        page = extract_forms(html)
+        intermediate = self._intermediate_token_sign_form(page)
+        if intermediate:
+            self._log.debug("intermediate_form_submitted")
+            post_url, payload = intermediate
+            headers = {
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Origin": SENASA_BASE,
+                "Referer": f"{SENASA_BASE}/afip",
+            }
+            resp = await self.http.post(post_url, data=payload, headers=headers)
+            self._log_response_details(resp, "Token-sign-auto-submit")
+            page = extract_forms(resp.text)
+
+        payload = self._user_selection_payload(page)
+        self._log.debug("user_selection_post", fields=len(payload))
+        resp_ajax = await self.http.post(LOGIN_URL, data=payload, headers=_AJAX_HEADERS)
+        self._log_response_details(resp_ajax, "User-selection-AJAX")
+
+        self._log.debug("default_aspx_navigation")
+        default_resp = await self.http.get(
+            f"{SENASA_BASE}/Default.aspx", allow_redirects=False, headers=_DEFAULT_ASPX_HEADERS
+        )
+        self._log_response_details(default_resp, "Default-aspx")
+        self._check_default_response(default_resp)
+
+    async def validate_session(self) -> bool:
         """Validate SENASA session without following redirects."""
         if not self._session_ready:
-            self._log("WARNING: validate_session called before session setup")
+            self._log.warning("validate_session_before_setup")
             return False
-        
-        url = f"{SENASA_BASE}/Sur/Extracciones/List"
-        validation_headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
-            "Accept-Language": "es-419,es;q=0.9,en;q=0.8",
-            "Cache-Control": "max-age=0",
-            "Priority": "u=0, i",
-            "Referer": f"{SENASA_BASE}/Default.aspx",
-            "Sec-Ch-Ua": '"Google Chrome";v="141", "Not?A_Brand";v="8", "Chromium";v="141"',
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Ch-Ua-Platform": '"Windows"',
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "same-origin",
-            "Sec-Fetch-User": "?1",
-            "Upgrade-Insecure-Requests": "1",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36",
-        }
-        
-        resp = self.http.get(url, allow_redirects=False, headers=validation_headers)
-        self._log_response_details(resp, "Session-validation")
-        
-        if resp.status_code in (301, 302, 303, 307, 308):
-            loc = resp.headers.get('Location', '')
-            if '/Login.aspx' in loc:
-                self._log("Validation failed: redirected to login")
-                return False
-        
-        success = resp.status_code == 200 and 'name="__VIEWSTATE"' in resp.text
-        self._log(f"Validation result: status={resp.status_code} viewstate={success} success={success}")
-        return success
\ No newline at end of file
+        probe = self._probe_result(
+            await self.http.head(VALIDATION_URL, allow_redirects=False, headers=_VALIDATION_HEADERS)
+        )
+        if probe is not None:
+            return probe
+        resp = await self.http.get(
+            VALIDATION_URL, allow_redirects=False, headers=_VALIDATION_HEADERS
+        )
+        return self._validation_result(resp)
@@ -0,0 +1,291 @@
+"""ASP.NET WebForms helpers for SENASA: UpdatePanel delta responses and GridView paging.
+
+SENASA pages are WebForms: every postback replays ``__VIEWSTATE``/``__EVENTVALIDATION``
+and, when the ScriptManager is present, can be sent as an async post
+(``__ASYNCPOST=true``) that answers with a *delta* instead of the whole page::
+
+    1|#||4|<len>|updatePanel|<panel id>|<html>|<len>|hiddenField|__VIEWSTATE|<value>|...
+
+Each segment is ``length|type|id|content|`` where ``length`` is the size of
+``content``. Content can itself contain ``|``, so the format has to be read by
+length, not split on the separator.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from urllib.parse import unquote
+
+from senasa_pipeline.infrastructure.adapters.html.forms import HtmlElement, extract_forms
+
+DELTA_PREFIX = "1|#|"
+
+_PAGER_RE = re.compile(r"__doPostBack\('([^']+)','Page\$(\d+)'\)")
+# Sys.WebForms.PageRequestManager._initialize('ctl00$ScriptManager1', 'aspnetForm', ['tctl00$up',...
+_PRM_INIT_RE = re.compile(r"PageRequestManager\._initialize\('([^']+)',\s*'[^']*',\s*\[([^\]]*)\]")
+
+ASYNC_POST_HEADERS = {
+    "Accept": "*/*",
+    "Cache-Control": "no-cache",
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+    "X-MicrosoftAjax": "Delta=true",
+    "X-Requested-With": "XMLHttpRequest",
+}
+
+
+class SenasaSessionExpiredError(RuntimeError):
+    """SENASA redirected to /Login.aspx: the stored session is no longer valid."""
+
+
+class WebFormsDeltaError(RuntimeError):
+    """The server answered an async postback with an ``error`` segment."""
+
+
+@dataclass(frozen=True)
+class DeltaSegment:
+    """One ``length|type|id|content|`` entry of an UpdatePanel response."""
+
+    type: str
+    id: str
+    content: str
+
+
+@dataclass
+class DeltaResponse:
+    """Parsed UpdatePanel delta: panel HTML, hidden field updates, redirect/error."""
+
+    segments: list[DeltaSegment] = field(default_factory=list)
+
+    @property
+    def panels(self) -> dict[str, str]:
+        return {s.id: s.content for s in self.segments if s.type == "updatePanel"}
+
+    @property
+    def hidden(self) -> dict[str, str]:
+        return {s.id: s.content for s in self.segments if s.type == "hiddenField"}
+
+    @property
+    def redirect(self) -> str | None:
+        for s in self.segments:
+            if s.type == "pageRedirect":
+                return unquote(s.content) if "%" in s.content else s.content
+        return None
+
+    @property
+    def error(self) -> str | None:
+        for s in self.segments:
+            if s.type == "error":
+                return s.content
+        return None
+
+
+class DeltaParser:
+    """Incremental parser for the UpdatePanel delta format.
+
+    ``feed`` accepts the body in chunks (e.g. from ``Response.aiter_text()``) and
+    returns the segments completed so far, so large panels don't need to be
+    re-scanned as more data arrives.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos = 0
+
+    def feed(self, chunk: str) -> list[DeltaSegment]:
+        """Adds a chunk of the body and returns the newly completed segments.
+
+        Raises:
+            ValueError: If the data is not a well-formed delta.
+        """
+        self._buffer += chunk
+        segments: list[DeltaSegment] = []
+        while (segment := self._next_segment()) is not None:
+            segments.append(segment)
+        # Descartar lo ya consumido para no crecer con el tamaño total de la respuesta
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        return segments
+
+    def close(self) -> None:
+        """Checks that the body ended on a segment boundary.
+
+        Raises:
+            ValueError: If a segment was left incomplete.
+        """
+        if self._buffer[self._pos :].strip():
+            raise ValueError("Respuesta delta truncada")
+
+    def _next_segment(self) -> DeltaSegment | None:
+        buf, pos = self._buffer, self._pos
+        length_end = buf.find("|", pos)
+        if length_end == -1:
+            return None
+        length_text = buf[pos:length_end]
+        if not length_text.isdigit():
+            raise ValueError(f"Longitud de segmento inválida: {length_text[:20]!r}")
+        type_end = buf.find("|", length_end + 1)
+        if type_end == -1:
+            return None
+        id_end = buf.find("|", type_end + 1)
+        if id_end == -1:
+            return None
+        content_end = id_end + 1 + int(length_text)
+        if content_end >= len(buf):
+            return None  # falta contenido o el "|" final
+        if buf[content_end] != "|":
+            raise ValueError("Segmento delta sin separador final")
+        self._pos = content_end + 1
+        return DeltaSegment(
+            type=buf[length_end + 1 : type_end],
+            id=buf[type_end + 1 : id_end],
+            content=buf[id_end + 1 : content_end],
+        )
+
+
+def is_delta(text: str) -> bool:
+    return text.startswith(DELTA_PREFIX)
+
+
+def parse_delta(text: str) -> DeltaResponse:
+    """Parses a complete UpdatePanel delta body.
+
+    Args:
+        text (str): Response body starting with ``1|#|``.
+
+    Returns:
+        DeltaResponse: Parsed segments.
+
+    Raises:
+        ValueError: If the body is not a well-formed delta.
+    """
+    if not is_delta(text):
+        raise ValueError("No es una respuesta delta de UpdatePanel")
+    parser = DeltaParser()
+    segments = parser.feed(text)
+    parser.close()
+    return DeltaResponse(segments=segments)
+
+
+def find_pager(text: str) -> tuple[str | None, set[int]]:
+    """GridView pager target and page numbers linked from ``text``.
+
+    The target is the first control posting ``Page$N``; only its links count.
+    """
+    pager = _PAGER_RE.findall(text)
+    if not pager:
+        return None, set()
+    target = pager[0][0]
+    return target, {int(n) for t, n in pager if t == target}
+
+
+def _iter_update_panels(raw: str) -> Iterator[str]:
+    for item in raw.split(","):
+        item = item.strip().strip("'\"")
+        # Cada UpdatePanel va prefijado con "t"/"f" (ChildrenAsTriggers)
+        if len(item) > 1:
+            yield item[1:]
+
+
+def find_update_panel(
+    text: str, doc: HtmlElement | None, grid_target: str | None
+) -> tuple[str, str] | None:
+    """ScriptManager unique id and the UpdatePanel that hosts the grid, if any.
+
+    Read from the ``PageRequestManager._initialize`` call WebForms renders in
+    every page that supports async posts. UpdatePanels are not naming
+    containers, so with several panels the one wrapping the grid element is
+    looked up in the document; otherwise the first panel is used.
+    """
+    match = _PRM_INIT_RE.search(text)
+    if not match:
+        return None
+    panels = list(_iter_update_panels(match.group(2)))
+    if not panels:
+        return None
+    if doc is not None and grid_target and len(panels) > 1:
+        grid_id = grid_target.replace("$", "_")
+        for panel in panels:
+            if doc.xpath(f'//*[@id="{panel.replace("$", "_")}"]//*[@id="{grid_id}"]'):
+                return match.group(1), panel
+    return match.group(1), panels[0]
+
+
+@dataclass
+class WebFormsPage:
+    """One GridView page returned by a ``Page$N`` postback.
+
+    ``html`` is the full document for a regular postback and the updated
+    panel(s) for an async post; either can be given to a grid parser.
+    ``hidden`` is the form state to post from this page.
+    """
+
+    number: int
+    html: str
+    hidden: dict[str, str]
+    bytes_received: int
+    async_post: bool = False
+
+
+def page_postback(
+    target: str,
+    number: int,
+    fields: Mapping[str, str],
+    script: tuple[str, str] | None = None,
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Form data and extra headers that request ``Page$<number>`` of a GridView.
+
+    Args:
+        target (str): Grid unique id posted as ``__EVENTTARGET``.
+        number (int): Page to request.
+        fields (Mapping[str, str]): Hidden fields of the page whose pager linked
+            ``number`` (WebForms validates the event against that state), plus
+            any filter inputs to replay.
+        script (tuple[str, str] | None, optional): ScriptManager and UpdatePanel
+            (see find_update_panel) to send an async post; None for a full postback.
+
+    Returns:
+        tuple[dict[str, str], dict[str, str]]: Form data and headers to add.
+    """
+    data = {**fields, "__EVENTTARGET": target, "__EVENTARGUMENT": f"Page${number}"}
+    if script is None:
+        return data, {}
+    script_manager, panel = script
+    data[script_manager] = f"{panel}|{target}"
+    data["__ASYNCPOST"] = "true"
+    return data, dict(ASYNC_POST_HEADERS)
+
+
+def read_page_postback(text: str, number: int, hidden: Mapping[str, str]) -> WebFormsPage:
+    """Parses the answer to a page_postback.
+
+    A delta only carries the hidden fields that changed, so they are merged
+    over ``hidden`` (the state that was posted). A full page (no ScriptManager,
+    or the server ignored the async post) brings its whole form state.
+
+    Raises:
+        WebFormsDeltaError: The delta has an error segment or an unexpected redirect.
+        SenasaSessionExpiredError: The delta redirects to the login page.
+    """
+    if not is_delta(text):
+        return WebFormsPage(
+            number=number,
+            html=text,
+            hidden=dict(extract_forms(text).hidden),
+            bytes_received=len(text),
+        )
+    delta = parse_delta(text)
+    if delta.error:
+        raise WebFormsDeltaError(f"Page${number}: {delta.error}")
+    if delta.redirect:
+        if "/Login.aspx" in delta.redirect:
+            raise SenasaSessionExpiredError(f"Page${number} redirected to login")
+        raise WebFormsDeltaError(f"Page${number}: redirect inesperado a {delta.redirect}")
+    return WebFormsPage(
+        number=number,
+        html="".join(delta.panels.values()),
+        hidden={**hidden, **delta.hidden},
+        bytes_received=len(text),
+        async_post=True,
+    )
@@ -1,15 +1,22 @@
 from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Tuple
-from senasa_pipeline.application.ports.session_store_port import SessionStorePort
+import threading
+import time
+from senasa_pipeline.application.ports.session_store_port import RefreshLockPort, SessionStorePort
 
-class InMemorySessionStore(SessionStorePort):
-    """Simple in-memory store for development. Not persistent."""
+class InMemorySessionStore(SessionStorePort, RefreshLockPort):
+    """Simple in-memory store for development. Not persistent.
+
+    The refresh lease only coordinates callers within this process.
+    """
 
     def __init__(self) -> None:
         self._cookies: dict[str, str] = {}
         self._expires_at: datetime | None = None
         self._is_active: bool = False
+        self._lease_lock = threading.Lock()
+        self._lease: tuple[str, float] | None = None
 
     def load(self) -> tuple[dict[str, str], datetime | None, bool]:
         return dict(self._cookies), self._expires_at, self._is_active
@@ -21,3 +28,16 @@ class InMemorySessionStore(SessionStorePort):
 
     def mark_inactive(self) -> None:
         self._is_active = False
+
+    def acquire(self, owner: str, ttl_seconds: float) -> bool:
+        now = time.monotonic()
+        with self._lease_lock:
+            if self._lease and self._lease[0] != owner and self._lease[1] >= now:
+                return False
+            self._lease = (owner, now + ttl_seconds)
+            return True
+
+    def release(self, owner: str) -> None:
+        with self._lease_lock:
+            if self._lease and self._lease[0] == owner:
+                self._lease = None
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import time
+from datetime import UTC, datetime
+
+from sqlalchemy import Engine, or_, select, update
+
+from senasa_pipeline.application.ports.session_store_port import RefreshLockPort, SessionStorePort
+from senasa_pipeline.infrastructure.repositories.postgresql_repository import insert_statement
+from senasa_pipeline.infrastructure.repositories.sql_tables import (
+    senasa_refresh_lock,
+    senasa_session,
+)
+
+
+class SQLSessionStore(SessionStorePort, RefreshLockPort):
+    """Session store in the DATABASE_URL database, next to the records.
+
+    The API and every Celery worker reuse the same cookies and take the same
+    refresh lease (single lock row), so only one of them runs the AFIP login
+    even when they run on different hosts. The tables come from
+    ``alembic upgrade head``; their single rows are created on first use.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+        with engine.begin() as conn:
+            conn.execute(
+                insert_statement(engine, senasa_session)
+                .values(id=1, cookies="{}", expires_at=None, is_active=False)
+                .on_conflict_do_nothing(index_elements=["id"])
+            )
+            conn.execute(
+                insert_statement(engine, senasa_refresh_lock)
+                .values(id=1, owner=None, expires_at=None)
+                .on_conflict_do_nothing(index_elements=["id"])
+            )
+
+    def load(self) -> tuple[dict[str, str], datetime | None, bool]:
+        stmt = select(
+            senasa_session.c.cookies, senasa_session.c.expires_at, senasa_session.c.is_active
+        ).where(senasa_session.c.id == 1)
+        with self._engine.connect() as conn:
+            row = conn.execute(stmt).first()
+        if row is None:
+            return {}, None, False
+        cookies_str, expires, active = row
+        # SQLite no guarda la zona horaria: las fechas se escriben en UTC
+        if expires is not None and expires.tzinfo is None:
+            expires = expires.replace(tzinfo=UTC)
+        return json.loads(cookies_str or "{}"), expires, bool(active)
+
+    def save(self, cookies: dict[str, str], expires_at: datetime) -> None:
+        with self._engine.begin() as conn:
+            conn.execute(
+                update(senasa_session)
+                .where(senasa_session.c.id == 1)
+                .values(
+                    cookies=json.dumps(cookies),
+                    expires_at=expires_at.astimezone(UTC),
+                    is_active=True,
+                )
+            )
+
+    def mark_inactive(self) -> None:
+        with self._engine.begin() as conn:
+            conn.execute(
+                update(senasa_session).where(senasa_session.c.id == 1).values(is_active=False)
+            )
+
+    def acquire(self, owner: str, ttl_seconds: float) -> bool:
+        # UPDATE condicional: la base serializa escrituras concurrentes sobre la fila
+        now = time.time()
+        lock = senasa_refresh_lock.c
+        stmt = (
+            update(senasa_refresh_lock)
+            .where(
+                lock.id == 1,
+                or_(lock.owner.is_(None), lock.owner == owner, lock.expires_at < now),
+            )
+            .values(owner=owner, expires_at=now + ttl_seconds)
+        )
+        with self._engine.begin() as conn:
+            return conn.execute(stmt).rowcount == 1
+
+    def release(self, owner: str) -> None:
+        with self._engine.begin() as conn:
+            conn.execute(
+                update(senasa_refresh_lock)
+                .where(senasa_refresh_lock.c.id == 1, senasa_refresh_lock.c.owner == owner)
+                .values(owner=None, expires_at=None)
+            )
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 
-from senasa_pipeline.application.ports.session_store_port import SessionStorePort
+from senasa_pipeline.application.ports.session_store_port import RefreshLockPort, SessionStorePort
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS senasa_session (
@@ -14,27 +16,38 @@ CREATE TABLE IF NOT EXISTS senasa_session (
   is_active INTEGER NOT NULL DEFAULT 0
 );
 INSERT OR IGNORE INTO senasa_session (id, cookies, expires_at, is_active) VALUES (1, '{}', NULL, 0);
+CREATE TABLE IF NOT EXISTS senasa_refresh_lock (
+  id INTEGER PRIMARY KEY CHECK (id = 1),
+  owner TEXT,
+  expires_at REAL
+);
+INSERT OR IGNORE INTO senasa_refresh_lock (id, owner, expires_at) VALUES (1, NULL, NULL);
 """
 
 
-class SQLiteSessionStore(SessionStorePort):
+class SQLiteSessionStore(SessionStorePort, RefreshLockPort):
     """SQLite-backed session store. Persists cookies/expiry across restarts.
 
-    File path configurable; creates schema on first use.
+    File path configurable; creates schema on first use. Also provides the
+    cross-process refresh lease (single lock row) used by EnsureSenasaSessionUseCase,
+    so every worker/process pointing at the same file shares it.
     """
 
     def __init__(self, db_path: str = ".senasa_auth.sqlite") -> None:
         self._path = Path(db_path)
-        self._conn = sqlite3.connect(self._path)
+        # Shared across API worker threads and the scraping thread
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._lock = threading.Lock()
         self._conn.execute("PRAGMA journal_mode=WAL;")
         self._conn.executescript(SCHEMA)
         self._conn.commit()
 
     def load(self) -> tuple[dict[str, str], datetime | None, bool]:
-        cur = self._conn.execute(
-            "SELECT cookies, expires_at, is_active FROM senasa_session WHERE id=1"
-        )
-        row = cur.fetchone()
+        with self._lock:
+            cur = self._conn.execute(
+                "SELECT cookies, expires_at, is_active FROM senasa_session WHERE id=1"
+            )
+            row = cur.fetchone()
         if not row:
             return {}, None, False
         import json
@@ -55,12 +68,34 @@ class SQLiteSessionStore(SessionStorePort):
         import json
 
         expires_iso = expires_at.astimezone(UTC).isoformat()
-        self._conn.execute(
-            "UPDATE senasa_session SET cookies=?, expires_at=?, is_active=1 WHERE id=1",
-            (json.dumps(cookies), expires_iso),
-        )
-        self._conn.commit()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE senasa_session SET cookies=?, expires_at=?, is_active=1 WHERE id=1",
+                (json.dumps(cookies), expires_iso),
+            )
+            self._conn.commit()
 
     def mark_inactive(self) -> None:
-        self._conn.execute("UPDATE senasa_session SET is_active=0 WHERE id=1")
-        self._conn.commit()
+        with self._lock:
+            self._conn.execute("UPDATE senasa_session SET is_active=0 WHERE id=1")
+            self._conn.commit()
+
+    def acquire(self, owner: str, ttl_seconds: float) -> bool:
+        # Un único UPDATE condicional es atómico entre procesos (SQLite serializa escrituras)
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE senasa_refresh_lock SET owner=?, expires_at=? "
+                "WHERE id=1 AND (owner IS NULL OR owner=? OR expires_at < ?)",
+                (owner, now + ttl_seconds, owner, now),
+            )
+            self._conn.commit()
+        return cur.rowcount == 1
+
+    def release(self, owner: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE senasa_refresh_lock SET owner=NULL, expires_at=NULL WHERE id=1 AND owner=?",
+                (owner,),
+            )
+            self._conn.commit()
@@ -1,18 +1,247 @@
-from collections.abc import Sequence
+import io
+import os
+import time
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import cast
 
-from senasa_pipeline.application.dtos.senasa_record_dto import SenasaRecordDTO
+import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import xlsxwriter  # type: ignore[import-untyped]
+from xlsxwriter.format import Format  # type: ignore[import-untyped]
+from xlsxwriter.worksheet import Worksheet  # type: ignore[import-untyped]
+
+from senasa_pipeline.application.ports.storage_port import IStoragePort, IStreamingExportPort
+from senasa_pipeline.application.record_batch import SenasaRecordBatch
+from senasa_pipeline.infrastructure import metrics
+
+EXPORT_SCHEMA = pa.schema(
+    [
+        ("nro_senasa", pa.string()),
+        ("establecimiento_codigo", pa.string()),
+        ("fecha_extraccion", pa.date32()),
+        ("peso", pa.float64()),
+        ("tipo_miel", pa.string()),
+        ("origen", pa.string()),
+        ("productor", pa.string()),
+    ]
+)
+_EXPORT_FIELDS = EXPORT_SCHEMA.names
+EXCEL_MAX_ROWS = 1_048_576
+
+# Formatos que se pueden generar de forma incremental (ver StreamingExportAdapter)
+STREAM_MEDIA_TYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _tables(batches: Iterable[SenasaRecordBatch], rows: int) -> Iterator[pa.Table]:
+    """Regroups batches into EXPORT_SCHEMA tables of ``rows`` rows (the last may be shorter).
+
+    Slices share the batches' buffers: only the dictionary columns are decoded.
+    """
+    pending: list[pa.Table] = []
+    size = 0
+    for batch in batches:
+        table = batch.to_arrow(dense=True).cast(EXPORT_SCHEMA)
+        pending.append(table)
+        size += table.num_rows
+        while size >= rows:
+            merged = pa.concat_tables(pending)
+            yield merged.slice(0, rows)
+            rest = merged.slice(rows)
+            pending, size = ([rest] if rest.num_rows else []), rest.num_rows
+    if size:
+        yield pa.concat_tables(pending)
 
 
 class ParquetStorageAdapter:
-    def export(self, rows: Sequence[SenasaRecordDTO], fmt: str, path: str) -> str:
+    """Writes Parquet files incrementally, one row group per chunk of input rows.
+
+    Only ``row_group_size`` rows are held in memory at a time, so exporting the
+    full dataset runs in bounded memory regardless of its size.
+
+    Args:
+        compression (str, optional): Parquet codec (zstd, snappy, gzip, none). Defaults to "zstd".
+        row_group_size (int, optional): Rows per row group. Defaults to 65536.
+    """
+
+    def __init__(self, compression: str = "zstd", row_group_size: int = 65536) -> None:
+        self.compression = compression
+        self.row_group_size = max(1, row_group_size)
+
+    def export(self, batches: Iterable[SenasaRecordBatch], fmt: str, path: str) -> str:
         out = Path(path)
-        out.write_text("parquet export placeholder")
+        with pq.ParquetWriter(out, EXPORT_SCHEMA, compression=self.compression) as writer:
+            for table in _tables(batches, self.row_group_size):
+                writer.write_table(table, row_group_size=self.row_group_size)
         return str(out)
 
 
 class ExcelExportAdapter:
-    def export(self, rows: Sequence[SenasaRecordDTO], fmt: str, path: str) -> str:
+    """Writes xlsx files with xlsxwriter in constant-memory mode.
+
+    Rows are flushed to disk as they are written, so memory does not grow with
+    the export size. When a sheet reaches Excel's row limit a new one is started
+    (``tambores``, ``tambores_2``, ...), each with its own header row.
+
+    Args:
+        max_rows_per_sheet (int, optional): Sheet row limit including the header.
+            Defaults to EXCEL_MAX_ROWS.
+        sheet_name (str, optional): Base sheet name. Defaults to "tambores".
+    """
+
+    def __init__(self, max_rows_per_sheet: int = EXCEL_MAX_ROWS, sheet_name: str = "tambores"):
+        self.max_rows_per_sheet = max(2, min(max_rows_per_sheet, EXCEL_MAX_ROWS))
+        self.sheet_name = sheet_name
+
+    def export(self, batches: Iterable[SenasaRecordBatch], fmt: str, path: str) -> str:
         out = Path(path)
-        out.write_text("xlsx export placeholder")
+        workbook = xlsxwriter.Workbook(str(out), {"constant_memory": True})
+        try:
+            header_fmt = workbook.add_format({"bold": True})
+            date_fmt = workbook.add_format({"num_format": "yyyy-mm-dd"})
+            sheet = None
+            row = 0
+            for values in _rows(batches):
+                if sheet is None or row >= self.max_rows_per_sheet:
+                    sheet = self._add_sheet(workbook, header_fmt)
+                    row = 1
+                for col, name in enumerate(_EXPORT_FIELDS):
+                    value = values[name]
+                    if name == "fecha_extraccion":
+                        sheet.write_datetime(row, col, value, date_fmt)
+                    else:
+                        sheet.write(row, col, value)
+                row += 1
+            if sheet is None:
+                self._add_sheet(workbook, header_fmt)
+        finally:
+            workbook.close()
         return str(out)
+
+    def _add_sheet(self, workbook: xlsxwriter.Workbook, header_fmt: Format) -> Worksheet:
+        n = len(workbook.worksheets())
+        sheet = workbook.add_worksheet(self.sheet_name if n == 0 else f"{self.sheet_name}_{n + 1}")
+        # constant_memory requires writing rows in order, header first
+        sheet.write_row(0, 0, _EXPORT_FIELDS, header_fmt)
+        return sheet
+
+
+class MultiFormatStorageAdapter(IStoragePort):
+    """Dispatches ``export`` to the adapter registered for the requested format."""
+
+    def __init__(self, adapters: dict[str, IStoragePort]) -> None:
+        self.adapters = adapters
+
+    def export(self, batches: Iterable[SenasaRecordBatch], fmt: str, path: str) -> str:
+        adapter = self.adapters.get(fmt.lower())
+        if adapter is None:
+            raise ValueError(f"Formato de exportación no soportado: {fmt}")
+        started = time.perf_counter()
+        out = adapter.export(batches, fmt, path)
+        metrics.observe_export(fmt.lower(), os.path.getsize(out), started)
+        return out
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that keeps what was written until ``drain`` hands it out."""
+
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+        self._size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:  # type: ignore[override]
+        self._parts.append(bytes(data))
+        self._size += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._size
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _rows(batches: Iterable[SenasaRecordBatch]) -> Iterator[dict[str, object]]:
+    # xlsxwriter escribe celda por celda: una conversión Arrow por batch
+    for batch in batches:
+        yield from batch.to_arrow(dense=True).to_pylist()
+
+
+class StreamingExportAdapter(IStreamingExportPort):
+    """Serializes record batches to Parquet, CSV or NDJSON as a stream of byte chunks.
+
+    Columns go from the batches to the Arrow/Polars writers without per-row
+    Python objects. Nothing is written to disk and at most one chunk of rows
+    is held in memory: Parquet emits one row group per ``row_group_size`` rows
+    (the footer comes last), CSV and NDJSON emit one chunk per ``chunk_rows`` rows.
+
+    Args:
+        compression (str, optional): Parquet codec. Defaults to "zstd".
+        row_group_size (int, optional): Rows per Parquet row group. Defaults to 65536.
+        chunk_rows (int, optional): Rows per CSV/NDJSON chunk. Defaults to 5000.
+    """
+
+    def __init__(
+        self,
+        compression: str = "zstd",
+        row_group_size: int = 65536,
+        chunk_rows: int = 5000,
+    ) -> None:
+        self.compression = compression
+        self.row_group_size = max(1, row_group_size)
+        self.chunk_rows = max(1, chunk_rows)
+
+    def media_type(self, fmt: str) -> str:
+        try:
+            return STREAM_MEDIA_TYPES[fmt.lower()]
+        except KeyError:
+            raise ValueError(f"Formato de exportación no soportado: {fmt}") from None
+
+    def stream(self, batches: Iterable[SenasaRecordBatch], fmt: str) -> Iterator[bytes]:
+        fmt = fmt.lower()
+        self.media_type(fmt)  # valida antes de empezar a consumir filas
+        if fmt == "parquet":
+            chunks = self._parquet(batches)
+        elif fmt == "csv":
+            chunks = self._csv(batches)
+        else:
+            chunks = self._ndjson(batches)
+        return metrics.measure_stream(chunks, fmt)
+
+    def _parquet(self, batches: Iterable[SenasaRecordBatch]) -> Iterator[bytes]:
+        sink = _ChunkSink()
+        with pq.ParquetWriter(sink, EXPORT_SCHEMA, compression=self.compression) as writer:
+            yield sink.drain()  # magic "PAR1": la descarga arranca antes del primer row group
+            for table in _tables(batches, self.row_group_size):
+                writer.write_table(table, row_group_size=self.row_group_size)
+                yield sink.drain()
+        yield sink.drain()
+
+    def _csv(self, batches: Iterable[SenasaRecordBatch]) -> Iterator[bytes]:
+        sink = _ChunkSink()
+        with pa_csv.CSVWriter(sink, EXPORT_SCHEMA) as writer:
+            wrote = False
+            for table in _tables(batches, self.chunk_rows):
+                writer.write_table(table)
+                wrote = True
+                yield sink.drain()
+            if not wrote:
+                writer.write_table(EXPORT_SCHEMA.empty_table())  # sólo el encabezado
+        if tail := sink.drain():
+            yield tail
+
+    def _ndjson(self, batches: Iterable[SenasaRecordBatch]) -> Iterator[bytes]:
+        for table in _tables(batches, self.chunk_rows):
+            # Polars serializa las columnas (fechas ISO) sin un dict por fila
+            yield cast(pl.DataFrame, pl.from_arrow(table)).write_ndjson().encode()
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from senasa_pipeline.application.ports.sync_state_port import SyncCheckpoint, SyncStatePort
+
+
+class InMemorySyncStateStore(SyncStatePort):
+    """Simple in-memory checkpoint store for development and tests. Not persistent."""
+
+    def __init__(self) -> None:
+        self._checkpoints: dict[str, SyncCheckpoint] = {}
+
+    def load(self) -> dict[str, SyncCheckpoint]:
+        return dict(self._checkpoints)
+
+    def save(self, checkpoints: Mapping[str, SyncCheckpoint]) -> None:
+        self._checkpoints.update(checkpoints)
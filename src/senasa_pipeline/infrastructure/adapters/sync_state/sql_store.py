@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import UTC, datetime
+
+from sqlalchemy import Engine, select
+
+from senasa_pipeline.application.ports.sync_state_port import SyncCheckpoint, SyncStatePort
+from senasa_pipeline.infrastructure.repositories.postgresql_repository import upsert_statement
+from senasa_pipeline.infrastructure.repositories.sql_tables import sync_mark
+
+
+class SQLSyncStateStore(SyncStatePort):
+    """Checkpoint store in the DATABASE_URL database, next to the records.
+
+    The API and every Celery worker read and advance the same marks, so a
+    sync that ran on a worker is where the next run resumes from. The
+    ``sync_mark`` table comes from ``alembic upgrade head``.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+        self._upsert = upsert_statement(engine, sync_mark, "establecimiento_codigo")
+
+    def load(self) -> dict[str, SyncCheckpoint]:
+        stmt = select(
+            sync_mark.c.establecimiento_codigo,
+            sync_mark.c.fecha_extraccion,
+            sync_mark.c.cursor_fecha,
+        )
+        with self._engine.connect() as conn:
+            rows = conn.execute(stmt).all()
+        return {codigo: SyncCheckpoint(mark, cursor) for codigo, mark, cursor in rows}
+
+    def save(self, checkpoints: Mapping[str, SyncCheckpoint]) -> None:
+        if not checkpoints:
+            return
+        now = datetime.now(UTC)
+        with self._engine.begin() as conn:
+            conn.execute(
+                self._upsert,
+                [
+                    {
+                        "establecimiento_codigo": codigo,
+                        "fecha_extraccion": cp.fecha_extraccion,
+                        "cursor_fecha": cp.cursor,
+                        "updated_at": now,
+                    }
+                    for codigo, cp in checkpoints.items()
+                ],
+            )
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Mapping
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+from senasa_pipeline.application.ports.sync_state_port import SyncCheckpoint, SyncStatePort
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_mark (
+  establecimiento_codigo TEXT PRIMARY KEY,
+  fecha_extraccion TEXT,
+  cursor_fecha TEXT,
+  updated_at TEXT NOT NULL
+);
+"""
+
+
+class SQLiteSyncStateStore(SyncStatePort):
+    """SQLite-backed checkpoint store. Survives restarts so crashed syncs resume.
+
+    File path configurable; creates schema on first use.
+    """
+
+    def __init__(self, db_path: str = ".senasa_sync_state.sqlite") -> None:
+        self._path = Path(db_path)
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def load(self) -> dict[str, SyncCheckpoint]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT establecimiento_codigo, fecha_extraccion, cursor_fecha FROM sync_mark"
+            ).fetchall()
+        return {codigo: SyncCheckpoint(_date(mark), _date(cursor)) for codigo, mark, cursor in rows}
+
+    def save(self, checkpoints: Mapping[str, SyncCheckpoint]) -> None:
+        if not checkpoints:
+            return
+        now = datetime.now(UTC).isoformat()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sync_mark VALUES (?, ?, ?, ?)",
+                [
+                    (codigo, _iso(cp.fecha_extraccion), _iso(cp.cursor), now)
+                    for codigo, cp in checkpoints.items()
+                ],
+            )
+            self._conn.commit()
+
+
+def _date(value: str | None) -> date | None:
+    return date.fromisoformat(value) if value else None
+
+
+def _iso(value: date | None) -> str | None:
+    return value.isoformat() if value else None
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import date
+from typing import cast
+
+import polars as pl
+import pyarrow as pa
+
+from senasa_pipeline.application.record_batch import SenasaRecordBatch
+from senasa_pipeline.application.use_cases.sync_senasa_data import BatchValidation
+from senasa_pipeline.domain.entities.senasa_record import SenasaRecord
+from senasa_pipeline.infrastructure import metrics
+
+# Códigos de rechazo (columna ``reasons``, separados por coma)
+NRO_SENASA_INVALIDO = "nro_senasa_invalido"
+ESTABLECIMIENTO_INVALIDO = "establecimiento_invalido"
+PESO_FUERA_DE_RANGO = "peso_fuera_de_rango"
+FECHA_INVALIDA = "fecha_invalida"
+CUIT_INVALIDO = "cuit_invalido"
+
+_CUIT_WEIGHTS = (5, 4, 3, 2, 7, 6, 5, 4, 3, 2)
+_MIN_CODE_LENGTH = 3  # ver CodigoSenasa
+
+VALIDATION_SCHEMA = {
+    "nro_senasa": pl.String,
+    "establecimiento_codigo": pl.String,
+    "fecha_extraccion": pl.Date,
+    "peso": pl.Float64,
+    "cuit": pl.String,
+}
+
+
+def _records_frame(records: Sequence[SenasaRecord]) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "nro_senasa": [str(r.tambor.nro_senasa) for r in records],
+            "establecimiento_codigo": [str(r.tambor.establecimiento_codigo) for r in records],
+            "fecha_extraccion": [r.tambor.fecha_extraccion for r in records],
+            "peso": [r.tambor.peso for r in records],
+            "cuit": [str(r.establecimiento.cuit) if r.establecimiento else None for r in records],
+        },
+        schema=VALIDATION_SCHEMA,
+    )
+
+
+def _batch_frame(batch: SenasaRecordBatch) -> pl.DataFrame:
+    # Sin copiar columnas: el CUIT sale del establecimiento, guardado una vez por código
+    cuits = {codigo: str(est.cuit) for codigo, est in batch.establecimientos.items()}
+    codigo = pl.col("establecimiento_codigo").cast(pl.String)
+    frame = cast(pl.DataFrame, pl.from_arrow(batch.table))  # un Table siempre da un DataFrame
+    return frame.select(
+        "nro_senasa",
+        codigo,
+        "fecha_extraccion",
+        "peso",
+        pl.when(pl.col("has_establecimiento"))
+        .then(codigo.replace_strict(cuits, default=None, return_dtype=pl.String))
+        .alias("cuit"),
+    )
+
+
+def _cuit_is_valid(col: pl.Expr) -> pl.Expr:
+    """Módulo 11 de AFIP: 11 dígitos y dígito verificador correcto."""
+    digits = [col.str.slice(i, 1).cast(pl.Int32, strict=False) for i in range(11)]
+    total = pl.sum_horizontal([d * w for d, w in zip(digits[:10], _CUIT_WEIGHTS, strict=True)])
+    check = (11 - total % 11) % 11  # resto 0 -> 0; resto 1 -> 10 (nunca válido)
+    return col.str.contains(r"^\d{11}$") & (check == digits[10])
+
+
+class PolarsRecordValidator:
+    """Vectorized SenasaRecord validation over Polars/Arrow batches.
+
+    Every rule is a column expression evaluated once per batch, so the cost per
+    row is that of the Polars kernels rather than a Python call per record:
+
+    - ``nro_senasa`` / ``establecimiento_codigo``: CodigoSenasa length (>= 3).
+    - ``peso``: within ``(0, max_peso_kg]``.
+    - ``fecha_extraccion``: between ``min_fecha`` and today (no future dates).
+    - ``cuit`` (establecimiento, when present): 11 digits with a valid AFIP
+      check digit.
+
+    Args:
+        max_peso_kg (float, optional): Heaviest acceptable tambor. Defaults to 400.
+        min_fecha (date, optional): Oldest acceptable extracción. Defaults to 2000-01-01.
+        today (date | None, optional): Upper date bound. Defaults to the current date.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_peso_kg: float = 400.0,
+        min_fecha: date = date(2000, 1, 1),
+        today: date | None = None,
+    ) -> None:
+        self.max_peso_kg = max_peso_kg
+        self.min_fecha = min_fecha
+        self.today = today
+
+    def _checks(self) -> list[tuple[str, pl.Expr]]:
+        today = self.today or date.today()
+        fecha = pl.col("fecha_extraccion")
+        peso = pl.col("peso")
+        cuit = pl.col("cuit")
+        return [
+            (NRO_SENASA_INVALIDO, pl.col("nro_senasa").str.len_chars() >= _MIN_CODE_LENGTH),
+            (
+                ESTABLECIMIENTO_INVALIDO,
+                pl.col("establecimiento_codigo").str.len_chars() >= _MIN_CODE_LENGTH,
+            ),
+            (PESO_FUERA_DE_RANGO, (peso > 0) & (peso <= self.max_peso_kg) & peso.is_not_nan()),
+            (FECHA_INVALIDA, (fecha >= self.min_fecha) & (fecha <= today)),
+            (CUIT_INVALIDO, cuit.is_null() | _cuit_is_valid(cuit)),
+        ]
+
+    def validate_frame(self, batch: pl.DataFrame | pa.RecordBatch | pa.Table) -> pl.DataFrame:
+        """Evaluates all rules over a batch with the VALIDATION_SCHEMA columns.
+
+        A missing ``cuit`` column is treated as "no establecimiento data".
+
+        Args:
+            batch (pl.DataFrame | pa.RecordBatch | pa.Table): Rows to validate.
+
+        Returns:
+            pl.DataFrame: ``valid`` (bool) and ``reasons`` (comma-separated codes
+            of the failed rules, null when valid), one row per input row.
+        """
+        # Un RecordBatch/Table de Arrow siempre da un DataFrame
+        df = batch if isinstance(batch, pl.DataFrame) else cast(pl.DataFrame, pl.from_arrow(batch))
+        if "cuit" not in df.columns:
+            df = df.with_columns(pl.lit(None, dtype=pl.String).alias("cuit"))
+        # Un valor nulo (o no parseable) también es un rechazo de su regla
+        failed = [
+            pl.when(check.fill_null(False)).then(None).otherwise(pl.lit(code))
+            for code, check in self._checks()
+        ]
+        reasons = pl.concat_str(failed, separator=",", ignore_nulls=True)
+        return df.select(
+            (reasons == "").alias("valid"),
+            pl.when(reasons == "").then(None).otherwise(reasons).alias("reasons"),
+        )
+
+    def validate_batch(
+        self, records: Sequence[SenasaRecord] | SenasaRecordBatch
+    ) -> BatchValidation:
+        """Validates a batch of records; see validate_frame for the rules."""
+        if not records:
+            return BatchValidation(mask=[], reasons=[])
+        if isinstance(records, SenasaRecordBatch):
+            frame = _batch_frame(records)
+        else:
+            frame = _records_frame(records)
+        result = self.validate_frame(frame)
+        reasons = result["reasons"].to_list()
+        metrics.count_rejects(reasons)
+        return BatchValidation(mask=result["valid"].to_list(), reasons=reasons)
+
+    def validate(self, record: SenasaRecord) -> bool:
+        """Single-record check (IDataValidationService); prefer validate_batch."""
+        return bool(self.validate_batch([record]).mask[0])
@@ -0,0 +1,213 @@
+"""Prometheus metrics of the pipeline hot paths.
+
+Everything is registered on ``REGISTRY``, which ``/metrics`` exposes (see
+``senasa_pipeline.presentation.api.main``). Adapters record their own
+metrics; application code stays unaware of Prometheus and is measured through
+the callbacks it already offers (e.g. SyncSenasaDataUseCase.on_progress, see
+SyncMetrics).
+
+Metrics live in the process that records them: a Celery worker keeps its own
+values, which the API's ``/metrics`` does not include.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+REGISTRY = CollectorRegistry()
+
+_HTTP_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+_JOB_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+_WRITE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "senasa_http_request_duration_seconds",
+    "AFIP/SENASA HTTP hop latency, redirects included.",
+    ["host", "step", "status"],
+    buckets=_HTTP_BUCKETS,
+    registry=REGISTRY,
+)
+LOGIN_SECONDS = Histogram(
+    "senasa_login_duration_seconds",
+    "Login duration by stage (afip_jsf, afip_portal_cf, senasa) and outcome.",
+    ["stage", "outcome"],
+    buckets=_HTTP_BUCKETS,
+    registry=REGISTRY,
+)
+SYNC_RECORDS = Counter(
+    "senasa_sync_records_total",
+    "Records through the sync pipeline by stage (skipped, fetched, validated, rejected, saved).",
+    ["stage"],
+    registry=REGISTRY,
+)
+SYNC_SECONDS = Histogram(
+    "senasa_sync_duration_seconds",
+    "Sync run duration by outcome.",
+    ["outcome"],
+    buckets=_JOB_BUCKETS,
+    registry=REGISTRY,
+)
+SYNC_RECORDS_PER_SECOND = Gauge(
+    "senasa_sync_records_per_second",
+    "Records saved per second by the last finished sync.",
+    registry=REGISTRY,
+)
+VALIDATION_REJECTS = Counter(
+    "senasa_validation_rejects_total",
+    "Records rejected by validation, by failed rule.",
+    ["reason"],
+    registry=REGISTRY,
+)
+REPOSITORY_WRITE_SECONDS = Histogram(
+    "senasa_repository_write_duration_seconds",
+    "Batch write latency of the repositories.",
+    ["backend", "table"],
+    buckets=_WRITE_BUCKETS,
+    registry=REGISTRY,
+)
+REPOSITORY_ROWS_WRITTEN = Counter(
+    "senasa_repository_rows_written_total",
+    "Rows written by repository batch writes.",
+    ["backend", "table"],
+    registry=REGISTRY,
+)
+EXPORT_BYTES = Counter(
+    "senasa_export_bytes_total",
+    "Bytes produced by exports, by format.",
+    ["format"],
+    registry=REGISTRY,
+)
+EXPORT_SECONDS = Histogram(
+    "senasa_export_duration_seconds",
+    "Duration of finished exports, by format.",
+    ["format"],
+    buckets=_JOB_BUCKETS,
+    registry=REGISTRY,
+)
+EXPORT_BYTES_PER_SECOND = Gauge(
+    "senasa_export_bytes_per_second",
+    "Throughput of the last finished export, by format.",
+    ["format"],
+    registry=REGISTRY,
+)
+
+
+def observe_http(response: Any, step: str) -> None:
+    """Records one HTTP hop from its response.
+
+    Uses the timing httpx measured for the response (and the redirects before
+    it), so callers only add a line after the request. Responses that do not
+    wrap an httpx.Response (e.g. test fakes) are ignored.
+
+    Args:
+        response (Any): httpx.Response, or HttpResponse wrapping one.
+        step (str): Step name, e.g. "POST-afip" or "Extracciones-page".
+    """
+    raw = getattr(response, "raw", response)
+    if not isinstance(raw, httpx.Response):
+        return
+    try:
+        seconds = sum(r.elapsed.total_seconds() for r in (*raw.history, raw))
+    except RuntimeError:  # respuesta en streaming todavía abierta
+        return
+    first = raw.history[0] if raw.history else raw
+    observe_hop(str(first.request.url), step, str(raw.status_code), seconds)
+
+
+def observe_hop(url: str, step: str, status: str, seconds: float) -> None:
+    """Records an HTTP hop timed by the caller (e.g. a streamed download)."""
+    host = urlsplit(url).hostname or "unknown"
+    HTTP_REQUEST_SECONDS.labels(host, step, status).observe(seconds)
+
+
+def observe_login(stage: str, outcome: str, started: float) -> None:
+    """Records a login stage that began at ``started`` (time.perf_counter())."""
+    LOGIN_SECONDS.labels(stage, outcome).observe(time.perf_counter() - started)
+
+
+def count_rejects(reasons: Iterable[str | None]) -> None:
+    """Counts rejections per rule from comma-separated reason strings."""
+    counts: dict[str, int] = {}
+    for value in reasons:
+        if value:
+            for reason in value.split(","):
+                counts[reason] = counts.get(reason, 0) + 1
+    for reason, n in counts.items():
+        VALIDATION_REJECTS.labels(reason).inc(n)
+
+
+def observe_write(backend: str, table: str, rows: int, started: float) -> None:
+    """Records a batch write of ``rows`` rows that began at ``started``."""
+    REPOSITORY_WRITE_SECONDS.labels(backend, table).observe(time.perf_counter() - started)
+    REPOSITORY_ROWS_WRITTEN.labels(backend, table).inc(rows)
+
+
+def observe_export(fmt: str, size: int, started: float) -> None:
+    """Records a finished export of ``size`` bytes that began at ``started``."""
+    EXPORT_BYTES.labels(fmt).inc(size)
+    _export_finished(fmt, size, started)
+
+
+def measure_stream(chunks: Iterable[bytes], fmt: str) -> Iterator[bytes]:
+    """Passes ``chunks`` through, counting bytes as they are produced.
+
+    Duration and throughput are recorded only when the stream completes (not
+    when the client disconnects mid-download).
+    """
+    started = time.perf_counter()
+    size = 0
+    for chunk in chunks:
+        EXPORT_BYTES.labels(fmt).inc(len(chunk))
+        size += len(chunk)
+        yield chunk
+    _export_finished(fmt, size, started)
+
+
+def _export_finished(fmt: str, size: int, started: float) -> None:
+    seconds = time.perf_counter() - started
+    EXPORT_SECONDS.labels(fmt).observe(seconds)
+    if seconds > 0:
+        EXPORT_BYTES_PER_SECOND.labels(fmt).set(size / seconds)
+
+
+class SyncMetrics:
+    """Feeds the sync metrics from SyncProgress counters.
+
+    ``update`` takes the cumulative counters (``SyncProgress.as_dict()``) after
+    every batch and adds the increments to ``senasa_sync_records_total``, so
+    ``rate()`` gives live records/sec; ``finish`` records the run duration and
+    its overall saved records/sec.
+    """
+
+    _STAGES = {
+        "records_fetched": "fetched",
+        "records_validated": "validated",
+        "records_rejected": "rejected",
+        "records_saved": "saved",
+        # Filas de origen que no se pudieron parsear (no llegan a "fetched")
+        "records_skipped": "skipped",
+    }
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._last: dict[str, int] = {}
+
+    def update(self, progress: Mapping[str, int]) -> None:
+        for key, stage in self._STAGES.items():
+            value = int(progress.get(key, 0))
+            delta = value - self._last.get(key, 0)
+            if delta > 0:
+                SYNC_RECORDS.labels(stage).inc(delta)
+            self._last[key] = value
+
+    def finish(self, outcome: str) -> None:
+        seconds = time.perf_counter() - self.started
+        SYNC_SECONDS.labels(outcome).observe(seconds)
+        if outcome == "succeeded" and seconds > 0:
+            SYNC_RECORDS_PER_SECOND.set(self._last.get("records_saved", 0) / seconds)
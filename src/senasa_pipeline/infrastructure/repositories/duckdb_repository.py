@@ -1,19 +1,323 @@
-from collections.abc import Sequence
+from __future__ import annotations
 
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from typing import Any, cast
+
+import duckdb
+import polars as pl
+import pyarrow as pa
+
+from senasa_pipeline.application.record_batch import SenasaRecordBatch
+from senasa_pipeline.domain.entities.establecimiento import Establecimiento
 from senasa_pipeline.domain.entities.senasa_record import SenasaRecord
-from senasa_pipeline.domain.repositories.interfaces import ISenasaRepository
+from senasa_pipeline.domain.repositories.interfaces import (
+    IEstablecimientoRepository,
+    ISenasaRepository,
+    RecordFilter,
+)
 from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
+from senasa_pipeline.infrastructure import metrics
+from senasa_pipeline.infrastructure.repositories.mappers import (
+    ESTABLECIMIENTO_COLUMNS,
+    establecimiento_from_row,
+    establecimiento_row,
+    record_from_row,
+    tambor_row,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS establecimientos (
+  codigo_senasa VARCHAR PRIMARY KEY,
+  nombre VARCHAR NOT NULL,
+  direccion VARCHAR NOT NULL,
+  localidad VARCHAR NOT NULL,
+  provincia VARCHAR NOT NULL,
+  cuit VARCHAR NOT NULL,
+  fecha_vencimiento DATE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tambores (
+  nro_senasa VARCHAR PRIMARY KEY,
+  establecimiento_codigo VARCHAR NOT NULL,
+  fecha_extraccion DATE NOT NULL,
+  peso DOUBLE NOT NULL,
+  tipo_miel VARCHAR NOT NULL,
+  origen VARCHAR NOT NULL,
+  productor VARCHAR NOT NULL
+);
+"""
+
+_SELECT_RECORDS = """
+SELECT t.nro_senasa, t.establecimiento_codigo, t.fecha_extraccion, t.peso,
+       t.tipo_miel, t.origen, t.productor,
+       e.codigo_senasa, e.nombre, e.direccion, e.localidad, e.provincia,
+       e.cuit, e.fecha_vencimiento
+FROM tambores t
+LEFT JOIN establecimientos e ON e.codigo_senasa = t.establecimiento_codigo
+"""
+
+_SELECT_TAMBORES = """
+SELECT t.nro_senasa, t.establecimiento_codigo, t.fecha_extraccion, t.peso,
+       t.tipo_miel, t.origen, t.productor
+FROM tambores t
+"""
+
+_TAMBOR_SCHEMA = pa.schema(
+    [
+        ("nro_senasa", pa.string()),
+        ("establecimiento_codigo", pa.string()),
+        ("fecha_extraccion", pa.date32()),
+        ("peso", pa.float64()),
+        ("tipo_miel", pa.string()),
+        ("origen", pa.string()),
+        ("productor", pa.string()),
+    ]
+)
+_ESTABLECIMIENTO_SCHEMA = pa.schema(
+    [
+        ("codigo_senasa", pa.string()),
+        ("nombre", pa.string()),
+        ("direccion", pa.string()),
+        ("localidad", pa.string()),
+        ("provincia", pa.string()),
+        ("cuit", pa.string()),
+        ("fecha_vencimiento", pa.date32()),
+    ]
+)
+
+
+def _rows_table(schema: pa.Schema, rows: dict[str, tuple[Any, ...]]) -> pa.Table:
+    columns = zip(*rows.values(), strict=True)
+    return pa.Table.from_arrays(
+        [pa.array(col, type=f.type) for col, f in zip(columns, schema, strict=True)],
+        schema=schema,
+    )
+
+
+def _dedupe(table: pa.Table, key: str) -> pa.Table:
+    """Keeps the last row per key, like the dict-based path for plain records."""
+    frame = cast(pl.DataFrame, pl.from_arrow(table))  # un Table siempre da un DataFrame
+    if frame[key].n_unique() == frame.height:
+        return table
+    return frame.unique(subset=key, keep="last", maintain_order=True).to_arrow()
+
+
+def _where(
+    filters: RecordFilter | None, after: CodigoSenasa | None = None
+) -> tuple[str, list[Any]]:
+    """WHERE clause (or "") and parameters for a tambores query aliased ``t``."""
+    clauses: list[str] = []
+    params: list[Any] = []
+    if after is not None:
+        clauses.append("t.nro_senasa > ?")
+        params.append(str(after))
+    if filters is not None:
+        for column, value in (
+            ("establecimiento_codigo", filters.establecimiento),
+            ("productor", filters.productor),
+            ("tipo_miel", filters.tipo_miel),
+        ):
+            if value is not None:
+                clauses.append(f"t.{column} = ?")
+                params.append(value)
+        if filters.fecha_desde is not None:
+            clauses.append("t.fecha_extraccion >= ?")
+            params.append(filters.fecha_desde)
+        if filters.fecha_hasta is not None:
+            clauses.append("t.fecha_extraccion <= ?")
+            params.append(filters.fecha_hasta)
+    return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+
+def _insert_table(conn: duckdb.DuckDBPyConnection, table: str, batch: pa.Table) -> None:
+    conn.register("_batch", batch)
+    try:
+        conn.execute(f"INSERT OR REPLACE INTO {table} SELECT * FROM _batch")  # noqa: S608
+    finally:
+        conn.unregister("_batch")
 
 
 class DuckDBSenasaRepository(ISenasaRepository):
-    def __init__(self) -> None:
-        self._data: list[SenasaRecord] = []
+    """DuckDB-backed repository for SENASA records.
+
+    - Tambores and establecimientos live in separate columnar tables
+    - ``nro_senasa`` is the primary key, so point lookups use DuckDB's ART index
+    - ``list`` pushes ordering/limit/offset and RecordFilter down to SQL; ``after``
+      gives keyset paging. Filters are plain scans pruned by DuckDB's min/max
+      zonemaps, so no secondary indexes are created
+
+    ``establecimiento_repo`` shares this connection, so both repositories see
+    the same (possibly in-memory) database.
+
+    Args:
+        db_path (str, optional): DuckDB database file. Defaults to ":memory:".
+    """
+
+    def __init__(self, db_path: str = ":memory:") -> None:
+        self._conn = duckdb.connect(db_path)
+        self._lock = threading.Lock()
+        self._conn.execute(SCHEMA)
+        self.establecimiento_repo = DuckDBEstablecimientoRepository(self._conn, self._lock)
 
     def save(self, record: SenasaRecord) -> None:
-        self._data.append(record)
+        with self._lock:
+            self._conn.execute("BEGIN TRANSACTION")
+            try:
+                if record.establecimiento is not None:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO establecimientos VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        establecimiento_row(record.establecimiento),
+                    )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO tambores VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    tambor_row(record.tambor),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def save_many(self, records: Sequence[SenasaRecord] | SenasaRecordBatch) -> int:
+        """Bulk upsert a batch of records in a single transaction.
+
+        Rows are deduplicated by key (last one wins) and loaded through Arrow
+        tables, so DuckDB ingests the whole batch vectorized instead of one
+        INSERT per tambor. A SenasaRecordBatch is ingested from its columns
+        directly, without building rows.
+
+        Args:
+            records (Sequence[SenasaRecord] | SenasaRecordBatch): Records to persist.
+
+        Returns:
+            int: Number of records received.
+        """
+        if not records:
+            return 0
+        if isinstance(records, SenasaRecordBatch):
+            tambores = _dedupe(records.to_arrow(dense=True), "nro_senasa")
+            establecimientos = {
+                str(e.codigo_senasa): establecimiento_row(e)
+                for e in records.establecimientos.values()
+            }
+        else:
+            tambores = _rows_table(
+                _TAMBOR_SCHEMA, {str(r.tambor.nro_senasa): tambor_row(r.tambor) for r in records}
+            )
+            establecimientos = {
+                str(r.establecimiento.codigo_senasa): establecimiento_row(r.establecimiento)
+                for r in records
+                if r.establecimiento is not None
+            }
+        with self._lock:
+            started = time.perf_counter()
+            self._conn.execute("BEGIN TRANSACTION")
+            try:
+                if establecimientos:
+                    self._insert_arrow(
+                        "establecimientos",
+                        _rows_table(_ESTABLECIMIENTO_SCHEMA, establecimientos),
+                    )
+                self._insert_arrow("tambores", tambores)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            metrics.observe_write("duckdb", "tambores", tambores.num_rows, started)
+        return len(records)
+
+    def _insert_arrow(self, table: str, batch: pa.Table) -> None:
+        _insert_table(self._conn, table, batch)
 
     def get_by_nro(self, nro_senasa: CodigoSenasa) -> SenasaRecord | None:
-        return next((r for r in self._data if r.tambor.nro_senasa == nro_senasa), None)
+        with self._lock:
+            row = self._conn.execute(
+                f"{_SELECT_RECORDS} WHERE t.nro_senasa = ?", [str(nro_senasa)]
+            ).fetchone()
+        return record_from_row(row) if row else None
+
+    def list(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        after: CodigoSenasa | None = None,
+        filters: RecordFilter | None = None,
+    ) -> Sequence[SenasaRecord]:
+        where, params = _where(filters, after)
+        sql = f"{_SELECT_RECORDS}{where} ORDER BY t.nro_senasa LIMIT ? OFFSET ?"
+        with self._lock:
+            rows = self._conn.execute(sql, [*params, limit, offset]).fetchall()
+        return [record_from_row(r) for r in rows]
+
+    def list_batch(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        after: CodigoSenasa | None = None,
+        filters: RecordFilter | None = None,
+    ) -> SenasaRecordBatch:
+        """Tambor columns of ``list`` straight from DuckDB's Arrow result."""
+        where, params = _where(filters, after)
+        sql = f"{_SELECT_TAMBORES}{where} ORDER BY t.nro_senasa LIMIT ? OFFSET ?"
+        with self._lock:
+            table = self._conn.execute(sql, [*params, limit, offset]).to_arrow_table()
+        return SenasaRecordBatch.from_arrow(table)
+
+    def count(self, filters: RecordFilter | None = None) -> int:
+        where, params = _where(filters)
+        with self._lock:
+            sql = f"SELECT count(*) FROM tambores t{where}"  # noqa: S608
+            row = self._conn.execute(sql, params).fetchone()
+        return int(row[0]) if row else 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class DuckDBEstablecimientoRepository(IEstablecimientoRepository):
+    """Establecimientos table of a DuckDB database, keyed on ``codigo_senasa``.
+
+    Usually obtained from ``DuckDBSenasaRepository.establecimiento_repo``.
+
+    Args:
+        conn (duckdb.DuckDBPyConnection): Connection to a database with SCHEMA applied.
+        lock (threading.Lock | None, optional): Lock serializing use of ``conn``.
+    """
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection, lock: threading.Lock | None = None) -> None:
+        self._conn = conn
+        self._lock = lock or threading.Lock()
+
+    def upsert(self, est: Establecimiento) -> None:
+        self.upsert_many([est])
+
+    def upsert_many(self, ests: Sequence[Establecimiento]) -> int:
+        """Bulk upsert through one Arrow table (last one wins per código)."""
+        if not ests:
+            return 0
+        rows = {str(e.codigo_senasa): establecimiento_row(e) for e in ests}
+        with self._lock:
+            started = time.perf_counter()
+            _insert_table(
+                self._conn, "establecimientos", _rows_table(_ESTABLECIMIENTO_SCHEMA, rows)
+            )
+            metrics.observe_write("duckdb", "establecimientos", len(rows), started)
+        return len(rows)
+
+    def get(self, codigo: CodigoSenasa) -> Establecimiento | None:
+        return self.get_many([str(codigo)]).get(str(codigo))
 
-    def list(self, limit: int = 100, offset: int = 0) -> Sequence[SenasaRecord]:
-        return self._data[offset : offset + limit]
+    def get_many(self, codigos: Iterable[str]) -> dict[str, Establecimiento]:
+        keys = sorted({str(c) for c in codigos})
+        if not keys:
+            return {}
+        sql = (
+            f"SELECT {', '.join(ESTABLECIMIENTO_COLUMNS)} FROM establecimientos "  # noqa: S608
+            "WHERE codigo_senasa IN (SELECT unnest(?::VARCHAR[]))"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, [keys]).fetchall()
+        return {row[0]: establecimiento_from_row(row) for row in rows}
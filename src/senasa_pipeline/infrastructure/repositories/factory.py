@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import NamedTuple
+
+from sqlalchemy import Engine
+
+from senasa_pipeline.application.ports.sync_state_port import SyncStatePort
+from senasa_pipeline.config import Settings, settings
+from senasa_pipeline.domain.repositories.interfaces import (
+    IEstablecimientoRepository,
+    ISenasaRepository,
+)
+from senasa_pipeline.infrastructure.adapters.session.sql_store import SQLSessionStore
+from senasa_pipeline.infrastructure.adapters.session.sqlite_store import SQLiteSessionStore
+from senasa_pipeline.infrastructure.adapters.sync_state.sql_store import SQLSyncStateStore
+from senasa_pipeline.infrastructure.adapters.sync_state.sqlite_store import SQLiteSyncStateStore
+from senasa_pipeline.infrastructure.repositories.duckdb_repository import DuckDBSenasaRepository
+from senasa_pipeline.infrastructure.repositories.postgresql_repository import (
+    PostgreSQLEstablecimientoRepository,
+    PostgreSQLSenasaRepository,
+    build_engine,
+)
+
+
+@cache
+def _engine(config: Settings) -> Engine:
+    # Un pool por configuración: repositorios y stores de estado lo comparten
+    return build_engine(
+        config.database_url,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        statement_cache_size=config.db_statement_cache_size,
+    )
+
+
+class Repositories(NamedTuple):
+    records: ISenasaRepository
+    establecimientos: IEstablecimientoRepository
+
+
+def build_repositories(config: Settings = settings) -> Repositories:
+    """Builds the repositories selected by the settings.
+
+    With DATABASE_URL set, both repositories share one pooled SQLAlchemy
+    engine (DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_STATEMENT_CACHE_SIZE) and upsert
+    in chunks of DB_BATCH_SIZE; the schema comes from ``alembic upgrade head``.
+    ``postgresql+psycopg://`` URLs need the ``postgres`` extra. Without it,
+    records live in the DuckDB file at DUCKDB_PATH, which only one process
+    can open.
+
+    Args:
+        config (Settings, optional): Settings to read. Defaults to the process settings.
+
+    Returns:
+        Repositories: Record and establecimiento repositories over the same database.
+    """
+    if config.database_url:
+        engine = _engine(config)
+        return Repositories(
+            PostgreSQLSenasaRepository(engine, batch_size=config.db_batch_size),
+            PostgreSQLEstablecimientoRepository(engine, batch_size=config.db_batch_size),
+        )
+    repo = DuckDBSenasaRepository(db_path=config.duckdb_path)
+    return Repositories(repo, repo.establecimiento_repo)
+
+
+def build_sync_state(config: Settings = settings) -> SyncStatePort:
+    """Builds the incremental sync checkpoint store selected by the settings.
+
+    With DATABASE_URL set, marks live in its ``sync_mark`` table over the
+    repositories' engine, so the API and Celery workers on other hosts share
+    them. Without it, they live in the SQLite file at SYNC_STATE_DB_PATH.
+
+    Args:
+        config (Settings, optional): Settings to read. Defaults to the process settings.
+
+    Returns:
+        SyncStatePort: Checkpoint store next to the records.
+    """
+    if config.database_url:
+        return SQLSyncStateStore(_engine(config))
+    return SQLiteSyncStateStore(db_path=config.sync_state_db_path)
+
+
+def build_session_store(config: Settings = settings) -> SQLSessionStore | SQLiteSessionStore:
+    """Builds the SENASA session store and refresh lease selected by the settings.
+
+    With DATABASE_URL set, cookies and the login lease live in its
+    ``senasa_session``/``senasa_refresh_lock`` tables, so the API and Celery
+    workers on other hosts reuse one session and run a single AFIP login.
+    Without it, they live in the SQLite file at SESSION_DB_PATH.
+
+    Args:
+        config (Settings, optional): Settings to read. Defaults to the process settings.
+
+    Returns:
+        SQLSessionStore | SQLiteSessionStore: Session store that is also the refresh lease.
+    """
+    if config.database_url:
+        return SQLSessionStore(_engine(config))
+    return SQLiteSessionStore(db_path=config.session_db_path)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from senasa_pipeline.domain.entities.establecimiento import Establecimiento
+from senasa_pipeline.domain.entities.senasa_record import SenasaRecord
+from senasa_pipeline.domain.entities.tambor import Tambor
+from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
+from senasa_pipeline.domain.value_objects.cuit import CUIT
+from senasa_pipeline.domain.value_objects.fecha_vencimiento import FechaVencimiento
+
+TAMBOR_COLUMNS = (
+    "nro_senasa",
+    "establecimiento_codigo",
+    "fecha_extraccion",
+    "peso",
+    "tipo_miel",
+    "origen",
+    "productor",
+)
+ESTABLECIMIENTO_COLUMNS = (
+    "codigo_senasa",
+    "nombre",
+    "direccion",
+    "localidad",
+    "provincia",
+    "cuit",
+    "fecha_vencimiento",
+)
+
+
+def tambor_row(t: Tambor) -> tuple[Any, ...]:
+    """Plain-typed row for a Tambor, in TAMBOR_COLUMNS order."""
+    return (
+        str(t.nro_senasa),
+        str(t.establecimiento_codigo),
+        t.fecha_extraccion,
+        t.peso,
+        t.tipo_miel,
+        t.origen,
+        t.productor,
+    )
+
+
+def establecimiento_row(e: Establecimiento) -> tuple[Any, ...]:
+    """Plain-typed row for an Establecimiento, in ESTABLECIMIENTO_COLUMNS order."""
+    return (
+        str(e.codigo_senasa),
+        e.nombre,
+        e.direccion,
+        e.localidad,
+        e.provincia,
+        str(e.cuit),
+        date(e.fecha_vencimiento.year, e.fecha_vencimiento.month, e.fecha_vencimiento.day),
+    )
+
+
+def establecimiento_from_row(row: tuple[Any, ...] | Any) -> Establecimiento:
+    """Builds an Establecimiento from a row in ESTABLECIMIENTO_COLUMNS order."""
+    return Establecimiento(
+        codigo_senasa=CodigoSenasa(row[0]),
+        nombre=row[1],
+        direccion=row[2],
+        localidad=row[3],
+        provincia=row[4],
+        cuit=CUIT(row[5]),
+        fecha_vencimiento=FechaVencimiento.from_date(row[6]),
+    )
+
+
+def record_from_row(row: tuple[Any, ...] | Any) -> SenasaRecord:
+    """Builds a SenasaRecord from tambor columns followed by (nullable) establecimiento columns."""
+    tambor = Tambor(
+        nro_senasa=CodigoSenasa(row[0]),
+        establecimiento_codigo=CodigoSenasa(row[1]),
+        fecha_extraccion=row[2],
+        peso=row[3],
+        tipo_miel=row[4],
+        origen=row[5],
+        productor=row[6],
+    )
+    est = establecimiento_from_row(row[7:]) if row[7] is not None else None
+    return SenasaRecord(tambor=tambor, establecimiento=est)
@@ -1,3 +1,268 @@
-class PostgreSQLSenasaRepository:
-    # Implementación real pendiente (SQLAlchemy/Alembic)
-    pass
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from sqlalchemy import Engine, Select, Table, create_engine, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.sql.dml import Insert
+
+from senasa_pipeline.application.record_batch import SenasaRecordBatch
+from senasa_pipeline.domain.entities.establecimiento import Establecimiento
+from senasa_pipeline.domain.entities.senasa_record import SenasaRecord
+from senasa_pipeline.domain.repositories.interfaces import (
+    IEstablecimientoRepository,
+    ISenasaRepository,
+    RecordFilter,
+)
+from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
+from senasa_pipeline.infrastructure import metrics
+from senasa_pipeline.infrastructure.repositories.mappers import (
+    ESTABLECIMIENTO_COLUMNS,
+    TAMBOR_COLUMNS,
+    establecimiento_from_row,
+    establecimiento_row,
+    record_from_row,
+    tambor_row,
+)
+from senasa_pipeline.infrastructure.repositories.sql_tables import establecimientos, tambores
+
+
+def build_engine(
+    url: str,
+    *,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    statement_cache_size: int = 500,
+) -> Engine:
+    """Creates a pooled SQLAlchemy engine for the SENASA repositories.
+
+    Args:
+        url (str): SQLAlchemy database URL (e.g. ``postgresql+psycopg://...``).
+        pool_size (int, optional): Persistent connections kept in the pool. Defaults to 5.
+        max_overflow (int, optional): Extra connections allowed under load. Defaults to 10.
+        statement_cache_size (int, optional): Compiled statement cache entries. Defaults to 500.
+
+    Returns:
+        Engine: Engine with pre-ping enabled so stale pooled connections are recycled.
+    """
+    kwargs: dict[str, Any] = {"pool_pre_ping": True, "query_cache_size": statement_cache_size}
+    if not url.startswith("sqlite"):
+        kwargs.update(pool_size=pool_size, max_overflow=max_overflow)
+    return create_engine(url, **kwargs)
+
+
+def insert_statement(engine: Engine, table: Table) -> postgresql.Insert | sqlite.Insert:
+    """INSERT for the engine's dialect, with its ON CONFLICT clauses."""
+    if engine.dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+def upsert_statement(engine: Engine, table: Table, key: str) -> Insert:
+    """INSERT ... ON CONFLICT (key) DO UPDATE for the engine's dialect."""
+    stmt = insert_statement(engine, table)
+    return stmt.on_conflict_do_update(
+        index_elements=[key],
+        set_={c.name: stmt.excluded[c.name] for c in table.columns if c.name != key},
+    )
+
+
+def _chunks(rows: Sequence[dict[str, Any]], size: int) -> Iterator[Sequence[dict[str, Any]]]:
+    for i in range(0, len(rows), size):
+        yield rows[i : i + size]
+
+
+_SELECT_TAMBORES = select(*(tambores.c[name] for name in TAMBOR_COLUMNS))
+
+_SELECT_RECORDS = select(
+    *(tambores.c[name] for name in TAMBOR_COLUMNS),
+    *(establecimientos.c[name] for name in ESTABLECIMIENTO_COLUMNS),
+).select_from(
+    tambores.outerjoin(
+        establecimientos,
+        establecimientos.c.codigo_senasa == tambores.c.establecimiento_codigo,
+    )
+)
+
+
+def _filtered(stmt: Select[Any], filters: RecordFilter | None) -> Select[Any]:
+    """Applies RecordFilter to a statement over ``tambores``.
+
+    Equality filters combined with ``ORDER BY nro_senasa`` are served by the
+    ``(column, nro_senasa)`` indexes (migration 0002).
+    """
+    if filters is None:
+        return stmt
+    for column, value in (
+        (tambores.c.establecimiento_codigo, filters.establecimiento),
+        (tambores.c.productor, filters.productor),
+        (tambores.c.tipo_miel, filters.tipo_miel),
+    ):
+        if value is not None:
+            stmt = stmt.where(column == value)
+    if filters.fecha_desde is not None:
+        stmt = stmt.where(tambores.c.fecha_extraccion >= filters.fecha_desde)
+    if filters.fecha_hasta is not None:
+        stmt = stmt.where(tambores.c.fecha_extraccion <= filters.fecha_hasta)
+    return stmt
+
+
+class PostgreSQLSenasaRepository(ISenasaRepository):
+    """SQLAlchemy Core repository for SENASA records (PostgreSQL in production).
+
+    - Batched ``INSERT ... ON CONFLICT`` upserts keyed on ``nro_senasa``
+    - Keyset pagination on the primary key via ``list(after=...)``, with
+      RecordFilter conditions pushed down to indexed WHERE clauses
+    - Schema is managed by Alembic (``migrations/``)
+
+    Args:
+        engine (Engine): Pooled engine, usually from ``build_engine``.
+        batch_size (int, optional): Rows per executemany round-trip. Defaults to 1000.
+    """
+
+    def __init__(self, engine: Engine, *, batch_size: int = 1000) -> None:
+        self._engine = engine
+        self._batch_size = max(1, batch_size)
+        self._upsert_tambor = upsert_statement(engine, tambores, "nro_senasa")
+        self._upsert_est = upsert_statement(engine, establecimientos, "codigo_senasa")
+
+    def save(self, record: SenasaRecord) -> None:
+        self.save_many([record])
+
+    def save_many(self, records: Sequence[SenasaRecord] | SenasaRecordBatch) -> int:
+        """Upserts records in chunks of ``batch_size`` inside one transaction.
+
+        A SenasaRecordBatch is converted to parameter rows in one Arrow call,
+        without building a domain object per tambor.
+
+        Args:
+            records (Sequence[SenasaRecord] | SenasaRecordBatch): Records to persist.
+
+        Returns:
+            int: Number of records received.
+        """
+        if not records:
+            return 0
+        if isinstance(records, SenasaRecordBatch):
+            tambor_rows = {row["nro_senasa"]: row for row in records.to_pylist()}
+            ests: Iterable[Establecimiento] = records.establecimientos.values()
+        else:
+            tambor_rows = {
+                str(r.tambor.nro_senasa): dict(
+                    zip(TAMBOR_COLUMNS, tambor_row(r.tambor), strict=True)
+                )
+                for r in records
+            }
+            ests = (r.establecimiento for r in records if r.establecimiento is not None)
+        est_rows = {
+            str(e.codigo_senasa): dict(
+                zip(ESTABLECIMIENTO_COLUMNS, establecimiento_row(e), strict=True)
+            )
+            for e in ests
+        }
+        started = time.perf_counter()
+        with self._engine.begin() as conn:
+            for chunk in _chunks(list(est_rows.values()), self._batch_size):
+                conn.execute(self._upsert_est, chunk)
+            for chunk in _chunks(list(tambor_rows.values()), self._batch_size):
+                conn.execute(self._upsert_tambor, chunk)
+        metrics.observe_write("postgresql", "tambores", len(tambor_rows), started)
+        return len(records)
+
+    def get_by_nro(self, nro_senasa: CodigoSenasa) -> SenasaRecord | None:
+        stmt = _SELECT_RECORDS.where(tambores.c.nro_senasa == str(nro_senasa))
+        with self._engine.connect() as conn:
+            row = conn.execute(stmt).first()
+        return record_from_row(row) if row else None
+
+    def list(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        after: CodigoSenasa | None = None,
+        filters: RecordFilter | None = None,
+    ) -> Sequence[SenasaRecord]:
+        stmt = _filtered(_SELECT_RECORDS, filters).order_by(tambores.c.nro_senasa).limit(limit)
+        if after is not None:
+            stmt = stmt.where(tambores.c.nro_senasa > str(after))
+        if offset:
+            stmt = stmt.offset(offset)
+        with self._engine.connect() as conn:
+            rows = conn.execute(stmt).all()
+        return [record_from_row(r) for r in rows]
+
+    def list_batch(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        after: CodigoSenasa | None = None,
+        filters: RecordFilter | None = None,
+    ) -> SenasaRecordBatch:
+        """Tambor columns of ``list``, columnarized from the result tuples."""
+        stmt = _filtered(_SELECT_TAMBORES, filters).order_by(tambores.c.nro_senasa).limit(limit)
+        if after is not None:
+            stmt = stmt.where(tambores.c.nro_senasa > str(after))
+        if offset:
+            stmt = stmt.offset(offset)
+        with self._engine.connect() as conn:
+            rows = conn.execute(stmt).all()
+        return SenasaRecordBatch.from_rows(rows)
+
+    def count(self, filters: RecordFilter | None = None) -> int:
+        stmt = _filtered(select(func.count()).select_from(tambores), filters)
+        with self._engine.connect() as conn:
+            return int(conn.execute(stmt).scalar_one())
+
+
+class PostgreSQLEstablecimientoRepository(IEstablecimientoRepository):
+    """SQLAlchemy Core repository for establecimientos keyed on ``codigo_senasa``.
+
+    Args:
+        engine (Engine): Pooled engine, usually from ``build_engine``.
+        batch_size (int, optional): Rows per upsert/lookup round-trip. Defaults to 1000.
+    """
+
+    def __init__(self, engine: Engine, *, batch_size: int = 1000) -> None:
+        self._engine = engine
+        self._batch_size = max(1, batch_size)
+        self._upsert = upsert_statement(engine, establecimientos, "codigo_senasa")
+
+    def upsert(self, est: Establecimiento) -> None:
+        self.upsert_many([est])
+
+    def upsert_many(self, ests: Sequence[Establecimiento]) -> int:
+        rows = {
+            str(e.codigo_senasa): dict(
+                zip(ESTABLECIMIENTO_COLUMNS, establecimiento_row(e), strict=True)
+            )
+            for e in ests
+        }
+        if not rows:
+            return 0
+        started = time.perf_counter()
+        with self._engine.begin() as conn:
+            for chunk in _chunks(list(rows.values()), self._batch_size):
+                conn.execute(self._upsert, chunk)
+        metrics.observe_write("postgresql", "establecimientos", len(rows), started)
+        return len(rows)
+
+    def get(self, codigo: CodigoSenasa) -> Establecimiento | None:
+        return self.get_many([str(codigo)]).get(str(codigo))
+
+    def get_many(self, codigos: Iterable[str]) -> dict[str, Establecimiento]:
+        keys = sorted({str(c) for c in codigos})
+        found: dict[str, Establecimiento] = {}
+        columns = [establecimientos.c[name] for name in ESTABLECIMIENTO_COLUMNS]
+        with self._engine.connect() as conn:
+            # IN acotado: no superar el límite de parámetros del driver
+            for i in range(0, len(keys), self._batch_size):
+                stmt = select(*columns).where(
+                    establecimientos.c.codigo_senasa.in_(keys[i : i + self._batch_size])
+                )
+                for row in conn.execute(stmt):
+                    found[row[0]] = establecimiento_from_row(row)
+        return found
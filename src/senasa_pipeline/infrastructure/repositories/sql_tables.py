@@ -0,0 +1,79 @@
+"""SQLAlchemy Core table definitions shared by the SQL repository and Alembic."""
+
+from __future__ import annotations
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+)
+
+metadata = MetaData()
+
+establecimientos = Table(
+    "establecimientos",
+    metadata,
+    Column("codigo_senasa", String(32), primary_key=True),
+    Column("nombre", String(255), nullable=False),
+    Column("direccion", String(255), nullable=False),
+    Column("localidad", String(128), nullable=False),
+    Column("provincia", String(128), nullable=False),
+    Column("cuit", String(11), nullable=False),
+    Column("fecha_vencimiento", Date, nullable=False),
+)
+
+tambores = Table(
+    "tambores",
+    metadata,
+    Column("nro_senasa", String(32), primary_key=True),
+    Column("establecimiento_codigo", String(32), nullable=False),
+    Column("fecha_extraccion", Date, nullable=False),
+    Column("peso", Float, nullable=False),
+    Column("tipo_miel", String(64), nullable=False),
+    Column("origen", String(64), nullable=False),
+    Column("productor", String(255), nullable=False),
+    # (filtro, nro_senasa): igualdad + keyset ordenado sin sort (ver RecordFilter)
+    Index("ix_tambores_establecimiento_nro", "establecimiento_codigo", "nro_senasa"),
+    Index("ix_tambores_productor_nro", "productor", "nro_senasa"),
+    Index("ix_tambores_tipo_miel_nro", "tipo_miel", "nro_senasa"),
+    Index("ix_tambores_fecha_extraccion", "fecha_extraccion"),
+)
+
+# Marcas de sync incremental (ver SyncCheckpoint): compartidas por la API y los workers
+sync_mark = Table(
+    "sync_mark",
+    metadata,
+    Column("establecimiento_codigo", String(32), primary_key=True),
+    Column("fecha_extraccion", Date),
+    Column("cursor_fecha", Date),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+)
+
+# Sesión SENASA y lease de login (una fila cada una): un solo login AFIP entre hosts
+senasa_session = Table(
+    "senasa_session",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=False),
+    Column("cookies", Text, nullable=False),
+    Column("expires_at", DateTime(timezone=True)),
+    Column("is_active", Boolean, nullable=False),
+    CheckConstraint("id = 1", name="ck_senasa_session_single_row"),
+)
+
+senasa_refresh_lock = Table(
+    "senasa_refresh_lock",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=False),
+    Column("owner", String(64)),
+    Column("expires_at", Float),
+    CheckConstraint("id = 1", name="ck_senasa_refresh_lock_single_row"),
+)
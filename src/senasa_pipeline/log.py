@@ -0,0 +1,150 @@
+"""Structured logging on structlog.
+
+- Events are key/value pairs (``log.info("login_complete", cookies=3)``), so
+  nothing is formatted unless the event is emitted: below LOG_LEVEL the
+  logger methods are no-ops. Expensive diagnostics (HTML parsing, snippets)
+  go behind ``debug_enabled()``.
+- Values under secret-looking keys (token, sign, password, cookies, ...) are
+  masked before rendering.
+- ``correlation_scope`` / ``correlated`` bind a ``correlation_id`` per use-case
+  execution (the job id for background jobs); every event logged inside
+  carries it, also from worker threads started with a copied context (see
+  ``application.streaming.prefetch``).
+
+Configured from LOG_LEVEL and LOG_FORMAT (console | json) on import.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+import re
+import sys
+import uuid
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from contextlib import contextmanager
+from typing import Any, TypeVar, cast
+
+import structlog
+
+from senasa_pipeline.config import settings
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Palabras completas de la clave (access_token, cookies_sent), no subcadenas
+_SECRET_KEY_RE = re.compile(
+    r"(?:^|[_-])(?:tokens?|sign|password|passwd|secret|cookies?|authorization|credentials?)"
+    r"(?:[_-]|$)",
+    re.IGNORECASE,
+)
+# Medidas de un secreto (cookie_count, token_length) no lo revelan
+_MEASURE_KEY_RE = re.compile(r"[_-](?:count|length|len|size)$", re.IGNORECASE)
+_level = logging.INFO
+
+
+def mask(value: Any) -> str:
+    """Placeholder that keeps only the length of a secret."""
+    return f"<masked len={len(str(value))}>"
+
+
+def _masked(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {k: mask(v) for k, v in value.items()}
+    return mask(value)
+
+
+def _is_secret_key(key: str) -> bool:
+    return bool(_SECRET_KEY_RE.search(key)) and not _MEASURE_KEY_RE.search(key)
+
+
+def mask_secrets(
+    logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+) -> MutableMapping[str, Any]:
+    """structlog processor: masks values whose key looks like a secret."""
+    for key, value in event_dict.items():
+        if key != "event" and value is not None and _is_secret_key(key):
+            event_dict[key] = _masked(value)
+    return event_dict
+
+
+def configure_logging(level: str | int = "INFO", *, json: bool = False) -> None:
+    """(Re)configures structlog for the process.
+
+    Args:
+        level (str | int, optional): Minimum level, e.g. "DEBUG". Defaults to "INFO".
+        json (bool, optional): One JSON object per line instead of console output.
+    """
+    global _level
+    _level = level if isinstance(level, int) else logging.getLevelName(level.upper())
+    if not isinstance(_level, int):
+        _level = logging.INFO
+    processors: list[Any] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        mask_secrets,
+    ]
+    if json:
+        processors += [structlog.processors.format_exc_info, structlog.processors.JSONRenderer()]
+    else:
+        # ConsoleRenderer formatea exc_info por su cuenta
+        processors.append(structlog.dev.ConsoleRenderer(colors=False))
+    structlog.configure(
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(_level),
+        logger_factory=structlog.WriteLoggerFactory(file=sys.stderr),
+        cache_logger_on_first_use=False,
+    )
+
+
+def debug_enabled() -> bool:
+    """True if debug events are emitted; guard costly diagnostics with it."""
+    return _level <= logging.DEBUG
+
+
+def get_logger(component: str) -> Any:
+    """Logger whose events carry ``component`` (e.g. the class name).
+
+    Lazy: it follows ``configure_logging`` even when created before it.
+    """
+    return structlog.get_logger(component=component)
+
+
+@contextmanager
+def correlation_scope(use_case: str, correlation_id: str | None = None) -> Iterator[str]:
+    """Binds a correlation id to every event logged inside.
+
+    Nested scopes (a sync that logs in first, a job running a use case) keep
+    the enclosing id unless one is given, so a whole execution shares it.
+    """
+    current = structlog.contextvars.get_contextvars().get("correlation_id")
+    cid = correlation_id or current or uuid.uuid4().hex[:16]
+    with structlog.contextvars.bound_contextvars(correlation_id=cid, use_case=use_case):
+        yield cid
+
+
+def correlated(use_case: str) -> Callable[[F], F]:
+    """Decorator: runs each call (sync or async) in its own correlation_scope."""
+
+    def decorate(fn: F) -> F:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def run_async(*args: Any, **kwargs: Any) -> Any:
+                with correlation_scope(use_case):
+                    return await fn(*args, **kwargs)
+
+            return cast(F, run_async)
+
+        @functools.wraps(fn)
+        def run(*args: Any, **kwargs: Any) -> Any:
+            with correlation_scope(use_case):
+                return fn(*args, **kwargs)
+
+        return cast(F, run)
+
+    return decorate
+
+
+configure_logging(settings.log_level, json=settings.log_format == "json")
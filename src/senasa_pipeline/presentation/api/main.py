@@ -1,20 +1,72 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
-from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from starlette.responses import Response
 
+from senasa_pipeline.application.session_renewer import SessionRenewer
+from senasa_pipeline.config import settings
+from senasa_pipeline.infrastructure import metrics
+from senasa_pipeline.infrastructure.adapters.http.client_pool import HttpClientRegistry
+from senasa_pipeline.infrastructure.repositories.factory import build_session_store
+from senasa_pipeline.presentation.api.routes.auth import ensure_senasa_session
 from senasa_pipeline.presentation.api.routes.auth import router as auth_router
 from senasa_pipeline.presentation.api.routes.health import router as health_router
+from senasa_pipeline.presentation.api.routes.jobs import job_queue
+from senasa_pipeline.presentation.api.routes.jobs import router as jobs_router
 from senasa_pipeline.presentation.api.routes.senasa import router as senasa_router
 
-app = FastAPI(title="SENASA Data Pipeline", version="0.2.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Pool HTTP compartido por todo el proceso: evita un handshake TLS por request
+    app.state.http_clients = HttpClientRegistry(
+        timeout=settings.http_timeout,
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+        http2=settings.http2,
+    )
+    renewer_task = _start_session_renewer(app.state.http_clients)
+    try:
+        yield
+    finally:
+        if renewer_task:
+            renewer_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await renewer_task
+        await app.state.http_clients.aclose()
+        # Los threads del executor local no son daemon: sin esto el proceso no termina
+        job_queue.shutdown(wait=False)
+
+
+def _start_session_renewer(http_clients: HttpClientRegistry) -> asyncio.Task[None] | None:
+    # Renueva la sesión SENASA antes de que venza: ningún request paga el login AFIP
+    if not (settings.session_renewal_enabled and settings.afip_cuit):
+        return None
+    renewer = SessionRenewer(
+        build_session_store(),
+        lambda: ensure_senasa_session(http_clients, force=True),
+        ttl_hours=settings.session_ttl_hours,
+        renew_fraction=settings.session_renew_fraction,
+        jitter_fraction=settings.session_renew_jitter_fraction,
+        max_failures=settings.session_renew_max_failures,
+    )
+    return asyncio.create_task(renewer.run(), name="senasa-session-renewer")
+
+
+app = FastAPI(title="SENASA Data Pipeline", version="0.2.0", lifespan=lifespan)
 app.include_router(health_router)
 app.include_router(senasa_router)
+app.include_router(jobs_router)
 app.include_router(auth_router)
 
-registry = CollectorRegistry()
+registry = metrics.REGISTRY
 
 
 @app.get("/metrics")
-def metrics() -> Response:  # type: ignore[misc]
+def metrics_endpoint() -> Response:
     data = generate_latest(registry)
     return Response(content=data, media_type=CONTENT_TYPE_LATEST)
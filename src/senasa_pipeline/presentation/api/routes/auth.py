@@ -1,47 +1,70 @@
 from __future__ import annotations
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 import os
-from senasa_pipeline.application.use_cases.ensure_senasa_session import EnsureSenasaSessionUseCase, SystemClock
-from senasa_pipeline.infrastructure.adapters.http.httpx_client import HttpxClient
-from senasa_pipeline.infrastructure.adapters.afip.unified_provider import UnifiedAfipProvider
-from senasa_pipeline.infrastructure.adapters.senasa.login_consumer import SenasaLoginConsumer
-from senasa_pipeline.infrastructure.adapters.session.sqlite_store import SQLiteSessionStore
+from senasa_pipeline.application.use_cases.ensure_senasa_session import (
+    AsyncEnsureSenasaSessionUseCase,
+    EnsureSessionResult,
+    SessionValidationCache,
+    SystemClock,
+)
+from senasa_pipeline.infrastructure.adapters.afip.unified_provider import AsyncUnifiedAfipProvider
+from senasa_pipeline.infrastructure.adapters.http.client_pool import HttpClientRegistry
+from senasa_pipeline.infrastructure.adapters.senasa.login_consumer import AsyncSenasaLoginConsumer
+from senasa_pipeline.infrastructure.repositories.factory import build_session_store
 from senasa_pipeline.config import settings
 
-router = APIRouter(prefix="/v1/auth", tags=["auth"]) 
+router = APIRouter(prefix="/v1/auth", tags=["auth"])
+
+# Compartido entre requests: "sesión ya activa" no consulta SENASA mientras el probe siga fresco
+_validation_cache = SessionValidationCache(ttl_seconds=settings.session_validation_ttl_seconds)
+# Con DATABASE_URL es el mismo store (y lease) que usan los workers Celery
+_session_store = build_session_store()
+
+async def ensure_senasa_session(
+    http_clients: HttpClientRegistry, *, force: bool = False
+) -> EnsureSessionResult:
+    """Runs the async ensure-session use case over the shared connection pool.
+
+    Used by the route and by the background SessionRenewer (``force=True``).
+    """
+    # Único cliente (cookie jar) para mantener sesión unificada AFIP+SENASA,
+    # sobre el pool de conexiones compartido del proceso (ver lifespan)
+    http = http_clients.client()
+    try:
+        # Adaptadores con sesión HTTP compartida
+        provider = AsyncUnifiedAfipProvider(
+            http=http,
+            cuit=settings.afip_cuit,
+            password=os.getenv("AFIP_PASSWORD", "")
+        )
+        consumer = AsyncSenasaLoginConsumer(http=http)
+
+        # Store y use case
+        use_case = AsyncEnsureSenasaSessionUseCase(
+            store=_session_store,
+            provider=provider,
+            consumer=consumer,
+            clock=SystemClock(),
+            ttl_hours=settings.session_ttl_hours,
+            # Lease en el mismo store: un solo login AFIP aunque haya varios workers
+            refresh_lock=_session_store,
+            lock_ttl_seconds=settings.session_refresh_lock_seconds,
+            lock_wait_seconds=settings.session_refresh_lock_seconds,
+            validation_cache=_validation_cache,
+        )
+
+        # Ejecutar caso de uso sin bloquear el event loop. El use case ya persiste
+        # las cookies al refrescar; quien esperó a otro worker reutiliza las del store.
+        return await use_case.execute(force=force)
+    finally:
+        await http.aclose()
+
 
 @router.post("/ensure_session")
-def ensure_session() -> dict[str, str | None]:  # type: ignore[misc]
-    # Único HttpxClient compartido para mantener sesión unificada AFIP+SENASA
-    http = HttpxClient(timeout=settings.http_timeout)
-    
-    # Adaptadores con sesión HTTP compartida
-    provider = UnifiedAfipProvider(
-        http=http, 
-        cuit=settings.afip_cuit, 
-        password=os.getenv("AFIP_PASSWORD", "")
-    )
-    consumer = SenasaLoginConsumer(http=http)
-    
-    # Store y use case
-    store = SQLiteSessionStore(db_path=".senasa_auth.sqlite")
-    use_case = EnsureSenasaSessionUseCase(
-        store=store, 
-        provider=provider, 
-        consumer=consumer, 
-        clock=SystemClock(), 
-        ttl_hours=settings.session_ttl_hours
-    )
-    
-    # Ejecutar caso de uso
-    result = use_case.execute()
-    
-    # Persistir si exitoso
-    if result.status in ("REFRESHED", "ALREADY_ACTIVE"):
-        store.save(consumer.cookies or http.dump_cookies(), result.expires_at or SystemClock().now())
-    
+async def ensure_session(request: Request, force: bool = False) -> dict[str, str | None]:  # type: ignore[misc]
+    result = await ensure_senasa_session(request.app.state.http_clients, force=force)
     return {
-        "status": result.status, 
-        "expires_at": result.expires_at.isoformat() if result.expires_at else None, 
+        "status": result.status,
+        "expires_at": result.expires_at.isoformat() if result.expires_at else None,
         "message": result.message
     }
@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+from typing import Any
+
+from fastapi import APIRouter, Request
 
 router = APIRouter(tags=["health"])
 
@@ -6,3 +8,9 @@ router = APIRouter(tags=["health"])
 @router.get("/health")
 def health() -> dict[str, str]:  # type: ignore[misc]
     return {"status": "ok"}
+
+
+@router.get("/health/http-pool")
+def http_pool(request: Request) -> dict[str, Any]:  # type: ignore[misc]
+    """Shared AFIP/SENASA connection pool config and per-host reuse stats."""
+    return request.app.state.http_clients.stats()
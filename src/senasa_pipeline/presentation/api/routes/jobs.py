@@ -0,0 +1,69 @@
+from pathlib import Path
+from typing import Any
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+
+from senasa_pipeline.application.ports.job_queue_port import JOB_SUCCEEDED, JobQueuePort
+from senasa_pipeline.config import Settings, settings
+from senasa_pipeline.infrastructure.adapters.jobs.local_queue import LocalJobQueue
+
+router = APIRouter(prefix="/v1/jobs", tags=["jobs"])
+
+
+def _build_job_queue(config: Settings = settings) -> JobQueuePort:
+    # Con broker configurado los jobs corren en workers Celery; si no, en este proceso
+    if config.celery_broker_url:
+        # API y workers abren la base a la vez: DuckDB toma un lock exclusivo del archivo.
+        # Con DATABASE_URL las marcas de sync, la sesión SENASA y su lease también viven
+        # ahí (ver build_sync_state/build_session_store), no en SQLite locales a cada host
+        if not config.database_url:
+            raise RuntimeError(
+                "CELERY_BROKER_URL requiere DATABASE_URL: DuckDB no se comparte entre procesos"
+            )
+        from senasa_pipeline.infrastructure.adapters.jobs.celery_queue import CeleryJobQueue
+
+        return CeleryJobQueue(
+            config.celery_broker_url, backend_url=config.celery_result_backend or None
+        )
+    return LocalJobQueue(max_workers=config.job_workers)
+
+
+# Los routers que encolan trabajo registran sus handlers acá (ver routes/senasa.py)
+job_queue = _build_job_queue()
+
+
+@router.get("/{job_id}")
+def get_job(job_id: str) -> dict[str, Any]:  # type: ignore[misc]
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job no encontrado")
+    return job.as_dict()
+
+
+@router.post("/{job_id}/cancel")
+def cancel_job(job_id: str) -> dict[str, Any]:  # type: ignore[misc]
+    """Cancels a queued job, or asks a running one to stop at its next batch."""
+    if not job_queue.cancel(job_id):
+        raise HTTPException(status_code=409, detail="Job inexistente o ya finalizado")
+    job = job_queue.get(job_id)
+    return job.as_dict() if job else {"id": job_id}
+
+
+@router.get("/{job_id}/download")
+def download_job_output(job_id: str):  # type: ignore[misc]
+    """Output file of a finished export job.
+
+    The job records the file name only; it is resolved against this host's
+    EXPORT_DIR, which Celery workers must share (e.g. a common volume).
+    """
+    job = job_queue.get(job_id)
+    result = (job.result or {}) if job else {}
+    if job is None or job.status != JOB_SUCCEEDED or not result.get("file"):
+        raise HTTPException(status_code=404, detail="El job no tiene un archivo disponible")
+    path = Path(settings.export_dir) / Path(result["file"]).name
+    if not path.is_file():
+        raise HTTPException(
+            status_code=404, detail="Archivo no encontrado en EXPORT_DIR de este host"
+        )
+    return FileResponse(path, filename=result.get("filename"))
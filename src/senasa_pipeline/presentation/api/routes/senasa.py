@@ -1,49 +1,371 @@
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
 
 from senasa_pipeline.application.dtos.export_request_dto import ExportRequestDTO
 from senasa_pipeline.application.dtos.sync_request_dto import SyncRequestDTO
+from senasa_pipeline.application.establecimiento_cache import EstablecimientoCache
+from senasa_pipeline.application.ports.job_queue_port import JobCancelledError, JobContext
 from senasa_pipeline.application.use_cases.export_senasa_data import ExportSenasaDataUseCase
-from senasa_pipeline.application.use_cases.sync_senasa_data import SyncSenasaDataUseCase
+from senasa_pipeline.application.use_cases.sync_senasa_data import (
+    SyncProgress,
+    SyncSenasaDataUseCase,
+)
+from senasa_pipeline.config import settings
+from senasa_pipeline.domain.repositories.interfaces import RecordFilter
+from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
+from senasa_pipeline.infrastructure import metrics
 from senasa_pipeline.infrastructure.adapters.notification_adapter import SimpleNotificationAdapter
 from senasa_pipeline.infrastructure.adapters.scraping_adapter import SenasaWebScrapingAdapter
-from senasa_pipeline.infrastructure.adapters.storage_adapter import ParquetStorageAdapter
-from senasa_pipeline.infrastructure.repositories.duckdb_repository import DuckDBSenasaRepository
+from senasa_pipeline.infrastructure.adapters.storage_adapter import (
+    STREAM_MEDIA_TYPES,
+    ExcelExportAdapter,
+    MultiFormatStorageAdapter,
+    ParquetStorageAdapter,
+    StreamingExportAdapter,
+)
+from senasa_pipeline.infrastructure.adapters.validation_adapter import PolarsRecordValidator
+from senasa_pipeline.infrastructure.repositories.factory import (
+    build_repositories,
+    build_session_store,
+    build_sync_state,
+)
+from senasa_pipeline.presentation.api.routes.jobs import job_queue
 
 router = APIRouter(prefix="/v1/senasa", tags=["senasa"])
 
-_repo = DuckDBSenasaRepository()
-_scraper = SenasaWebScrapingAdapter()
+_repo, _establecimiento_repo = build_repositories()
+_establecimientos = EstablecimientoCache(
+    _establecimiento_repo, maxsize=settings.establecimiento_cache_size
+)
+_scraper = SenasaWebScrapingAdapter(
+    build_session_store(),
+    concurrency=settings.scraper_concurrency,
+    requests_per_second=settings.scraper_requests_per_second,
+    timeout=settings.http_timeout,
+    mode=settings.scraper_mode,
+    download_dir=settings.scraper_download_dir or None,
+    export_control=settings.scraper_export_control or None,
+    filter_field=settings.scraper_filter_field or None,
+    batch_size=settings.sync_batch_size,
+)
+_sync_state = build_sync_state()
+_validator = PolarsRecordValidator(max_peso_kg=settings.validation_max_peso_kg)
 _notifier = SimpleNotificationAdapter()
-_storage = ParquetStorageAdapter()
+_storage = MultiFormatStorageAdapter(
+    {
+        "parquet": ParquetStorageAdapter(
+            compression=settings.export_parquet_compression,
+            row_group_size=settings.export_row_group_size,
+        ),
+        "xlsx": ExcelExportAdapter(),
+    }
+)
+_streamer = StreamingExportAdapter(
+    compression=settings.export_parquet_compression,
+    row_group_size=settings.export_row_group_size,
+    chunk_rows=settings.export_page_size,
+)
 
+# Content negotiation de /export: media types aceptados por formato
+_EXPORT_MEDIA_TYPES = {
+    "application/vnd.apache.parquet": "parquet",
+    "application/x-parquet": "parquet",
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": "xlsx",
+}
+# Campos de cada item de /records (origen no se expone)
+_RECORD_ITEM_FIELDS = [
+    "nro_senasa",
+    "establecimiento_codigo",
+    "fecha_extraccion",
+    "peso",
+    "tipo_miel",
+    "productor",
+]
+_XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
-@router.post("/sync")
+
+def _sync_use_case(ctx: JobContext, sync_metrics: metrics.SyncMetrics) -> SyncSenasaDataUseCase:
+    def report(progress: SyncProgress) -> None:
+        counters = progress.as_dict()
+        sync_metrics.update(counters)
+        ctx.report(**counters)
+
+    return SyncSenasaDataUseCase(
+        scraper=_scraper,
+        validator=_validator,
+        repo=_repo,
+        batch_size=settings.sync_batch_size,
+        max_pending_batches=settings.sync_prefetch_batches,
+        state=_sync_state,
+        establecimientos=_establecimientos,
+        on_progress=report,
+        partition_workers=settings.sync_partition_workers,
+        overlap_days=settings.sync_overlap_days,
+    )
+
+
+def run_sync_job(params: dict[str, Any], ctx: JobContext) -> dict[str, Any]:
+    """Job "senasa.sync": scrape and persist, reporting SyncProgress per batch.
+
+    ``params["establecimientos"]`` (a list of códigos) runs a partitioned sync.
+    """
+    sync_metrics = metrics.SyncMetrics()
+    uc = _sync_use_case(ctx, sync_metrics)
+    req = SyncRequestDTO(
+        incremental=bool(params.get("incremental", False)),
+        establecimientos=tuple(params.get("establecimientos") or ()),
+    )
+    try:
+        processed = uc.execute(req)
+    except JobCancelledError:
+        sync_metrics.finish("cancelled")
+        raise
+    except Exception:
+        sync_metrics.finish("failed")
+        raise
+    sync_metrics.finish("succeeded")
+    rejected = dict(uc.rejected)
+    _notifier.notify("sync_finished", {"processed": processed, "rejected": rejected})
+    return {"processed": processed, "rejected": rejected}
+
+
+def run_export_job(params: dict[str, Any], ctx: JobContext) -> dict[str, Any]:
+    """Job "senasa.export": writes the export to EXPORT_DIR/<job id>.<format>."""
+    fmt = str(params.get("format", "parquet")).lower()
+    req = ExportRequestDTO(format=fmt, filters=_export_filters(params))
+    uc = ExportSenasaDataUseCase(
+        repo=_repo,
+        storage=_storage,
+        streamer=_streamer,
+        page_size=settings.export_page_size,
+        on_progress=lambda rows: ctx.report(rows_exported=rows),
+    )
+    out_dir = Path(settings.export_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"{ctx.job_id}.{fmt}"
+    try:
+        if fmt in STREAM_MEDIA_TYPES:
+            with path.open("wb") as f:
+                for chunk in uc.stream(req):
+                    f.write(chunk)
+        else:
+            uc.execute(req, path=str(path))
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return {
+        "file": path.name,
+        "filename": f"senasa_export.{fmt}",
+        "rows": ctx.progress.get("rows_exported", 0),
+        "size": path.stat().st_size,
+    }
+
+
+job_queue.register("senasa.sync", run_sync_job)
+job_queue.register("senasa.export", run_export_job)
+
+
+@router.post("/sync", status_code=status.HTTP_202_ACCEPTED)
 def sync_endpoint(body: dict[str, Any] | None = None):  # type: ignore[misc]
-    req = SyncRequestDTO(incremental=bool(body or {}).get("incremental", False))
-    uc = SyncSenasaDataUseCase(scraper=_scraper, validator=lambda r: True, repo=_repo)  # type: ignore[arg-type]
-    processed = uc.execute(req)
-    _notifier.notify("sync_finished", {"processed": processed})
-    return {"processed": processed}
+    """Queues a sync; follow it with GET /v1/jobs/{id}.
+
+    ``establecimientos`` (a list of códigos, or "all" for every establecimiento
+    with a checkpoint) partitions the sync: one scrape per establecimiento,
+    SYNC_PARTITION_WORKERS at a time inside a single job. With ``fan_out``
+    every establecimiento becomes its own job instead, so partitions spread
+    over the job workers (e.g. several Celery workers).
+    """
+    body = body or {}
+    incremental = bool(body.get("incremental", False))
+    codigos = _sync_partitions(body.get("establecimientos"))
+    if codigos and body.get("fan_out"):
+        jobs = [
+            job_queue.submit(
+                "senasa.sync", {"incremental": incremental, "establecimientos": [codigo]}
+            )
+            for codigo in codigos
+        ]
+        return {"jobs": [{**job.as_dict(), "status_url": f"/v1/jobs/{job.id}"} for job in jobs]}
+    params: dict[str, Any] = {"incremental": incremental}
+    if codigos:
+        params["establecimientos"] = codigos
+    job = job_queue.submit("senasa.sync", params)
+    return {**job.as_dict(), "status_url": f"/v1/jobs/{job.id}"}
+
+
+def _sync_partitions(value: Any) -> list[str]:
+    if not value:
+        return []
+    if value == "all":
+        codigos = _sync_state.load()
+        if not codigos:
+            raise HTTPException(
+                status_code=409, detail="Sin establecimientos conocidos: corré un sync completo"
+            )
+        return sorted(codigos)
+    if not isinstance(value, list) or not all(isinstance(c, str) and c for c in value):
+        raise HTTPException(status_code=400, detail='establecimientos: lista de códigos o "all"')
+    return list(dict.fromkeys(value))
 
 
 @router.get("/records")
-def list_records(limit: int = 100, offset: int = 0):  # type: ignore[misc]
-    rows = [
-        {
-            "nro_senasa": str(r.tambor.nro_senasa),
-            "establecimiento_codigo": str(r.tambor.establecimiento_codigo),
-            "peso": r.tambor.peso,
-        }
-        for r in _repo.list(limit=limit, offset=offset)
-    ]
-    return {"items": rows, "count": len(rows)}
+def list_records(  # type: ignore[misc]
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
+    offset: int = Query(0, ge=0),
+    establecimiento: str | None = None,
+    productor: str | None = None,
+    tipo_miel: str | None = None,
+    fecha_desde: date | None = None,
+    fecha_hasta: date | None = None,
+    include_total: bool = False,
+):
+    """Tambores ordered by nro_senasa, filtered in the repository query.
+
+    Page with ``cursor``: pass the previous response's ``next_cursor`` (null on
+    the last page). ``offset`` is kept for compatibility but costs a scan of
+    every skipped row. ``total`` (a COUNT with the same filters) is only
+    computed when ``include_total`` is set.
+    """
+    try:
+        after = CodigoSenasa(cursor) if cursor else None
+    except AssertionError as exc:
+        raise HTTPException(status_code=400, detail="cursor inválido") from exc
+    filters = RecordFilter(
+        establecimiento=establecimiento,
+        productor=productor,
+        tipo_miel=tipo_miel,
+        fecha_desde=fecha_desde,
+        fecha_hasta=fecha_hasta,
+    )
+    # Una fila de más indica si hay página siguiente sin un COUNT
+    batch = _repo.list_batch(limit=limit + 1, offset=offset, after=after, filters=filters)
+    # Una sola conversión Arrow para toda la página; FastAPI serializa las fechas en ISO
+    rows = batch[:limit].to_arrow().select(_RECORD_ITEM_FIELDS).to_pylist()
+    body: dict[str, Any] = {
+        "items": rows,
+        "count": len(rows),
+        "next_cursor": rows[-1]["nro_senasa"] if len(batch) > limit else None,
+    }
+    if include_total:
+        body["total"] = _repo.count(filters)
+    return body
+
+
+@router.post("/export/jobs", status_code=status.HTTP_202_ACCEPTED)
+def export_job(body: dict[str, Any] | None = None):  # type: ignore[misc]
+    """Queues an export to a file; download it from GET /v1/jobs/{id}/download."""
+    body = body or {}
+    fmt = str(body.get("format", "parquet")).lower()
+    if fmt not in (*STREAM_MEDIA_TYPES, "xlsx"):
+        raise HTTPException(
+            status_code=400, detail="Formatos soportados: parquet, csv, ndjson, xlsx"
+        )
+    _export_filters(body)  # 400 ahora y no al correr el job
+    job = job_queue.submit("senasa.export", {**body, "format": fmt})
+    return {**job.as_dict(), "status_url": f"/v1/jobs/{job.id}"}
+
+
+def _negotiate_format(accept: str | None) -> str | None:
+    """Export format for an Accept header (highest q first); parquet for */* or none."""
+    if not accept:
+        return "parquet"
+    ranges: list[tuple[float, str]] = []
+    for part in accept.split(","):
+        media, *params = (p.strip() for p in part.split(";"))
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            ranges.append((q, media.lower()))
+    for _, media in sorted(ranges, key=lambda r: -r[0]):
+        if media in ("*/*", "application/*"):
+            return "parquet"
+        if media in _EXPORT_MEDIA_TYPES:
+            return _EXPORT_MEDIA_TYPES[media]
+    return None
+
+
+def _export_filters(body: dict[str, Any]) -> RecordFilter:
+    try:
+        return RecordFilter(
+            establecimiento=body.get("establecimiento"),
+            productor=body.get("productor"),
+            tipo_miel=body.get("tipo_miel"),
+            fecha_desde=date.fromisoformat(body["fecha_desde"])
+            if body.get("fecha_desde")
+            else None,
+            fecha_hasta=date.fromisoformat(body["fecha_hasta"])
+            if body.get("fecha_hasta")
+            else None,
+        )
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail=f"Filtro inválido: {exc}") from exc
 
 
 @router.post("/export")
-def export_records(body: dict[str, Any]):  # type: ignore[misc]
-    req = ExportRequestDTO(format=body.get("format", "parquet"))
-    uc = ExportSenasaDataUseCase(repo=_repo, storage=_storage)
-    out = uc.execute(req, path=body.get("path", "export.parquet"))
-    return {"path": out}
+def export_records(  # type: ignore[misc]
+    body: dict[str, Any] | None = None, accept: str | None = Header(None)
+):
+    """Streams the export in the response body (Parquet, CSV or NDJSON).
+
+    The format comes from ``format`` in the body (400 if unsupported) or,
+    failing that, from the Accept header (406 if nothing acceptable). Rows
+    are read from the repository in keyset pages and serialized chunk by
+    chunk, so the download starts right away and the export is never held in
+    memory. xlsx cannot be produced incrementally: it
+    is written to a temporary file first. Body fields establecimiento,
+    productor, tipo_miel, fecha_desde and fecha_hasta filter the rows.
+    """
+    body = body or {}
+    if body.get("format"):
+        fmt: str | None = str(body["format"]).lower()
+        if fmt not in (*STREAM_MEDIA_TYPES, "xlsx"):
+            # Valor inválido en el body: no es un fallo de negociación (406)
+            raise HTTPException(
+                status_code=400, detail="Formatos soportados: parquet, csv, ndjson, xlsx"
+            )
+    else:
+        fmt = _negotiate_format(accept)
+    if fmt is None:
+        raise HTTPException(
+            status_code=406, detail="Formatos soportados: parquet, csv, ndjson, xlsx"
+        )
+    req = ExportRequestDTO(format=fmt, filters=_export_filters(body))
+    uc = ExportSenasaDataUseCase(
+        repo=_repo, storage=_storage, streamer=_streamer, page_size=settings.export_page_size
+    )
+    filename = f"senasa_export.{fmt}"
+    if fmt == "xlsx":
+        fd, path = tempfile.mkstemp(suffix=".xlsx")
+        os.close(fd)
+        try:
+            uc.execute(req, path=path)
+        except Exception:
+            os.unlink(path)
+            raise
+        return FileResponse(
+            path,
+            media_type=_XLSX_MEDIA_TYPE,
+            filename=filename,
+            background=BackgroundTask(os.unlink, path),
+        )
+    return StreamingResponse(
+        uc.stream(req),
+        media_type=_streamer.media_type(fmt),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -2,26 +2,88 @@ import typer
 
 from senasa_pipeline.application.dtos.export_request_dto import ExportRequestDTO
 from senasa_pipeline.application.dtos.sync_request_dto import SyncRequestDTO
+from senasa_pipeline.application.establecimiento_cache import EstablecimientoCache
 from senasa_pipeline.application.use_cases.export_senasa_data import ExportSenasaDataUseCase
 from senasa_pipeline.application.use_cases.sync_senasa_data import SyncSenasaDataUseCase
+from senasa_pipeline.config import settings
 from senasa_pipeline.infrastructure.adapters.notification_adapter import SimpleNotificationAdapter
 from senasa_pipeline.infrastructure.adapters.scraping_adapter import SenasaWebScrapingAdapter
-from senasa_pipeline.infrastructure.adapters.storage_adapter import ParquetStorageAdapter
-from senasa_pipeline.infrastructure.repositories.duckdb_repository import DuckDBSenasaRepository
+from senasa_pipeline.infrastructure.adapters.storage_adapter import (
+    ExcelExportAdapter,
+    MultiFormatStorageAdapter,
+    ParquetStorageAdapter,
+)
+from senasa_pipeline.infrastructure.adapters.validation_adapter import PolarsRecordValidator
+from senasa_pipeline.infrastructure.repositories.factory import (
+    build_repositories,
+    build_session_store,
+    build_sync_state,
+)
 
 app = typer.Typer(help="SENASA Data Pipeline CLI")
 
-_repo = DuckDBSenasaRepository()
-_scraper = SenasaWebScrapingAdapter()
+_repo, _establecimiento_repo = build_repositories()
+_establecimientos = EstablecimientoCache(
+    _establecimiento_repo, maxsize=settings.establecimiento_cache_size
+)
+_scraper = SenasaWebScrapingAdapter(
+    build_session_store(),
+    concurrency=settings.scraper_concurrency,
+    requests_per_second=settings.scraper_requests_per_second,
+    timeout=settings.http_timeout,
+    mode=settings.scraper_mode,
+    download_dir=settings.scraper_download_dir or None,
+    export_control=settings.scraper_export_control or None,
+    filter_field=settings.scraper_filter_field or None,
+    batch_size=settings.sync_batch_size,
+)
+_sync_state = build_sync_state()
+_validator = PolarsRecordValidator(max_peso_kg=settings.validation_max_peso_kg)
 _notifier = SimpleNotificationAdapter()
-_storage = ParquetStorageAdapter()
+_storage = MultiFormatStorageAdapter(
+    {
+        "parquet": ParquetStorageAdapter(
+            compression=settings.export_parquet_compression,
+            row_group_size=settings.export_row_group_size,
+        ),
+        "xlsx": ExcelExportAdapter(),
+    }
+)
+
+# Opción repetible (-e A -e B): su default no puede ser una llamada en la firma (B008)
+_ESTABLECIMIENTO_OPTION = typer.Option(
+    None, "--establecimiento", "-e", help="Sync particionado: uno por establecimiento"
+)
 
 
 @app.command()
-def sync(incremental: bool = typer.Option(False, "--incremental", "-i")) -> None:
-    uc = SyncSenasaDataUseCase(scraper=_scraper, validator=lambda r: True, repo=_repo)  # type: ignore[arg-type]
-    n = uc.execute(SyncRequestDTO(incremental=incremental))
+def sync(
+    incremental: bool = typer.Option(False, "--incremental", "-i"),
+    establecimiento: list[str] | None = _ESTABLECIMIENTO_OPTION,
+    all_establecimientos: bool = typer.Option(
+        False, "--all-establecimientos", help="Particionar por todos los que tienen checkpoint"
+    ),
+) -> None:
+    codigos = list(establecimiento or [])
+    if all_establecimientos:
+        codigos += sorted(_sync_state.load())
+    uc = SyncSenasaDataUseCase(
+        scraper=_scraper,
+        validator=_validator,
+        repo=_repo,
+        batch_size=settings.sync_batch_size,
+        max_pending_batches=settings.sync_prefetch_batches,
+        state=_sync_state,
+        establecimientos=_establecimientos,
+        partition_workers=settings.sync_partition_workers,
+        overlap_days=settings.sync_overlap_days,
+    )
+    n = uc.execute(
+        SyncRequestDTO(incremental=incremental, establecimientos=tuple(dict.fromkeys(codigos)))
+    )
     typer.echo(f"Registros procesados: {n}")
+    if uc.rejected:
+        typer.echo(f"Registros rechazados por regla: {dict(uc.rejected)}")
 
 
 @app.command()
@@ -29,6 +91,6 @@ def export(
     format: str = typer.Option("parquet", "--format", "-f"),
     path: str = typer.Option("export.parquet", "--path", "-p"),
 ) -> None:
-    uc = ExportSenasaDataUseCase(repo=_repo, storage=_storage)
+    uc = ExportSenasaDataUseCase(repo=_repo, storage=_storage, page_size=settings.export_page_size)
     out = uc.execute(ExportRequestDTO(format=format), path=path)
     typer.echo(out)
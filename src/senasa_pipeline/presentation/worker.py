@@ -0,0 +1,18 @@
+"""Celery worker entry point: ``celery -A senasa_pipeline.presentation.worker worker``.
+
+Importing the SENASA routes registers the job handlers on the shared queue;
+requires CELERY_BROKER_URL and a DATABASE_URL shared with the API. The
+routes build their stores from it (see infrastructure.repositories.factory):
+syncs run here advance the incremental marks the API reads, and reuse the
+API's SENASA session and refresh lease, so one AFIP login serves every host.
+Export files land in EXPORT_DIR, which the API must see too to serve downloads.
+"""
+
+from senasa_pipeline.infrastructure.adapters.jobs.celery_queue import CeleryJobQueue
+from senasa_pipeline.presentation.api.routes import senasa  # noqa: F401  (registra handlers)
+from senasa_pipeline.presentation.api.routes.jobs import job_queue
+
+if not isinstance(job_queue, CeleryJobQueue):
+    raise RuntimeError("CELERY_BROKER_URL no configurado: los jobs corren dentro de la API")
+
+app = job_queue.app
@@ -0,0 +1,5 @@
+import os
+
+# Las rutas de la API abren sus stores al importarse: en los tests, en memoria
+for _name in ("DUCKDB_PATH", "SESSION_DB_PATH", "SYNC_STATE_DB_PATH"):
+    os.environ.setdefault(_name, ":memory:")
@@ -0,0 +1,58 @@
+"""HTML fixtures shaped like the AFIP JSF and SENASA login pages.
+
+``padding`` adds script/markup bulk so pages approach the size of captured ones
+(the SENASA login page carries a ~100 KB ``__VIEWSTATE``).
+"""
+
+from __future__ import annotations
+
+USER_BUTTON_ID = "ctl00_MasterEditBox_ucLogin_rptUsuariosAfip_ctl05_btnLoginAfip"
+
+
+def _filler(padding: int) -> str:
+    return "".join(
+        f'<div class="row"><span id="s{i}">Texto de ayuda {i}</span>'
+        f"<script>var x{i} = {{a: {i}, b: 'c'}};</script></div>"
+        for i in range(padding)
+    )
+
+
+def afip_login_page(view_state: str = "VS-CUIT", *, padding: int = 0) -> str:
+    return (
+        "<html><head><title>AFIP</title></head><body>"
+        f"{_filler(padding)}"
+        '<form id="F1" name="F1" method="post" action="/contribuyente_/loginClave.xhtml">'
+        '<input type="text" name="F1:username" value="">'
+        '<input type="submit" name="F1:btnSiguiente" value="Siguiente">'
+        f'<input type="hidden" name="javax.faces.ViewState" value="{view_state}">'
+        "</form></body></html>"
+    )
+
+
+def afip_token_page(token: str = "TOKEN", sign: str = "SIGN") -> str:
+    return (
+        '<html><body onload="document.myform.submit()">'
+        '<form name="myform" method="post" action="https://trazabilidadapicola.senasa.gob.ar/afip">'
+        f'<input type="hidden" name="token" value="{token}">'
+        f'<input type="hidden" name="sign" value="{sign}">'
+        "</form></body></html>"
+    )
+
+
+def senasa_login_page(*, viewstate_size: int = 100, padding: int = 0) -> str:
+    users = "".join(
+        f'<a id="ctl00_MasterEditBox_ucLogin_rptUsuariosAfip_ctl0{i}_btnLoginAfip" '
+        f"href=\"javascript:__doPostBack('x','')\">USUARIO {i} (20-0000000{i}-1)</a>"
+        for i in range(5)
+    )
+    return (
+        "<html><body>"
+        '<form name="aspnetForm" method="post" action="./Login.aspx?from=afip" id="aspnetForm">'
+        f'<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{"A" * viewstate_size}">'
+        '<input type="hidden" name="__VIEWSTATEGENERATOR" value="C2EE9ABB">'
+        '<input type="hidden" name="__EVENTVALIDATION" value="EV">'
+        f"{_filler(padding)}"
+        f'<div id="ctl00_MasterEditBox_ucLogin_rptUsuariosAfip">{users}'
+        f'<a id="{USER_BUTTON_ID}" href="#">COOP. APICOLA DEL PARANA (30-70933844-3)</a>'
+        "</div></form></body></html>"
+    )
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import date
+
+from senasa_pipeline.domain.entities.establecimiento import Establecimiento
+from senasa_pipeline.domain.entities.senasa_record import SenasaRecord
+from senasa_pipeline.domain.entities.tambor import Tambor
+from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
+from senasa_pipeline.domain.value_objects.cuit import CUIT
+from senasa_pipeline.domain.value_objects.fecha_vencimiento import FechaVencimiento
+
+
+def make_establecimiento(codigo: str = "EST001") -> Establecimiento:
+    return Establecimiento(
+        CodigoSenasa(codigo),
+        "Est 1",
+        "Dir",
+        "Loc",
+        "Prov",
+        CUIT("20301234567"),
+        FechaVencimiento.from_date(date(2026, 1, 1)),
+    )
+
+
+def make_record(
+    nro: str,
+    peso: float = 300.0,
+    *,
+    est: str = "EST001",
+    fecha: date = date(2025, 1, 10),
+) -> SenasaRecord:
+    t = Tambor(
+        CodigoSenasa(nro),
+        CodigoSenasa(est),
+        fecha,
+        peso,
+        "flores",
+        "AR",
+        "Juan",
+    )
+    return SenasaRecord(tambor=t, establecimiento=make_establecimiento(est))
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Protocol
+
 
 class FakeStore:
     def __init__(self) -> None:
@@ -28,10 +28,25 @@ class FakeConsumer:
         self.valid_first = valid_first
         self.cookies = {"cookie": "value"}
         self._validated = False
+        self.restored = None
+        self.probes = 0
+    def restore_session(self, cookies):
+        self.restored = dict(cookies)
     def validate_session(self) -> bool:
+        self.probes += 1
         if not self._validated:
             self._validated = True
             return self.valid_first
         return True
     def login_with_token_sign(self, token, sign):
         self.cookies = {"session": "abc"}
+
+class AsyncFakeProvider(FakeProvider):
+    async def get_token_sign(self):
+        return super().get_token_sign()
+
+class AsyncFakeConsumer(FakeConsumer):
+    async def validate_session(self) -> bool:
+        return super().validate_session()
+    async def login_with_token_sign(self, token, sign):
+        super().login_with_token_sign(token, sign)
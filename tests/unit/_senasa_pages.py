@@ -0,0 +1,96 @@
+"""HTML fixtures that mimic SENASA ASP.NET WebForms GridView pages."""
+
+from __future__ import annotations
+
+GRID_TARGET = "ctl00$MasterEditBox$gvExtracciones"
+HEADERS = [
+    "Nro. SENASA",
+    "Establecimiento",
+    "Fecha Extracción",
+    "Peso (kg)",
+    "Tipo de Miel",
+    "Origen",
+    "Productor",
+]
+
+
+def grid_rows_html(page: int, rows_per_page: int = 3) -> str:
+    rows = "".join(
+        f"<tr><td>T{page:03d}{i}</td><td>EST001</td><td>10/01/2025</td>"
+        f"<td>1.234,5</td><td>flores</td><td>AR</td><td>Juan</td></tr>"
+        for i in range(rows_per_page)
+    )
+    header = "".join(f"<th>{h}</th>" for h in HEADERS)
+    return f"<tr>{header}</tr>{rows}"
+
+
+def linked_pages(page: int, total_pages: int, window: int = 3) -> set[int]:
+    """Pages the pager of ``page`` links to: its window plus "..." to the next one."""
+    start = ((page - 1) // window) * window + 1
+    return {n for n in range(start, min(start + window + 1, total_pages + 1)) if n != page}
+
+
+def pager_html(page: int, total_pages: int, window: int = 3) -> str:
+    start = ((page - 1) // window) * window + 1
+    links = "".join(
+        f"<a href=\"javascript:__doPostBack('{GRID_TARGET}','Page${n}')\">{n}</a>"
+        for n in range(start, min(start + window, total_pages + 1))
+        if n != page
+    )
+    if start + window <= total_pages:
+        # GridView muestra "..." hacia la siguiente ventana de páginas
+        links += (
+            f"<a href=\"javascript:__doPostBack('{GRID_TARGET}','Page${start + window}')\">...</a>"
+        )
+    return f'<tr><td colspan="7">{links}</td></tr>'
+
+
+def grid_page(page: int, total_pages: int, viewstate: str = "VS1") -> str:
+    grid_id = GRID_TARGET.replace("$", "_")
+    return (
+        "<html><body><form>"
+        f'<input type="hidden" name="__VIEWSTATE" value="{viewstate}"/>'
+        '<input type="hidden" name="__EVENTVALIDATION" value="EV"/>'
+        f'<table id="{grid_id}">{grid_rows_html(page)}{pager_html(page, total_pages)}</table>'
+        "</form></body></html>"
+    )
+
+
+SCRIPT_MANAGER = "ctl00$ScriptManager1"
+UPDATE_PANEL = "ctl00$MasterEditBox$upGrilla"
+
+
+def delta_segment(type_: str, id_: str, content: str) -> str:
+    return f"{len(content)}|{type_}|{id_}|{content}|"
+
+
+def async_grid_page(total_pages: int, viewstate: str = "VS1") -> str:
+    """Page 1 with a ScriptManager and the grid inside an UpdatePanel."""
+    grid_id = GRID_TARGET.replace("$", "_")
+    panel_id = UPDATE_PANEL.replace("$", "_")
+    return (
+        "<html><body><form>"
+        f'<input type="hidden" name="__VIEWSTATE" value="{viewstate}"/>'
+        '<input type="hidden" name="__EVENTVALIDATION" value="EV"/>'
+        "<script>Sys.WebForms.PageRequestManager._initialize("
+        f"'{SCRIPT_MANAGER}', 'aspnetForm', ['tctl00$upMenu','ctl00_upMenu','t{UPDATE_PANEL}',"
+        f"'{panel_id}'], [], [], 90, 'ctl00');</script>"
+        '<div id="ctl00_upMenu"><a href="#">Menu | Inicio</a></div>'
+        f'<div id="{panel_id}"><table id="{grid_id}">'
+        f"{grid_rows_html(1)}{pager_html(1, total_pages)}</table></div>"
+        "</form></body></html>"
+    )
+
+
+def grid_delta(page: int, total_pages: int, viewstate: str) -> str:
+    """UpdatePanel async-post answer for ``Page$<page>``."""
+    grid_id = GRID_TARGET.replace("$", "_")
+    panel = f'<table id="{grid_id}">{grid_rows_html(page)}{pager_html(page, total_pages)}</table>'
+    return (
+        "1|#||4|"
+        + delta_segment("updatePanel", UPDATE_PANEL.replace("$", "_"), panel)
+        + delta_segment("hiddenField", "__EVENTTARGET", "")
+        + delta_segment("hiddenField", "__VIEWSTATE", viewstate)
+        + delta_segment("asyncPostBackControlIDs", "", "")
+        + delta_segment("pageTitle", "", "Extracciones | SENASA")
+    )
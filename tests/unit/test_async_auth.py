@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import httpx
+from structlog.testing import capture_logs
+
+from senasa_pipeline.application.use_cases.ensure_senasa_session import (
+    AsyncEnsureSenasaSessionUseCase,
+    SystemClock,
+)
+from senasa_pipeline.infrastructure.adapters.http.httpx_client import AsyncHttpxClient
+from senasa_pipeline.infrastructure.adapters.senasa.login_consumer import (
+    SENASA_BASE,
+    AsyncSenasaLoginConsumer,
+)
+from tests.unit._fakes_auth import AsyncFakeConsumer, AsyncFakeProvider, FakeStore
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class FixedClock(SystemClock):
+    def now(self) -> datetime:
+        return NOW
+
+
+def test_async_ensure_session_already_active() -> None:
+    store = FakeStore()
+    exp = NOW + timedelta(hours=6)
+    store.save({"k": "v"}, exp)
+    provider = AsyncFakeProvider()
+
+    uc = AsyncEnsureSenasaSessionUseCase(
+        store=store, provider=provider, consumer=AsyncFakeConsumer(), clock=FixedClock()
+    )
+    res = asyncio.run(uc.execute())
+
+    assert res.status == "ALREADY_ACTIVE"
+    assert res.expires_at == exp
+    assert provider.called == 0
+
+
+def test_async_ensure_session_refreshes_and_saves_cookies() -> None:
+    store = FakeStore()
+    provider = AsyncFakeProvider(token="T", sign="S")
+
+    uc = AsyncEnsureSenasaSessionUseCase(
+        store=store,
+        provider=provider,
+        consumer=AsyncFakeConsumer(valid_first=True),
+        clock=FixedClock(),
+        ttl_hours=2,
+    )
+    res = asyncio.run(uc.execute())
+
+    assert res.status == "REFRESHED"
+    assert provider.called == 1
+    assert store.load() == ({"session": "abc"}, NOW + timedelta(hours=2), True)
+
+
+def test_async_consumer_validation_detects_login_redirect() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("Cookie") == "ASP.NET_SessionId=ok":
+            return httpx.Response(200, text='<input name="__VIEWSTATE" value="x">')
+        return httpx.Response(302, headers={"Location": f"{SENASA_BASE}/Login.aspx"})
+
+    async def run(cookie: str) -> bool:
+        client = AsyncHttpxClient(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        client.set_cookies({"ASP.NET_SessionId": cookie})
+        consumer = AsyncSenasaLoginConsumer(client)
+        consumer._session_ready = True
+        try:
+            return await consumer.validate_session()
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run("ok")) is True
+    assert asyncio.run(run("expired")) is False
+
+
+class AsyncBrokenProbeConsumer(AsyncFakeConsumer):
+    async def validate_session(self) -> bool:
+        if self.probes == 0:
+            self.probes += 1
+            raise httpx.ConnectError("senasa down")
+        return await super().validate_session()
+
+
+def test_async_failed_probe_is_logged_and_triggers_login() -> None:
+    store = FakeStore()
+    store.save({"k": "v"}, NOW + timedelta(hours=6))
+    provider = AsyncFakeProvider()
+    uc = AsyncEnsureSenasaSessionUseCase(
+        store=store, provider=provider, consumer=AsyncBrokenProbeConsumer(), clock=FixedClock()
+    )
+
+    with capture_logs() as logs:
+        res = asyncio.run(uc.execute())
+
+    assert res.status == "REFRESHED" and provider.called == 1
+    assert [e["error"] for e in logs if e["event"] == "session_probe_failed"] == ["senasa down"]
@@ -0,0 +1,70 @@
+from datetime import date
+
+from senasa_pipeline.domain.repositories.interfaces import RecordFilter
+from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
+from senasa_pipeline.infrastructure.repositories.duckdb_repository import DuckDBSenasaRepository
+from tests.unit._factories import make_record as _record
+
+
+def test_get_by_nro_roundtrip():
+    repo = DuckDBSenasaRepository()
+    repo.save(_record("ABC123"))
+    got = repo.get_by_nro(CodigoSenasa("ABC123"))
+    assert got == _record("ABC123")
+    assert repo.get_by_nro(CodigoSenasa("ZZZ999")) is None
+
+
+def test_save_upserts_by_nro_senasa():
+    repo = DuckDBSenasaRepository()
+    repo.save(_record("ABC123", peso=300.0))
+    repo.save(_record("ABC123", peso=280.5))
+    rows = repo.list()
+    assert len(rows) == 1
+    assert rows[0].tambor.peso == 280.5
+
+
+def test_list_is_ordered_and_paginated():
+    repo = DuckDBSenasaRepository()
+    for nro in ("C003", "A001", "B002"):
+        repo.save(_record(nro))
+    page = repo.list(limit=2, offset=1)
+    assert [str(r.tambor.nro_senasa) for r in page] == ["B002", "C003"]
+
+
+def test_data_persists_on_disk(tmp_path):
+    path = str(tmp_path / "senasa.duckdb")
+    repo = DuckDBSenasaRepository(db_path=path)
+    repo.save(_record("ABC123"))
+    repo.close()
+    assert DuckDBSenasaRepository(db_path=path).get_by_nro(CodigoSenasa("ABC123")) is not None
+
+
+def test_list_filters_with_keyset_cursor_and_count():
+    repo = DuckDBSenasaRepository()
+    repo.save_many(
+        [
+            _record(f"T{i:03d}", est="EST002" if i % 2 else "EST001", fecha=date(2025, 1, 1 + i))
+            for i in range(10)
+        ]
+    )
+    filters = RecordFilter(establecimiento="EST002", fecha_desde=date(2025, 1, 3))
+
+    first = repo.list(limit=2, filters=filters)
+    assert [str(r.tambor.nro_senasa) for r in first] == ["T003", "T005"]
+    rest = repo.list(limit=10, after=first[-1].tambor.nro_senasa, filters=filters)
+    assert [str(r.tambor.nro_senasa) for r in rest] == ["T007", "T009"]
+    assert repo.count(filters) == 4
+    assert repo.count(RecordFilter(productor="Nadie")) == 0
+    assert repo.count() == 10
+
+
+def test_list_batch_reads_the_same_page_as_arrow_columns():
+    repo = DuckDBSenasaRepository()
+    repo.save_many([_record(f"T{i:03d}", fecha=date(2025, 1, 1 + i)) for i in range(6)])
+    filters = RecordFilter(fecha_desde=date(2025, 1, 2))
+
+    batch = repo.list_batch(limit=3, after=CodigoSenasa("T001"), filters=filters)
+    page = repo.list(limit=3, after=CodigoSenasa("T001"), filters=filters)
+    assert [v.tambor for v in batch] == [r.tambor for r in page]
+    assert batch[0].establecimiento is None
+    assert len(repo.list_batch(filters=RecordFilter(productor="Nadie"))) == 0
@@ -0,0 +1,80 @@
+from dataclasses import replace
+
+from senasa_pipeline.application.dtos.sync_request_dto import SyncRequestDTO
+from senasa_pipeline.application.establecimiento_cache import EstablecimientoCache
+from senasa_pipeline.application.use_cases.sync_senasa_data import SyncSenasaDataUseCase
+from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
+from senasa_pipeline.infrastructure.repositories.duckdb_repository import DuckDBSenasaRepository
+from tests.unit._factories import make_establecimiento, make_record
+
+
+class CountingRepo:
+    def __init__(self, inner):
+        self.inner = inner
+        self.get_many_calls = []
+        self.upserted = []
+
+    def get_many(self, codigos):
+        self.get_many_calls.append(sorted(codigos))
+        return self.inner.get_many(codigos)
+
+    def upsert_many(self, ests):
+        self.upserted.extend(str(e.codigo_senasa) for e in ests)
+        return self.inner.upsert_many(ests)
+
+
+class ListScraper:
+    def __init__(self, records):
+        self.records = records
+
+    def fetch_latest(self, incremental: bool = False, since=None):
+        yield from self.records
+
+
+class AlwaysValid:
+    def validate(self, record):
+        return True
+
+
+def test_cache_prefetches_in_bulk_and_evicts_lru():
+    repo = DuckDBSenasaRepository()
+    repo.establecimiento_repo.upsert_many([make_establecimiento(f"E{i:02d}") for i in range(4)])
+    counting = CountingRepo(repo.establecimiento_repo)
+    cache = EstablecimientoCache(counting, maxsize=2)
+
+    assert set(cache.prefetch(["E00", "E01", "NOPE"])) == {"E00", "E01"}
+    assert counting.get_many_calls == [["E00", "E01", "NOPE"]]
+    assert cache.get("E00") == make_establecimiento("E00")  # hit, E00 pasa a ser el más reciente
+    assert cache.get("E02") is not None
+    assert len(counting.get_many_calls) == 2
+    assert "E00" in cache and "E01" not in cache
+
+
+def test_cache_upserts_only_new_or_changed_and_interns():
+    repo = DuckDBSenasaRepository()
+    counting = CountingRepo(repo.establecimiento_repo)
+    cache = EstablecimientoCache(counting)
+    est = make_establecimiento("E01")
+
+    assert cache.upsert_changed([est, make_establecimiento("E02")]) == 2
+    assert cache.upsert_changed([make_establecimiento("E01")]) == 0
+    assert cache.upsert_changed([replace(est, nombre="Nuevo")]) == 1
+    assert counting.upserted == ["E01", "E02", "E01"]
+    assert repo.establecimiento_repo.get(CodigoSenasa("E01")).nombre == "Nuevo"
+    assert cache.intern(replace(est, nombre="Nuevo")) is cache.get("E01")
+
+
+def test_sync_writes_each_establecimiento_once_per_run():
+    repo = DuckDBSenasaRepository()
+    counting = CountingRepo(repo.establecimiento_repo)
+    cache = EstablecimientoCache(counting)
+    records = [make_record(f"T{i:04d}", est=f"E{i % 3:02d}") for i in range(30)]
+    uc = SyncSenasaDataUseCase(
+        ListScraper(records), AlwaysValid(), repo, batch_size=4, establecimientos=cache
+    )
+
+    assert uc.execute(SyncRequestDTO(incremental=False)) == 30
+    assert sorted(counting.upserted) == ["E00", "E01", "E02"]
+    assert uc.establecimientos_written == 3
+    stored = repo.get_by_nro(CodigoSenasa("T0004"))
+    assert stored.establecimiento == records[4].establecimiento
@@ -0,0 +1,186 @@
+import asyncio
+import base64
+from datetime import date
+from urllib.parse import parse_qs
+
+import httpx
+import polars as pl
+import pytest
+from structlog.testing import capture_logs
+
+from senasa_pipeline.application.record_batch import RECORD_SCHEMA, SenasaRecordBatch
+from senasa_pipeline.infrastructure.adapters.scraping_adapter import SenasaWebScrapingAdapter
+from senasa_pipeline.infrastructure.adapters.senasa.export_download import (
+    PENDING_DOWNLOAD_BYTES,
+    PENDING_DOWNLOAD_FILENAME,
+    SenasaExportUnavailableError,
+    SenasaGridExporter,
+    iter_record_batches,
+    read_export,
+)
+from tests.unit._senasa_pages import HEADERS, grid_page
+
+EXPORT_BUTTON = "ctl00$MasterEditBox$btnExportarExcel"
+
+CSV = (
+    ";".join(HEADERS)
+    + "\n"
+    + "T0001;EST001;10/01/2025;1.234,5;flores;AR;Juan\n"
+    + "T0002;EST001;05/12/2024;300;multiflora;AR;Ana\n"
+    + "X;EST001;10/01/2025;100;flores;AR;Juan\n"  # código inválido
+    + "T0004;EST001;fecha;100;flores;AR;Juan\n"
+).encode("cp1252")
+
+
+def _list_page(total_pages: int = 3) -> str:
+    button = f'<input type="submit" name="{EXPORT_BUTTON}" value="Exportar a Excel"/>'
+    return grid_page(1, total_pages).replace("</form>", f"{button}</form>")
+
+
+def test_read_export_parses_latin1_csv_vectorized(tmp_path):
+    path = tmp_path / "extracciones.csv"
+    path.write_bytes(CSV)
+
+    df = read_export(path)
+
+    assert df["nro_senasa"].to_list() == ["T0001", "T0002"]
+    assert df["peso"].to_list() == [1234.5, 300.0]
+    assert df["fecha_extraccion"].to_list() == [date(2025, 1, 10), date(2024, 12, 5)]
+    assert read_export(path, since=date(2025, 1, 1)).height == 1
+    [batch] = list(iter_record_batches(df))
+    assert isinstance(batch, SenasaRecordBatch)
+    assert batch.table.schema == RECORD_SCHEMA
+    assert batch[0].tambor.productor == "Juan"
+
+
+def test_read_export_logs_and_counts_rows_it_drops(tmp_path):
+    path = tmp_path / "extracciones.csv"
+    path.write_bytes(CSV)
+    skipped: list[int] = []
+
+    with capture_logs() as logs:
+        df = read_export(path, since=date(2025, 1, 1), on_skipped=skipped.append)
+
+    # La fila anterior a ``since`` se filtra sin contarse como descartada
+    assert df["nro_senasa"].to_list() == ["T0001"]
+    assert skipped == [2]
+    warnings = [e for e in logs if e["event"] == "export_row_skipped"]
+    assert [(e["log_level"], e["row"]) for e in warnings] == [("warning", 3), ("warning", 4)]
+    assert warnings[1]["cells"][:3] == ["T0004", "EST001", "fecha"]
+
+
+def test_read_export_reads_utf8_csv_from_the_file(tmp_path):
+    path = tmp_path / "extracciones.csv"
+    path.write_bytes(("\ufeff" + CSV.decode("cp1252").replace(";Juan", ";Juan Peña")).encode())
+
+    df = read_export(path)
+
+    assert df["productor"].to_list() == ["Juan Peña", "Ana"]
+
+
+def test_read_export_handles_xlsx_and_html_tables(tmp_path):
+    xlsx = tmp_path / "extracciones.xlsx"
+    pl.DataFrame(
+        {
+            "Nro. SENASA": ["T0001"],
+            "Establecimiento": ["EST001"],
+            "Fecha Extracción": [date(2025, 1, 10)],
+            "Peso (kg)": [250.0],
+            "Tipo de Miel": ["flores"],
+            "Origen": ["AR"],
+            "Productor": ["Juan"],
+        }
+    ).write_excel(xlsx)
+    html = tmp_path / "extracciones.xls"
+    html.write_text(f"<table>{grid_page(1, 1).split('<table')[1].split('>', 1)[1]}")
+
+    xlsx_df = read_export(xlsx)
+    assert xlsx_df.row(0, named=True)["fecha_extraccion"] == date(2025, 1, 10)
+    assert xlsx_df["peso"].to_list() == [250.0]
+    assert read_export(html).height == 3
+
+    missing = tmp_path / "otro.csv"
+    missing.write_text("a;b\n1;2\n")
+    with pytest.raises(SenasaExportUnavailableError):
+        read_export(missing)
+
+
+def _download(handler, tmp_path):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await SenasaGridExporter(client, tmp_path).download()
+
+    return asyncio.run(run())
+
+
+def test_exporter_presses_export_button_and_streams_attachment(tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, text=_list_page())
+        form = parse_qs(request.content.decode())
+        assert form[EXPORT_BUTTON] == ["Exportar a Excel"]
+        assert form["__VIEWSTATE"] == ["VS1"]
+        return httpx.Response(
+            200,
+            content=CSV,
+            headers={"Content-Disposition": 'attachment; filename="Extracciones.csv"'},
+        )
+
+    download = _download(handler, tmp_path)
+
+    assert download.filename == "Extracciones.csv"
+    assert download.path.parent == tmp_path and download.path.suffix == ".csv"
+    assert download.path.read_bytes() == CSV and download.size == len(CSV)
+
+
+def test_exporter_reads_pending_download_hidden_fields(tmp_path):
+    page = grid_page(1, 1).replace(
+        "</form>",
+        f'<input type="hidden" name="{PENDING_DOWNLOAD_BYTES}" '
+        f'value="{base64.b64encode(CSV).decode()}"/>'
+        f'<input type="hidden" name="{PENDING_DOWNLOAD_FILENAME}" value="Extracciones.csv"/>'
+        "</form>",
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=_list_page() if request.method == "GET" else page)
+
+    download = _download(handler, tmp_path)
+
+    assert read_export(download.path).height == 2
+
+
+def test_adapter_auto_mode_falls_back_to_html_paging(tmp_path):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.method)
+        return httpx.Response(200, text=grid_page(1, total_pages=1))
+
+    adapter = SenasaWebScrapingAdapter(
+        mode="auto", download_dir=str(tmp_path), transport=httpx.MockTransport(handler)
+    )
+    records = list(adapter.fetch_latest())
+
+    assert len(records) == 3
+    assert requests == ["GET", "GET"]  # sin botón de export: se pagina la grilla
+    with pytest.raises(ValueError):
+        SenasaWebScrapingAdapter(mode="excel")
+
+
+def test_adapter_download_mode_counts_dropped_export_rows(tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, text=_list_page())
+        return httpx.Response(
+            200,
+            content=CSV,
+            headers={"Content-Disposition": 'attachment; filename="Extracciones.csv"'},
+        )
+
+    adapter = SenasaWebScrapingAdapter(
+        mode="download", download_dir=str(tmp_path), transport=httpx.MockTransport(handler)
+    )
+
+    assert [r.nro_senasa for r in adapter.fetch_latest()] == ["T0001", "T0002"]
+    assert adapter.rows_skipped == 2
@@ -0,0 +1,99 @@
+import json
+from datetime import date
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import load_workbook
+
+from senasa_pipeline.application.dtos.export_request_dto import ExportRequestDTO
+from senasa_pipeline.application.use_cases.export_senasa_data import ExportSenasaDataUseCase
+from senasa_pipeline.domain.repositories.interfaces import RecordFilter
+from senasa_pipeline.infrastructure.adapters.storage_adapter import (
+    ExcelExportAdapter,
+    ParquetStorageAdapter,
+    StreamingExportAdapter,
+)
+from senasa_pipeline.infrastructure.repositories.duckdb_repository import DuckDBSenasaRepository
+from tests.unit._factories import make_record
+
+
+def _repo(n):
+    repo = DuckDBSenasaRepository()
+    repo.save_many([make_record(f"T{i:05d}") for i in range(n)])
+    return repo
+
+
+def test_export_streams_full_dataset_in_row_groups(tmp_path):
+    storage = ParquetStorageAdapter(compression="snappy", row_group_size=1000)
+    uc = ExportSenasaDataUseCase(repo=_repo(2500), storage=storage, page_size=300)
+    out = uc.execute(ExportRequestDTO(format="parquet"), path=str(tmp_path / "out.parquet"))
+    meta = pq.ParquetFile(out).metadata
+    assert meta.num_rows == 2500
+    assert meta.num_row_groups == 3
+    table = pq.read_table(out)
+    assert table.column("nro_senasa")[2499].as_py() == "T02499"
+
+
+def test_export_empty_repository_writes_schema_only(tmp_path):
+    uc = ExportSenasaDataUseCase(repo=DuckDBSenasaRepository(), storage=ParquetStorageAdapter())
+    out = uc.execute(ExportRequestDTO(), path=str(tmp_path / "empty.parquet"))
+    table = pq.read_table(out)
+    assert table.num_rows == 0
+    assert "fecha_extraccion" in table.column_names
+
+
+def test_excel_export_splits_sheets_at_row_limit(tmp_path):
+    uc = ExportSenasaDataUseCase(repo=_repo(25), storage=ExcelExportAdapter(max_rows_per_sheet=11))
+    out = uc.execute(ExportRequestDTO(format="xlsx"), path=str(tmp_path / "out.xlsx"))
+    wb = load_workbook(out, read_only=True)
+    assert wb.sheetnames == ["tambores", "tambores_2", "tambores_3"]
+    assert [wb[name].max_row for name in wb.sheetnames] == [11, 11, 6]
+    header = next(wb["tambores_3"].iter_rows(values_only=True))
+    assert header[0] == "nro_senasa"
+
+
+def test_stream_export_formats_match_repository_rows():
+    uc = ExportSenasaDataUseCase(
+        repo=_repo(25),
+        streamer=StreamingExportAdapter(row_group_size=10, chunk_rows=10),
+        page_size=7,
+    )
+
+    parquet = list(uc.stream(ExportRequestDTO(format="parquet")))
+    assert parquet[0] == b"PAR1" and len(parquet) > 3
+    meta = pq.ParquetFile(pa.BufferReader(b"".join(parquet))).metadata
+    assert meta.num_rows == 25
+    assert meta.num_row_groups == 3
+
+    lines = b"".join(uc.stream(ExportRequestDTO(format="csv"))).decode().splitlines()
+    assert lines[0].startswith('"nro_senasa"') and len(lines) == 26
+
+    filters = RecordFilter(fecha_desde=date(2025, 1, 10))
+    rows = b"".join(uc.stream(ExportRequestDTO(format="ndjson", filters=filters))).splitlines()
+    assert json.loads(rows[-1])["nro_senasa"] == "T00024"
+    assert json.loads(rows[0])["fecha_extraccion"] == "2025-01-10"
+    empty = ExportRequestDTO(format="ndjson", filters=RecordFilter(productor="X"))
+    assert list(uc.stream(empty)) == []
+
+
+def test_export_reads_arrow_batches_not_records(tmp_path):
+    class BatchOnlyRepo:
+        def __init__(self, repo):
+            self.repo = repo
+
+        def list(self, *args, **kwargs):
+            raise AssertionError("export must not build records")
+
+        def list_batch(self, *args, **kwargs):
+            return self.repo.list_batch(*args, **kwargs)
+
+    uc = ExportSenasaDataUseCase(
+        repo=BatchOnlyRepo(_repo(12)),
+        storage=ExcelExportAdapter(),
+        streamer=StreamingExportAdapter(chunk_rows=5),
+        page_size=5,
+    )
+    rows = b"".join(uc.stream(ExportRequestDTO(format="ndjson"))).splitlines()
+    assert [json.loads(row)["nro_senasa"] for row in rows] == [f"T{i:05d}" for i in range(12)]
+    out = uc.execute(ExportRequestDTO(format="xlsx"), path=str(tmp_path / "out.xlsx"))
+    assert load_workbook(out, read_only=True)["tambores"].max_row == 13
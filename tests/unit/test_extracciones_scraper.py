@@ -0,0 +1,232 @@
+import asyncio
+from datetime import date
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+from structlog.testing import capture_logs
+
+from senasa_pipeline.infrastructure.adapters.senasa.extracciones_scraper import (
+    EXTRACCIONES_LIST_URL,
+    SenasaExtraccionesScraper,
+    SenasaFilterUnavailableError,
+    SenasaGridLayoutError,
+    SenasaSessionExpiredError,
+    parse_grid_page,
+)
+from tests.unit._senasa_pages import (
+    GRID_TARGET,
+    SCRIPT_MANAGER,
+    UPDATE_PANEL,
+    async_grid_page,
+    delta_segment,
+    grid_delta,
+    grid_page,
+    linked_pages,
+)
+
+
+def test_parse_grid_page_extracts_rows_state_and_pager():
+    page = parse_grid_page(grid_page(1, total_pages=5))
+    assert len(page.records) == 3
+    t = page.records[0].tambor
+    assert str(t.nro_senasa) == "T0010"
+    assert t.peso == 1234.5
+    assert page.hidden["__VIEWSTATE"] == "VS1"
+    assert page.pager_target == GRID_TARGET
+    assert page.page_numbers == {2, 3, 4}
+
+
+async def _collect(scraper):
+    return [page async for page in scraper.iter_pages()]
+
+
+def test_scraper_fetches_all_pages_concurrently_in_order():
+    total = 11
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        if request.method == "GET":
+            return httpx.Response(200, text=grid_page(1, total, viewstate="VS1"))
+        form = parse_qs(request.content.decode())
+        assert form["__EVENTTARGET"] == [GRID_TARGET]
+        assert "__ASYNCPOST" not in form  # sin ScriptManager: postbacks completos
+        n = int(form["__EVENTARGUMENT"][0].split("$")[1])
+        # Como WebForms: sólo se aceptan páginas que el pager del estado posteado mostraba
+        posted_from = int(form["__VIEWSTATE"][0].removeprefix("VS"))
+        if n not in linked_pages(posted_from, total):
+            return httpx.Response(500, text="Invalid postback or callback argument")
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, text=grid_page(n, total, viewstate=f"VS{n}"))
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            scraper = SenasaExtraccionesScraper(client, concurrency=3, requests_per_second=0)
+            return await _collect(scraper)
+
+    pages = asyncio.run(run())
+    assert [str(p[0].tambor.nro_senasa) for p in pages] == [f"T{n:03d}0" for n in range(1, 12)]
+    assert 1 < max_in_flight <= 3
+
+
+def test_scraper_pages_through_update_panel_async_posts():
+    total = 5
+    posts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, text=async_grid_page(total, viewstate="VS1"))
+        form = parse_qs(request.content.decode(), keep_blank_values=True)
+        n = int(form["__EVENTARGUMENT"][0].split("$")[1])
+        posts.append((n, form["__VIEWSTATE"][0]))
+        assert request.headers["X-MicrosoftAjax"] == "Delta=true"
+        assert form[SCRIPT_MANAGER] == [f"{UPDATE_PANEL}|{GRID_TARGET}"]
+        # El delta no reenvía EVENTVALIDATION: viene del estado de la página que enlazó
+        assert form["__EVENTVALIDATION"] == ["EV"]
+        if n not in linked_pages(int(form["__VIEWSTATE"][0].removeprefix("VS")), total):
+            return httpx.Response(500, text="Invalid postback or callback argument")
+        return httpx.Response(200, text=grid_delta(n, total, viewstate=f"VS{n}"))
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            scraper = SenasaExtraccionesScraper(client, concurrency=2, requests_per_second=0)
+            return await _collect(scraper)
+
+    pages = asyncio.run(run())
+    assert [str(p[0].tambor.nro_senasa) for p in pages] == [f"T{n:03d}0" for n in range(1, 6)]
+    assert sorted(posts) == [(2, "VS1"), (3, "VS1"), (4, "VS1"), (5, "VS4")]
+
+
+def test_scraper_raises_when_an_async_post_redirects_to_login():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, text=async_grid_page(3))
+        return httpx.Response(
+            200, text="1|#||4|" + delta_segment("pageRedirect", "", "/Login.aspx")
+        )
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await _collect(SenasaExtraccionesScraper(client, requests_per_second=0))
+
+    with pytest.raises(SenasaSessionExpiredError):
+        asyncio.run(run())
+
+
+def test_parse_grid_page_rejects_a_grid_without_the_expected_columns():
+    html = grid_page(1, total_pages=2).replace("Peso (kg)", "Kilos")
+    with pytest.raises(SenasaGridLayoutError, match="peso"):
+        parse_grid_page(html)
+    # Sin pager, una tabla ajena con encabezados no es la grilla
+    assert parse_grid_page(grid_page(1, total_pages=1).replace("Peso (kg)", "Kilos")).records == []
+
+
+def test_scraper_logs_and_counts_rows_it_cannot_parse():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, text=grid_page(1, 2))
+        # Página 2: una fila con fecha ilegible y otra con código demasiado corto
+        html = grid_page(2, 2).replace("10/01/2025", "sin fecha", 1).replace("T0021", "T", 1)
+        return httpx.Response(200, text=html)
+
+    skipped: list[int] = []
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            scraper = SenasaExtraccionesScraper(
+                client, requests_per_second=0, on_skipped=skipped.append
+            )
+            return await _collect(scraper)
+
+    with capture_logs() as logs:
+        pages = asyncio.run(run())
+
+    assert [len(p) for p in pages] == [3, 1]
+    assert skipped == [2]
+    warnings = [e for e in logs if e["event"] == "grid_row_skipped"]
+    assert [(e["log_level"], e["page"]) for e in warnings] == [("warning", 2)] * 2
+    assert warnings[0]["cells"][:3] == ["T0020", "EST001", "sin fecha"]
+
+
+def test_scraper_raises_when_redirected_to_login():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(302, headers={"Location": "/Login.aspx?ReturnUrl=x"})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await _collect(SenasaExtraccionesScraper(client, list_url=EXTRACCIONES_LIST_URL))
+
+    with pytest.raises(SenasaSessionExpiredError):
+        asyncio.run(run())
+
+
+def test_scraper_stops_paging_when_rows_are_older_than_since():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.method)
+        return httpx.Response(200, text=grid_page(1, total_pages=5))
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            scraper = SenasaExtraccionesScraper(client, requests_per_second=0)
+            return [p async for p in scraper.iter_pages(since=date(2025, 2, 1))]
+
+    pages = asyncio.run(run())
+    assert len(pages) == 1
+    assert requests == ["GET"]
+
+
+FILTER_FIELD = "ctl00$MasterEditBox$txtEstablecimiento"
+SEARCH_BUTTON = "ctl00$MasterEditBox$btnBuscar"
+
+
+def _search_page(page: int, total_pages: int) -> str:
+    search = (
+        f'<input type="text" name="{FILTER_FIELD}" id="{FILTER_FIELD.replace("$", "_")}"/>'
+        f'<input type="submit" name="{SEARCH_BUTTON}" value="Buscar"/>'
+    )
+    return grid_page(page, total_pages).replace("<form>", f"<form>{search}")
+
+
+def test_scraper_filters_by_establecimiento_and_replays_the_filter():
+    posts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, text=_search_page(1, 2))
+        form = parse_qs(request.content.decode())
+        posts.append(form)
+        assert form[FILTER_FIELD] == ["EST001"]
+        if SEARCH_BUTTON in form:
+            return httpx.Response(200, text=_search_page(1, 2))
+        return httpx.Response(200, text=_search_page(2, 2))
+
+    async def run(codigo):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            scraper = SenasaExtraccionesScraper(client, requests_per_second=0)
+            return [p async for p in scraper.iter_pages(establecimiento=codigo)]
+
+    pages = asyncio.run(run("EST001"))
+    assert [len(p) for p in pages] == [3, 3]
+    assert posts[0][SEARCH_BUTTON] == ["Buscar"]
+    assert SEARCH_BUTTON not in posts[1]
+    assert posts[1]["__EVENTARGUMENT"] == ["Page$2"]
+
+
+def test_scraper_without_establecimiento_filter_raises():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=grid_page(1, 2))
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            scraper = SenasaExtraccionesScraper(client, requests_per_second=0)
+            return [p async for p in scraper.iter_pages(establecimiento="EST001")]
+
+    with pytest.raises(SenasaFilterUnavailableError):
+        asyncio.run(run())
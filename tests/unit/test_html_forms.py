@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pytest
+
+from senasa_pipeline.infrastructure.adapters.afip.unified_provider import (
+    AFIP_LOGIN_URL,
+    UnifiedAfipProvider,
+)
+from senasa_pipeline.infrastructure.adapters.html.forms import extract_forms
+from senasa_pipeline.infrastructure.adapters.senasa.login_consumer import SenasaLoginConsumer
+from tests.unit._auth_pages import (
+    USER_BUTTON_ID,
+    afip_login_page,
+    afip_token_page,
+    senasa_login_page,
+)
+
+
+def test_extract_forms_reads_forms_and_inputs() -> None:
+    page = extract_forms(afip_login_page("VS1", padding=3))
+
+    form = page.form(id="F1")
+    assert form is not None
+    assert form.action == "/contribuyente_/loginClave.xhtml"
+    assert form.fields["javax.faces.ViewState"] == "VS1"
+    assert page.inputs["F1:username"] == ""
+    assert page.hidden == {"javax.faces.ViewState": "VS1"}
+    assert page.form(name="myform") is None
+
+
+@pytest.mark.parametrize("text", ["", "   ", '{"token": "x"}'])
+def test_extract_forms_tolerates_non_html(text: str) -> None:
+    page = extract_forms(text)
+    assert page.forms == []
+    assert page.form() is None
+
+
+def test_afip_parsers_extract_view_state_and_token_sign() -> None:
+    view_state, action = UnifiedAfipProvider._parse_f1_form(
+        afip_login_page("VS2"), AFIP_LOGIN_URL, "error"
+    )
+    assert view_state == "VS2"
+    assert action == "https://auth.afip.gob.ar/contribuyente_/loginClave.xhtml"
+
+    assert UnifiedAfipProvider._parse_token_sign_form(afip_token_page("T", "S")) == (
+        "https://trazabilidadapicola.senasa.gob.ar/afip",
+        "T",
+        "S",
+    )
+    assert UnifiedAfipProvider._parse_token_sign_form("<html></html>") == ("", "", "")
+    with pytest.raises(RuntimeError, match="error"):
+        UnifiedAfipProvider._parse_f1_form("<html></html>", AFIP_LOGIN_URL, "error")
+
+
+def test_senasa_user_selection_payload_targets_coop_button() -> None:
+    consumer = SenasaLoginConsumer(http=None)  # type: ignore[arg-type]
+    page = extract_forms(senasa_login_page(viewstate_size=10))
+
+    payload = consumer._user_selection_payload(page)
+
+    assert payload["__EVENTTARGET"] == USER_BUTTON_ID.replace("_", "$")
+    assert payload["__VIEWSTATE"] == "A" * 10
+    assert payload["__EVENTVALIDATION"] == "EV"
+    assert consumer._intermediate_token_sign_form(page) is None
+    assert consumer._intermediate_token_sign_form(extract_forms(afip_token_page())) == (
+        "https://trazabilidadapicola.senasa.gob.ar/afip",
+        {"token": "TOKEN", "sign": "SIGN"},
+    )
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from senasa_pipeline.infrastructure.adapters.http.client_pool import HttpClientRegistry
+
+
+def _pooled_transport() -> httpx.MockTransport:
+    """Simulates a keep-alive pool: only the first request per host opens a connection."""
+    open_hosts: set[str] = set()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host not in open_hosts:
+            open_hosts.add(request.url.host)
+            await request.extensions["trace"]("connection.connect_tcp.complete", {})
+        return httpx.Response(
+            200, headers={"Set-Cookie": f"{request.url.host.split('.')[0]}={request.url.path}"}
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_clients_share_pool_but_not_cookies() -> None:
+    registry = HttpClientRegistry(transport=_pooled_transport())
+
+    async def run() -> tuple[dict[str, str], dict[str, str]]:
+        first, second = registry.client(), registry.client()
+        await first.get("https://auth.afip.gob.ar/a")
+        await first.aclose()  # must not close the shared pool
+        await second.get("https://auth.afip.gob.ar/b")
+        await second.get("https://trazabilidadapicola.senasa.gob.ar/c")
+        await second.get("https://trazabilidadapicola.senasa.gob.ar/d")
+        return first.dump_cookies(), second.dump_cookies()
+
+    first_cookies, second_cookies = asyncio.run(run())
+
+    assert first_cookies == {"auth": "/a"}
+    assert second_cookies == {"auth": "/b", "trazabilidadapicola": "/d"}
+    hosts = registry.stats()["hosts"]
+    assert hosts["auth.afip.gob.ar"] == {
+        "requests": 2,
+        "connections_opened": 1,
+        "http2_responses": 0,
+        "reuse_rate": 0.5,
+    }
+    assert hosts["trazabilidadapicola.senasa.gob.ar"]["reuse_rate"] == 0.5
+
+
+def test_stats_report_pool_limits() -> None:
+    registry = HttpClientRegistry(
+        max_connections=8, max_keepalive_connections=4, keepalive_expiry=15.0
+    )
+    try:
+        stats = registry.stats()
+        assert stats["max_connections"] == 8
+        assert stats["max_keepalive_connections"] == 4
+        assert stats["keepalive_expiry"] == 15.0
+        assert stats["hosts"] == {}
+    finally:
+        asyncio.run(registry.aclose())
@@ -0,0 +1,190 @@
+import threading
+from dataclasses import replace
+from datetime import date, timedelta
+
+import pytest
+
+from senasa_pipeline.application.dtos.sync_request_dto import SyncRequestDTO
+from senasa_pipeline.application.ports.sync_state_port import SyncCheckpoint
+from senasa_pipeline.application.use_cases.sync_senasa_data import SyncSenasaDataUseCase
+from senasa_pipeline.config import settings
+from senasa_pipeline.infrastructure.adapters.sync_state.memory_store import (
+    InMemorySyncStateStore,
+)
+from senasa_pipeline.infrastructure.adapters.sync_state.sql_store import SQLSyncStateStore
+from senasa_pipeline.infrastructure.adapters.sync_state.sqlite_store import SQLiteSyncStateStore
+from senasa_pipeline.infrastructure.repositories.duckdb_repository import DuckDBSenasaRepository
+from senasa_pipeline.infrastructure.repositories.factory import build_sync_state
+from senasa_pipeline.infrastructure.repositories.postgresql_repository import build_engine
+from senasa_pipeline.infrastructure.repositories.sql_tables import metadata
+from tests.unit._factories import make_record
+
+
+class ListScraper:
+    def __init__(self, records):
+        self.records = records
+        self.since = None
+
+    def fetch_latest(self, incremental: bool = False, since=None):
+        self.since = since
+        return list(self.records)
+
+
+class AlwaysValid:
+    def validate(self, record):
+        return True
+
+
+def _records():
+    return [
+        make_record("A0001", est="EST001", fecha=date(2025, 1, 1)),
+        make_record("A0002", est="EST001", fecha=date(2025, 1, 5)),
+        make_record("B0001", est="EST002", fecha=date(2025, 1, 3)),
+    ]
+
+
+def test_full_sync_records_high_water_marks():
+    state = InMemorySyncStateStore()
+    uc = SyncSenasaDataUseCase(
+        ListScraper(_records()), AlwaysValid(), DuckDBSenasaRepository(), state=state
+    )
+    assert uc.execute(SyncRequestDTO(incremental=False)) == 3
+    assert state.load() == {
+        "EST001": SyncCheckpoint(date(2025, 1, 5)),
+        "EST002": SyncCheckpoint(date(2025, 1, 3)),
+    }
+
+
+def test_incremental_sync_refetches_from_the_mark_date():
+    state = InMemorySyncStateStore()
+    state.save(
+        {"EST001": SyncCheckpoint(date(2025, 1, 5)), "EST002": SyncCheckpoint(date(2025, 1, 3))}
+    )
+    new = make_record("A0003", est="EST001", fecha=date(2025, 1, 6))
+    scraper = ListScraper([*_records(), new])
+    repo = DuckDBSenasaRepository()
+    uc = SyncSenasaDataUseCase(scraper, AlwaysValid(), repo, state=state)
+    # A0001 es anterior a la marca; A0002 y B0001 caen en la fecha de la marca (upsert)
+    assert uc.execute(SyncRequestDTO(incremental=True)) == 3
+    assert scraper.since == date(2025, 1, 3)
+    assert state.load()["EST001"] == SyncCheckpoint(date(2025, 1, 6))
+
+
+class CrashingScraper:
+    """Newest-first listing whose first scrape fails after ``fail_after`` rows."""
+
+    def __init__(self, records, fail_after):
+        self.records = sorted(records, key=lambda r: r.tambor.fecha_extraccion, reverse=True)
+        self.fail_after = fail_after
+        self.since = []
+
+    def fetch_latest(self, incremental: bool = False, since=None):
+        self.since.append(since)
+        rows = [r for r in self.records if since is None or r.tambor.fecha_extraccion >= since]
+        for i, rec in enumerate(rows):
+            if i == self.fail_after:
+                self.fail_after = None
+                raise ConnectionError("connection reset")
+            yield rec
+
+
+def test_crashed_incremental_run_is_fetched_again_on_resume():
+    state = InMemorySyncStateStore()
+    state.save({"EST001": SyncCheckpoint(date(2025, 1, 1))})
+    records = [
+        make_record(f"A{n:04d}", fecha=date(2025, 1, 1) + timedelta(days=n)) for n in range(1, 11)
+    ]
+    scraper = CrashingScraper(records, fail_after=3)
+    repo = DuckDBSenasaRepository()
+    uc = SyncSenasaDataUseCase(scraper, AlwaysValid(), repo, state=state, batch_size=2)
+
+    with pytest.raises(ConnectionError):
+        uc.execute(SyncRequestDTO(incremental=True))
+    assert len(repo.list(limit=100)) == 2
+    # Sólo se movió el cursor: la marca sigue donde la dejó el último sync completo
+    assert state.load()["EST001"] == SyncCheckpoint(date(2025, 1, 1), cursor=date(2025, 1, 11))
+
+    assert uc.execute(SyncRequestDTO(incremental=True)) == 10
+    assert scraper.since == [date(2025, 1, 1), date(2025, 1, 1)]
+    assert len(repo.list(limit=100)) == 10
+    assert state.load()["EST001"] == SyncCheckpoint(date(2025, 1, 11))
+
+
+def test_tambor_added_later_on_the_mark_date_is_picked_up():
+    state = InMemorySyncStateStore()
+    repo = DuckDBSenasaRepository()
+    first = [make_record("A0005", fecha=date(2025, 1, 5))]
+    SyncSenasaDataUseCase(ListScraper(first), AlwaysValid(), repo, state=state).execute(
+        SyncRequestDTO()
+    )
+    late = make_record("A0001", fecha=date(2025, 1, 5))
+    uc = SyncSenasaDataUseCase(ListScraper([*first, late]), AlwaysValid(), repo, state=state)
+    uc.execute(SyncRequestDTO(incremental=True))
+    assert [str(r.tambor.nro_senasa) for r in repo.list(limit=10)] == ["A0001", "A0005"]
+
+
+class PartitionScraper:
+    """Serves each establecimiento separately; both partitions must run at once."""
+
+    def __init__(self, records):
+        self.records = records
+        self.since = {}
+        self._barrier = threading.Barrier(2, timeout=5)
+
+    def fetch_latest(self, incremental: bool = False, since=None, establecimiento=None):
+        self.since[establecimiento] = since
+        self._barrier.wait()
+        return [r for r in self.records if str(r.tambor.establecimiento_codigo) == establecimiento]
+
+
+def test_partitioned_sync_runs_establecimientos_in_parallel_with_own_checkpoints():
+    state = InMemorySyncStateStore()
+    state.save({"EST001": SyncCheckpoint(date(2025, 1, 5))})
+    new = make_record("A0003", est="EST001", fecha=date(2025, 1, 6))
+    scraper = PartitionScraper([*_records(), new])
+    progress = []
+    uc = SyncSenasaDataUseCase(
+        scraper,
+        AlwaysValid(),
+        DuckDBSenasaRepository(),
+        state=state,
+        partition_workers=2,
+        on_progress=lambda p: progress.append(p.records_saved),
+    )
+    req = SyncRequestDTO(incremental=True, establecimientos=("EST001", "EST002"))
+    assert uc.execute(req) == 3
+    # EST002 no tenía checkpoint: se sincroniza completo
+    assert scraper.since == {"EST001": date(2025, 1, 5), "EST002": None}
+    assert uc.progress.records_fetched == 4
+    assert uc.progress.records_saved == 3
+    assert progress[-1] == 3
+    assert state.load() == {
+        "EST001": SyncCheckpoint(date(2025, 1, 6)),
+        "EST002": SyncCheckpoint(date(2025, 1, 3)),
+    }
+
+
+def test_sqlite_sync_state_survives_restart(tmp_path):
+    path = str(tmp_path / "state.sqlite")
+    checkpoints = {
+        "EST001": SyncCheckpoint(date(2025, 1, 5), cursor=date(2025, 1, 7)),
+        "EST002": SyncCheckpoint(cursor=date(2025, 1, 2)),
+    }
+    SQLiteSyncStateStore(path).save(checkpoints)
+    assert SQLiteSyncStateStore(path).load() == checkpoints
+
+
+def test_sync_state_on_database_url_is_shared_between_processes(tmp_path):
+    # Se usa el dialecto SQLite como stand-in local de PostgreSQL
+    url = f"sqlite:///{tmp_path / 'senasa.sqlite'}"
+    metadata.create_all(build_engine(url))
+    api = build_sync_state(replace(settings, database_url=url))
+    worker = SQLSyncStateStore(build_engine(url))
+    assert isinstance(api, SQLSyncStateStore)
+
+    worker.save({"EST001": SyncCheckpoint(cursor=date(2025, 1, 2))})
+    worker.save({"EST001": SyncCheckpoint(date(2025, 1, 5)), "EST002": SyncCheckpoint()})
+    assert api.load() == {
+        "EST001": SyncCheckpoint(date(2025, 1, 5)),
+        "EST002": SyncCheckpoint(),
+    }
@@ -0,0 +1,138 @@
+import threading
+from dataclasses import replace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from senasa_pipeline.application.dtos.sync_request_dto import SyncRequestDTO
+from senasa_pipeline.application.ports.job_queue_port import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_SUCCEEDED,
+    JobCancelledError,
+)
+from senasa_pipeline.application.use_cases.sync_senasa_data import SyncSenasaDataUseCase
+from senasa_pipeline.config import settings
+from senasa_pipeline.infrastructure.adapters.jobs.celery_queue import CeleryJobQueue
+from senasa_pipeline.infrastructure.adapters.jobs.local_queue import LocalJobQueue
+from senasa_pipeline.infrastructure.repositories.duckdb_repository import DuckDBSenasaRepository
+from senasa_pipeline.presentation.api.routes import jobs
+from tests.unit._factories import make_record
+
+
+class PagedScraper:
+    pages_fetched = 0
+
+    def fetch_latest(self, incremental: bool = False, since=None):
+        for page in range(5):
+            self.pages_fetched = page + 1
+            yield from (make_record(f"T{page}{i:03d}") for i in range(10))
+
+
+class AlwaysValid:
+    def validate(self, record):
+        return True
+
+
+def _wait(queue, job_id):
+    for _ in range(200):
+        job = queue.get(job_id)
+        if job.finished:
+            return job
+        threading.Event().wait(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_local_queue_runs_handlers_and_records_outcome():
+    queue = LocalJobQueue(max_workers=2)
+    queue.register("ok", lambda params, ctx: {"double": params["n"] * 2})
+    queue.register("boom", lambda params, ctx: 1 / 0)
+
+    ok = _wait(queue, queue.submit("ok", {"n": 21}).id)
+    failed = _wait(queue, queue.submit("boom").id)
+
+    assert ok.status == JOB_SUCCEEDED and ok.result == {"double": 42}
+    assert failed.status == JOB_FAILED and failed.error.startswith("ZeroDivisionError")
+    assert queue.get("nope") is None
+    assert not queue.cancel(ok.id)
+    queue.shutdown()
+
+
+def test_cancelled_sync_job_stops_between_batches_with_progress():
+    repo = DuckDBSenasaRepository()
+    queue = LocalJobQueue()
+    started = threading.Event()
+    release = threading.Event()
+
+    def run_sync(params, ctx):
+        def report(progress):
+            ctx.report(**progress.as_dict())
+            started.set()
+            release.wait(5)
+
+        uc = SyncSenasaDataUseCase(
+            PagedScraper(), AlwaysValid(), repo, batch_size=10, on_progress=report
+        )
+        return {"processed": uc.execute(SyncRequestDTO(incremental=False))}
+
+    queue.register("sync", run_sync)
+    job = queue.submit("sync")
+    assert started.wait(5)
+    assert queue.cancel(job.id)
+    release.set()
+
+    done = _wait(queue, job.id)
+    assert done.status == JOB_CANCELLED and done.cancel_requested
+    # El lote en curso al cancelar se guarda; los siguientes no se leen
+    assert done.progress["records_saved"] == done.progress["records_validated"] == 20
+    assert done.progress["pages_fetched"] >= 2
+    assert len(repo.list(limit=100)) == 20
+    queue.shutdown()
+
+
+def test_celery_queue_reports_progress_and_result():
+    queue = CeleryJobQueue("memory://", backend_url="cache+memory://")
+    queue.app.conf.update(task_always_eager=True, task_store_eager_result=True)
+
+    def handler(params, ctx):
+        ctx.report(rows=params["rows"])
+        return {"ok": True}
+
+    def cancelled(params, ctx):
+        raise JobCancelledError(ctx.job_id)
+
+    queue.register("export", handler)
+    queue.register("cancelled", cancelled)
+
+    job = queue.submit("export", {"rows": 3})
+    assert job.status == JOB_SUCCEEDED and job.kind == "export"
+    assert job.progress == {"rows": 3} and job.result == {"ok": True}
+    assert queue.submit("cancelled").status == JOB_CANCELLED
+
+
+def test_celery_mode_requires_a_shared_database():
+    config = replace(settings, celery_broker_url="memory://", database_url="")
+    with pytest.raises(RuntimeError, match="DATABASE_URL"):
+        jobs._build_job_queue(config)
+    config = replace(config, database_url="sqlite:///senasa.sqlite")
+    assert isinstance(jobs._build_job_queue(config), CeleryJobQueue)
+
+
+def test_download_resolves_the_file_in_this_hosts_export_dir(tmp_path, monkeypatch):
+    queue = LocalJobQueue()
+    queue.register("export", lambda params, ctx: {"file": params["file"], "filename": "x.csv"})
+    monkeypatch.setattr(jobs, "job_queue", queue)
+    monkeypatch.setattr(jobs, "settings", replace(settings, export_dir=str(tmp_path)))
+    app = FastAPI()
+    app.include_router(jobs.router)
+    client = TestClient(app)
+    (tmp_path / "a.csv").write_text("nro\n1\n")
+
+    present = _wait(queue, queue.submit("export", {"file": "a.csv"}).id)
+    missing = _wait(queue, queue.submit("export", {"file": "b.csv"}).id)
+
+    resp = client.get(f"/v1/jobs/{present.id}/download")
+    assert resp.status_code == 200 and resp.text == "nro\n1\n"
+    assert client.get(f"/v1/jobs/{missing.id}/download").status_code == 404
+    queue.shutdown(wait=False)
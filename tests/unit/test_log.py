@@ -0,0 +1,74 @@
+import httpx
+import pytest
+import structlog
+from structlog.testing import capture_logs
+
+from senasa_pipeline.application.streaming import prefetch
+from senasa_pipeline.config import settings
+from senasa_pipeline.infrastructure.adapters.senasa.login_consumer import SenasaLoginConsumer
+from senasa_pipeline.log import configure_logging, correlation_scope, mask_secrets
+
+
+@pytest.fixture
+def log_level():
+    yield configure_logging
+    configure_logging(settings.log_level, json=settings.log_format == "json")
+
+
+def test_mask_secrets_keeps_only_length():
+    event = mask_secrets(
+        None,
+        "info",
+        {"event": "login", "token": "abc123", "sign": "xy", "cookies_sent": "a=1", "step": "s"},
+    )
+    assert event["token"] == "<masked len=6>"
+    assert event["sign"] == "<masked len=2>"
+    assert event["cookies_sent"] == "<masked len=3>"
+    assert event["step"] == "s"
+
+
+def test_mask_secrets_matches_whole_key_words_and_keeps_measures():
+    event = mask_secrets(
+        None,
+        "info",
+        {
+            "access_token": "abc",
+            "cookie_count": 3,
+            "token_length": 40,
+            "signature_ok": True,
+            "designer": "x",
+        },
+    )
+    assert event["access_token"] == "<masked len=3>"
+    assert event["cookie_count"] == 3
+    assert event["token_length"] == 40
+    assert event["signature_ok"] is True
+    assert event["designer"] == "x"
+
+
+def test_correlation_id_is_shared_by_nested_scopes_and_prefetch_thread():
+    def source():
+        yield structlog.contextvars.get_contextvars().get("correlation_id")
+
+    with correlation_scope("sync_job", correlation_id="job-1"):
+        with correlation_scope("sync") as cid:
+            assert cid == "job-1"
+            assert list(prefetch(source(), max_pending=1)) == ["job-1"]
+    assert "correlation_id" not in structlog.contextvars.get_contextvars()
+
+
+def test_response_diagnostics_only_at_debug(log_level):
+    request = httpx.Request("GET", "https://senasa.example/", headers={"Cookie": "a=1"})
+    resp = httpx.Response(200, text="<form></form>", request=request)
+    consumer = SenasaLoginConsumer(http=None)  # type: ignore[arg-type]
+
+    log_level("INFO")
+    with capture_logs() as logs:
+        consumer._log_response_details(resp, "step")
+    assert [e["event"] for e in logs] == ["senasa_step"]
+
+    log_level("DEBUG")
+    with capture_logs() as logs:
+        consumer._log_response_details(resp, "step")
+    details = next(e for e in logs if e["event"] == "senasa_step_details")
+    assert details["forms"] == 1
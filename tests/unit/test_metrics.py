@@ -0,0 +1,65 @@
+from datetime import date
+
+import httpx
+
+from senasa_pipeline.application.dtos.export_request_dto import ExportRequestDTO
+from senasa_pipeline.application.use_cases.export_senasa_data import ExportSenasaDataUseCase
+from senasa_pipeline.infrastructure import metrics
+from senasa_pipeline.infrastructure.adapters.storage_adapter import StreamingExportAdapter
+from senasa_pipeline.infrastructure.adapters.validation_adapter import PolarsRecordValidator
+from senasa_pipeline.infrastructure.repositories.duckdb_repository import DuckDBSenasaRepository
+from tests.unit._factories import make_record
+
+
+def _sample(name, **labels):
+    return metrics.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_observe_http_labels_hop_by_first_host_and_step():
+    # Con stream (como un transporte real) httpx mide ``elapsed`` al leer el body
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "auth.afip.gob.ar":
+            return httpx.Response(
+                302,
+                headers={"Location": "https://senasa.example/ok"},
+                stream=httpx.ByteStream(b""),
+            )
+        return httpx.Response(200, stream=httpx.ByteStream(b"ok"))
+
+    labels = {"host": "auth.afip.gob.ar", "step": "test-hop", "status": "200"}
+    before = _sample("senasa_http_request_duration_seconds_count", **labels)
+    with httpx.Client(transport=httpx.MockTransport(handler), follow_redirects=True) as client:
+        metrics.observe_http(client.get("https://auth.afip.gob.ar/login"), "test-hop")
+    assert _sample("senasa_http_request_duration_seconds_count", **labels) == before + 1
+
+
+def test_sync_metrics_counts_progress_increments():
+    before = _sample("senasa_sync_records_total", stage="saved")
+    skipped = _sample("senasa_sync_records_total", stage="skipped")
+    sync_metrics = metrics.SyncMetrics()
+    sync_metrics.update({"records_fetched": 10, "records_saved": 8})
+    sync_metrics.update({"records_fetched": 25, "records_saved": 20, "records_skipped": 2})
+    sync_metrics.finish("succeeded")
+    assert _sample("senasa_sync_records_total", stage="saved") == before + 20
+    assert _sample("senasa_sync_records_total", stage="skipped") == skipped + 2
+    assert _sample("senasa_sync_records_per_second") > 0
+
+
+def test_hot_paths_record_rejects_writes_and_export_bytes():
+    rejects = _sample("senasa_validation_rejects_total", reason="peso_fuera_de_rango")
+    writes = _sample("senasa_repository_rows_written_total", backend="duckdb", table="tambores")
+    exported = _sample("senasa_export_bytes_total", format="ndjson")
+
+    validator = PolarsRecordValidator(today=date(2025, 12, 31))
+    validator.validate_batch([make_record("A0001", peso=999.0), make_record("A0002")])
+    repo = DuckDBSenasaRepository()
+    repo.save_many([make_record("A0001"), make_record("A0002")])
+    export = ExportSenasaDataUseCase(repo, streamer=StreamingExportAdapter())
+    body = b"".join(export.stream(ExportRequestDTO(format="ndjson")))
+
+    assert _sample("senasa_validation_rejects_total", reason="peso_fuera_de_rango") == rejects + 1
+    assert (
+        _sample("senasa_repository_rows_written_total", backend="duckdb", table="tambores")
+        == writes + 2
+    )
+    assert _sample("senasa_export_bytes_total", format="ndjson") == exported + len(body)
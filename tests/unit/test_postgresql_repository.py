@@ -0,0 +1,85 @@
+# Se usa el dialecto SQLite como stand-in local de PostgreSQL
+from dataclasses import replace
+from datetime import date
+
+from senasa_pipeline.config import settings
+from senasa_pipeline.domain.repositories.interfaces import RecordFilter
+from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
+from senasa_pipeline.infrastructure.repositories.duckdb_repository import DuckDBSenasaRepository
+from senasa_pipeline.infrastructure.repositories.factory import build_repositories
+from senasa_pipeline.infrastructure.repositories.postgresql_repository import (
+    PostgreSQLEstablecimientoRepository,
+    PostgreSQLSenasaRepository,
+    build_engine,
+)
+from senasa_pipeline.infrastructure.repositories.sql_tables import metadata
+from tests.unit._factories import make_establecimiento, make_record
+
+
+def _engine(tmp_path):
+    engine = build_engine(f"sqlite:///{tmp_path / 'senasa.sqlite'}")
+    metadata.create_all(engine)
+    return engine
+
+
+def test_save_many_upserts_in_batches(tmp_path):
+    repo = PostgreSQLSenasaRepository(_engine(tmp_path), batch_size=7)
+    records = [make_record(f"T{i:04d}") for i in range(20)]
+    assert repo.save_many(records) == 20
+    repo.save_many([make_record("T0003", peso=111.0)])
+    assert len(repo.list(limit=100)) == 20
+    got = repo.get_by_nro(CodigoSenasa("T0003"))
+    assert got is not None
+    assert got.tambor.peso == 111.0
+    assert got.establecimiento == make_establecimiento()
+
+
+def test_list_keyset_pagination(tmp_path):
+    repo = PostgreSQLSenasaRepository(_engine(tmp_path))
+    repo.save_many([make_record(f"T{i:04d}") for i in range(10)])
+    first = repo.list(limit=4)
+    second = repo.list(limit=4, after=first[-1].tambor.nro_senasa)
+    assert [str(r.tambor.nro_senasa) for r in second] == ["T0004", "T0005", "T0006", "T0007"]
+
+
+def test_establecimiento_repository_upsert(tmp_path):
+    repo = PostgreSQLEstablecimientoRepository(_engine(tmp_path))
+    repo.upsert(make_establecimiento("EST009"))
+    assert repo.get(CodigoSenasa("EST009")) == make_establecimiento("EST009")
+    assert repo.get(CodigoSenasa("NOPE")) is None
+
+
+def test_establecimiento_repository_bulk(tmp_path):
+    repo = PostgreSQLEstablecimientoRepository(_engine(tmp_path), batch_size=2)
+    ests = [make_establecimiento(f"EST{i:03d}") for i in range(5)]
+    assert repo.upsert_many(ests + [ests[0]]) == 5
+    found = repo.get_many(["EST000", "EST004", "NOPE"])
+    assert found == {"EST000": ests[0], "EST004": ests[4]}
+
+
+def test_list_and_count_push_filters_down(tmp_path):
+    repo = PostgreSQLSenasaRepository(_engine(tmp_path))
+    repo.save_many([make_record(f"T{i:03d}", fecha=date(2025, 2, 1 + i)) for i in range(6)])
+    filters = RecordFilter(tipo_miel="flores", fecha_hasta=date(2025, 2, 4))
+    page = repo.list(limit=2, after=CodigoSenasa("T000"), filters=filters)
+    assert [str(r.tambor.nro_senasa) for r in page] == ["T001", "T002"]
+    assert repo.count(filters) == 4
+    assert repo.count(RecordFilter(establecimiento="OTRO")) == 0
+    batch = repo.list_batch(limit=2, after=CodigoSenasa("T000"), filters=filters)
+    assert [v.tambor for v in batch] == [r.tambor for r in page]
+    assert len(repo.list_batch(filters=RecordFilter(establecimiento="OTRO"))) == 0
+
+
+def test_factory_selects_sql_repositories_from_database_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'senasa.sqlite'}"
+    metadata.create_all(build_engine(url))
+    repos = build_repositories(replace(settings, database_url=url, db_batch_size=3))
+    assert isinstance(repos.records, PostgreSQLSenasaRepository)
+    assert repos.records.save_many([make_record(f"T{i:04d}") for i in range(5)]) == 5
+    assert repos.establecimientos.get(CodigoSenasa("EST001")) == make_establecimiento()
+
+
+def test_factory_defaults_to_duckdb():
+    repos = build_repositories(replace(settings, database_url="", duckdb_path=":memory:"))
+    assert isinstance(repos.records, DuckDBSenasaRepository)
+    assert repos.establecimientos is repos.records.establecimiento_repo
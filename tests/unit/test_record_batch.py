@@ -0,0 +1,120 @@
+from dataclasses import replace
+from datetime import date
+
+import pyarrow as pa
+
+from senasa_pipeline.application.record_batch import RECORD_SCHEMA, SenasaRecordBatch
+from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
+from senasa_pipeline.infrastructure.adapters.storage_adapter import EXPORT_SCHEMA
+from senasa_pipeline.infrastructure.repositories.duckdb_repository import DuckDBSenasaRepository
+from senasa_pipeline.infrastructure.repositories.postgresql_repository import (
+    PostgreSQLSenasaRepository,
+    build_engine,
+)
+from senasa_pipeline.infrastructure.repositories.sql_tables import metadata
+from tests.unit._factories import make_record
+
+
+def _records():
+    records = [make_record(f"T{i:04d}", peso=float(i)) for i in range(6)]
+    records[1] = make_record("T0001", peso=1.0, est="EST002")
+    records[2] = replace(records[2], establecimiento=None)
+    return records
+
+
+def test_batch_round_trips_records_with_dictionary_columns():
+    records = _records()
+    batch = SenasaRecordBatch.from_records(records)
+
+    assert batch.table.schema == RECORD_SCHEMA
+    assert pa.types.is_dictionary(batch.table.schema.field("tipo_miel").type)
+    assert len(batch.table.column("productor").combine_chunks().dictionary) == 1
+    assert batch.to_records() == records
+    view = batch[-1]
+    assert view.nro_senasa == "T0005" and view.peso == 5.0
+    assert view.tambor == records[-1].tambor
+    assert view.establecimiento == records[-1].establecimiento
+    assert batch[2].establecimiento is None
+    assert set(batch.establecimientos) == {"EST001", "EST002"}
+
+
+def test_batch_slices_filters_and_exports_without_rows():
+    batch = SenasaRecordBatch.from_records(_records())
+
+    assert [v.nro_senasa for v in batch[1:3]] == ["T0001", "T0002"]
+    assert [v.nro_senasa for v in batch.filter([i % 2 == 0 for i in range(6)])] == [
+        "T0000",
+        "T0002",
+        "T0004",
+    ]
+    assert batch.to_arrow(dense=True).schema == EXPORT_SCHEMA
+    assert batch[:1].to_pylist()[0]["tipo_miel"] == "flores"
+    both = SenasaRecordBatch.concat([batch[:2], batch[4:]])
+    assert [v.nro_senasa for v in both] == ["T0000", "T0001", "T0004", "T0005"]
+
+
+def test_from_records_takes_views_from_their_batches():
+    first = SenasaRecordBatch.from_records(_records())
+    second = SenasaRecordBatch.from_records([make_record("T0100")])
+    views = [*first[3:], *second]
+
+    rebatched = SenasaRecordBatch.from_records(views)
+
+    assert [v.nro_senasa for v in rebatched] == ["T0003", "T0004", "T0005", "T0100"]
+    assert rebatched.table.schema == RECORD_SCHEMA
+    assert rebatched[0].establecimiento == first[3].establecimiento
+
+
+def test_from_rows_columnarizes_tambor_tuples():
+    rows = [("T0001", "EST001", date(2025, 1, 10), 300.0, "flores", "AR", "Juan")]
+    batch = SenasaRecordBatch.from_rows(rows)
+    assert batch.table.schema.equals(RECORD_SCHEMA)
+    assert batch[0].tambor == make_record("T0001").tambor
+    assert batch[0].establecimiento is None
+    assert len(SenasaRecordBatch.from_rows([])) == 0
+
+
+def test_duckdb_ingests_batches_column_wise_last_row_wins():
+    repo = DuckDBSenasaRepository()
+    records = _records() + [make_record("T0003", peso=99.0)]
+
+    assert repo.save_many(SenasaRecordBatch.from_records(records)) == 7
+
+    assert len(repo.list(limit=100)) == 6
+    stored = repo.get_by_nro(CodigoSenasa("T0003"))
+    assert stored.tambor.peso == 99.0
+    assert stored.establecimiento == records[0].establecimiento
+
+
+def test_since_and_newest_are_computed_per_establecimiento():
+    batch = SenasaRecordBatch.from_records(
+        [
+            make_record("T0001", fecha=date(2025, 1, 3)),
+            make_record("T0002", fecha=date(2025, 1, 9)),
+            make_record("T0003", est="EST002", fecha=date(2025, 1, 1)),
+            make_record("T0004", est="EST003", fecha=date(2025, 1, 2)),
+        ]
+    )
+
+    kept = batch.since({"EST001": date(2025, 1, 5), "EST002": date(2025, 1, 1)})
+    assert [v.nro_senasa for v in kept] == ["T0002", "T0003", "T0004"]
+    assert batch.newest_by_establecimiento() == {
+        "EST001": date(2025, 1, 9),
+        "EST002": date(2025, 1, 1),
+        "EST003": date(2025, 1, 2),
+    }
+    assert batch[:0].newest_by_establecimiento() == {}
+
+
+def test_sql_repository_ingests_batches(tmp_path):
+    engine = build_engine(f"sqlite:///{tmp_path / 'senasa.sqlite'}")
+    metadata.create_all(engine)
+    repo = PostgreSQLSenasaRepository(engine, batch_size=4)
+    records = _records() + [make_record("T0003", peso=99.0)]
+
+    assert repo.save_many(SenasaRecordBatch.from_records(records)) == 7
+
+    assert len(repo.list(limit=100)) == 6
+    stored = repo.get_by_nro(CodigoSenasa("T0003"))
+    assert stored.tambor.peso == 99.0
+    assert stored.establecimiento == records[0].establecimiento
@@ -0,0 +1,113 @@
+from datetime import date, timedelta
+
+import polars as pl
+
+from senasa_pipeline.application.dtos.sync_request_dto import SyncRequestDTO
+from senasa_pipeline.application.use_cases.sync_senasa_data import SyncSenasaDataUseCase
+from senasa_pipeline.domain.entities.establecimiento import Establecimiento
+from senasa_pipeline.domain.entities.senasa_record import SenasaRecord
+from senasa_pipeline.domain.entities.tambor import Tambor
+from senasa_pipeline.domain.value_objects.codigo_senasa import CodigoSenasa
+from senasa_pipeline.domain.value_objects.cuit import CUIT
+from senasa_pipeline.domain.value_objects.fecha_vencimiento import FechaVencimiento
+from senasa_pipeline.infrastructure.adapters.validation_adapter import (
+    CUIT_INVALIDO,
+    FECHA_INVALIDA,
+    PESO_FUERA_DE_RANGO,
+    PolarsRecordValidator,
+)
+
+TODAY = date(2025, 3, 1)
+
+
+def _record(nro="T0001", peso=300.0, fecha=date(2025, 1, 10), cuit: str | None = "30709338443"):
+    tambor = Tambor(CodigoSenasa(nro), CodigoSenasa("EST001"), fecha, peso, "flores", "AR", "Juan")
+    if cuit is None:
+        return SenasaRecord(tambor=tambor)
+    est = Establecimiento(
+        CodigoSenasa("EST001"),
+        "Est 1",
+        "Dir",
+        "Loc",
+        "Prov",
+        CUIT(cuit),
+        FechaVencimiento.from_date(TODAY),
+    )
+    return SenasaRecord(tambor=tambor, establecimiento=est)
+
+
+def test_validate_batch_returns_mask_and_reason_codes():
+    validator = PolarsRecordValidator(today=TODAY)
+    records = [
+        _record(),
+        _record(cuit=None),
+        _record(peso=0.0),
+        _record(peso=900.0, fecha=TODAY + timedelta(days=1)),
+        _record(cuit="30709338440"),  # dígito verificador incorrecto
+        _record(fecha=date(1999, 12, 31)),
+    ]
+
+    result = validator.validate_batch(records)
+
+    assert list(result.mask) == [True, True, False, False, False, False]
+    assert list(result.reasons) == [
+        None,
+        None,
+        PESO_FUERA_DE_RANGO,
+        f"{PESO_FUERA_DE_RANGO},{FECHA_INVALIDA}",
+        CUIT_INVALIDO,
+        FECHA_INVALIDA,
+    ]
+    assert validator.validate(records[0]) is True
+    assert validator.validate(records[2]) is False
+
+
+def test_validate_frame_accepts_arrow_batches_with_nulls():
+    frame = pl.DataFrame(
+        {
+            "nro_senasa": ["T0001", "X", None],
+            "establecimiento_codigo": ["EST001", "EST001", "EST001"],
+            "fecha_extraccion": [date(2025, 1, 10), None, date(2025, 1, 10)],
+            "peso": [300.0, 300.0, float("nan")],
+        }
+    )
+
+    result = PolarsRecordValidator(today=TODAY).validate_frame(frame.to_arrow())
+
+    assert result["valid"].to_list() == [True, False, False]
+    assert result["reasons"].to_list() == [
+        None,
+        "nro_senasa_invalido,fecha_invalida",
+        "nro_senasa_invalido,peso_fuera_de_rango",
+    ]
+
+
+class _Scraper:
+    def __init__(self, records):
+        self.records = records
+
+    def fetch_latest(self, incremental=False, since=None):
+        return self.records
+
+
+class _Repo:
+    def __init__(self):
+        self.saved = []
+
+    def save_many(self, records):
+        self.saved += records
+        return len(records)
+
+
+def test_sync_use_case_uses_batch_validation():
+    repo = _Repo()
+    uc = SyncSenasaDataUseCase(
+        scraper=_Scraper([_record(), _record(nro="T0002", peso=-1.0), _record(nro="T0003")]),
+        validator=PolarsRecordValidator(today=TODAY),
+        repo=repo,
+        batch_size=2,
+    )
+
+    assert uc.execute(SyncRequestDTO(incremental=False)) == 2
+    assert [str(r.tambor.nro_senasa) for r in repo.saved] == ["T0001", "T0003"]
+    assert uc.rejected == {PESO_FUERA_DE_RANGO: 1}
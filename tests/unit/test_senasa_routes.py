@@ -0,0 +1,120 @@
+import io
+import json
+
+import polars as pl
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from senasa_pipeline.application.use_cases.export_senasa_data import ExportSenasaDataUseCase
+from senasa_pipeline.infrastructure.repositories.duckdb_repository import DuckDBSenasaRepository
+from senasa_pipeline.presentation.api.routes import senasa
+from tests.unit._factories import make_record
+
+
+@pytest.fixture
+def client(monkeypatch):
+    repo = DuckDBSenasaRepository()
+    repo.save_many(
+        [make_record(f"T{i:04d}", est="EST001" if i % 2 else "EST002") for i in range(5)]
+    )
+    monkeypatch.setattr(senasa, "_repo", repo)
+    app = FastAPI()
+    app.include_router(senasa.router)
+    yield TestClient(app)
+    repo.close()
+
+
+def test_records_pages_with_next_cursor(client):
+    first = client.get("/v1/senasa/records", params={"limit": 2}).json()
+    second = client.get(
+        "/v1/senasa/records", params={"limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+    last = client.get(
+        "/v1/senasa/records", params={"limit": 2, "cursor": second["next_cursor"]}
+    ).json()
+
+    assert [r["nro_senasa"] for r in first["items"]] == ["T0000", "T0001"]
+    assert first["next_cursor"] == "T0001" and "total" not in first
+    assert [r["nro_senasa"] for r in second["items"]] == ["T0002", "T0003"]
+    assert [r["nro_senasa"] for r in last["items"]] == ["T0004"]
+    assert last["next_cursor"] is None
+
+
+def test_records_rejects_an_invalid_cursor(client):
+    resp = client.get("/v1/senasa/records", params={"cursor": "X"})
+
+    assert resp.status_code == 400
+
+
+def test_records_total_counts_the_filtered_rows(client):
+    body = client.get(
+        "/v1/senasa/records",
+        params={"limit": 1, "establecimiento": "EST001", "include_total": True},
+    ).json()
+
+    assert body["count"] == 1 and body["total"] == 2
+    assert body["items"][0]["establecimiento_codigo"] == "EST001"
+
+
+@pytest.mark.parametrize(
+    ("accept", "fmt"),
+    [
+        (None, "parquet"),
+        ("text/csv", "csv"),
+        ("application/jsonl", "ndjson"),
+        ("application/x-ndjson;q=0.5, text/csv;q=0.9", "csv"),
+        ("text/csv;q=0, application/x-parquet", "parquet"),
+        ("text/csv;q=abc, application/x-ndjson;q=0.2", "ndjson"),
+        ("text/html, */*;q=0.1", "parquet"),
+        ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx"),
+        ("text/html", None),
+    ],
+)
+def test_negotiate_format_follows_accept_q_values(accept, fmt):
+    assert senasa._negotiate_format(accept) == fmt
+
+
+def test_export_streams_each_format(client):
+    parquet = client.post("/v1/senasa/export", json={})
+    csv = client.post(
+        "/v1/senasa/export", json={"establecimiento": "EST001"}, headers={"Accept": "text/csv"}
+    )
+    ndjson = client.post(
+        "/v1/senasa/export", json={"format": "NDJSON"}, headers={"Accept": "text/csv"}
+    )
+
+    assert parquet.headers["content-type"] == "application/vnd.apache.parquet"
+    assert pl.read_parquet(io.BytesIO(parquet.content)).height == 5
+    assert csv.headers["content-type"].startswith("text/csv")
+    assert 'filename="senasa_export.csv"' in csv.headers["content-disposition"]
+    assert pl.read_csv(io.BytesIO(csv.content))["nro_senasa"].to_list() == ["T0001", "T0003"]
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    assert len([json.loads(line) for line in ndjson.text.splitlines()]) == 5
+
+
+def test_export_rejects_unacceptable_and_invalid_formats(client):
+    by_accept = client.post("/v1/senasa/export", json={}, headers={"Accept": "text/html"})
+    by_body = client.post("/v1/senasa/export", json={"format": "pdf"})
+
+    assert by_accept.status_code == 406
+    assert by_body.status_code == 400
+
+
+def test_export_xlsx_goes_through_a_temp_file_removed_after_sending(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(senasa.tempfile, "tempdir", str(tmp_path))
+
+    resp = client.post("/v1/senasa/export", json={"format": "xlsx"})
+
+    assert resp.status_code == 200 and resp.content.startswith(b"PK")
+    assert resp.headers["content-type"] == senasa._XLSX_MEDIA_TYPE
+    assert pl.read_excel(io.BytesIO(resp.content), engine="openpyxl").height == 5
+    assert list(tmp_path.iterdir()) == []
+
+    def fail(self, req, path):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(ExportSenasaDataUseCase, "execute", fail)
+    with pytest.raises(RuntimeError, match="disk full"):
+        client.post("/v1/senasa/export", json={"format": "xlsx"})
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from senasa_pipeline.application.session_renewer import SessionRenewer
+from senasa_pipeline.application.use_cases.ensure_senasa_session import (
+    EnsureSessionResult,
+    SystemClock,
+)
+from tests.unit._fakes_auth import FakeStore
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class FixedClock(SystemClock):
+    def now(self) -> datetime:
+        return NOW
+
+
+def _renewer(store: FakeStore, calls: list[int], *, jitter: float = 0.0) -> SessionRenewer:
+    async def refresh() -> EnsureSessionResult:
+        calls.append(1)
+        store.save({"session": "new"}, NOW + timedelta(hours=10))
+        return EnsureSessionResult("REFRESHED", NOW + timedelta(hours=10), "ok")
+
+    return SessionRenewer(
+        store, refresh, ttl_hours=10, renew_fraction=0.8, clock=FixedClock(), rng=lambda: jitter
+    )
+
+
+def test_renewal_is_due_at_fraction_of_ttl_minus_jitter() -> None:
+    store = FakeStore()
+    store.save({"k": "v"}, NOW + timedelta(hours=5))  # issued 5h ago, renew at 8h
+    renewer = _renewer(store, [])
+
+    renewer.rng = lambda: 1.0  # jitter up to 5% of 10h
+    assert renewer.seconds_until_renewal() == 3 * 3600 - 1800
+
+
+def test_jitter_is_drawn_once_per_renewal_cycle() -> None:
+    store = FakeStore()
+    store.save({"k": "v"}, NOW + timedelta(hours=5))
+    draws = iter([0.0, 1.0])
+    renewer = _renewer(store, [])
+    renewer.rng = lambda: next(draws)
+
+    assert renewer.seconds_until_renewal() == 3 * 3600
+    assert renewer.seconds_until_renewal() == 3 * 3600  # mismo ciclo, mismo sorteo
+    store.save({"k": "v"}, NOW + timedelta(hours=6))
+    assert renewer.seconds_until_renewal() == 4 * 3600 - 1800
+
+
+def test_failed_renewals_back_off_and_stop_after_max_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = FakeStore()
+    calls: list[int] = []
+    sleeps: list[float] = []
+
+    async def refresh() -> EnsureSessionResult:
+        calls.append(1)
+        raise RuntimeError("AFIP caído")
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    renewer = SessionRenewer(
+        store,
+        refresh,
+        ttl_hours=10,
+        retry_seconds=60,
+        max_retry_seconds=300,
+        max_failures=5,
+        clock=FixedClock(),
+    )
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    asyncio.run(renewer.run())
+
+    assert len(calls) == 5
+    assert sleeps == [60, 120, 240, 300]
+
+
+def test_missing_or_inactive_session_is_due_immediately() -> None:
+    store = FakeStore()
+    renewer = _renewer(store, [])
+    assert renewer.seconds_until_renewal() == 0
+
+    store.save({"k": "v"}, NOW + timedelta(hours=9))
+    store.mark_inactive()
+    assert renewer.seconds_until_renewal() == 0
+
+
+def test_run_once_only_refreshes_when_due() -> None:
+    store = FakeStore()
+    store.save({"k": "v"}, NOW + timedelta(hours=9))
+    calls: list[int] = []
+    renewer = _renewer(store, calls)
+
+    assert asyncio.run(renewer.run_once()) is None
+    assert calls == []
+
+    store.save({"k": "v"}, NOW + timedelta(hours=1))
+    result = asyncio.run(renewer.run_once())
+    assert result is not None and result.status == "REFRESHED"
+    assert calls == [1]
+    assert renewer.seconds_until_renewal() == 8 * 3600
+
+
+def test_run_loop_renews_then_sleeps_until_next_window() -> None:
+    store = FakeStore()
+    calls: list[int] = []
+    renewer = _renewer(store, calls)
+
+    async def run() -> None:
+        task = asyncio.create_task(renewer.run())
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+    asyncio.run(run())
+    assert calls == [1]
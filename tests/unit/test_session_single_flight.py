@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import UTC, datetime
+
+from senasa_pipeline.application.use_cases.ensure_senasa_session import (
+    AsyncEnsureSenasaSessionUseCase,
+    EnsureSenasaSessionUseCase,
+)
+from senasa_pipeline.config import settings
+from senasa_pipeline.infrastructure.adapters.session.memory_store import InMemorySessionStore
+from senasa_pipeline.infrastructure.adapters.session.sql_store import SQLSessionStore
+from senasa_pipeline.infrastructure.adapters.session.sqlite_store import SQLiteSessionStore
+from senasa_pipeline.infrastructure.repositories.factory import build_session_store
+from senasa_pipeline.infrastructure.repositories.postgresql_repository import build_engine
+from senasa_pipeline.infrastructure.repositories.sql_tables import metadata
+from tests.unit._fakes_auth import AsyncFakeConsumer, AsyncFakeProvider, FakeConsumer, FakeProvider
+
+
+class SlowProvider(FakeProvider):
+    def get_token_sign(self):
+        time.sleep(0.2)
+        return super().get_token_sign()
+
+
+class AsyncSlowProvider(AsyncFakeProvider):
+    async def get_token_sign(self):
+        await asyncio.sleep(0.05)
+        return await super().get_token_sign()
+
+
+def test_concurrent_workers_share_a_single_login() -> None:
+    store = InMemorySessionStore()
+    provider = SlowProvider()
+
+    def worker() -> str:
+        # Una instancia por worker: sólo el lease del store los coordina
+        uc = EnsureSenasaSessionUseCase(
+            store=store,
+            provider=provider,
+            consumer=FakeConsumer(),
+            refresh_lock=store,
+            lock_poll_seconds=0.01,
+        )
+        return uc.execute().status
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        statuses = sorted(pool.map(lambda _: worker(), range(4)))
+
+    assert provider.called == 1
+    assert statuses == ["ALREADY_ACTIVE"] * 3 + ["REFRESHED"]
+    assert store.load()[0] == {"session": "abc"}
+
+
+def test_async_callers_on_one_instance_share_a_single_login() -> None:
+    store = InMemorySessionStore()
+    provider = AsyncSlowProvider()
+    uc = AsyncEnsureSenasaSessionUseCase(
+        store=store, provider=provider, consumer=AsyncFakeConsumer()
+    )
+
+    async def run() -> list[str]:
+        results = await asyncio.gather(*(uc.execute() for _ in range(3)))
+        return sorted(r.status for r in results)
+
+    assert asyncio.run(run()) == ["ALREADY_ACTIVE", "ALREADY_ACTIVE", "REFRESHED"]
+    assert provider.called == 1
+
+
+def test_sqlite_refresh_lease_is_shared_across_connections(tmp_path) -> None:
+    db = str(tmp_path / "auth.sqlite")
+    first, second = SQLiteSessionStore(db), SQLiteSessionStore(db)
+
+    assert first.acquire("a", ttl_seconds=60)
+    assert not second.acquire("b", ttl_seconds=60)
+    second.release("b")  # not the owner: no-op
+    assert not second.acquire("b", ttl_seconds=60)
+
+    first.release("a")
+    assert second.acquire("b", ttl_seconds=-1)  # already expired lease
+    assert first.acquire("a", ttl_seconds=60)  # expired leases can be taken over
+
+
+def test_database_url_session_and_lease_are_shared_across_engines(tmp_path) -> None:
+    # Se usa el dialecto SQLite como stand-in local de PostgreSQL: API y worker en otro host
+    url = f"sqlite:///{tmp_path / 'senasa.sqlite'}"
+    metadata.create_all(build_engine(url))
+    api = build_session_store(replace(settings, database_url=url))
+    worker = SQLSessionStore(build_engine(url))
+    assert isinstance(api, SQLSessionStore)
+    assert worker.load() == ({}, None, False)
+
+    assert worker.acquire("w", ttl_seconds=60)
+    assert not api.acquire("a", ttl_seconds=60)
+    expires = datetime(2030, 1, 1, tzinfo=UTC)
+    worker.save({"session": "abc"}, expires)
+    worker.release("w")
+    assert api.load() == ({"session": "abc"}, expires, True)
+    assert api.acquire("a", ttl_seconds=-1)
+    assert worker.acquire("w", ttl_seconds=60)  # expired leases can be taken over
+
+    api.mark_inactive()
+    assert worker.load()[2] is False
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import httpx
+from structlog.testing import capture_logs
+
+from senasa_pipeline.application.use_cases.ensure_senasa_session import (
+    EnsureSenasaSessionUseCase,
+    SessionValidationCache,
+    SystemClock,
+)
+from senasa_pipeline.infrastructure.adapters.http.httpx_client import HttpxClient
+from senasa_pipeline.infrastructure.adapters.senasa.login_consumer import (
+    SENASA_BASE,
+    SenasaLoginConsumer,
+)
+from tests.unit._fakes_auth import FakeConsumer, FakeProvider, FakeStore
+
+
+class MutableClock(SystemClock):
+    def __init__(self) -> None:
+        self.current = datetime(2025, 1, 1, tzinfo=UTC)
+
+    def now(self) -> datetime:
+        return self.current
+
+
+def test_recent_probe_is_reused_until_ttl_expires() -> None:
+    clock = MutableClock()
+    store = FakeStore()
+    store.save({"k": "v"}, clock.current + timedelta(hours=6))
+    consumer = FakeConsumer()
+    uc = EnsureSenasaSessionUseCase(
+        store=store,
+        provider=FakeProvider(),
+        consumer=consumer,
+        clock=clock,
+        validation_cache=SessionValidationCache(ttl_seconds=60, clock=clock),
+    )
+
+    assert uc.execute().message == "Valid session from store"
+    assert uc.execute().message == "Session validated recently (cached)"
+    assert consumer.probes == 1
+    assert consumer.restored == {"k": "v"}
+
+    clock.current += timedelta(seconds=61)
+    assert uc.execute().message == "Valid session from store"
+    assert consumer.probes == 2
+
+
+class BrokenProbeConsumer(FakeConsumer):
+    def validate_session(self) -> bool:
+        if self.probes == 0:
+            self.probes += 1
+            raise httpx.ConnectError("senasa down")
+        return super().validate_session()
+
+
+def test_failed_probe_is_logged_and_triggers_login() -> None:
+    clock = MutableClock()
+    store = FakeStore()
+    store.save({"k": "v"}, clock.current + timedelta(hours=6))
+    cache = SessionValidationCache(ttl_seconds=60, clock=clock)
+    provider = FakeProvider()
+    uc = EnsureSenasaSessionUseCase(
+        store=store,
+        provider=provider,
+        consumer=BrokenProbeConsumer(),
+        clock=clock,
+        validation_cache=cache,
+    )
+
+    with capture_logs() as logs:
+        res = uc.execute()
+
+    assert res.status == "REFRESHED" and provider.called == 1
+    failed = next(e for e in logs if e["event"] == "session_probe_failed")
+    assert failed["log_level"] == "warning" and failed["error"] == "senasa down"
+    assert cache.is_fresh({"session": "abc"}) and not cache.is_fresh({"k": "v"})
+
+
+def test_cache_is_keyed_by_cookies() -> None:
+    cache = SessionValidationCache(ttl_seconds=60)
+    cache.mark_valid({"k": "old"})
+
+    assert cache.is_fresh({"k": "old"})
+    assert not cache.is_fresh({"k": "new"})
+    cache.invalidate()
+    assert not cache.is_fresh({"k": "old"})
+
+
+def _consumer(handler) -> tuple[SenasaLoginConsumer, list[str]]:
+    seen: list[str] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        seen.append(request.method)
+        return handler(request)
+
+    http = HttpxClient()
+    http._client = httpx.Client(transport=httpx.MockTransport(record))
+    consumer = SenasaLoginConsumer(http)
+    consumer.restore_session({"ASP.NET_SessionId": "abc"})
+    return consumer, seen
+
+
+def test_head_probe_settles_validation_without_download() -> None:
+    ok, seen = _consumer(lambda r: httpx.Response(200))
+    assert ok.validate_session() is True
+    assert seen == ["HEAD"]
+
+    expired, seen = _consumer(
+        lambda r: httpx.Response(302, headers={"Location": f"{SENASA_BASE}/Login.aspx"})
+    )
+    assert expired.validate_session() is False
+    assert seen == ["HEAD"]
+
+
+def test_inconclusive_head_falls_back_to_full_page() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        return httpx.Response(200, text='<input name="__VIEWSTATE" value="x">')
+
+    consumer, seen = _consumer(handler)
+    assert consumer.validate_session() is True
+    assert seen == ["HEAD", "GET"]
@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+
+from senasa_pipeline.application.dtos.sync_request_dto import SyncRequestDTO
+from senasa_pipeline.application.streaming import batched, prefetch
+from senasa_pipeline.application.use_cases.sync_senasa_data import SyncSenasaDataUseCase
+from tests.unit._factories import make_record
+
+
+def test_batched_groups_lazily():
+    assert list(batched(iter(range(7)), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_prefetch_applies_back_pressure():
+    produced = []
+
+    def source():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    it = prefetch(source(), max_pending=2)
+    assert next(it) == 0
+    # queue (2) + item being put + item handed to the consumer
+    assert len(produced) <= 4
+    assert list(it) == list(range(1, 100))
+
+
+def test_prefetch_reraises_producer_errors():
+    def source():
+        yield 1
+        raise RuntimeError("page 2 failed")
+
+    it = prefetch(source(), max_pending=2)
+    assert next(it) == 1
+    with pytest.raises(RuntimeError, match="page 2 failed"):
+        next(it)
+
+
+def test_sync_persists_first_batch_while_scraper_is_still_running():
+    first_saved = threading.Event()
+
+    class SlowScraper:
+        def fetch_latest(self, incremental: bool = False, since=None):
+            for i in range(5):
+                yield make_record(f"T{i:04d}")
+            assert first_saved.wait(timeout=5)
+            for i in range(5, 10):
+                yield make_record(f"T{i:04d}")
+
+    class Repo:
+        def __init__(self):
+            self.saved = []
+
+        def save_many(self, records):
+            self.saved.extend(records)
+            first_saved.set()
+            return len(records)
+
+    class AlwaysValid:
+        def validate(self, record):
+            return True
+
+    repo = Repo()
+    uc = SyncSenasaDataUseCase(SlowScraper(), AlwaysValid(), repo, batch_size=5)
+    assert uc.execute(SyncRequestDTO()) == 10
+    assert len(repo.saved) == 10
@@ -11,7 +11,7 @@ from senasa_pipeline.infrastructure.repositories.duckdb_repository import DuckDB
 
 
 class FakeScraper:
-    def fetch_latest(self, incremental: bool = False):
+    def fetch_latest(self, incremental: bool = False, since=None):
         t = Tambor(
             CodigoSenasa("ABC123"),
             CodigoSenasa("EST001"),
@@ -44,3 +44,90 @@ def test_sync_use_case_processes_records():
     processed = uc.execute(SyncRequestDTO(incremental=False))
     assert processed == 1
     assert repo.get_by_nro(CodigoSenasa("ABC123")) is not None
+
+
+class RecordingRepo:
+    def __init__(self):
+        self.batches = []
+
+    def save_many(self, records):
+        self.batches.append(list(records))
+        return len(records)
+
+
+class ManyScraper:
+    def __init__(self, n):
+        self.n = n
+
+    def fetch_latest(self, incremental: bool = False, since=None):
+        base = FakeScraper().fetch_latest()[0]
+        return [
+            SenasaRecord(
+                tambor=Tambor(
+                    CodigoSenasa(f"T{i:05d}"),
+                    base.tambor.establecimiento_codigo,
+                    base.tambor.fecha_extraccion,
+                    base.tambor.peso,
+                    base.tambor.tipo_miel,
+                    base.tambor.origen,
+                    base.tambor.productor,
+                ),
+                establecimiento=base.establecimiento,
+            )
+            for i in range(self.n)
+        ]
+
+
+def test_sync_use_case_saves_in_batches():
+    repo = RecordingRepo()
+    uc = SyncSenasaDataUseCase(
+        scraper=ManyScraper(25), validator=AlwaysValid(), repo=repo, batch_size=10
+    )
+    processed = uc.execute(SyncRequestDTO(incremental=False))
+    assert processed == 25
+    assert [len(b) for b in repo.batches] == [10, 10, 5]
+
+
+def test_duckdb_save_many_bulk_upsert():
+    repo = DuckDBSenasaRepository()
+    records = ManyScraper(50).fetch_latest()
+    assert repo.save_many(records) == 50
+    assert repo.save_many(records[:5]) == 5
+    assert len(repo.list(limit=1000)) == 50
+    assert repo.get_by_nro(CodigoSenasa("T00049")).establecimiento is not None
+
+
+class SkippingScraper(ManyScraper):
+    """Counts dropped rows like SenasaWebScrapingAdapter, some after the last record."""
+
+    pages_fetched = 0
+    rows_skipped = 0
+
+    def fetch_latest(self, incremental: bool = False, since=None):
+        self.rows_skipped += 1
+        yield from super().fetch_latest()
+        self.pages_fetched += 1
+        self.rows_skipped += 2
+
+
+def _skipped_progress(n):
+    reports = []
+    uc = SyncSenasaDataUseCase(
+        scraper=SkippingScraper(n),
+        validator=AlwaysValid(),
+        repo=RecordingRepo(),
+        batch_size=10,
+        on_progress=lambda progress: reports.append(progress.as_dict()),
+    )
+    return uc.execute(SyncRequestDTO(incremental=False)), reports
+
+
+def test_sync_progress_reports_rows_the_scraper_skipped():
+    saved, reports = _skipped_progress(5)
+    assert saved == 5
+    assert reports[-1]["records_skipped"] == 3 and reports[-1]["records_saved"] == 5
+
+    # Sin ningún lote (todas las filas descartadas) igual se reporta al terminar
+    saved, reports = _skipped_progress(0)
+    assert saved == 0
+    assert reports == [{**reports[-1], "records_skipped": 3, "pages_fetched": 1}]
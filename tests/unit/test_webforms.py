@@ -0,0 +1,83 @@
+import pytest
+
+from senasa_pipeline.infrastructure.adapters.senasa.extracciones_scraper import parse_grid_page
+from senasa_pipeline.infrastructure.adapters.senasa.webforms import (
+    DeltaParser,
+    SenasaSessionExpiredError,
+    WebFormsDeltaError,
+    page_postback,
+    parse_delta,
+    read_page_postback,
+)
+from tests.unit._senasa_pages import (
+    GRID_TARGET,
+    SCRIPT_MANAGER,
+    UPDATE_PANEL,
+    async_grid_page,
+    delta_segment,
+    grid_delta,
+    grid_page,
+)
+
+
+def test_parse_delta_reads_segments_by_length():
+    delta = parse_delta(grid_delta(2, total_pages=5, viewstate="VS|2"))
+
+    assert delta.hidden == {"__EVENTTARGET": "", "__VIEWSTATE": "VS|2"}
+    assert list(delta.panels) == [UPDATE_PANEL.replace("$", "_")]
+    assert len(parse_grid_page(delta.panels[UPDATE_PANEL.replace("$", "_")]).records) == 3
+    assert delta.redirect is None and delta.error is None
+
+
+def test_delta_parser_accepts_arbitrary_chunks():
+    text = grid_delta(3, total_pages=5, viewstate="VS3")
+    parser = DeltaParser()
+    segments = []
+    for i in range(0, len(text), 7):
+        segments += parser.feed(text[i : i + 7])
+    parser.close()
+
+    assert segments == parse_delta(text).segments
+
+
+def test_parse_delta_redirect_and_malformed_input():
+    redirect = parse_delta("1|#||4|" + delta_segment("pageRedirect", "", "%2fDefault.aspx"))
+    assert redirect.redirect == "/Default.aspx"
+
+    with pytest.raises(ValueError):
+        parse_delta("<html></html>")
+    with pytest.raises(ValueError):
+        parse_delta("1|#||4|99|updatePanel|x|<table>|")
+
+
+def test_page_postback_builds_async_or_full_postbacks():
+    fields = {"__VIEWSTATE": "VS1", "__EVENTVALIDATION": "EV"}
+
+    data, headers = page_postback(GRID_TARGET, 2, fields, (SCRIPT_MANAGER, UPDATE_PANEL))
+    assert data["__EVENTTARGET"] == GRID_TARGET and data["__EVENTARGUMENT"] == "Page$2"
+    assert data[SCRIPT_MANAGER] == f"{UPDATE_PANEL}|{GRID_TARGET}"
+    assert data["__ASYNCPOST"] == "true" and data["__VIEWSTATE"] == "VS1"
+    assert headers["X-MicrosoftAjax"] == "Delta=true"
+
+    data, headers = page_postback(GRID_TARGET, 2, fields)
+    assert "__ASYNCPOST" not in data and headers == {}
+
+
+def test_read_page_postback_carries_unchanged_hidden_fields_forward():
+    posted = {"__VIEWSTATE": "VS1", "__EVENTVALIDATION": "EV"}
+
+    page = read_page_postback(grid_delta(2, 5, viewstate="VS2"), 2, posted)
+    assert page.async_post
+    assert page.hidden == {"__VIEWSTATE": "VS2", "__EVENTVALIDATION": "EV", "__EVENTTARGET": ""}
+    assert len(parse_grid_page(page.html).records) == 3
+    assert page.bytes_received < len(async_grid_page(5))
+
+    full = read_page_postback(grid_page(2, 5, viewstate="VS2"), 2, posted)
+    assert not full.async_post and full.hidden["__VIEWSTATE"] == "VS2"
+
+
+def test_read_page_postback_raises_on_login_redirect_and_delta_errors():
+    with pytest.raises(SenasaSessionExpiredError):
+        read_page_postback("1|#||4|" + delta_segment("pageRedirect", "", "/Login.aspx"), 2, {})
+    with pytest.raises(WebFormsDeltaError, match="boom"):
+        read_page_postback("1|#||4|" + delta_segment("error", "500", "boom"), 2, {})